@@ -0,0 +1,72 @@
+"""
+Benchmark des conversions en bloc PyFasty (update_from / to_dict)
+
+Construit un document de N clés (chacune un petit dict), puis compare :
+  - import : affectation clé par clé  vs  update_from()  (document déjà décodé,
+             le temps de json.loads est affiché à part)
+  - export : ast.literal_eval(str(node))  vs  to_dict()
+
+Usage : python benchmark/bench_bulk.py [--keys N] [--repeat N]
+"""
+
+import argparse
+import ast
+import gc
+import json
+import time
+
+import pyfasty
+
+def build_document(keys):
+    return {
+        f"key{i}": {"id": i, "name": f"item{i}", "score": i * 0.5, "tags": ["a", "b"]}
+        for i in range(keys)
+    }
+
+def best_of(repeat, func, prepare=lambda index: None):
+    best = float("inf")
+    for index in range(repeat):
+        argument = prepare(index)
+        gc.collect()
+        start = time.perf_counter()
+        func(index, argument)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+def main():
+    parser = argparse.ArgumentParser(description="PyFasty bulk import/export benchmark")
+    parser.add_argument("--keys", type=int, default=100000, help="clés de premier niveau")
+    parser.add_argument("--repeat", type=int, default=3, help="répétitions (meilleur temps)")
+    args = parser.parse_args()
+
+    text = json.dumps(build_document(args.keys))
+    parse = lambda index: json.loads(text)
+
+    def manual(index, document):
+        node = getattr(pyfasty.registry, f"bench_bulk_manual_{index}")
+        for key, value in document.items():
+            setattr(node, key, value)
+
+    def bulk(index, document):
+        getattr(pyfasty.registry, f"bench_bulk_update_{index}").update_from(document)
+
+    loads_ms = best_of(args.repeat, lambda index, argument: json.loads(text))
+    manual_ms = best_of(args.repeat, manual, parse)
+    bulk_ms = best_of(args.repeat, bulk, parse)
+
+    # Référence d'export : un nœud affecté d'un dict s'affiche comme ce dict
+    pyfasty.registry.bench_bulk_export = json.loads(text)
+    source = pyfasty.registry.bench_bulk_export
+    node = pyfasty.registry.bench_bulk_update_0
+    str_ms = best_of(args.repeat, lambda index, argument: ast.literal_eval(str(source)))
+    dict_ms = best_of(args.repeat, lambda index, argument: node.to_dict())
+    assert node.to_dict() == json.loads(text) == ast.literal_eval(str(source))
+
+    print(f"json.loads seul : {loads_ms:.1f} ms (hors mesures d'import)")
+    print(f"{'opération':>8} | {'référence':>24} | {'PyFasty':>22} | {'gain':>6}")
+    print("-" * 70)
+    print(f"{'import':>8} | {'setattr':>15} {manual_ms:>6.1f} ms | {'update_from':>19} {bulk_ms:>6.1f} ms | x{manual_ms / bulk_ms:>4.1f}")
+    print(f"{'export':>8} | {'literal_eval(str)':>15} {str_ms:>6.1f} ms | {'to_dict':>19} {dict_ms:>6.1f} ms | x{str_ms / dict_ms:>4.1f}")
+
+if __name__ == "__main__":
+    main()
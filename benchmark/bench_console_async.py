@@ -0,0 +1,67 @@
+"""
+Benchmark de l'écriture asynchrone de la console PyFasty (config["async"])
+
+Lance un processus enfant qui écrit N lignes avec console.info(), sa sortie
+standard étant un tube lu lentement (blocs de 4 Ko espacés de --delay ms),
+comme un terminal ou un pipeline lent. Mesure le temps passé dans les appels
+côté application :
+  - mode synchrone (défaut)
+  - mode asynchrone, overflow="block" (aucune ligne perdue)
+  - mode asynchrone, overflow="drop" (lignes abandonnées si l'anneau est plein)
+
+Usage : python benchmark/bench_console_async.py [--lines N] [--delay MS]
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+import time
+
+CHILD = """
+import json, sys, time
+import pyfasty
+pyfasty.console.config = {"format": "<%TYPE> <%MESSAGE>", "async": json.loads(sys.argv[1])}
+start = time.perf_counter()
+for i in range(int(sys.argv[2])):
+    pyfasty.console.info(f"message {i}")
+elapsed = time.perf_counter() - start
+sys.stderr.write(json.dumps({"elapsed": elapsed, "stats": pyfasty.console.async_stats()}))
+"""
+
+def run(lines, delay, async_config):
+    child = subprocess.Popen(
+        [sys.executable, "-c", CHILD, json.dumps(async_config), str(lines)],
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+    )
+    received = 0
+    while True:
+        chunk = child.stdout.read1(4096)
+        if not chunk:
+            break
+        received += chunk.count(b"\n")
+        time.sleep(delay / 1000)
+    report = json.loads(child.stderr.read())
+    child.wait()
+    return report["elapsed"], report["stats"], received
+
+def main():
+    parser = argparse.ArgumentParser(description="PyFasty async console benchmark")
+    parser.add_argument("--lines", type=int, default=20000, help="lignes écrites par l'enfant")
+    parser.add_argument("--delay", type=float, default=0.5, help="pause du lecteur entre deux blocs (ms)")
+    args = parser.parse_args()
+
+    modes = [
+        ("synchrone", {"enabled": False}),
+        ("async block", {"enabled": True, "queue_size": 65536, "overflow": "block"}),
+        ("async drop", {"enabled": True, "queue_size": 1024, "overflow": "drop"}),
+    ]
+
+    print(f"{'mode':>12} | {'appels':>10} | {'lignes reçues':>13} | {'abandonnées':>11}")
+    print("-" * 56)
+    for label, async_config in modes:
+        elapsed, stats, received = run(args.lines, args.delay, async_config)
+        print(f"{label:>12} | {elapsed * 1000:>7.1f} ms | {received:>13} | {stats['dropped']:>11}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Benchmark de l'écriture des logs console dans un fichier (save_log)
+
+Mesure le débit (lignes/s) de pyfasty.console.info() avec save_log activé :
+  - buffer_size=0 et vidage à chaque ligne (comportement le plus proche de
+    l'ancien fopen/fclose par message, sans les appels système d'ouverture)
+  - tampon par défaut (64 Ko, vidage sur error et toutes les secondes)
+et le compare à logging.FileHandler de la bibliothèque standard.
+L'affichage console est redirigé vers os.devnull pendant les mesures.
+
+Usage : python benchmark/bench_console_file.py [--lines N]
+"""
+
+import argparse
+import logging
+import os
+import sys
+import tempfile
+import time
+
+import pyfasty
+
+FORMAT = "<%Y>-<%m>-<%d> <%H>:<%M>:<%S>.<%F:3> | <%TYPE> | <%MESSAGE>"
+
+def bench_pyfasty(path, lines, **save_log):
+    pyfasty.console.config = {
+        "console_view": True,
+        "format": FORMAT,
+        "save_log": {"status": True, "filename": path, "filemode": "w", **save_log},
+    }
+    stdout = sys.stdout
+    sys.stdout = open(os.devnull, "w")
+    try:
+        start = time.perf_counter()
+        for i in range(lines):
+            pyfasty.console.info(f"message {i}")
+        pyfasty.console.flush()
+        elapsed = time.perf_counter() - start
+    finally:
+        sys.stdout.close()
+        sys.stdout = stdout
+    pyfasty.console.close()
+    return elapsed
+
+def bench_logging(path, lines):
+    logger = logging.getLogger("bench_console_file")
+    logger.propagate = False
+    handler = logging.FileHandler(path, mode="w")
+    handler.setFormatter(logging.Formatter("%(asctime)s | [%(levelname)s] | %(message)s"))
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    try:
+        start = time.perf_counter()
+        for i in range(lines):
+            logger.info(f"message {i}")
+        handler.flush()
+        return time.perf_counter() - start
+    finally:
+        logger.removeHandler(handler)
+        handler.close()
+
+def main():
+    parser = argparse.ArgumentParser(description="PyFasty console file sink benchmark")
+    parser.add_argument("--lines", type=int, default=100000, help="lignes écrites par mesure")
+    args = parser.parse_args()
+
+    directory = tempfile.gettempdir()
+    paths = [os.path.join(directory, f"pyfasty_bench_console_{i}.log") for i in range(3)]
+    results = [
+        ("logging.FileHandler", bench_logging(paths[0], args.lines)),
+        ("pyfasty non tamponné", bench_pyfasty(paths[1], args.lines, buffer_size=0, flush_level="debug")),
+        ("pyfasty tamponné", bench_pyfasty(paths[2], args.lines)),
+    ]
+
+    for path in paths:
+        with open(path) as f:
+            written = sum(1 for _ in f)
+        assert written == args.lines, f"{path} : {written} lignes écrites au lieu de {args.lines}"
+        os.remove(path)
+
+    print(f"{'écriture':>22} | {'temps':>10} | {'lignes/s':>12}")
+    print("-" * 50)
+    for label, elapsed in results:
+        print(f"{label:>22} | {elapsed * 1000:>7.1f} ms | {args.lines / elapsed:>12,.0f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Benchmark de la sauvegarde binaire PyFasty (dump / load)
+
+Construit un registry de N feuilles (1000 nœuds intermédiaires, valeurs
+entières, flottantes et chaînes), puis mesure :
+  - dump(path)
+  - lecture brute du fichier (référence)
+  - load(path)
+  - pickle.loads d'un arbre de dicts équivalent (référence)
+
+Usage : python benchmark/bench_dump.py [--leaves N] [--path FICHIER]
+"""
+
+import argparse
+import os
+import pickle
+import tempfile
+import time
+
+import pyfasty
+
+def build(root, leaves):
+    groups = 1000
+    per_group = max(1, leaves // groups)
+    for g in range(groups):
+        node = getattr(root, f"group{g}")
+        for i in range(per_group):
+            kind = i % 3
+            value = i if kind == 0 else (i * 0.5 if kind == 1 else f"value{i}")
+            setattr(node, f"leaf{i}", value)
+    return groups * per_group
+
+def timed(func):
+    start = time.perf_counter()
+    func()
+    return (time.perf_counter() - start) * 1000
+
+def raw_read(path):
+    with open(path, "rb") as f:
+        f.read()
+
+def as_dict(leaves):
+    groups = 1000
+    per_group = max(1, leaves // groups)
+    return {f"group{g}": {f"leaf{i}": (i if i % 3 == 0 else (i * 0.5 if i % 3 == 1 else f"value{i}"))
+                          for i in range(per_group)}
+            for g in range(groups)}
+
+def main():
+    parser = argparse.ArgumentParser(description="PyFasty dump/load benchmark")
+    parser.add_argument("--leaves", type=int, default=1000000, help="nombre de feuilles")
+    parser.add_argument("--path", default=os.path.join(tempfile.gettempdir(), "pyfasty_bench.dump"))
+    args = parser.parse_args()
+
+    count = build(pyfasty.registry.bench_dump, args.leaves)
+
+    dump_ms = timed(lambda: pyfasty.registry.bench_dump.dump(args.path))
+    size_mb = os.path.getsize(args.path) / 1e6
+    read_ms = timed(lambda: raw_read(args.path))
+    load_ms = timed(lambda: pyfasty.registry.bench_load.load(args.path))
+    pickled = pickle.dumps(as_dict(args.leaves), protocol=pickle.HIGHEST_PROTOCOL)
+    pickle_ms = timed(lambda: pickle.loads(pickled))
+
+    print(f"feuilles        : {count:,}")
+    print(f"taille fichier  : {size_mb:.1f} Mo")
+    print(f"dump            : {dump_ms:8.1f} ms")
+    print(f"lecture brute   : {read_ms:8.1f} ms")
+    print(f"load            : {load_ms:8.1f} ms ({load_ms / read_ms:.1f}x lecture brute)")
+    print(f"pickle.loads    : {pickle_ms:8.1f} ms (arbre de dicts équivalent)")
+
+    os.remove(args.path)
+
+if __name__ == "__main__":
+    main()
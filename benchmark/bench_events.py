@@ -0,0 +1,74 @@
+"""
+Benchmark du moteur d'événements PyFasty
+
+Mesure le coût d'une écriture registry en fonction du nombre de handlers
+enregistrés :
+  - "dependent" : écriture sur un nœud lu par toutes les conditions
+                  (chaque handler est réévalué)
+  - "unrelated" : écriture sur un nœud qu'aucune condition ne lit
+
+Avec --compile, les conditions sont enregistrées avec compile=True
+(prédicats natifs au lieu de l'appel de la lambda). Avec --stats, les
+mesures d'event_stats sont actives pendant le benchmark (coût de
+l'instrumentation) et la latence p99 des conditions est affichée.
+
+Usage : python benchmark/bench_events.py [--writes N] [--compile] [--stats]
+"""
+
+import argparse
+import time
+
+import pyfasty
+
+HANDLER_COUNTS = (1, 10, 50, 100, 250)
+
+def register_handlers(count, compile=False):
+    pyfasty.event_clear_handlers()
+    for i in range(count):
+        # Seuil jamais atteint : on mesure l'évaluation, pas les callbacks
+        pyfasty.event(lambda t=-1 - i: pyfasty.registry.bench.value == t, compile=compile)(lambda: None)
+
+def time_writes(writes, write):
+    start = time.perf_counter()
+    for i in range(writes):
+        write(i)
+    return (time.perf_counter() - start) / writes * 1e6
+
+def write_dependent(i):
+    pyfasty.registry.bench.value = i
+
+def write_unrelated(i):
+    pyfasty.registry.bench_other.value = i
+
+def main():
+    parser = argparse.ArgumentParser(description="PyFasty event engine benchmark")
+    parser.add_argument("--writes", type=int, default=2000, help="écritures par mesure")
+    parser.add_argument("--compile", action="store_true", help="conditions compilées en prédicats natifs")
+    parser.add_argument("--stats", action="store_true", help="instrumentation event_stats active")
+    args = parser.parse_args()
+
+    if args.stats:
+        pyfasty.event_stats_enable()
+
+    print(f"{'handlers':>9} | {'dependent (µs/write)':>21} | {'unrelated (µs/write)':>21}")
+    print("-" * 58)
+    for count in HANDLER_COUNTS:
+        register_handlers(count, args.compile)
+        # Première écriture : analyse et suivi des dépendances
+        write_dependent(0)
+        write_unrelated(0)
+        dependent = time_writes(args.writes, write_dependent)
+        unrelated = time_writes(args.writes, write_unrelated)
+        print(f"{count:>9} | {dependent:>21.2f} | {unrelated:>21.2f}")
+
+    if args.stats:
+        handlers = pyfasty.event_stats()["handlers"].values()
+        p99 = max(handler["condition_ns"]["p99"] for handler in handlers)
+        print(f"\ncondition p99 (pire handler) : {p99} ns")
+        pyfasty.event_stats_disable()
+        pyfasty.event_stats_reset()
+
+    pyfasty.event_clear_handlers()
+
+if __name__ == "__main__":
+    main()
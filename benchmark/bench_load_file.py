@@ -0,0 +1,98 @@
+"""
+Benchmark du chargement de config PyFasty (load_file)
+
+Écrit une configuration imbriquée (services -> instances -> paramètres) en
+JSON et en image dump(), puis mesure pour chaque format, en mode complet et
+paresseux (lazy=True) :
+  - le temps de load_file(path)
+  - le temps de lecture de quelques valeurs
+  - la mémoire Python allouée (tracemalloc) après ces lectures
+
+Usage : python benchmark/bench_load_file.py [--services N] [--instances N]
+"""
+
+import argparse
+import gc
+import json
+import os
+import tempfile
+import time
+import tracemalloc
+
+import pyfasty
+
+def build_document(services, instances):
+    return {
+        f"service{s}": {
+            f"instance{i}": {
+                "host": f"10.0.{s % 256}.{i % 256}",
+                "port": 8000 + i,
+                "weight": 0.5,
+                "enabled": True,
+                "limits": {"cpu": 2, "memory": 4096, "tags": ["a", "b"]},
+            }
+            for i in range(instances)
+        }
+        for s in range(services)
+    }
+
+def read_some(node, services):
+    total = 0
+    for s in range(0, services, max(1, services // 10)):
+        total += int(node.get_path(f"service{s}.instance0.port"))
+    return total
+
+def run(label, path, lazy, services, repeat=3):
+    load_ms = read_ms = float("inf")
+    for index in range(repeat):
+        node = getattr(pyfasty.config, f"bench_{label}_{'lazy' if lazy else 'full'}_{index}")
+        gc.collect()
+        start = time.perf_counter()
+        node.load_file(path, lazy=lazy)
+        middle = time.perf_counter()
+        read_some(node, services)
+        end = time.perf_counter()
+        load_ms = min(load_ms, (middle - start) * 1000)
+        read_ms = min(read_ms, (end - middle) * 1000)
+        node.load_file(path, lazy=True)
+
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    node = getattr(pyfasty.config, f"bench_{label}_{'lazy' if lazy else 'full'}_memory")
+    node.load_file(path, lazy=lazy)
+    read_some(node, services)
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    node.load_file(path, lazy=True)
+    return load_ms, read_ms, used / 1e6
+
+def main():
+    parser = argparse.ArgumentParser(description="PyFasty load_file benchmark")
+    parser.add_argument("--services", type=int, default=200, help="services de premier niveau")
+    parser.add_argument("--instances", type=int, default=500, help="instances par service")
+    args = parser.parse_args()
+
+    directory = tempfile.gettempdir()
+    json_path = os.path.join(directory, "pyfasty_bench_config.json")
+    dump_path = os.path.join(directory, "pyfasty_bench_config.dump")
+    with open(json_path, "w") as f:
+        json.dump(build_document(args.services, args.instances), f)
+    pyfasty.config.bench_source.load_file(json_path)
+    pyfasty.config.bench_source.dump(dump_path)
+    pyfasty.config.bench_source.load_file(dump_path, lazy=True)
+
+    print(f"{'fichier':>7} | {'taille':>8} | {'mode':>8} | {'load_file':>10} | {'lectures':>9} | {'mémoire':>9}")
+    print("-" * 67)
+    for label, path in (("json", json_path), ("dump", dump_path)):
+        size_mb = os.path.getsize(path) / 1e6
+        for lazy in (False, True):
+            load_ms, read_ms, used_mb = run(label, path, lazy, args.services)
+            mode = "lazy" if lazy else "complet"
+            print(f"{label:>7} | {size_mb:>6.1f}Mo | {mode:>8} | {load_ms:>7.1f} ms | {read_ms:>6.2f} ms | {used_mb:>6.1f} Mo")
+
+    os.remove(json_path)
+    os.remove(dump_path)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Benchmark mémoire des nœuds Registry/Config PyFasty
+
+Mesure (tracemalloc) le coût en octets :
+  - d'une feuille : registry.bench.leaves.kN = valeur
+  - d'un nœud intermédiaire : registry.bench.nodes.nN.leaf = valeur
+    (coût total moins celui de la feuille)
+  - des mêmes structures dans config
+
+Les noms et les valeurs sont créés avant la mesure : seuls les nœuds et
+leurs tables d'enfants sont comptés.
+
+Usage : python benchmark/bench_memory.py [--count N]
+"""
+
+import argparse
+import tracemalloc
+
+import pyfasty
+
+def measure(build):
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    keep = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return after - before, keep
+
+def leaves(root, names, values):
+    def build():
+        node = root.leaves
+        for name, value in zip(names, values):
+            setattr(node, name, value)
+        return node
+    return build
+
+def interior(root, names, values):
+    def build():
+        node = root.nodes
+        for name, value in zip(names, values):
+            getattr(node, name).leaf = value
+        return node
+    return build
+
+def main():
+    parser = argparse.ArgumentParser(description="PyFasty node memory benchmark")
+    parser.add_argument("--count", type=int, default=100000, help="nœuds créés par mesure")
+    args = parser.parse_args()
+
+    names = [f"k{i}" for i in range(args.count)]
+    values = [1000000 + i for i in range(args.count)]
+
+    print(f"{'module':>9} | {'bytes/leaf':>11} | {'bytes/interior':>15}")
+    print("-" * 42)
+    for label, root in (("registry", pyfasty.registry.bench_memory),
+                        ("config", pyfasty.config.bench_memory)):
+        leaf_total, keep_leaves = measure(leaves(root, names, values))
+        node_total, keep_nodes = measure(interior(root, names, values))
+        per_leaf = leaf_total / args.count
+        per_interior = node_total / args.count - per_leaf
+        print(f"{label:>9} | {per_leaf:>11.1f} | {per_interior:>15.1f}")
+        del keep_leaves, keep_nodes
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,5 @@
+import sys
+
 from setuptools import setup, Extension
 
 pyfasty_module = Extension(
@@ -9,6 +11,7 @@ pyfasty_module = Extension(
         'src/modules/pyfasty.console.c',
         'src/modules/pyfasty.executor.c',
         'src/modules/pyfasty.event.c',
+        'src/modules/pyfasty.shared.c',
         'src/thread/pyfasty_threading.c',
         'src/proxy/pyfasty.executor_proxy.c',
     ],
@@ -16,6 +19,8 @@ pyfasty_module = Extension(
     define_macros=[
         ('PY_SSIZE_T_CLEAN', None),
     ],
+    # shm_open est dans librt avant glibc 2.34
+    libraries=['rt'] if sys.platform.startswith('linux') else [],
 )
 
 setup(
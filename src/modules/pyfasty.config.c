@@ -3,7 +3,6 @@
 /* Structure pour la config */
 typedef struct {
     PyFastyBaseObject base;    /* Structure de base commune */
-    PyObject *observers;       /* Liste des observateurs pour les changements (pour event) */
 } PyFastyConfigObject;
 
 /* Forward declarations */
@@ -18,6 +17,9 @@ static PyObject *config_get_item(PyObject *self, PyObject *key);
 static int config_set_item(PyObject *self, PyObject *key, PyObject *value);
 static PyObject *config_get_method(PyObject *self, PyObject *args);
 static PyObject *config_get_path_method(PyObject *self, PyObject *args);
+static PyObject *config_dump_method(PyObject *self, PyObject *path);
+static PyObject *config_load_method(PyObject *self, PyObject *path);
+static PyObject *config_load_file_method(PyObject *self, PyObject *args, PyObject *kwds);
 static int config_contains(PyObject *self, PyObject *key);
 static PyObject *config_float(PyObject *obj);
 static PyObject *config_int(PyObject *obj);
@@ -57,6 +59,9 @@ static PyNumberMethods config_as_number = {
 static PyMethodDef config_methods[] = {
     {"get", (PyCFunction)config_get_method, METH_VARARGS, "Get config item with default value"},
     {"get_path", (PyCFunction)config_get_path_method, METH_VARARGS, "Get config item with a dot-notated path (e.g. 'a.b.c')"},
+    {"dump", (PyCFunction)config_dump_method, METH_O, "Write the node and its subtree to a file (versioned binary format)"},
+    {"load", (PyCFunction)config_load_method, METH_O, "Replace the node contents with a file written by dump()"},
+    {"load_file", (PyCFunction)(void(*)(void))config_load_file_method, METH_VARARGS | METH_KEYWORDS, "Replace the node contents with a dump() image or a JSON file, optionally loaded lazily"},
     {NULL, NULL, 0, NULL}  /* Sentinel */
 };
 
@@ -82,21 +87,7 @@ static PyTypeObject PyFastyConfigType = {
 
 /* Helper function to create a new config */
 static PyObject *config_create(int depth, PyObject *value) {
-    PyFastyConfigObject *config = (PyFastyConfigObject *)pyfasty_base_create(
-        &PyFastyConfigType, PYFASTY_CONFIG_TYPE, depth, value);
-    
-    if (config == NULL) {
-        return NULL;
-    }
-    
-    /* Ajouter la liste des observateurs */
-    config->observers = PyList_New(0);
-    if (config->observers == NULL) {
-        Py_DECREF(config);
-        return NULL;
-    }
-    
-    return (PyObject *)config;
+    return pyfasty_base_create(&PyFastyConfigType, PYFASTY_CONFIG_TYPE, depth, value);
 }
 
 /* Optimized fast-path getattr function */
@@ -113,7 +104,10 @@ static PyObject *config_getattr_recursive(PyObject *config_obj, PyObject *name)
     extern int g_in_condition_evaluation;
     
     /* NOUVEAU : Vérifier d'abord dans data */
-    PyObject *result = PyDict_GetItem(self->base.data, name);
+    PyObject *result = pyfasty_node_get(&self->base, name);
+    if (result == NULL && PyErr_Occurred()) {
+        return NULL;
+    }
     if (result != NULL) {
         /* Si c'est un objet Config wrappé, on le retourne TOUJOURS pour permettre les sous-attributs */
         if (PyObject_TypeCheck(result, &PyFastyConfigType)) {
@@ -127,6 +121,11 @@ static PyObject *config_getattr_recursive(PyObject *config_obj, PyObject *name)
         }
     }
     
+    /* Méthodes Config (get, get_path, dump...) - les clés de data sont prioritaires */
+    if (PyDict_GetItem(PyFastyConfigType.tp_dict, name) != NULL) {
+        return PyObject_GenericGetAttr(config_obj, name);
+    }
+    
     /* SOLUTION GÉNÉRALISTE : En mode READ-ONLY, NE PAS auto-créer d'attributs inexistants */
     /* Cette approche est complètement dynamique et ne fait aucun hardcoding de noms */
     if (g_in_condition_evaluation) {
@@ -146,11 +145,6 @@ extern PyObject *PyObject_CallMethod(PyObject *obj, const char *name, const char
 static int config_setattr_recursive(PyObject *config_obj, PyObject *name, PyObject *value) {
     PyFastyConfigObject *self = (PyFastyConfigObject *)config_obj;
     
-    /* Clear cache for this name */
-    if (PyDict_Contains(self->base.cache, name)) {
-        PyDict_DelItem(self->base.cache, name);
-    }
-    
     /* Handle direct value overrides for dictionary-like objects */
     if (value != NULL && strcmp(PyUnicode_AsUTF8(name), PYFASTY_CONFIG_PRIVATE_VALUE_ATTR) == 0) {
         Py_XDECREF(self->base.value);
@@ -160,7 +154,10 @@ static int config_setattr_recursive(PyObject *config_obj, PyObject *name, PyObje
     }
     
     /* Fast path: handle dictionaries specially for nested config objects */
-    PyObject *old_value = PyDict_GetItem(self->base.data, name);
+    PyObject *children = pyfasty_node_children(&self->base);
+    if (children == NULL) {
+        return -1;
+    }
     
     /* If value is a dictionary, special handling */
     if (value != NULL && PyDict_Check(value)) {
@@ -170,19 +167,19 @@ static int config_setattr_recursive(PyObject *config_obj, PyObject *name, PyObje
         }
         
         /* Set the nested config object */
-        int result = PyDict_SetItem(self->base.data, name, new_config);
+        int result = PyDict_SetItem(children, name, new_config);
         Py_DECREF(new_config);
         
         /* Trigger events when dictionaries are replaced or modified */
-        pyfasty_trigger_sync_events_with_module(MODULE_CONFIG);
+        pyfasty_trigger_sync_events_for_node(MODULE_CONFIG, config_obj, name);
         
         return result;
     } else if (value != NULL) {
         /* For normal values, just set directly */
-        int result = PyDict_SetItem(self->base.data, name, value);
+        int result = PyDict_SetItem(children, name, value);
         
         /* Trigger events for any attribute modification */
-        pyfasty_trigger_sync_events_with_module(MODULE_CONFIG);
+        pyfasty_trigger_sync_events_for_node(MODULE_CONFIG, config_obj, name);
         
         return result;
     } else {
@@ -194,12 +191,13 @@ static int config_setattr_recursive(PyObject *config_obj, PyObject *name, PyObje
 
 /* Deallocation function */
 static void config_dealloc(PyFastyConfigObject *self) {
-    /* Libérer les observateurs */
-    Py_XDECREF(self->observers);
-    
-    /* Retourner les dictionnaires au pool et libérer la valeur */
-    pyfasty_dict_pool_return(self->base.data);
-    pyfasty_dict_pool_return(self->base.cache);
+    /* Retourner la table des enfants au pool (ou libérer l'image d'un nœud
+       paresseux jamais ouvert) et libérer la valeur */
+    if (PYFASTY_NODE_IS_LAZY(&self->base)) {
+        Py_DECREF(self->base.data);
+    } else {
+        pyfasty_dict_pool_return(self->base.data);
+    }
     Py_XDECREF(self->base.value);
     
     /* Appel à PyObject_Del avec le bon type */
@@ -214,19 +212,7 @@ static PyObject *config_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         value = PyTuple_GetItem(args, 0);
     }
     
-    PyFastyConfigObject *self = (PyFastyConfigObject *)pyfasty_base_create(
-        type, PYFASTY_CONFIG_TYPE, 0, value);
-    
-    if (self != NULL) {
-        /* Initialize observers */
-        self->observers = PyList_New(0);
-        if (self->observers == NULL) {
-            Py_DECREF(self);
-            return NULL;
-        }
-    }
-    
-    return (PyObject *)self;
+    return pyfasty_base_create(type, PYFASTY_CONFIG_TYPE, 0, value);
 }
 
 /* Init function */
@@ -238,11 +224,6 @@ static int config_init(PyFastyConfigObject *self, PyObject *args, PyObject *kwds
     }
     
     /* L'initialisation des autres champs est gérée par pyfasty_base_create */
-    self->observers = PyList_New(0);
-    if (self->observers == NULL) {
-        return -1;
-    }
-    
     return 0;
 }
 
@@ -253,6 +234,12 @@ static PyObject *config_getattro(PyFastyConfigObject *self, PyObject *name) {
     
     /* Fast path: utiliser la fonction récursive optimisée */
     PyObject *result = config_getattr_recursive((PyObject *)self, name);
+    
+    if (g_dependency_tracking && result != NULL) {
+        pyfasty_trace_node_access(MODULE_CONFIG, (PyObject *)self, name,
+                                  PyObject_TypeCheck(result, &PyFastyConfigType) ? result : NULL);
+    }
+    
     return result;
 }
 
@@ -271,7 +258,7 @@ static int config_setattro(PyFastyConfigObject *self, PyObject *name, PyObject *
         self->base.value = value;
         
         /* Déclencher les événements après modification de la valeur directe */
-        pyfasty_trigger_sync_events_with_module(MODULE_CONFIG);
+        pyfasty_trigger_sync_events_for_node(MODULE_CONFIG, (PyObject *)self, NULL);
         return 0;
     }
     
@@ -282,7 +269,7 @@ static int config_setattro(PyFastyConfigObject *self, PyObject *name, PyObject *
     /* Déclencher les événements si la modification est réussie */
     if (result >= 0) {
         /* Déclencher uniquement les événements liés à la config */
-        pyfasty_trigger_sync_events_with_module(MODULE_CONFIG);
+        pyfasty_trigger_sync_events_for_node(MODULE_CONFIG, (PyObject *)self, name);
     }
     
     return result;
@@ -296,7 +283,13 @@ static PyObject *config_str(PyFastyConfigObject *self) {
     }
     
     /* Otherwise use the data dictionary */
-    return PyObject_Str(self->base.data);
+    PyObject *data = pyfasty_node_data(&self->base);
+    if (data == NULL) {
+        return NULL;
+    }
+    PyObject *result = PyObject_Str(data);
+    Py_DECREF(data);
+    return result;
 }
 
 /* String representation */
@@ -307,7 +300,13 @@ static PyObject *config_repr(PyFastyConfigObject *self) {
     }
     
     /* Otherwise use the data dictionary */
-    return PyObject_Repr(self->base.data);
+    PyObject *data = pyfasty_node_data(&self->base);
+    if (data == NULL) {
+        return NULL;
+    }
+    PyObject *result = PyObject_Repr(data);
+    Py_DECREF(data);
+    return result;
 }
 
 /* FONCTION GÉNÉRIQUE POUR CONVERSION NUMÉRIQUE - Évite la duplication */
@@ -356,7 +355,10 @@ static PyObject *config_richcompare(PyObject *self, PyObject *other, int op) {
     }
     
     /* Priorité 2: Valeur unique primitive dans data */
-    if (PyDict_Size(config->base.data) == 1) {
+    if (PYFASTY_NODE_IS_LAZY(&config->base) && pyfasty_node_children(&config->base) == NULL) {
+        return NULL;
+    }
+    if (config->base.data != NULL && PyDict_Size(config->base.data) == 1) {
         PyObject *key, *value;
         Py_ssize_t pos = 0;
         if (PyDict_Next(config->base.data, &pos, &key, &value)) {
@@ -381,7 +383,14 @@ static PyObject *config_richcompare(PyObject *self, PyObject *other, int op) {
 
 /* Fast implementation of __getitem__ */
 static PyObject *config_get_item(PyObject *self, PyObject *key) {
-    return pyfasty_common_getitem(self, key, &PyFastyConfigType, PYFASTY_CONFIG_TYPE, config_create);
+    PyObject *result = pyfasty_common_getitem(self, key, &PyFastyConfigType, PYFASTY_CONFIG_TYPE, config_create);
+    
+    if (g_dependency_tracking && result != NULL) {
+        pyfasty_trace_node_access(MODULE_CONFIG, self, key,
+                                  PyObject_TypeCheck(result, &PyFastyConfigType) ? result : NULL);
+    }
+    
+    return result;
 }
 
 /* Implementation of __setitem__ */
@@ -394,11 +403,23 @@ static PyObject *config_get_method(PyObject *self, PyObject *args) {
     return pyfasty_common_getmethod(self, args, PYFASTY_CONFIG_TYPE);
 }
 
+/* Segment de get_path : même lecture que l'accès par attribut, tracée pour les dépendances */
+static PyObject *config_get_path_segment(PyObject *self, PyObject *name) {
+    PyObject *result = config_getattr_recursive(self, name);
+    
+    if (g_dependency_tracking && result != NULL) {
+        pyfasty_trace_node_access(MODULE_CONFIG, self, name,
+                                  PyObject_TypeCheck(result, &PyFastyConfigType) ? result : NULL);
+    }
+    
+    return result;
+}
+
 /* Nouvelle fonction: accès optimisé par chemin composé */
 static PyObject *config_get_by_path(PyFastyConfigObject *self, const char *path) {
     return pyfasty_object_get_by_path((PyObject*)self, path, 
                                     &PyFastyConfigType, 
-                                    (PyFastyGetAttrFunc)config_getattr_recursive);
+                                    (PyFastyGetAttrFunc)config_get_path_segment);
 }
 
 /* Méthode Python get_path */
@@ -423,6 +444,30 @@ static PyObject *config_get_path_method(PyObject *self, PyObject *args) {
     return result;
 }
 
+/* Sauvegarde binaire du sous-arbre */
+static PyObject *config_dump_method(PyObject *self, PyObject *path) {
+    return pyfasty_common_dump(self, path);
+}
+
+/* Restauration depuis un fichier écrit par dump() */
+static PyObject *config_load_method(PyObject *self, PyObject *path) {
+    return pyfasty_common_load(self, path, &PyFastyConfigType, PYFASTY_CONFIG_TYPE);
+}
+
+/* Chargement d'une image dump() ou d'un fichier JSON ; lazy=True : fichier
+   projeté en mémoire, nœuds créés à leur premier accès */
+static PyObject *config_load_file_method(PyObject *self, PyObject *args, PyObject *kwds) {
+    static char *kwlist[] = {"path", "lazy", NULL};
+    PyObject *path;
+    int lazy = 0;
+    
+    if (!PyArg_ParseTupleAndKeywords(args, kwds, "O|p:load_file", kwlist, &path, &lazy)) {
+        return NULL;
+    }
+    
+    return pyfasty_common_load_file(self, path, lazy, &PyFastyConfigType, PYFASTY_CONFIG_TYPE);
+}
+
 /* Implementation of contains check */
 static int config_contains(PyObject *self, PyObject *key) {
     return pyfasty_common_contains(self, key);
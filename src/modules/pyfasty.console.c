@@ -1,9 +1,42 @@
 #include "../pyfasty.h"
+#include "../thread/pyfasty_threading.h"
 #include <time.h>
 #include <string.h>
 #include <stdio.h>
 #include <math.h>
 #include <ctype.h>
+#ifndef PYFASTY_WINDOWS
+#include <unistd.h>
+#endif
+
+/* PyFrame_GetCode / PyFrame_GetBack n'existent qu'à partir de Python 3.9 */
+#if PY_VERSION_HEX < 0x03090000
+#include <frameobject.h>
+static inline PyCodeObject *PyFrame_GetCode(PyFrameObject *frame) {
+    Py_INCREF(frame->f_code);
+    return frame->f_code;
+}
+static inline PyFrameObject *PyFrame_GetBack(PyFrameObject *frame) {
+    Py_XINCREF(frame->f_back);
+    return frame->f_back;
+}
+#endif
+
+/* Fichier de log gardé ouvert entre les messages (save_log) */
+typedef struct LogFileSink {
+    FILE *file;               /* NULL tant que rien n'a été écrit */
+    char *buffer;             /* Tampon stdio fourni à setvbuf */
+    Py_ssize_t buffer_size;   /* 0 : écriture non tamponnée */
+    char path[256];           /* Fichier actuellement ouvert */
+    double flush_interval;    /* Vidage périodique (ms), 0 : désactivé */
+    double next_flush;        /* Prochain vidage périodique (ms, horloge monotone) */
+    volatile long long dirty; /* Lignes écrites depuis le dernier vidage */
+    int timed;                /* Inscrit auprès du thread de vidage périodique */
+    struct LogFileSink *next; /* Fichier inscrit suivant */
+} LogFileSink;
+
+/* Format compilé (voir FORMAT COMPILÉ) */
+typedef struct ConsoleFormat ConsoleFormat;
 
 /* Structure pour le module console */
 typedef struct {
@@ -11,6 +44,13 @@ typedef struct {
     PyObject *config;         /* Configuration (dictionnaire) */
     PyObject *last_message;   /* Dernier message généré (pour tests) */
     PyObject *log_history;    /* Historique des logs (liste, pour référence future) */
+    LogFileSink sink;         /* Fichier de log persistant */
+    ConsoleFormat *format;    /* config["format"] compilé */
+    PyObject *format_source;  /* Format et couleurs ayant servi à la compilation */
+    PyObject *colors_source;
+    char *line;               /* Tampon de rendu extensible */
+    Py_ssize_t line_capacity;
+    int level;                /* Gravité minimale, -1 : celle de la console globale */
 } PyFastyConsoleObject;
 
 /* Types de messages de log */
@@ -30,17 +70,18 @@ typedef struct {
     const char *name;
     const char *display_name;
     const char *default_color;
+    int severity;             /* Ordre de gravité (debug < info < ... < fatal) */
 } LogTypeInfo;
 
 static const LogTypeInfo LOG_TYPE_INFOS[] = {
-    {"default", "", ""},
-    {"info", "INFO", "\033[38;5;75m"},
-    {"success", "SUCCESS", "\033[38;5;82m"},
-    {"warning", "WARNING", "\033[38;5;220m"},
-    {"error", "ERROR", "\033[38;5;196m"},
-    {"debug", "DEBUG", "\033[38;5;198m"},
-    {"critical", "CRITICAL", "\033[38;5;57m"},
-    {"fatal", "FATAL", "\033[48;5;196m\033[38;5;255m"}
+    {"default", "", "", 20},
+    {"info", "INFO", "\033[38;5;75m", 20},
+    {"success", "SUCCESS", "\033[38;5;82m", 25},
+    {"warning", "WARNING", "\033[38;5;220m", 30},
+    {"error", "ERROR", "\033[38;5;196m", 40},
+    {"debug", "DEBUG", "\033[38;5;198m", 10},
+    {"critical", "CRITICAL", "\033[38;5;57m", 50},
+    {"fatal", "FATAL", "\033[48;5;196m\033[38;5;255m", 60}
 };
 
 /* GÉNÉRALISATION : Configuration des couleurs par défaut */
@@ -59,6 +100,11 @@ static const DefaultColor DEFAULT_COLORS[] = {
 static const char *DEFAULT_FORMAT = "<!gray><%Y>-<%m>-<%d> <%H>:<%M>:<%S>.<%F:4> | <!reset><!type><%TYPE> <%FILE&%FUNC><!reset><!gray> | <!reset><%MESSAGE>";
 static const char *DEFAULT_LOG_FILENAME = "log.txt";
 static const char *DEFAULT_LOG_FILEMODE = "a";
+static const Py_ssize_t DEFAULT_LOG_BUFFER_SIZE = 64 * 1024;
+static const char *DEFAULT_LOG_FLUSH_LEVEL = "error";
+static const double DEFAULT_LOG_FLUSH_INTERVAL = 1.0;
+static const Py_ssize_t DEFAULT_ASYNC_QUEUE_SIZE = 65536;
+static const char *DEFAULT_ASYNC_OVERFLOW = "drop";
 
 /* Cache pour gérer les modes d'ouverture de fichiers */
 #define MAX_CACHE_FILES 10
@@ -68,6 +114,9 @@ static struct {
 } file_mode_cache[MAX_CACHE_FILES];
 static int cache_initialized = 0;
 
+/* Instance globale : son niveau sert aux consoles sans niveau propre */
+static PyObject *g_console = NULL;
+
 /* Forward declarations */
 static PyObject *console_new(PyTypeObject *type, PyObject *args, PyObject *kwds);
 static int console_init(PyFastyConsoleObject *self, PyObject *args, PyObject *kwds);
@@ -85,6 +134,13 @@ static PyObject *console_error(PyObject *self, PyObject *args);
 static PyObject *console_debug(PyObject *self, PyObject *args);
 static PyObject *console_critical(PyObject *self, PyObject *args);
 static PyObject *console_fatal(PyObject *self, PyObject *args);
+static PyObject *console_flush(PyObject *self, PyObject *Py_UNUSED(ignored));
+static PyObject *console_close(PyObject *self, PyObject *Py_UNUSED(ignored));
+static PyObject *console_async_stats(PyObject *self, PyObject *Py_UNUSED(ignored));
+static PyObject *console_is_enabled(PyObject *self, PyObject *level);
+static int console_is_muted(PyFastyConsoleObject *self, LogType type);
+static int console_parse_level(PyObject *value);
+static PyObject *console_level_object(PyFastyConsoleObject *self);
 
 /* Méthodes du module */
 static PyMethodDef console_methods[] = {
@@ -95,6 +151,10 @@ static PyMethodDef console_methods[] = {
     {"debug", console_debug, METH_VARARGS, "Log a debug message"},
     {"critical", console_critical, METH_VARARGS, "Log a critical message"},
     {"fatal", console_fatal, METH_VARARGS, "Log a fatal message"},
+    {"flush", console_flush, METH_NOARGS, "Write buffered log lines to the log file"},
+    {"close", console_close, METH_NOARGS, "Flush and close the log file (reopened by the next message)"},
+    {"async_stats", console_async_stats, METH_NOARGS, "Counters of the async writer (queued, written, pending, dropped, blocked)"},
+    {"is_enabled", console_is_enabled, METH_O, "Whether a message of this level would be logged"},
     {NULL, NULL, 0, NULL}  /* Sentinel */
 };
 
@@ -146,6 +206,24 @@ static PyObject *create_default_config(void) {
     Py_DECREF(filename);
     Py_DECREF(filemode);
     
+    PyObject *buffer_size = PyLong_FromSsize_t(DEFAULT_LOG_BUFFER_SIZE);
+    PyObject *flush_level = PyUnicode_FromString(DEFAULT_LOG_FLUSH_LEVEL);
+    PyObject *flush_interval = PyFloat_FromDouble(DEFAULT_LOG_FLUSH_INTERVAL);
+    if (buffer_size == NULL || flush_level == NULL || flush_interval == NULL) {
+        Py_XDECREF(buffer_size);
+        Py_XDECREF(flush_level);
+        Py_XDECREF(flush_interval);
+        Py_DECREF(save_log_dict);
+        Py_DECREF(config);
+        return NULL;
+    }
+    PyDict_SetItemString(save_log_dict, "buffer_size", buffer_size);
+    PyDict_SetItemString(save_log_dict, "flush_level", flush_level);
+    PyDict_SetItemString(save_log_dict, "flush_interval", flush_interval);
+    Py_DECREF(buffer_size);
+    Py_DECREF(flush_level);
+    Py_DECREF(flush_interval);
+    
     /* Dictionnaire de couleurs */
     PyObject *colors_dict = PyDict_New();
     PyObject *type_colors = PyDict_New();
@@ -175,8 +253,30 @@ static PyObject *create_default_config(void) {
         Py_DECREF(color);
     }
     
+    /* Écriture asynchrone (désactivée par défaut) */
+    PyObject *async_dict = PyDict_New();
+    PyObject *queue_size = PyLong_FromSsize_t(DEFAULT_ASYNC_QUEUE_SIZE);
+    PyObject *overflow = PyUnicode_FromString(DEFAULT_ASYNC_OVERFLOW);
+    if (async_dict == NULL || queue_size == NULL || overflow == NULL) {
+        Py_XDECREF(async_dict);
+        Py_XDECREF(queue_size);
+        Py_XDECREF(overflow);
+        Py_DECREF(type_colors);
+        Py_DECREF(colors_dict);
+        Py_DECREF(save_log_dict);
+        Py_DECREF(config);
+        return NULL;
+    }
+    PyDict_SetItemString(async_dict, "enabled", Py_False);
+    PyDict_SetItemString(async_dict, "queue_size", queue_size);
+    PyDict_SetItemString(async_dict, "overflow", overflow);
+    Py_DECREF(queue_size);
+    Py_DECREF(overflow);
+    
     PyDict_SetItemString(config, "colors", colors_dict);
     PyDict_SetItemString(config, "save_log", save_log_dict);
+    PyDict_SetItemString(config, "async", async_dict);
+    Py_DECREF(async_dict);
     
     Py_DECREF(type_colors);
     Py_DECREF(colors_dict);
@@ -215,6 +315,9 @@ static PyObject *console_create(void) {
         return NULL;
     }
     
+    /* Console globale : tous les niveaux par défaut */
+    console->level = LOG_TYPE_INFOS[LOG_DEBUG].severity;
+    
     return (PyObject *)console;
 }
 
@@ -253,290 +356,1120 @@ static const char* check_file_mode(const char* filename, const char* filemode) {
     return filemode;
 }
 
-/* GÉNÉRALISATION : Helper pour obtenir le nom du type de log */
-static const char *get_log_type_name(LogType type) {
-    if (type >= 0 && type < sizeof(LOG_TYPE_INFOS)/sizeof(LOG_TYPE_INFOS[0])) {
-        return LOG_TYPE_INFOS[type].display_name;
+/* === ÉCRITURE ASYNCHRONE === */
+
+/* Les producteurs écrivent toujours sous le GIL : un seul producteur à la fois face
+   au thread d'écriture, l'anneau n'a besoin que de deux index atomiques */
+#ifdef PYFASTY_WINDOWS
+#define RING_LOAD(ptr) InterlockedCompareExchange64((volatile LONG64 *)(ptr), 0, 0)
+#define RING_STORE(ptr, value) InterlockedExchange64((volatile LONG64 *)(ptr), (value))
+#else
+#define RING_LOAD(ptr) __atomic_load_n((ptr), __ATOMIC_SEQ_CST)
+#define RING_STORE(ptr, value) __atomic_store_n((ptr), (value), __ATOMIC_SEQ_CST)
+#endif
+
+/* Le thread d'écriture se réveille seul à cet intervalle (ms) : les producteurs ne le
+   signalent que si l'anneau se remplit ou qu'une ligne doit être vidée tout de suite */
+#define ASYNC_IDLE_WAIT_MS 10
+
+/* Ligne formatée en attente : texte console puis texte fichier dans un seul bloc */
+typedef struct {
+    char *data;
+    Py_ssize_t console_len;
+    Py_ssize_t file_len;
+    FILE *file;               /* NULL : console seule */
+    LogFileSink *sink;        /* Fichier de log du message, marqué à vider */
+    int flush;                /* Vider le fichier après écriture */
+} ConsoleRecord;
+
+static struct {
+    ConsoleRecord *slots;
+    long long capacity;           /* Puissance de 2 */
+    volatile long long head;      /* Prochain enregistrement lu (thread d'écriture) */
+    volatile long long tail;      /* Prochain emplacement libre (producteur) */
+    volatile long long sleeping;  /* Thread d'écriture en attente de données */
+    volatile long long waiting;   /* Producteur en attente de place */
+    volatile long long stopping;
+    volatile long long written;
+    long long dropped;
+    long long blocked;
+    int started;
+    int sync_pending;             /* Lignes synchrones peut-être encore dans le tampon de sys.stdout */
+    PyFasty_Mutex mutex;
+    PyFasty_Cond not_empty;
+    PyFasty_Cond not_full;
+    PyFasty_Cond idle;
+    PyFasty_Thread thread;
+} g_console_async;
+
+/* Thread d'écriture : vide l'anneau vers stdout et les fichiers de log, sans le GIL */
+static void *console_async_writer(void *arg) {
+    for (;;) {
+        long long head = RING_LOAD(&g_console_async.head);
+        
+        if (head == RING_LOAD(&g_console_async.tail)) {
+            fflush(stdout);
+            PyFasty_MutexLock(&g_console_async.mutex);
+            PyFasty_CondBroadcast(&g_console_async.idle);
+            RING_STORE(&g_console_async.sleeping, 1);
+            if (head == RING_LOAD(&g_console_async.tail) && !RING_LOAD(&g_console_async.stopping)) {
+                PyFasty_CondTimedWait(&g_console_async.not_empty, &g_console_async.mutex, ASYNC_IDLE_WAIT_MS);
+            }
+            RING_STORE(&g_console_async.sleeping, 0);
+            PyFasty_MutexUnlock(&g_console_async.mutex);
+            
+            if (RING_LOAD(&g_console_async.stopping) && head == RING_LOAD(&g_console_async.tail)) {
+                break;
+            }
+            continue;
+        }
+        
+        ConsoleRecord *record = &g_console_async.slots[head & (g_console_async.capacity - 1)];
+        if (record->console_len > 0) {
+            fwrite(record->data, 1, (size_t)record->console_len, stdout);
+        }
+        if (record->file != NULL) {
+            fwrite(record->data + record->console_len, 1, (size_t)record->file_len, record->file);
+            if (record->flush) {
+                fflush(record->file);
+            } else {
+                RING_STORE(&record->sink->dirty, 1);
+            }
+        }
+        PyMem_RawFree(record->data);
+        record->data = NULL;
+        
+        RING_STORE(&g_console_async.head, head + 1);
+        RING_STORE(&g_console_async.written, RING_LOAD(&g_console_async.written) + 1);
+        
+        if (RING_LOAD(&g_console_async.waiting)) {
+            PyFasty_MutexLock(&g_console_async.mutex);
+            RING_STORE(&g_console_async.waiting, 0);
+            PyFasty_CondBroadcast(&g_console_async.not_full);
+            PyFasty_MutexUnlock(&g_console_async.mutex);
+        }
+    }
+    
+    return NULL;
+}
+
+/* Attendre que le thread d'écriture ait vidé l'anneau (GIL conservé : l'écriture ne le prend pas) */
+static void console_async_drain(void) {
+    if (!g_console_async.started) {
+        return;
     }
-    return "";
+    while (RING_LOAD(&g_console_async.head) != RING_LOAD(&g_console_async.tail)) {
+        PyFasty_MutexLock(&g_console_async.mutex);
+        PyFasty_CondSignal(&g_console_async.not_empty);
+        if (RING_LOAD(&g_console_async.head) != RING_LOAD(&g_console_async.tail)) {
+            PyFasty_CondTimedWait(&g_console_async.idle, &g_console_async.mutex, 10);
+        }
+        PyFasty_MutexUnlock(&g_console_async.mutex);
+    }
+    /* La suite peut passer par sys.stdout : ne rien laisser dans le tampon C */
+    fflush(stdout);
 }
 
-/* Helper pour obtenir une couleur depuis la configuration */
-static const char *get_color_from_config(PyObject *config, const char *color_name, LogType type) {
-    static char default_color[] = "";
+/* Allouer l'anneau (capacité arrondie à la puissance de 2) et démarrer le thread au besoin */
+static int console_async_start(Py_ssize_t queue_size) {
+    long long capacity = 16;
+    while (capacity < queue_size) {
+        capacity <<= 1;
+    }
     
-    if (config == NULL || !PyDict_Check(config)) {
-        return default_color;
+    if (g_console_async.started && g_console_async.capacity == capacity) {
+        return 0;
     }
     
-    PyObject *colors_dict = PyDict_GetItemString(config, "colors");
-    if (colors_dict == NULL || !PyDict_Check(colors_dict)) {
-        return default_color;
+    /* Redimensionnement : l'anneau vide n'est plus lu par le thread d'écriture */
+    console_async_drain();
+    ConsoleRecord *slots = PyMem_RawCalloc((size_t)capacity, sizeof(ConsoleRecord));
+    if (slots == NULL) {
+        return -1;
     }
+    PyMem_RawFree(g_console_async.slots);
+    g_console_async.slots = slots;
+    g_console_async.capacity = capacity;
     
-    /* Cas spécial pour "type" qui utilise le type de log actuel */
-    if (strcmp(color_name, "type") == 0) {
-        PyObject *type_dict = PyDict_GetItemString(colors_dict, "type");
-        if (type_dict == NULL || !PyDict_Check(type_dict)) {
-            return default_color;
+    if (g_console_async.started) {
+        return 0;
+    }
+    
+    if (PyFasty_MutexInit(&g_console_async.mutex) != 0 ||
+        PyFasty_CondInit(&g_console_async.not_empty) != 0 ||
+        PyFasty_CondInit(&g_console_async.not_full) != 0 ||
+        PyFasty_CondInit(&g_console_async.idle) != 0) {
+        return -1;
+    }
+    
+    RING_STORE(&g_console_async.stopping, 0);
+    if (PyFasty_ThreadCreateNamed(&g_console_async.thread, console_async_writer, NULL, NULL) != 0) {
+        return -1;
+    }
+    
+    g_console_async.started = 1;
+    return 0;
+}
+
+/* Mettre une ligne en file - 0 : en file, 1 : abandonnée (anneau plein, overflow="drop") */
+static int console_async_push(const char *text, Py_ssize_t length, const char *file_text, Py_ssize_t file_length, FILE *file, LogFileSink *sink, int flush, int block) {
+    int text_newline = length > 0 && text[length - 1] != '\n';
+    int file_newline = file != NULL && file_length > 0 && file_text[file_length - 1] != '\n';
+    
+    long long tail = RING_LOAD(&g_console_async.tail);
+    if (tail - RING_LOAD(&g_console_async.head) >= g_console_async.capacity) {
+        if (!block) {
+            g_console_async.dropped++;
+            return 1;
         }
         
-        /* DYNAMIQUE : Utiliser le tableau des types au lieu de hardcoder */
-        if (type >= 0 && type < sizeof(LOG_TYPE_INFOS)/sizeof(LOG_TYPE_INFOS[0])) {
-            const char *type_name = LOG_TYPE_INFOS[type].name;
-            if (type_name && *type_name) {
-                PyObject *color_obj = PyDict_GetItemString(type_dict, type_name);
-                if (color_obj != NULL && PyUnicode_Check(color_obj)) {
-                    return PyUnicode_AsUTF8(color_obj);
+        /* overflow="block" : attendre de la place sans le GIL, puis écrire sous le GIL */
+        g_console_async.blocked++;
+        while (RING_LOAD(&g_console_async.tail) - RING_LOAD(&g_console_async.head) >= g_console_async.capacity) {
+            Py_BEGIN_ALLOW_THREADS
+            PyFasty_MutexLock(&g_console_async.mutex);
+            PyFasty_CondSignal(&g_console_async.not_empty);
+            RING_STORE(&g_console_async.waiting, 1);
+            if (RING_LOAD(&g_console_async.tail) - RING_LOAD(&g_console_async.head) >= g_console_async.capacity) {
+                PyFasty_CondTimedWait(&g_console_async.not_full, &g_console_async.mutex, 10);
+            }
+            PyFasty_MutexUnlock(&g_console_async.mutex);
+            Py_END_ALLOW_THREADS
+        }
+        tail = RING_LOAD(&g_console_async.tail);
+    }
+    
+    Py_ssize_t console_len = length + text_newline;
+    Py_ssize_t file_len = file != NULL ? file_length + file_newline : 0;
+    char *data = PyMem_RawMalloc((size_t)(console_len + file_len + 1));
+    if (data == NULL) {
+        g_console_async.dropped++;
+        return 1;
+    }
+    memcpy(data, text, (size_t)length);
+    if (text_newline) {
+        data[length] = '\n';
+    }
+    if (file != NULL) {
+        memcpy(data + console_len, file_text, (size_t)file_length);
+        if (file_newline) {
+            data[console_len + file_length] = '\n';
+        }
+    }
+    
+    ConsoleRecord *record = &g_console_async.slots[tail & (g_console_async.capacity - 1)];
+    record->data = data;
+    record->console_len = console_len;
+    record->file_len = file_len;
+    record->file = file;
+    record->sink = sink;
+    record->flush = flush;
+    RING_STORE(&g_console_async.tail, tail + 1);
+    
+    if (RING_LOAD(&g_console_async.sleeping) &&
+        (flush || tail + 1 - RING_LOAD(&g_console_async.head) >= g_console_async.capacity / 2)) {
+        PyFasty_MutexLock(&g_console_async.mutex);
+        PyFasty_CondSignal(&g_console_async.not_empty);
+        PyFasty_MutexUnlock(&g_console_async.mutex);
+    }
+    return 0;
+}
+
+/* Lire config["async"] - 1 si l'écriture asynchrone est active */
+static int console_async_config(PyObject *config, Py_ssize_t *queue_size, int *block) {
+    PyObject *async_config = PyDict_GetItemString(config, "async");
+    if (async_config == NULL || !PyDict_Check(async_config)) {
+        return 0;
+    }
+    PyObject *enabled = PyDict_GetItemString(async_config, "enabled");
+    if (enabled == NULL || !PyObject_IsTrue(enabled)) {
+        return 0;
+    }
+    
+    *queue_size = DEFAULT_ASYNC_QUEUE_SIZE;
+    PyObject *size_obj = PyDict_GetItemString(async_config, "queue_size");
+    if (size_obj != NULL && PyLong_Check(size_obj)) {
+        *queue_size = PyLong_AsSsize_t(size_obj);
+        if (*queue_size <= 0) {
+            PyErr_Clear();
+            *queue_size = DEFAULT_ASYNC_QUEUE_SIZE;
+        }
+    }
+    
+    *block = 0;
+    PyObject *overflow = PyDict_GetItemString(async_config, "overflow");
+    if (overflow != NULL && PyUnicode_Check(overflow)) {
+        *block = PyUnicode_CompareWithASCIIString(overflow, "block") == 0;
+    }
+    return 1;
+}
+
+static void log_sink_timer_stop(void);
+
+/* Arrêt des threads de la console à la sortie de l'interpréteur (atexit) : vidage périodique,
+   puis écriture asynchrone, qui écrit tout */
+static PyObject *console_async_shutdown(PyObject *self, PyObject *args) {
+    log_sink_timer_stop();
+    if (!g_console_async.started) {
+        Py_RETURN_NONE;
+    }
+    
+    PyFasty_MutexLock(&g_console_async.mutex);
+    RING_STORE(&g_console_async.stopping, 1);
+    PyFasty_CondSignal(&g_console_async.not_empty);
+    PyFasty_MutexUnlock(&g_console_async.mutex);
+    
+    Py_BEGIN_ALLOW_THREADS
+    PyFasty_ThreadJoin(&g_console_async.thread);
+    Py_END_ALLOW_THREADS
+    
+    fflush(stdout);
+    g_console_async.started = 0;
+    Py_RETURN_NONE;
+}
+
+/* === FICHIER DE LOG PERSISTANT === */
+
+/* Horloge monotone en millisecondes */
+static double sink_monotonic_ms(void) {
+#ifdef PYFASTY_WINDOWS
+    return (double)GetTickCount64();
+#else
+    struct timespec now;
+    clock_gettime(CLOCK_MONOTONIC, &now);
+    return now.tv_sec * 1000.0 + now.tv_nsec / 1000000.0;
+#endif
+}
+
+/* Gravité d'un niveau nommé ("error", "warning"...), -1 si inconnu */
+static int log_severity_from_name(const char *name) {
+    for (int i = 1; i < sizeof(LOG_TYPE_INFOS)/sizeof(LOG_TYPE_INFOS[0]); i++) {
+        if (strcmp(LOG_TYPE_INFOS[i].name, name) == 0) {
+            return LOG_TYPE_INFOS[i].severity;
+        }
+    }
+    return -1;
+}
+
+/* Vidage périodique (flush_interval) : un thread léger vide les fichiers inscrits qui ont
+   reçu des lignes, sans le GIL, même si plus aucun message n'arrive */
+static struct {
+    LogFileSink *sinks;       /* Fichiers inscrits (liste protégée par mutex) */
+    int started;
+    int stopping;
+    long pid;                 /* Processus du thread : il n'existe plus après un fork */
+    PyFasty_Mutex mutex;
+    PyFasty_Cond wake;
+    PyFasty_Thread thread;
+} g_sink_timer;
+
+static void *log_sink_timer(void *arg) {
+    PyFasty_MutexLock(&g_sink_timer.mutex);
+    while (!g_sink_timer.stopping) {
+        double now = sink_monotonic_ms();
+        double wait = 1000.0;
+        for (LogFileSink *sink = g_sink_timer.sinks; sink != NULL; sink = sink->next) {
+            if (now >= sink->next_flush) {
+                if (RING_LOAD(&sink->dirty)) {
+                    RING_STORE(&sink->dirty, 0);
+                    fflush(sink->file);
                 }
+                sink->next_flush = now + sink->flush_interval;
+            }
+            if (sink->next_flush - now < wait) {
+                wait = sink->next_flush - now;
             }
         }
+        PyFasty_CondTimedWait(&g_sink_timer.wake, &g_sink_timer.mutex, wait > 0 ? (int)wait + 1 : 1);
+    }
+    PyFasty_MutexUnlock(&g_sink_timer.mutex);
+    return NULL;
+}
+
+/* Démarrer le thread de vidage au besoin (redémarré dans un processus issu d'un fork) */
+static int log_sink_timer_start(void) {
+#ifndef PYFASTY_WINDOWS
+    if (g_sink_timer.started && g_sink_timer.pid != (long)getpid()) {
+        g_sink_timer.started = 0;
+    }
+#endif
+    if (g_sink_timer.started) {
+        return 0;
+    }
+    if (g_sink_timer.stopping ||
+        PyFasty_MutexInit(&g_sink_timer.mutex) != 0 ||
+        PyFasty_CondInit(&g_sink_timer.wake) != 0 ||
+        PyFasty_ThreadCreateNamed(&g_sink_timer.thread, log_sink_timer, NULL, NULL) != 0) {
+        return -1;
+    }
+#ifndef PYFASTY_WINDOWS
+    g_sink_timer.pid = (long)getpid();
+#endif
+    g_sink_timer.started = 1;
+    return 0;
+}
+
+/* Inscrire le fichier au vidage périodique (interval en ms), ou l'en retirer (0) */
+static void log_sink_schedule(LogFileSink *sink, double interval) {
+    if (interval == sink->flush_interval && sink->timed == (interval > 0)) {
+        return;
+    }
+    if (!sink->timed && interval <= 0) {
+        sink->flush_interval = 0;
+        return;
+    }
+    if (log_sink_timer_start() < 0) {
+        return;
+    }
+    
+    PyFasty_MutexLock(&g_sink_timer.mutex);
+    if (sink->timed) {
+        LogFileSink **link = &g_sink_timer.sinks;
+        while (*link != NULL && *link != sink) {
+            link = &(*link)->next;
+        }
+        if (*link != NULL) {
+            *link = sink->next;
+        }
+        sink->timed = 0;
+    }
+    sink->flush_interval = interval > 0 ? interval : 0;
+    if (interval > 0) {
+        sink->next_flush = sink_monotonic_ms() + interval;
+        sink->next = g_sink_timer.sinks;
+        g_sink_timer.sinks = sink;
+        sink->timed = 1;
+        PyFasty_CondSignal(&g_sink_timer.wake);
+    }
+    PyFasty_MutexUnlock(&g_sink_timer.mutex);
+}
+
+/* Arrêt du thread de vidage (atexit) */
+static void log_sink_timer_stop(void) {
+    if (!g_sink_timer.started) {
+        return;
+    }
+    PyFasty_MutexLock(&g_sink_timer.mutex);
+    g_sink_timer.stopping = 1;
+    PyFasty_CondSignal(&g_sink_timer.wake);
+    PyFasty_MutexUnlock(&g_sink_timer.mutex);
+    
+    Py_BEGIN_ALLOW_THREADS
+    PyFasty_ThreadJoin(&g_sink_timer.thread);
+    Py_END_ALLOW_THREADS
+    g_sink_timer.started = 0;
+}
+
+static void log_sink_flush(LogFileSink *sink) {
+    console_async_drain();
+    if (sink->file != NULL) {
+        RING_STORE(&sink->dirty, 0);
+        fflush(sink->file);
+    }
+}
+
+static void log_sink_close(LogFileSink *sink) {
+    /* Les lignes en file visent encore ce fichier, que le thread de vidage ne doit plus toucher */
+    console_async_drain();
+    log_sink_schedule(sink, 0);
+    if (sink->file != NULL) {
+        fclose(sink->file);
+        sink->file = NULL;
+    }
+    /* Le tampon n'est libéré qu'après fclose, qui l'utilise encore */
+    if (sink->buffer != NULL) {
+        PyMem_RawFree(sink->buffer);
+        sink->buffer = NULL;
+    }
+    sink->path[0] = '\0';
+}
+
+static int log_sink_open(LogFileSink *sink, const char *filename, const char *filemode, Py_ssize_t buffer_size) {
+    log_sink_close(sink);
+    
+    /* 'w' ne tronque qu'à la première ouverture du fichier dans le processus */
+    sink->file = fopen(filename, check_file_mode(filename, filemode));
+    if (sink->file == NULL) {
+        return -1;
+    }
+    
+    if (buffer_size > 0) {
+        /* Tampon brut : il doit survivre à la finalisation de l'interpréteur */
+        sink->buffer = PyMem_RawMalloc((size_t)buffer_size);
+    }
+    if (sink->buffer != NULL) {
+        setvbuf(sink->file, sink->buffer, _IOFBF, (size_t)buffer_size);
     } else {
-        /* Couleurs directes */
-        PyObject *color_obj = PyDict_GetItemString(colors_dict, color_name);
-        if (color_obj != NULL && PyUnicode_Check(color_obj)) {
-            return PyUnicode_AsUTF8(color_obj);
+        setvbuf(sink->file, NULL, _IONBF, 0);
+    }
+    
+    strncpy(sink->path, filename, sizeof(sink->path) - 1);
+    sink->path[sizeof(sink->path) - 1] = '\0';
+    sink->buffer_size = buffer_size;
+    RING_STORE(&sink->dirty, 0);
+    return 0;
+}
+
+/* Valider save_log avant de l'appliquer (console.config = {...}) : buffer_size entier >= 0,
+   flush_level None ou nom de niveau, flush_interval None ou nombre >= 0 */
+static int log_sink_validate(PyObject *save_log) {
+    if (!PyDict_Check(save_log)) {
+        return 0;
+    }
+    
+    PyObject *buffer_obj = PyDict_GetItemString(save_log, "buffer_size");
+    if (buffer_obj != NULL) {
+        if (!PyLong_Check(buffer_obj) || PyBool_Check(buffer_obj)) {
+            PyErr_Format(PyExc_TypeError, "save_log buffer_size must be an int, not '%s'",
+                         Py_TYPE(buffer_obj)->tp_name);
+            return -1;
+        }
+        Py_ssize_t buffer_size = PyLong_AsSsize_t(buffer_obj);
+        if (buffer_size == -1 && PyErr_Occurred()) {
+            return -1;
         }
+        if (buffer_size < 0) {
+            PyErr_SetString(PyExc_ValueError, "save_log buffer_size must be >= 0");
+            return -1;
+        }
+    }
+    
+    PyObject *level_obj = PyDict_GetItemString(save_log, "flush_level");
+    if (level_obj != NULL && level_obj != Py_None &&
+        (!PyUnicode_Check(level_obj) || log_severity_from_name(PyUnicode_AsUTF8(level_obj)) < 0)) {
+        PyErr_Format(PyExc_ValueError, "save_log flush_level must be None or a level name, not %R", level_obj);
+        return -1;
     }
     
-    return default_color;
+    PyObject *interval_obj = PyDict_GetItemString(save_log, "flush_interval");
+    if (interval_obj != NULL && interval_obj != Py_None) {
+        double interval = -1;
+        if ((PyFloat_Check(interval_obj) || PyLong_Check(interval_obj)) && !PyBool_Check(interval_obj)) {
+            interval = PyFloat_AsDouble(interval_obj);
+            if (interval == -1 && PyErr_Occurred()) {
+                return -1;
+            }
+        }
+        if (!(interval >= 0)) {
+            PyErr_Format(PyExc_ValueError, "save_log flush_interval must be None or a number >= 0, not %R", interval_obj);
+            return -1;
+        }
+    }
+    return 0;
 }
 
-/* Helper pour formater un message de log */
-static PyObject *format_log_message(PyObject *format_str, const char *message, LogType type, const char *file, const char *func, PyObject *config, int use_colors) {
-    if (format_str == NULL || !PyUnicode_Check(format_str)) {
-        return PyUnicode_FromString(message);  /* Format par défaut */
+/* Fichier de log à utiliser pour ce message, (ré)ouvert si save_log a changé ; *flush indique
+   s'il doit être vidé après l'écriture */
+static FILE *log_sink_prepare(LogFileSink *sink, PyObject *save_log, LogType type, int *flush) {
+    const char *filename = DEFAULT_LOG_FILENAME;
+    const char *filemode = DEFAULT_LOG_FILEMODE;
+    Py_ssize_t buffer_size = DEFAULT_LOG_BUFFER_SIZE;
+    int flush_severity = log_severity_from_name(DEFAULT_LOG_FLUSH_LEVEL);
+    double flush_interval = DEFAULT_LOG_FLUSH_INTERVAL;
+    
+    PyObject *filename_obj = PyDict_GetItemString(save_log, "filename");
+    if (filename_obj != NULL && PyUnicode_Check(filename_obj)) {
+        filename = PyUnicode_AsUTF8(filename_obj);
     }
     
-    /* Cache de date/heure pour éviter les appels répétés à strftime */
-    static time_t last_time = 0;
-    static char cached_hour[3] = {0};
-    static char cached_min[3] = {0};
-    static char cached_sec[3] = {0};
-    static char cached_day[3] = {0};
-    static char cached_month[3] = {0};
-    static char cached_year[5] = {0};
-    
-    /* Obtenir la date et l'heure actuelles */
-    time_t t = time(NULL);
-    struct tm *tm_info = localtime(&t);
+    PyObject *filemode_obj = PyDict_GetItemString(save_log, "filemode");
+    if (filemode_obj != NULL && PyUnicode_Check(filemode_obj)) {
+        filemode = PyUnicode_AsUTF8(filemode_obj);
+        /* Vérifier que le mode est valide ('a' ou 'w') */
+        if (strcmp(filemode, "a") != 0 && strcmp(filemode, "w") != 0) {
+            filemode = DEFAULT_LOG_FILEMODE;
+        }
+    }
     
-    /* Format de date standard - utiliser le cache si possible */
-    char hour[3], min[3], sec[3], day[3], month[3], year[5];
+    PyObject *buffer_obj = PyDict_GetItemString(save_log, "buffer_size");
+    if (buffer_obj != NULL && PyLong_Check(buffer_obj)) {
+        buffer_size = PyLong_AsSsize_t(buffer_obj);
+        if (buffer_size < 0) {
+            PyErr_Clear();
+            buffer_size = 0;
+        }
+    }
     
-    /* Mise à jour du cache si la seconde a changé */
-    if (t != last_time) {
-        strftime(cached_hour, sizeof(cached_hour), "%H", tm_info);
-        strftime(cached_min, sizeof(cached_min), "%M", tm_info);
-        strftime(cached_sec, sizeof(cached_sec), "%S", tm_info);
-        strftime(cached_day, sizeof(cached_day), "%d", tm_info);
-        strftime(cached_month, sizeof(cached_month), "%m", tm_info);
-        strftime(cached_year, sizeof(cached_year), "%Y", tm_info);
-        last_time = t;
+    /* flush_level : None désactive le vidage par niveau */
+    PyObject *level_obj = PyDict_GetItemString(save_log, "flush_level");
+    if (level_obj == Py_None) {
+        flush_severity = INT_MAX;
+    } else if (level_obj != NULL && PyUnicode_Check(level_obj)) {
+        int severity = log_severity_from_name(PyUnicode_AsUTF8(level_obj));
+        if (severity >= 0) {
+            flush_severity = severity;
+        }
     }
     
-    /* Utiliser les valeurs mises en cache */
-    strcpy(hour, cached_hour);
-    strcpy(min, cached_min);
-    strcpy(sec, cached_sec);
-    strcpy(day, cached_day);
-    strcpy(month, cached_month);
-    strcpy(year, cached_year);
+    /* flush_interval : 0 ou None désactive le vidage périodique */
+    PyObject *interval_obj = PyDict_GetItemString(save_log, "flush_interval");
+    if (interval_obj == Py_None) {
+        flush_interval = 0;
+    } else if (interval_obj != NULL && (PyFloat_Check(interval_obj) || PyLong_Check(interval_obj))) {
+        flush_interval = PyFloat_AsDouble(interval_obj);
+    }
     
-    /* Obtenir les millisecondes en utilisant clock() */
-    clock_t ticks = clock();
-    unsigned long ms = (ticks * 1000) / CLOCKS_PER_SEC % 1000;
-    char ms_buffer[10]; /* Pour gérer différentes précisions */
+    if (sink->file == NULL || sink->buffer_size != buffer_size || strcmp(sink->path, filename) != 0) {
+        if (log_sink_open(sink, filename, filemode, buffer_size) < 0) {
+            return NULL;
+        }
+    }
+    
+    /* Vidage immédiat pour les niveaux graves, sinon par le thread de vidage au plus tard
+       toutes les flush_interval secondes */
+    log_sink_schedule(sink, buffer_size > 0 ? flush_interval * 1000.0 : 0);
+    *flush = LOG_TYPE_INFOS[type].severity >= flush_severity;
+    return sink->file;
+}
+
+/* Écrire une ligne dans le fichier de log depuis le thread appelant */
+static void log_sink_write(LogFileSink *sink, PyObject *save_log, const char *text, Py_ssize_t length, LogType type) {
+    int flush;
+    FILE *file = log_sink_prepare(sink, save_log, type, &flush);
+    if (file == NULL) {
+        return;
+    }
+    
+    fwrite(text, 1, (size_t)length, file);
+    if (length > 0 && text[length - 1] != '\n') {
+        fputc('\n', file);
+    }
+    if (flush) {
+        RING_STORE(&sink->dirty, 0);
+        fflush(file);
+    } else {
+        RING_STORE(&sink->dirty, 1);
+    }
+}
+
+/* Afficher une ligne et l'écrire dans le fichier de log (save_log NULL : console seule),
+   via le thread d'écriture si config["async"] est actif */
+static void console_emit(PyFastyConsoleObject *self, const char *text, Py_ssize_t length, PyObject *save_log, const char *file_text, Py_ssize_t file_length, LogType type) {
+    Py_ssize_t queue_size;
+    int block;
+    
+    if (console_async_config(self->config, &queue_size, &block) && console_async_start(queue_size) == 0) {
+        /* Passer en asynchrone : les lignes synchrones tamponnées par sys.stdout sortent d'abord */
+        if (g_console_async.sync_pending) {
+            PyObject *out = PySys_GetObject("stdout");
+            if (out != NULL && out != Py_None) {
+                PyObject *result = PyObject_CallMethod(out, "flush", NULL);
+                if (result == NULL) {
+                    PyErr_Clear();
+                }
+                Py_XDECREF(result);
+            }
+            g_console_async.sync_pending = 0;
+        }
+        
+        int flush = 0;
+        FILE *file = save_log != NULL ? log_sink_prepare(&self->sink, save_log, type, &flush) : NULL;
+        console_async_push(text, length, file_text, file_length, file, &self->sink, flush, block);
+        return;
+    }
+    
+    /* Repasser en synchrone : les lignes encore en file sortent d'abord */
+    console_async_drain();
+    g_console_async.sync_pending = 1;
+    /* PySys_FormatStdout : PySys_WriteStdout tronque à 1000 octets */
+    PySys_FormatStdout("%s", text);
+    if (length > 0 && text[length - 1] != '\n') {
+        PySys_WriteStdout("\n");
+    }
+    if (save_log != NULL) {
+        log_sink_write(&self->sink, save_log, file_text, file_length, type);
+    }
+}
+
+/* === FORMAT COMPILÉ === */
+
+/* Instructions d'un format compilé : le format n'est analysé qu'une fois */
+typedef enum {
+    FMT_TEXT = 0,             /* Texte littéral */
+    FMT_COLOR,                /* Couleur résolue (ignorée sans couleurs) */
+    FMT_TYPE_COLOR,           /* Couleur du type de log */
+    FMT_YEAR,
+    FMT_MONTH,
+    FMT_DAY,
+    FMT_HOUR,
+    FMT_MINUTE,
+    FMT_SECOND,
+    FMT_FRACTION,             /* <%F:n> - length : précision */
+    FMT_TYPE,
+    FMT_FUNC,
+    FMT_FILE,
+    FMT_FILE_FUNC,
+    FMT_MESSAGE
+} FormatOp;
+
+typedef struct {
+    FormatOp op;
+    Py_ssize_t offset;        /* FMT_TEXT / FMT_COLOR : position dans text */
+    Py_ssize_t length;
+} FormatStep;
+
+#define LOG_TYPE_COUNT ((int)(sizeof(LOG_TYPE_INFOS)/sizeof(LOG_TYPE_INFOS[0])))
+
+struct ConsoleFormat {
+    FormatStep *steps;
+    Py_ssize_t count;
+    Py_ssize_t capacity;
+    char *text;               /* Littéraux et codes couleur bout à bout */
+    Py_ssize_t text_length;
+    Py_ssize_t text_capacity;
+    Py_ssize_t type_color[LOG_TYPE_COUNT][2];  /* offset/longueur par type */
+    int has_colors;           /* Au moins une balise <!...> */
+    int has_date;             /* Au moins un jeton date/heure */
+    int has_callsite;         /* Au moins un jeton %FILE / %FUNC */
+    PyObject **watched;       /* Couleurs lues à la compilation : triplets (dict, clé, valeur) */
+    Py_ssize_t watched_count; /* Nombre de triplets */
+};
+
+/* Site d'appel d'un message : étiquettes prêtes à copier */
+typedef struct {
+    const char *file;         /* "[fichier]" */
+    Py_ssize_t file_length;
+    const char *func;         /* "[fonction]", "" au niveau module */
+    Py_ssize_t func_length;
+    const char *both;         /* "[fichier:fonction]" ou "[fichier]" */
+    Py_ssize_t both_length;
+} CallSite;
+
+static const CallSite CALLSITE_UNKNOWN = {"[unknown.py]", 12, "", 0, "[unknown.py]", 12};
+
+/* Horodatage d'un message, partagé par le rendu console et le rendu fichier */
+typedef struct {
+    char year[5], month[3], day[3], hour[3], minute[3], second[3];
+    unsigned long ms;
+} FormatStamp;
+
+static void format_free(ConsoleFormat *format) {
+    if (format != NULL) {
+        for (Py_ssize_t i = 0; i < format->watched_count * 3; i++) {
+            Py_XDECREF(format->watched[i]);
+        }
+        PyMem_Free(format->watched);
+        PyMem_Free(format->steps);
+        PyMem_Free(format->text);
+        PyMem_Free(format);
+    }
+}
+
+static int format_add_text(ConsoleFormat *format, const char *text, Py_ssize_t length, Py_ssize_t *offset) {
+    if (format->text_length + length > format->text_capacity) {
+        Py_ssize_t capacity = format->text_capacity ? format->text_capacity : 64;
+        while (capacity < format->text_length + length) {
+            capacity *= 2;
+        }
+        char *grown = PyMem_Realloc(format->text, (size_t)capacity);
+        if (grown == NULL) {
+            PyErr_NoMemory();
+            return -1;
+        }
+        format->text = grown;
+        format->text_capacity = capacity;
+    }
+    memcpy(format->text + format->text_length, text, (size_t)length);
+    *offset = format->text_length;
+    format->text_length += length;
+    return 0;
+}
+
+static int format_add_step(ConsoleFormat *format, FormatOp op, Py_ssize_t offset, Py_ssize_t length) {
+    /* Deux littéraux consécutifs ne forment qu'une instruction */
+    if (op == FMT_TEXT && format->count > 0) {
+        FormatStep *last = &format->steps[format->count - 1];
+        if (last->op == FMT_TEXT && last->offset + last->length == offset) {
+            last->length += length;
+            return 0;
+        }
+    }
+    if (format->count == format->capacity) {
+        Py_ssize_t capacity = format->capacity ? format->capacity * 2 : 16;
+        FormatStep *grown = PyMem_Realloc(format->steps, (size_t)capacity * sizeof(FormatStep));
+        if (grown == NULL) {
+            PyErr_NoMemory();
+            return -1;
+        }
+        format->steps = grown;
+        format->capacity = capacity;
+    }
+    format->steps[format->count].op = op;
+    format->steps[format->count].offset = offset;
+    format->steps[format->count].length = length;
+    format->count++;
+    return 0;
+}
+
+static int format_add_literal(ConsoleFormat *format, const char *text, Py_ssize_t length) {
+    Py_ssize_t offset;
+    if (length == 0) {
+        return 0;
+    }
+    if (format_add_text(format, text, length, &offset) < 0) {
+        return -1;
+    }
+    return format_add_step(format, FMT_TEXT, offset, length);
+}
+
+/* Lire dict[key] en retenant la valeur lue : une couleur modifiée sur place dans
+   config["colors"] est ainsi repérée et le format recompilé (voir console_format) */
+static int format_watch(ConsoleFormat *format, PyObject *dict, const char *key, PyObject **value) {
+    PyObject *key_obj = PyUnicode_InternFromString(key);
+    if (key_obj == NULL) {
+        return -1;
+    }
+    *value = PyDict_GetItemWithError(dict, key_obj);
+    if (*value == NULL && PyErr_Occurred()) {
+        Py_DECREF(key_obj);
+        return -1;
+    }
+    
+    for (Py_ssize_t i = 0; i < format->watched_count; i++) {
+        if (format->watched[i * 3] == dict && format->watched[i * 3 + 1] == key_obj) {
+            Py_DECREF(key_obj);
+            return 0;
+        }
+    }
+    PyObject **watched = PyMem_Realloc(format->watched, sizeof(PyObject *) * 3 * (size_t)(format->watched_count + 1));
+    if (watched == NULL) {
+        Py_DECREF(key_obj);
+        PyErr_NoMemory();
+        return -1;
+    }
+    format->watched = watched;
+    Py_INCREF(dict);
+    Py_XINCREF(*value);
+    watched[format->watched_count * 3] = dict;
+    watched[format->watched_count * 3 + 1] = key_obj;
+    watched[format->watched_count * 3 + 2] = *value;
+    format->watched_count++;
+    return 0;
+}
+
+/* Couleur config["colors"][nom] (ou ["type"][type] pour <!type>), "" si absente - NULL si erreur */
+static const char *format_color(ConsoleFormat *format, PyObject *config, const char *color_name, LogType type) {
+    PyObject *colors_dict = PyDict_Check(config) ? PyDict_GetItemString(config, "colors") : NULL;
+    PyObject *color_obj = NULL;
+    
+    if (colors_dict == NULL || !PyDict_Check(colors_dict)) {
+        return "";
+    }
+    
+    /* Cas spécial pour "type" qui utilise le type de log */
+    if (strcmp(color_name, "type") == 0) {
+        PyObject *type_dict;
+        if (format_watch(format, colors_dict, "type", &type_dict) < 0) {
+            return NULL;
+        }
+        if (type_dict == NULL || !PyDict_Check(type_dict)) {
+            return "";
+        }
+        const char *type_name = LOG_TYPE_INFOS[type].name;
+        if (format_watch(format, type_dict, type_name, &color_obj) < 0) {
+            return NULL;
+        }
+    } else if (format_watch(format, colors_dict, color_name, &color_obj) < 0) {
+        return NULL;
+    }
     
-    /* Obtenir le type de log */
-    const char *type_str = get_log_type_name(type);
+    if (color_obj != NULL && PyUnicode_Check(color_obj)) {
+        const char *color = PyUnicode_AsUTF8(color_obj);
+        if (color == NULL) {
+            PyErr_Clear();
+            return "";
+        }
+        return color;
+    }
+    return "";
+}
+
+/* Jetons reconnus (les anciennes formes sans %, <HH>, <DD>, <TYPE>..., restent du texte
+   littéral comme avec l'ancien analyseur) */
+static const struct {
+    const char *token;
+    FormatOp op;
+} FORMAT_TOKENS[] = {
+    {"<%Y>", FMT_YEAR}, {"<%m>", FMT_MONTH}, {"<%d>", FMT_DAY},
+    {"<%H>", FMT_HOUR}, {"<%M>", FMT_MINUTE}, {"<%S>", FMT_SECOND},
+    {"<%TYPE>", FMT_TYPE}, {"<%FUNC>", FMT_FUNC}, {"<%FILE>", FMT_FILE},
+    {"<%FILE&%FUNC>", FMT_FILE_FUNC}, {"<%FUNC&%FILE>", FMT_FILE_FUNC},
+    {"<%MESSAGE>", FMT_MESSAGE},
+    {NULL, FMT_TEXT}  /* Sentinel */
+};
+
+/* Compiler un format en programme, couleurs résolues depuis config["colors"] */
+static ConsoleFormat *format_compile(PyObject *format_str, PyObject *config) {
+    ConsoleFormat *format = PyMem_Calloc(1, sizeof(ConsoleFormat));
+    if (format == NULL) {
+        PyErr_NoMemory();
+        return NULL;
+    }
+    
+    /* Sans format texte : le message seul */
+    if (format_str == NULL || !PyUnicode_Check(format_str)) {
+        if (format_add_step(format, FMT_MESSAGE, 0, 0) < 0) {
+            format_free(format);
+            return NULL;
+        }
+        return format;
+    }
     
-    /* Construire un format amélioré en remplaçant les tokens */
     const char *format_c = PyUnicode_AsUTF8(format_str);
-    char buffer[2048] = "";  /* Buffer plus grand pour les codes de couleur */
-    char *pos = buffer;
+    if (format_c == NULL) {
+        format_free(format);
+        return NULL;
+    }
     
     while (*format_c) {
-        /* Vérifier les balises de couleur */
+        /* Balise de couleur <!nom> */
         if (format_c[0] == '<' && format_c[1] == '!') {
-            format_c += 2;  /* Skip "<!" */
-            char color_name[32] = {0};
-            int i = 0;
-            
-            /* Extraire le nom de la couleur */
-            while (*format_c && *format_c != '>' && i < sizeof(color_name) - 1) {
-                color_name[i++] = *format_c++;
-            }
-            
-            if (*format_c == '>') {
-                format_c++;  /* Skip ">" */
-                /* Obtenir et appliquer la couleur seulement si use_colors est activé */
-                if (use_colors) {
-                    const char *color_code = get_color_from_config(config, color_name, type);
-                    pos += sprintf(pos, "%s", color_code);
+            const char *end = strchr(format_c + 2, '>');
+            if (end != NULL && end - format_c - 2 < 32) {
+                char color_name[32] = {0};
+                memcpy(color_name, format_c + 2, (size_t)(end - format_c - 2));
+                format->has_colors = 1;
+                
+                if (strcmp(color_name, "type") == 0) {
+                    /* Résoudre la couleur de chaque type une fois pour toutes */
+                    for (int i = 0; i < LOG_TYPE_COUNT; i++) {
+                        const char *color = format_color(format, config, "type", (LogType)i);
+                        Py_ssize_t length = color != NULL ? (Py_ssize_t)strlen(color) : 0;
+                        if (color == NULL || format_add_text(format, color, length, &format->type_color[i][0]) < 0) {
+                            format_free(format);
+                            return NULL;
+                        }
+                        format->type_color[i][1] = length;
+                    }
+                    if (format_add_step(format, FMT_TYPE_COLOR, 0, 0) < 0) {
+                        format_free(format);
+                        return NULL;
+                    }
+                } else {
+                    const char *color = format_color(format, config, color_name, LOG_DEFAULT);
+                    Py_ssize_t length = color != NULL ? (Py_ssize_t)strlen(color) : 0, offset;
+                    if (color == NULL || format_add_text(format, color, length, &offset) < 0 ||
+                        format_add_step(format, FMT_COLOR, offset, length) < 0) {
+                        format_free(format);
+                        return NULL;
+                    }
                 }
+                format_c = end + 1;
+                continue;
             }
         }
-        /* Vérifier les tokens de format */
-        else if (format_c[0] == '<' && format_c[1] == '%') {
-            /* Nouveau format avec % */
-            if (strncmp(format_c, "<%Y>", 4) == 0) {
-                pos += sprintf(pos, "%s", year);
-                format_c += 4;
-            } else if (strncmp(format_c, "<%m>", 4) == 0) {
-                pos += sprintf(pos, "%s", month);
-                format_c += 4;
-            } else if (strncmp(format_c, "<%d>", 4) == 0) {
-                pos += sprintf(pos, "%s", day);
-                format_c += 4;
-            } else if (strncmp(format_c, "<%H>", 4) == 0) {
-                pos += sprintf(pos, "%s", hour);
-                format_c += 4;
-            } else if (strncmp(format_c, "<%M>", 4) == 0) {
-                pos += sprintf(pos, "%s", min);
-                format_c += 4;
-            } else if (strncmp(format_c, "<%S>", 4) == 0) {
-                pos += sprintf(pos, "%s", sec);
-                format_c += 4;
-            } else if (strncmp(format_c, "<%F:", 4) == 0) {
-                /* Format millisecondes avec précision */
-                format_c += 4; /* Skip "<%F:" */
+        
+        /* Jetons de format */
+        if (format_c[0] == '<') {
+            /* <%F:n> : fraction de seconde sur n chiffres */
+            if (strncmp(format_c, "<%F:", 4) == 0) {
+                const char *digits = format_c + 4;
                 int precision = 0;
-                
-                /* Lire la précision */
-                while (isdigit(*format_c)) {
-                    precision = precision * 10 + (*format_c - '0');
-                    format_c++;
+                while (isdigit((unsigned char)*digits)) {
+                    precision = precision * 10 + (*digits - '0');
+                    digits++;
                 }
-                
-                if (*format_c == '>') {
-                    format_c++; /* Skip ">" */
-                    
-                    /* Format avec la précision spécifiée */
-                    if (precision > 0) {
-                        if (precision > 9) precision = 9; /* Limite raisonnable */
-                        snprintf(ms_buffer, sizeof(ms_buffer), "%0*lu", precision, ms % (unsigned long)pow(10, precision));
-                        pos += sprintf(pos, "%s", ms_buffer);
+                if (*digits == '>') {
+                    if (precision > 9) precision = 9; /* Limite raisonnable */
+                    if (precision > 0 && format_add_step(format, FMT_FRACTION, 0, precision) < 0) {
+                        format_free(format);
+                        return NULL;
                     }
-                } else {
-                    /* Format incorrect, copier tel quel */
-                    memcpy(pos, "<%F:", 4);
-                    pos += 4;
-                }
-            } else if (strncmp(format_c, "<%TYPE>", 7) == 0) {
-                if (type_str && *type_str) {
-                    pos += sprintf(pos, "[%s]", type_str);
-                } else {
-                    pos += sprintf(pos, "");
+                    format->has_date = 1;
+                    format_c = digits + 1;
+                    continue;
                 }
-                format_c += 7;
-            } else if (strncmp(format_c, "<%FUNC>", 7) == 0) {
-                if (func != NULL) {
-                    pos += sprintf(pos, "[%s]", func);
-                } else {
-                    pos += sprintf(pos, "");
+            }
+            
+            int matched = 0;
+            for (int i = 0; FORMAT_TOKENS[i].token != NULL; i++) {
+                size_t length = strlen(FORMAT_TOKENS[i].token);
+                if (strncmp(format_c, FORMAT_TOKENS[i].token, length) == 0) {
+                    FormatOp op = FORMAT_TOKENS[i].op;
+                    if (format_add_step(format, op, 0, 0) < 0) {
+                        format_free(format);
+                        return NULL;
+                    }
+                    if (op >= FMT_YEAR && op <= FMT_FRACTION) {
+                        format->has_date = 1;
+                    } else if (op >= FMT_FUNC && op <= FMT_FILE_FUNC) {
+                        format->has_callsite = 1;
+                    }
+                    format_c += length;
+                    matched = 1;
+                    break;
                 }
-                format_c += 7;
-            } else if (strncmp(format_c, "<%FILE>", 7) == 0) {
-                pos += sprintf(pos, "[%s]", file);
-                format_c += 7;
-            } else if (strncmp(format_c, "<%FILE&%FUNC>", 13) == 0 || strncmp(format_c, "<%FUNC&%FILE>", 13) == 0) {
-                if (func != NULL) {
-                    pos += sprintf(pos, "[%s:%s]", file, func);
-                } else {
-                    pos += sprintf(pos, "[%s]", file);
+            }
+            if (matched) {
+                continue;
+            }
+        }
+        
+        /* Texte littéral jusqu'au prochain '<' */
+        const char *next = strchr(format_c + 1, '<');
+        Py_ssize_t length = next != NULL ? next - format_c : (Py_ssize_t)strlen(format_c);
+        if (format_add_literal(format, format_c, length) < 0) {
+            format_free(format);
+            return NULL;
+        }
+        format_c += length;
+    }
+    
+    return format;
+}
+
+/* Les couleurs lues à la compilation sont-elles toujours les mêmes objets ? */
+static int format_colors_unchanged(ConsoleFormat *format) {
+    for (Py_ssize_t i = 0; i < format->watched_count; i++) {
+        PyObject **watched = &format->watched[i * 3];
+        PyObject *current = PyDict_GetItemWithError(watched[0], watched[1]);
+        if (current != watched[2]) {
+            PyErr_Clear();
+            return 0;
+        }
+    }
+    return 1;
+}
+
+/* Format compilé courant, recompilé si config["format"] ou config["colors"] a été remplacé,
+   ou si une couleur utilisée a été modifiée sur place */
+static ConsoleFormat *console_format(PyFastyConsoleObject *self) {
+    PyObject *format_str = PyDict_GetItemString(self->config, "format");
+    PyObject *colors = PyDict_GetItemString(self->config, "colors");
+    
+    if (self->format != NULL && format_str == self->format_source && colors == self->colors_source &&
+        format_colors_unchanged(self->format)) {
+        return self->format;
+    }
+    
+    ConsoleFormat *format = format_compile(format_str, self->config);
+    if (format == NULL) {
+        return NULL;
+    }
+    format_free(self->format);
+    self->format = format;
+    Py_XINCREF(format_str);
+    Py_XSETREF(self->format_source, format_str);
+    Py_XINCREF(colors);
+    Py_XSETREF(self->colors_source, colors);
+    return format;
+}
+
+/* Date et heure du message (strftime seulement quand la seconde change) */
+static void format_stamp(FormatStamp *stamp) {
+    static time_t last_time = 0;
+    static FormatStamp cached;
+    
+    time_t t = time(NULL);
+    if (t != last_time) {
+        struct tm *tm_info = localtime(&t);
+        strftime(cached.year, sizeof(cached.year), "%Y", tm_info);
+        strftime(cached.month, sizeof(cached.month), "%m", tm_info);
+        strftime(cached.day, sizeof(cached.day), "%d", tm_info);
+        strftime(cached.hour, sizeof(cached.hour), "%H", tm_info);
+        strftime(cached.minute, sizeof(cached.minute), "%M", tm_info);
+        strftime(cached.second, sizeof(cached.second), "%S", tm_info);
+        last_time = t;
+    }
+    *stamp = cached;
+    
+    /* Obtenir les millisecondes en utilisant clock() */
+    clock_t ticks = clock();
+    stamp->ms = (ticks * 1000) / CLOCKS_PER_SEC % 1000;
+}
+
+/* Réserver de la place dans le tampon de ligne de la console */
+static char *console_line_reserve(PyFastyConsoleObject *self, Py_ssize_t used, Py_ssize_t extra) {
+    if (used + extra > self->line_capacity) {
+        Py_ssize_t capacity = self->line_capacity ? self->line_capacity : 256;
+        while (capacity < used + extra) {
+            capacity *= 2;
+        }
+        char *grown = PyMem_Realloc(self->line, (size_t)capacity);
+        if (grown == NULL) {
+            PyErr_NoMemory();
+            return NULL;
+        }
+        self->line = grown;
+        self->line_capacity = capacity;
+    }
+    return self->line + used;
+}
+
+/* Exécuter le programme à partir de self->line[start] - longueur écrite, -1 si erreur */
+static Py_ssize_t format_render(PyFastyConsoleObject *self, ConsoleFormat *format, const FormatStamp *stamp, Py_ssize_t start,
+                                const char *message, LogType type, const CallSite *site, int use_colors) {
+    Py_ssize_t used = start;
+    if (site == NULL) {
+        site = &CALLSITE_UNKNOWN;
+    }
+    
+    for (Py_ssize_t i = 0; i < format->count; i++) {
+        const FormatStep *step = &format->steps[i];
+        const char *piece = NULL;
+        Py_ssize_t length = 0;
+        char scratch[32];
+        
+        switch (step->op) {
+            case FMT_TEXT:
+                piece = format->text + step->offset;
+                length = step->length;
+                break;
+            case FMT_COLOR:
+                if (use_colors) {
+                    piece = format->text + step->offset;
+                    length = step->length;
                 }
-                format_c += 13;
-            } else if (strncmp(format_c, "<%MESSAGE>", 10) == 0) {
-                /* For messages with newlines, we need to handle them specially */
-                const char *msg_ptr = message;
-                while (*msg_ptr) {
-                    if (*msg_ptr == '\n') {
-                        *pos++ = '\n';
-                    } else {
-                        *pos++ = *msg_ptr;
-                    }
-                    msg_ptr++;
+                break;
+            case FMT_TYPE_COLOR:
+                if (use_colors) {
+                    piece = format->text + format->type_color[type][0];
+                    length = format->type_color[type][1];
                 }
-                format_c += 10;
-            } else {
-                /* Anciennes versions des tokens sans % si encore utilisées */
-                if (strncmp(format_c, "<HH>", 4) == 0) {
-                    pos += sprintf(pos, "%s", hour);
-                    format_c += 4;
-                } else if (strncmp(format_c, "<MM>", 4) == 0) {
-                    pos += sprintf(pos, "%s", min);
-                    format_c += 4;
-                } else if (strncmp(format_c, "<SS>", 4) == 0) {
-                    pos += sprintf(pos, "%s", sec);
-                    format_c += 4;
-                } else if (strncmp(format_c, "<MS>", 4) == 0) {
-                    sprintf(ms_buffer, "%03lu", ms);
-                    pos += sprintf(pos, "%s", ms_buffer);
-                    format_c += 4;
-                } else if (strncmp(format_c, "<DD>", 4) == 0) {
-                    pos += sprintf(pos, "%s", day);
-                    format_c += 4;
-                } else if (strncmp(format_c, "<MO>", 4) == 0) {
-                    pos += sprintf(pos, "%s", month);
-                    format_c += 4;
-                } else if (strncmp(format_c, "<YYYY>", 6) == 0) {
-                    pos += sprintf(pos, "%s", year);
-                    format_c += 6;
-                } else if (strncmp(format_c, "<TYPE>", 6) == 0) {
-                    if (type_str && *type_str) {
-                        pos += sprintf(pos, "[%s]", type_str);
-                    } else {
-                        pos += sprintf(pos, "");
-                    }
-                    format_c += 6;
-                } else if (strncmp(format_c, "<FUNC>", 6) == 0) {
-                    if (func != NULL) {
-                        pos += sprintf(pos, "[%s]", func);
-                    } else {
-                        pos += sprintf(pos, "");
-                    }
-                    format_c += 6;
-                } else if (strncmp(format_c, "<FILE>", 6) == 0) {
-                    pos += sprintf(pos, "[%s]", file);
-                    format_c += 6;
-                } else if (strncmp(format_c, "<FILE&FUNC>", 11) == 0 || strncmp(format_c, "<FUNC&FILE>", 11) == 0) {
-                    if (func != NULL) {
-                        pos += sprintf(pos, "[%s:%s]", file, func);
-                    } else {
-                        pos += sprintf(pos, "[%s]", file);
-                    }
-                    format_c += 11;
-                } else if (strncmp(format_c, "<MESSAGE>", 9) == 0) {
-                    /* For messages with newlines, we need to handle them specially */
-                    const char *msg_ptr = message;
-                    while (*msg_ptr) {
-                        if (*msg_ptr == '\n') {
-                            *pos++ = '\n';
-                        } else {
-                            *pos++ = *msg_ptr;
-                        }
-                        msg_ptr++;
-                    }
-                    format_c += 9;
-                } else {
-                    /* Si ce n'est pas un token reconnu, ajouter simplement le caractère */
-                    *pos++ = *format_c++;
+                break;
+            case FMT_YEAR:   piece = stamp->year;   length = 4; break;
+            case FMT_MONTH:  piece = stamp->month;  length = 2; break;
+            case FMT_DAY:    piece = stamp->day;    length = 2; break;
+            case FMT_HOUR:   piece = stamp->hour;   length = 2; break;
+            case FMT_MINUTE: piece = stamp->minute; length = 2; break;
+            case FMT_SECOND: piece = stamp->second; length = 2; break;
+            case FMT_FRACTION: {
+                int precision = (int)step->length;
+                unsigned long modulo = (unsigned long)pow(10, precision);
+                length = snprintf(scratch, sizeof(scratch), "%0*lu", precision, stamp->ms % modulo);
+                piece = scratch;
+                break;
+            }
+            case FMT_TYPE:
+                if (*LOG_TYPE_INFOS[type].display_name) {
+                    length = snprintf(scratch, sizeof(scratch), "[%s]", LOG_TYPE_INFOS[type].display_name);
+                    piece = scratch;
                 }
+                break;
+            case FMT_FUNC:      piece = site->func; length = site->func_length; break;
+            case FMT_FILE:      piece = site->file; length = site->file_length; break;
+            case FMT_FILE_FUNC: piece = site->both; length = site->both_length; break;
+            case FMT_MESSAGE:
+                piece = message;
+                length = (Py_ssize_t)strlen(message);
+                break;
+        }
+        
+        if (length > 0) {
+            char *out = console_line_reserve(self, used, length);
+            if (out == NULL) {
+                return -1;
             }
-        } else {
-            /* Copier caractère par caractère */
-            *pos++ = *format_c++;
+            memcpy(out, piece, (size_t)length);
+            used += length;
         }
     }
-    *pos = '\0';  /* Terminer la chaîne */
     
-    /* Créer l'objet Python pour le résultat formaté */
-    return PyUnicode_FromString(buffer);
+    return used - start;
 }
 
 /* CORRECTION : Fonction centrale pour gérer les logs avec option simple */
-static PyObject *console_log_internal(PyFastyConsoleObject *self, const char *message, LogType type, const char *file, const char *func, int use_simple_format) {
+static PyObject *console_log_internal(PyFastyConsoleObject *self, const char *message, LogType type, const CallSite *site, int use_simple_format) {
     /* Mode silencieux pendant l'exécution des callbacks d'événements */
     if (pyfasty_is_in_callback_execution()) {
         Py_INCREF(Py_None);
@@ -567,7 +1500,21 @@ static PyObject *console_log_internal(PyFastyConsoleObject *self, const char *me
         }
         
         /* Afficher directement le message comme print() */
-        PySys_WriteStdout("%s\n", message);
+        Py_ssize_t length = (Py_ssize_t)strlen(message);
+        if (length == 0 || message[length - 1] == '\n') {
+            /* print() garde le saut de ligne du message et en ajoute un */
+            char *line = PyMem_Malloc((size_t)length + 2);
+            if (line == NULL) {
+                return PyErr_NoMemory();
+            }
+            memcpy(line, message, (size_t)length);
+            line[length] = '\n';
+            line[length + 1] = '\0';
+            console_emit(self, line, length + 1, NULL, NULL, 0, LOG_DEFAULT);
+            PyMem_Free(line);
+        } else {
+            console_emit(self, message, length, NULL, NULL, 0, LOG_DEFAULT);
+        }
         
         return simple_message;
     }
@@ -588,11 +1535,20 @@ static PyObject *console_log_internal(PyFastyConsoleObject *self, const char *me
         }
     }
     
-    /* Récupérer le format */
-    PyObject *format_str = PyDict_GetItemString(self->config, "format");
-    
-    /* Formater le message */
-    PyObject *formatted_message = format_log_message(format_str, message, type, file, func, self->config, 1);
+    /* Formater le message avec le format compilé */
+    ConsoleFormat *format = console_format(self);
+    if (format == NULL) {
+        return NULL;
+    }
+    FormatStamp stamp;
+    if (format->has_date) {
+        format_stamp(&stamp);
+    }
+    Py_ssize_t length = format_render(self, format, &stamp, 0, message, type, site, 1);
+    if (length < 0) {
+        return NULL;
+    }
+    PyObject *formatted_message = PyUnicode_FromStringAndSize(self->line, length);
     if (formatted_message == NULL) {
         return NULL;
     }
@@ -609,68 +1565,35 @@ static PyObject *console_log_internal(PyFastyConsoleObject *self, const char *me
     }
     
     /* Afficher le message (utiliser PySys_WriteStdout pour éviter la récursion) */
-    PyObject *str_obj = PyObject_Str(formatted_message);
-    if (str_obj != NULL) {
-        const char *str = PyUnicode_AsUTF8(str_obj);
-        if (str != NULL) {
-            /* Ne pas ajouter de \n automatiquement pour préserver le formatage */
-            PySys_WriteStdout("%s", str);
-            
-            /* Si le message ne se termine pas par un saut de ligne, en ajouter un */
-            size_t len = strlen(str);
-            if (len > 0 && str[len-1] != '\n') {
-                PySys_WriteStdout("\n");
-            }
-            
-            /* Écrire dans le fichier de log si activé */
-            PyObject *save_log = PyDict_GetItemString(self->config, "save_log");
-            if (save_log != NULL && PyDict_Check(save_log)) {
-                PyObject *status = PyDict_GetItemString(save_log, "status");
-                if (status != NULL && PyObject_IsTrue(status)) {
-                    /* Récupérer le nom du fichier et le mode */
-                    PyObject *filename_obj = PyDict_GetItemString(save_log, "filename");
-                    PyObject *filemode_obj = PyDict_GetItemString(save_log, "filemode");
-                    
-                    const char *filename = DEFAULT_LOG_FILENAME;
-                    const char *filemode = DEFAULT_LOG_FILEMODE;
-                    
-                    if (filename_obj != NULL && PyUnicode_Check(filename_obj)) {
-                        filename = PyUnicode_AsUTF8(filename_obj);
-                    }
-                    
-                    if (filemode_obj != NULL && PyUnicode_Check(filemode_obj)) {
-                        filemode = PyUnicode_AsUTF8(filemode_obj);
-                        /* Vérifier que le mode est valide ('a' ou 'w') */
-                        if (strcmp(filemode, "a") != 0 && strcmp(filemode, "w") != 0) {
-                            filemode = DEFAULT_LOG_FILEMODE;
-                        }
-                    }
-                    
-                    /* Ajuster le mode d'ouverture si nécessaire */
-                    filemode = check_file_mode(filename, filemode);
-                    
-                    /* Ouvrir le fichier et écrire le message */
-                    FILE *log_file = fopen(filename, filemode);
-                    if (log_file != NULL) {
-                        /* Format sans couleurs pour le fichier log */
-                        PyObject *log_formatted_message = format_log_message(format_str, message, type, file, func, self->config, 0);
-                        if (log_formatted_message != NULL) {
-                            const char *log_str = PyUnicode_AsUTF8(log_formatted_message);
-                            if (log_str != NULL) {
-                                fprintf(log_file, "%s", log_str);
-                                size_t len = strlen(log_str);
-                                if (len > 0 && log_str[len-1] != '\n') {
-                                    fprintf(log_file, "\n");
-                                }
-                            }
-                            Py_DECREF(log_formatted_message);
-                        }
-                        fclose(log_file);
-                    }
+    Py_ssize_t len;
+    const char *str = PyUnicode_AsUTF8AndSize(formatted_message, &len);
+    if (str != NULL) {
+        /* Écrire dans le fichier de log si activé */
+        PyObject *save_log = PyDict_GetItemString(self->config, "save_log");
+        PyObject *status = NULL;
+        if (save_log != NULL && PyDict_Check(save_log)) {
+            status = PyDict_GetItemString(save_log, "status");
+        }
+        if (status != NULL && PyObject_IsTrue(status)) {
+            /* Sans balise de couleur, le message affiché est déjà celui du fichier */
+            if (!format->has_colors) {
+                console_emit(self, str, len, save_log, str, len, type);
+            } else {
+                /* Format sans couleurs pour le fichier log, rendu dans le même tampon */
+                Py_ssize_t log_len = format_render(self, format, &stamp, 0, message, type, site, 0);
+                if (log_len < 0) {
+                    Py_DECREF(formatted_message);
+                    return NULL;
                 }
+                console_emit(self, str, len, save_log, self->line, log_len, type);
+            }
+        } else {
+            if (self->sink.file != NULL) {
+                /* save_log désactivé : rendre la main sur le fichier */
+                log_sink_close(&self->sink);
             }
+            console_emit(self, str, len, NULL, NULL, 0, type);
         }
-        Py_DECREF(str_obj);
     }
     
     return formatted_message;
@@ -700,6 +1623,9 @@ static PyObject *console_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
             Py_DECREF(self);
             return NULL;
         }
+        
+        /* Hérite du niveau de la console globale */
+        self->level = -1;
     }
     
     return (PyObject *)self;
@@ -718,6 +1644,11 @@ static int console_init(PyFastyConsoleObject *self, PyObject *args, PyObject *kw
 
 /* Implementation de console_dealloc */
 static void console_dealloc(PyFastyConsoleObject *self) {
+    log_sink_close(&self->sink);
+    format_free(self->format);
+    PyMem_Free(self->line);
+    Py_XDECREF(self->format_source);
+    Py_XDECREF(self->colors_source);
     Py_XDECREF(self->config);
     Py_XDECREF(self->last_message);
     Py_XDECREF(self->log_history);
@@ -736,6 +1667,11 @@ static PyObject *console_getattro(PyFastyConsoleObject *self, PyObject *name) {
         return self->config;
     }
     
+    /* Cas spécial pour level */
+    if (strcmp(name_str, "level") == 0) {
+        return console_level_object(self);
+    }
+    
     /* Cas standard */
     return PyObject_GenericGetAttr((PyObject *)self, name);
 }
@@ -748,6 +1684,12 @@ static int console_setattro(PyFastyConsoleObject *self, PyObject *name, PyObject
     if (strcmp(name_str, "config") == 0) {
         /* Si la nouvelle valeur est un dictionnaire, fusionner avec la config existante */
         if (PyDict_Check(value)) {
+            /* Options du fichier de log vérifiées avant toute modification */
+            PyObject *save_log = PyDict_GetItemString(value, "save_log");
+            if (save_log != NULL && log_sink_validate(save_log) < 0) {
+                return -1;
+            }
+            
             /* Mettre à jour les clés définies dans le nouveau dictionnaire */
             PyObject *key, *val;
             Py_ssize_t pos = 0;
@@ -758,6 +1700,11 @@ static int console_setattro(PyFastyConsoleObject *self, PyObject *name, PyObject
                 }
             }
             
+            /* Compiler le format une fois ici plutôt qu'à chaque message */
+            if (console_format(self) == NULL) {
+                return -1;
+            }
+            
             /* Déclencher les événements après modification de la config */
             if (!g_in_condition_evaluation) {
                 pyfasty_trigger_sync_events_with_module(MODULE_CONSOLE);
@@ -779,6 +1726,26 @@ static int console_setattro(PyFastyConsoleObject *self, PyObject *name, PyObject
         }
     }
     
+    /* Cas spécial pour level : None (ou del) rend le niveau hérité, tous les niveaux pour
+       la console globale */
+    if (strcmp(name_str, "level") == 0) {
+        int severity;
+        if (value == NULL || value == Py_None) {
+            severity = (PyObject *)self == g_console ? LOG_TYPE_INFOS[LOG_DEBUG].severity : -1;
+        } else {
+            severity = console_parse_level(value);
+            if (severity < 0) {
+                return -1;
+            }
+        }
+        self->level = severity;
+        
+        if (!g_in_condition_evaluation) {
+            pyfasty_trigger_sync_events_with_module(MODULE_CONSOLE);
+        }
+        return 0;
+    }
+    
     /* Cas standard */
     int result = PyObject_GenericSetAttr((PyObject *)self, name, value);
     
@@ -815,7 +1782,7 @@ static PyObject *console_call(PyObject *self, PyObject *args, PyObject *kwds) {
     const char *msg = PyUnicode_AsUTF8(str_message);
     
     /* CORRECTION : Appel direct avec format simple (comme print) */
-    PyObject *result = console_log_internal(console, msg, LOG_DEFAULT, NULL, NULL, 1);
+    PyObject *result = console_log_internal(console, msg, LOG_DEFAULT, NULL, 1);
     
     /* Nettoyage */
     Py_DECREF(str_message);
@@ -823,12 +1790,229 @@ static PyObject *console_call(PyObject *self, PyObject *args, PyObject *kwds) {
     return result;
 }
 
+/* === NIVEAUX === */
+
+/* Gravité minimale effective : niveau propre ou celui de la console globale */
+static inline int console_min_severity(PyFastyConsoleObject *self) {
+    if (self->level >= 0) {
+        return self->level;
+    }
+    return g_console != NULL ? ((PyFastyConsoleObject *)g_console)->level : 0;
+}
+
+/* Niveau donné par nom ("warning") ou par gravité numérique - -1 avec ValueError sinon */
+static int console_parse_level(PyObject *value) {
+    if (PyUnicode_Check(value)) {
+        const char *name = PyUnicode_AsUTF8(value);
+        if (name == NULL) {
+            return -1;
+        }
+        int severity = log_severity_from_name(name);
+        if (severity < 0) {
+            PyErr_Format(PyExc_ValueError, "Unknown log level '%s' (expected debug, info, success, warning, error, critical or fatal)", name);
+        }
+        return severity;
+    }
+    if (PyLong_Check(value)) {
+        long severity = PyLong_AsLong(value);
+        if (severity == -1 && PyErr_Occurred()) {
+            return -1;
+        }
+        if (severity < 0 || severity > INT_MAX) {
+            PyErr_SetString(PyExc_ValueError, "Log level must be a non-negative integer");
+            return -1;
+        }
+        return (int)severity;
+    }
+    PyErr_Format(PyExc_TypeError, "Log level must be a level name or an int, not '%.200s'", Py_TYPE(value)->tp_name);
+    return -1;
+}
+
+/* Nom du niveau (ou sa gravité s'il n'a pas de nom), None si hérité */
+static PyObject *console_level_object(PyFastyConsoleObject *self) {
+    if (self->level < 0) {
+        Py_RETURN_NONE;
+    }
+    for (int i = 1; i < LOG_TYPE_COUNT; i++) {
+        if (LOG_TYPE_INFOS[i].severity == self->level) {
+            return PyUnicode_FromString(LOG_TYPE_INFOS[i].name);
+        }
+    }
+    return PyLong_FromLong(self->level);
+}
+
+/* console.is_enabled(level) : le message serait-il affiché ? */
+static PyObject *console_is_enabled(PyObject *self, PyObject *level) {
+    PyFastyConsoleObject *console = (PyFastyConsoleObject *)self;
+    int severity = console_parse_level(level);
+    if (severity < 0) {
+        return NULL;
+    }
+    if (severity < console_min_severity(console)) {
+        Py_RETURN_FALSE;
+    }
+    
+    /* Même filtrage que l'affichage : debug_view pour le niveau debug, puis console_view */
+    LogType type = severity <= LOG_TYPE_INFOS[LOG_DEBUG].severity ? LOG_DEBUG : LOG_INFO;
+    if (console_is_muted(console, type)) {
+        Py_RETURN_FALSE;
+    }
+    Py_RETURN_TRUE;
+}
+
+/* === SITE D'APPEL === */
+
+/* Étiquettes de site d'appel par identité de code object : adresse -> (code, étiquettes).
+   Les code objects se comparent par valeur sans tenir compte de co_filename, deux fonctions
+   identiques de fichiers différents partageraient donc une clé. Le cache garde une référence
+   forte sur chaque code object rencontré (son adresse ne peut pas être réutilisée, mais ses
+   constantes restent en vie), même après la destruction de sa fonction (code généré par exec,
+   lambdas recréées) : au plus CALLSITE_CACHE_MAX, vidé quand il est plein */
+#define CALLSITE_CACHE_MAX 4096
+static PyObject *g_callsite_cache = NULL;
+
+/* Site d'appel d'un code object : (fichier, fonction, fichier:fonction), ou None pour un
+   code de pyfasty/ à sauter en remontant la pile */
+static PyObject *callsite_from_code(PyCodeObject *code) {
+    const char *path = PyUnicode_Check(code->co_filename) ? PyUnicode_AsUTF8(code->co_filename) : NULL;
+    if (path == NULL) {
+        PyErr_Clear();
+        Py_RETURN_NONE;
+    }
+    
+    const char *last_slash = strrchr(path, '\\');
+    const char *last_slash2 = strrchr(path, '/');
+    if (last_slash2 > last_slash) last_slash = last_slash2;
+    const char *simple_filename = (last_slash != NULL) ? last_slash + 1 : path;
+    
+    /* Trouver un fichier spécifique, ou tout fichier qui n'est pas dans pyfasty/ */
+    if (strstr(simple_filename, "test_console.py") == NULL &&
+        strstr(simple_filename, "main.py") == NULL &&
+        (strstr(path, "pyfasty/") != NULL || strstr(path, "pyfasty\\") != NULL)) {
+        Py_RETURN_NONE;
+    }
+    
+    /* Pas de fonction au niveau module */
+    const char *func = PyUnicode_Check(code->co_name) ? PyUnicode_AsUTF8(code->co_name) : NULL;
+    if (func == NULL) {
+        PyErr_Clear();
+    }
+    if (func != NULL && strcmp(func, "<module>") == 0) {
+        func = NULL;
+    }
+    
+    if (func != NULL) {
+        return Py_BuildValue("(NNN)",
+                             PyUnicode_FromFormat("[%s]", simple_filename),
+                             PyUnicode_FromFormat("[%s]", func),
+                             PyUnicode_FromFormat("[%s:%s]", simple_filename, func));
+    }
+    PyObject *file = PyUnicode_FromFormat("[%s]", simple_filename);
+    if (file == NULL) {
+        return NULL;
+    }
+    return Py_BuildValue("(ONO)", file, PyUnicode_FromString(""), file);
+}
+
+/* Étiquettes du premier appelant hors de pyfasty (nouvelle référence), NULL si inconnu */
+static PyObject *callsite_capture(void) {
+    if (g_callsite_cache == NULL) {
+        g_callsite_cache = PyDict_New();
+        if (g_callsite_cache == NULL) {
+            PyErr_Clear();
+            return NULL;
+        }
+    }
+    
+    PyFrameObject *frame = PyEval_GetFrame();
+    Py_XINCREF(frame);
+    while (frame != NULL) {
+        PyCodeObject *code = PyFrame_GetCode(frame);
+        PyObject *key = PyLong_FromVoidPtr(code);
+        PyObject *entry = key != NULL ? PyDict_GetItemWithError(g_callsite_cache, key) : NULL;
+        PyObject *site = NULL;
+        if (entry != NULL) {
+            site = PyTuple_GET_ITEM(entry, 1);
+            Py_INCREF(site);
+        } else if (!PyErr_Occurred()) {
+            site = callsite_from_code(code);
+            entry = site != NULL ? PyTuple_Pack(2, (PyObject *)code, site) : NULL;
+            if (entry != NULL) {
+                if (PyDict_GET_SIZE(g_callsite_cache) >= CALLSITE_CACHE_MAX) {
+                    PyDict_Clear(g_callsite_cache);
+                }
+                if (PyDict_SetItem(g_callsite_cache, key, entry) < 0) {
+                    PyErr_Clear();
+                }
+                Py_DECREF(entry);
+            } else {
+                PyErr_Clear();
+            }
+        }
+        Py_XDECREF(key);
+        Py_DECREF(code);
+        
+        if (site == NULL) {
+            PyErr_Clear();
+        } else if (site != Py_None) {
+            Py_DECREF(frame);
+            return site;
+        } else {
+            Py_DECREF(site);
+        }
+        
+        /* Passer à la frame précédente */
+        PyFrameObject *back = PyFrame_GetBack(frame);
+        Py_DECREF(frame);
+        frame = back;
+    }
+    return NULL;
+}
+
+/* Message qui ne sera ni affiché ni écrit : inutile de capturer le site d'appel */
+static int console_is_muted(PyFastyConsoleObject *self, LogType type) {
+    if (pyfasty_is_in_callback_execution() || g_in_condition_evaluation) {
+        return 1;
+    }
+    PyObject *console_view = PyDict_GetItemString(self->config, "console_view");
+    if (console_view == NULL || !PyObject_IsTrue(console_view)) {
+        return 1;
+    }
+    if (type == LOG_DEBUG) {
+        PyObject *debug_view = PyDict_GetItemString(self->config, "debug_view");
+        if (debug_view == NULL || !PyObject_IsTrue(debug_view)) {
+            return 1;
+        }
+    }
+    return 0;
+}
+
 /* Implementation de console_log (générique) */
 static PyObject *console_log(PyObject *self, PyObject *args, LogType type) {
+    PyFastyConsoleObject *console = (PyFastyConsoleObject *)self;
     const char *message;
     
-    if (!PyArg_ParseTuple(args, "s", &message)) {
-        return NULL;
+    /* Arguments vérifiés d'abord : un appel filtré lève les mêmes erreurs qu'un appel affiché.
+       Cas courant (une chaîne) sans PyArg_ParseTuple, qui reste là pour les messages d'erreur */
+    PyObject *arg = PyTuple_GET_SIZE(args) == 1 ? PyTuple_GET_ITEM(args, 0) : NULL;
+    Py_ssize_t message_length = 0;
+    message = arg != NULL && PyUnicode_Check(arg) ? PyUnicode_AsUTF8AndSize(arg, &message_length) : NULL;
+    if (message == NULL || strlen(message) != (size_t)message_length) {
+        PyErr_Clear();
+        if (!PyArg_ParseTuple(args, "s", &message)) {
+            return NULL;
+        }
+    }
+    
+    /* Niveau filtré : retour immédiat, sans événements ni site d'appel */
+    if (LOG_TYPE_INFOS[type].severity < console_min_severity(console)) {
+        Py_RETURN_NONE;
+    }
+    if (type == LOG_DEBUG) {
+        PyObject *debug_view = PyDict_GetItemString(console->config, "debug_view");
+        if (debug_view == NULL || !PyObject_IsTrue(debug_view)) {
+            Py_RETURN_NONE;
+        }
     }
     
     /* Ne déclencher les événements console QUE si on n'est PAS en évaluation */
@@ -836,109 +2020,31 @@ static PyObject *console_log(PyObject *self, PyObject *args, LogType type) {
         pyfasty_trigger_sync_events_with_module(MODULE_CONSOLE);
     }
     
-    /* Extraire le fichier et la fonction appelante en utilisant l'introspection Python */
-    char file_buffer[256] = "unknown.py";
-    char func_buffer[256] = "";
-    const char *file = file_buffer;
-    const char *func = NULL;  /* NULL si pas de fonction (niveau module) */
+    if (console_is_muted(console, type)) {
+        Py_RETURN_NONE;
+    }
     
-    /* Obtenir la frame courante */
-    PyObject *frame_obj = PyEval_GetFrame();
-    if (frame_obj != NULL) {
-        PyObject *current_frame = frame_obj;
-        Py_INCREF(current_frame);
-        
-        /* Traverser la pile d'appel pour trouver la frame qui nous intéresse */
-        PyObject *back_frame = NULL;
-        while (current_frame != NULL) {
-            /* Obtenir d'abord les informations de cette frame */
-            PyObject *code_obj = NULL;
-            if (PyObject_HasAttrString(current_frame, "f_code")) {
-                code_obj = PyObject_GetAttrString(current_frame, "f_code");
-                
-                if (code_obj != NULL) {
-                    /* Obtenir le nom du fichier */
-                    PyObject *filename_obj = NULL;
-                    const char *temp_file = NULL;
-                    
-                    if (PyObject_HasAttrString(code_obj, "co_filename")) {
-                        filename_obj = PyObject_GetAttrString(code_obj, "co_filename");
-                        if (filename_obj != NULL && PyUnicode_Check(filename_obj)) {
-                            temp_file = PyUnicode_AsUTF8(filename_obj);
-                        }
-                    }
-                    
-                    /* Obtenir le nom de la fonction */
-                    PyObject *funcname_obj = NULL;
-                    const char *temp_func = NULL;
-                    
-                    if (PyObject_HasAttrString(code_obj, "co_name")) {
-                        funcname_obj = PyObject_GetAttrString(code_obj, "co_name");
-                        if (funcname_obj != NULL && PyUnicode_Check(funcname_obj)) {
-                            temp_func = PyUnicode_AsUTF8(funcname_obj);
-                        }
-                    }
-                    
-                    /* Si nous avons trouvé un fichier test_console.py ou main.py, utiliser cette frame */
-                    if (temp_file != NULL) {
-                        const char *last_slash = strrchr(temp_file, '\\');
-                        const char *last_slash2 = strrchr(temp_file, '/');
-                        if (last_slash2 > last_slash) last_slash = last_slash2;
-                        
-                        const char *simple_filename = (last_slash != NULL) ? last_slash + 1 : temp_file;
-                        
-                        /* Trouver un fichier spécifique, ou tout fichier qui n'est pas dans pyfasty/ */
-                        if (strstr(simple_filename, "test_console.py") != NULL ||
-                            strstr(simple_filename, "main.py") != NULL ||
-                            (strstr(temp_file, "pyfasty/") == NULL && 
-                             strstr(temp_file, "pyfasty\\") == NULL)) {
-                            
-                            /* Extraire et stocker le nom du fichier simple */
-                            strncpy(file_buffer, simple_filename, sizeof(file_buffer) - 1);
-                            file_buffer[sizeof(file_buffer) - 1] = '\0';
-                            file = file_buffer;
-                            
-                            /* Stocker la fonction si disponible et pas "<module>" */
-                            if (temp_func != NULL && strcmp(temp_func, "<module>") != 0) {
-                                strncpy(func_buffer, temp_func, sizeof(func_buffer) - 1);
-                                func_buffer[sizeof(func_buffer) - 1] = '\0';
-                                func = func_buffer;
-                            }
-                            
-                            /* Nous avons trouvé une bonne frame, on peut arrêter la recherche */
-                            Py_XDECREF(funcname_obj);
-                            Py_XDECREF(filename_obj);
-                            Py_DECREF(code_obj);
-                            break;
-                        }
-                    }
-                    
-                    Py_XDECREF(funcname_obj);
-                    Py_XDECREF(filename_obj);
-                    Py_DECREF(code_obj);
-                }
-            }
-            
-            /* Passer à la frame précédente */
-            back_frame = NULL;
-            if (PyObject_HasAttrString(current_frame, "f_back")) {
-                back_frame = PyObject_GetAttrString(current_frame, "f_back");
-                Py_DECREF(current_frame);
-                current_frame = back_frame;
-            } else {
-                Py_DECREF(current_frame);
-                current_frame = NULL;
-            }
-        }
-        
-        /* Libérer la référence si on n'a pas trouvé de frame d'intérêt */
-        if (current_frame != NULL) {
-            Py_DECREF(current_frame);
+    /* Le site d'appel n'est cherché que si le format l'affiche */
+    ConsoleFormat *format = console_format(console);
+    if (format == NULL) {
+        return NULL;
+    }
+    PyObject *labels = format->has_callsite ? callsite_capture() : NULL;
+    
+    CallSite site;
+    if (labels != NULL) {
+        site.file = PyUnicode_AsUTF8AndSize(PyTuple_GET_ITEM(labels, 0), &site.file_length);
+        site.func = PyUnicode_AsUTF8AndSize(PyTuple_GET_ITEM(labels, 1), &site.func_length);
+        site.both = PyUnicode_AsUTF8AndSize(PyTuple_GET_ITEM(labels, 2), &site.both_length);
+        if (site.file == NULL || site.func == NULL || site.both == NULL) {
+            Py_DECREF(labels);
+            return NULL;
         }
     }
     
-    /* CORRECTION : Appeler avec format normal (pas simple) pour les méthodes de log */
-    return console_log_internal((PyFastyConsoleObject *)self, message, type, file, func, 0);
+    PyObject *result = console_log_internal(console, message, type, labels != NULL ? &site : NULL, 0);
+    Py_XDECREF(labels);
+    return result;
 }
 
 /* Implementation des fonctions de log spécifiques */
@@ -970,8 +2076,32 @@ static PyObject *console_fatal(PyObject *self, PyObject *args) {
     return console_log(self, args, LOG_FATAL);
 }
 
-/* Instance globale */
-static PyObject *g_console = NULL;
+/* console.flush() : écrire les lignes encore en tampon */
+static PyObject *console_flush(PyObject *self, PyObject *Py_UNUSED(ignored)) {
+    log_sink_flush(&((PyFastyConsoleObject *)self)->sink);
+    Py_RETURN_NONE;
+}
+
+/* console.close() : vider et fermer le fichier, rouvert en ajout au prochain message */
+static PyObject *console_close(PyObject *self, PyObject *Py_UNUSED(ignored)) {
+    log_sink_close(&((PyFastyConsoleObject *)self)->sink);
+    Py_RETURN_NONE;
+}
+
+/* console.async_stats() : compteurs du thread d'écriture */
+static PyObject *console_async_stats(PyObject *self, PyObject *Py_UNUSED(ignored)) {
+    long long queued = RING_LOAD(&g_console_async.tail);
+    long long written = RING_LOAD(&g_console_async.written);
+    return Py_BuildValue("{s:O,s:L,s:L,s:L,s:L,s:L,s:L}",
+                         "running", g_console_async.started ? Py_True : Py_False,
+                         "capacity", g_console_async.capacity,
+                         "queued", queued,
+                         "written", written,
+                         "pending", queued - RING_LOAD(&g_console_async.head),
+                         "dropped", g_console_async.dropped,
+                         "blocked", g_console_async.blocked);
+}
+
 
 /* Initialisation du module */
 int PyFasty_Console_Init(PyObject *module) {
@@ -999,5 +2129,22 @@ int PyFasty_Console_Init(PyObject *module) {
         return -1;
     }
     
+    /* Écrire les lignes en file avant la finalisation de l'interpréteur */
+    static PyMethodDef shutdown_method = {
+        "_console_async_shutdown", console_async_shutdown, METH_NOARGS, "Arrête le thread d'écriture de la console"
+    };
+    PyObject *atexit = PyImport_ImportModule("atexit");
+    if (atexit == NULL) {
+        return -1;
+    }
+    PyObject *shutdown = PyCFunction_New(&shutdown_method, NULL);
+    PyObject *result = shutdown ? PyObject_CallMethod(atexit, "register", "O", shutdown) : NULL;
+    Py_XDECREF(shutdown);
+    Py_DECREF(atexit);
+    if (result == NULL) {
+        return -1;
+    }
+    Py_DECREF(result);
+    
     return 0;
 }
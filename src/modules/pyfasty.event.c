@@ -1,10 +1,12 @@
 #include "../pyfasty.h"
+#include "../thread/pyfasty_threading.h"
 
 /* =================== VARIABLES GLOBALES =================== */
 
 static PyObject *g_event_handlers = NULL;
 int g_events_enabled = 0;
 static int g_is_evaluating = 0;
+static unsigned long g_evaluating_thread = 0;  /* Thread qui mène l'évaluation en cours */
 static long g_current_timestamp = 0;
 
 /* État du module actuel pour le déclenchement contextualisé */
@@ -20,174 +22,429 @@ int g_in_condition_evaluation = 0;
 static int g_evaluation_depth = 0;
 static const int MAX_EVALUATION_DEPTH = 10;
 
-/* Cache des états des handlers */
-#define MAX_HANDLERS 256
-static struct {
-    PyObject *handler_tuple;
+/* Règles d'évaluation d'un handler, déterminées une fois à l'enregistrement */
+typedef enum {
+    RULE_DIRECT_MODULE = 1,           /* lambda: pyfasty.module - à chaque écriture du module */
+    RULE_SIMPLE,                      /* lambda: pyfasty.module.attr - sur changement False→True */
+    RULE_IMPOSSIBLE,                  /* Ne se déclenche jamais */
+    RULE_COMPARISON                   /* Conditions avec comparaison - sur changement False→True */
+} HandlerRule;
+
+/* Exécution des callbacks déclenchés */
+typedef enum {
+    DISPATCH_SYNC = 0,                /* Dans le thread de l'écriture (défaut) */
+    DISPATCH_ASYNC,                   /* Thread de dispatch des événements */
+    DISPATCH_ASYNCIO                  /* Boucle asyncio via call_soon_threadsafe */
+} DispatchMode;
+
+/* Déclenchement selon l'état de la condition (trigger=) */
+typedef enum {
+    TRIGGER_AUTO = 0,                 /* Selon la règle : chaque écriture (module direct) ou front montant */
+    TRIGGER_RISING,                   /* False→True */
+    TRIGGER_FALLING,                  /* True→False */
+    TRIGGER_CHANGE,                   /* Les deux fronts */
+    TRIGGER_LEVEL                     /* Chaque évaluation vraie */
+} TriggerMode;
+
+/* Analyse précalculée d'une condition */
+typedef struct {
+    HandlerRule rule;
+    ModuleType module;                /* Module déclencheur (MODULE_ALL : config ou registry) */
+} HandlerAnalysis;
+
+/* Condition compilée en prédicat natif (compile=True) */
+typedef struct CompiledPredicate CompiledPredicate;
+
+/* Histogramme de latences (ns) à la manière HDR : 16 seaux linéaires, puis 8 sous-seaux
+ * par puissance de deux - précision relative de 12,5 % jusqu'à ~2^44 ns */
+#define EVENT_HISTOGRAM_LINEAR 16
+#define EVENT_HISTOGRAM_SUB_BUCKETS 8
+#define EVENT_HISTOGRAM_OCTAVES 40
+#define EVENT_HISTOGRAM_BUCKETS (EVENT_HISTOGRAM_LINEAR + EVENT_HISTOGRAM_OCTAVES * EVENT_HISTOGRAM_SUB_BUCKETS)
+
+typedef struct {
+    long long count;
+    long long total;
+    long long max;
+    long long buckets[EVENT_HISTOGRAM_BUCKETS];
+} LatencyHistogram;
+
+/* Instrumentation d'un handler (allouée à la première mesure, event_stats_enable) */
+typedef struct {
+    long long evaluations;
+    long long errors;                 /* Exceptions levées par la condition ou le callback */
+    LatencyHistogram condition;
+    LatencyHistogram callback;
+} HandlerStats;
+
+/* Origine d'une erreur : les échecs consécutifs sont comptés séparément */
+typedef enum {
+    ERROR_PHASE_CONDITION = 0,
+    ERROR_PHASE_CALLBACK
+} ErrorPhase;
+
+/* Handler d'événement : condition, callback et état d'évaluation en ligne */
+typedef struct {
+    PyObject_HEAD
+    PyObject *condition;
+    PyObject *callback;
+    HandlerAnalysis analysis;         /* Classification de la condition */
     int last_state;                    /* -1: unknown, 0: false, 1: true */
-    int is_impossible;                 /* Condition impossible à évaluer */
+    int active;                       /* 0 une fois retiré (event_remove / event_clear_handlers) */
     long last_evaluation_triggered;   /* Timestamp du dernier déclenchement */
-    int is_direct_module;             /* Événement module direct */
-} g_handler_states[MAX_HANDLERS];
+    PyObject *dependencies;           /* Clés lues à la dernière évaluation (NULL = non suivi) */
+    PyObject *dependency_paths;       /* Chemins lisibles correspondants (inspection) */
+    int tracked_modules;              /* Modules lus à la dernière évaluation */
+    long due_stamp;                   /* Marqué à réévaluer pour l'écriture en cours */
+    TriggerMode trigger;              /* Front ou niveau déclencheur */
+    double rearm_after_ms;            /* Réarmement après ce délai dans l'état déclencheur (0 : jamais) */
+    double last_trigger_ms;           /* Dernier déclenchement (ms, horloge monotone) */
+    int trigger_state;                /* État de la condition au dernier déclenchement */
+    DispatchMode dispatch;            /* Exécution du callback */
+    PyObject *loop;                   /* Boucle asyncio (DISPATCH_ASYNCIO) */
+    int max_pending;                  /* Exécutions en attente au maximum */
+    int coalesce;                     /* 1 : un déclenchement déjà en attente absorbe les suivants */
+    int pending;                      /* Exécutions en attente (protégé par le GIL) */
+    long dropped;                     /* Déclenchements abandonnés ou regroupés */
+    double debounce_ms;               /* Limitation de fréquence (0 : désactivée) */
+    double throttle_ms;
+    double max_rate;
+    double last_attempt;              /* Dernier déclenchement demandé (ms, horloge monotone) */
+    double last_fired;                /* Dernier déclenchement accepté */
+    double tokens;                    /* Jetons disponibles pour max_rate */
+    long fired;                       /* Déclenchements acceptés */
+    long suppressed;                  /* Déclenchements supprimés par debounce/throttle/max_rate */
+    int failures[2];                  /* Échecs consécutifs de la condition et du callback (ErrorPhase) */
+    CompiledPredicate *compiled;      /* Prédicat natif (NULL : condition interprétée) */
+    HandlerStats *stats;              /* Instrumentation (NULL tant qu'aucune mesure) */
+} EventHandlerObject;
+
+static PyTypeObject EventHandlerType;
+
+/* =================== SUIVI DES DÉPENDANCES =================== */
+
+/* Variable exportée : lectures registry/config enregistrées pendant l'évaluation
+ * (seules celles du thread g_tracking_thread sont retenues) */
+int g_dependency_tracking = 0;
+static unsigned long g_tracking_thread = 0;
+
+/* Lectures de l'évaluation en cours : clé -> module racine (ou None pour un nœud) */
+static PyObject *g_tracking_reads = NULL;
+/* Nœuds atteints pendant l'évaluation en cours : nœud -> lecture qui l'a produit */
+static PyObject *g_tracking_parents = NULL;
+static int g_tracking_modules = 0;
+
+/* Index inverse : clé (nœud ou couple nœud/nom) -> {handler: None} */
+static PyObject *g_dependency_index = NULL;
+static long g_dependency_stamp = 0;
+
+/* Écritures d'autres threads pendant une évaluation : rejouées par le thread évaluateur */
+static int g_deferred_modules = 0;
+static int g_deferred_untargeted = 0;
+static PyObject *g_deferred_keys = NULL;      /* Clés de dépendance écrites (liste) */
+static int g_deferred_draining = 0;
+
+/* Écritures regroupées : profondeur d'imbrication et modules touchés */
+static int g_batch_depth = 0;
+static int g_batch_modules = 0;
+static int g_batch_untargeted = 0;
+
+/* Instrumentation (event_stats_enable) : mesures coupées par défaut */
+static int g_stats_enabled = 0;
+static int g_condition_failed = 0;    /* Exception levée (puis effacée) par la dernière condition */
+
+/* Totaux par type de module déclencheur */
+typedef struct {
+    long long passes;                 /* Passes d'évaluation */
+    long long evaluations;
+    long long fires;
+    long long errors;
+    long long condition_ns;
+} ModuleStats;
+
+#define EVENT_STATS_MODULES 7
+static ModuleStats g_module_stats[EVENT_STATS_MODULES];
+static int g_max_evaluation_depth = 0;
+static long long g_depth_limit_hits = 0;
+
+/* Politique d'erreur des conditions et callbacks (event_error_policy) */
+typedef enum {
+    ERROR_POLICY_IGNORE = 0,          /* Exception effacée silencieusement (défaut) */
+    ERROR_POLICY_LOG,                 /* sys.unraisablehook (stderr par défaut) */
+    ERROR_POLICY_COLLECT              /* File circulaire lue par event_errors() */
+} ErrorPolicy;
+
+static ErrorPolicy g_error_policy = ERROR_POLICY_IGNORE;
+static const char *const g_error_phase_names[] = {"condition", "callback"};
+static int g_error_max_failures = 0;  /* Désactivation après N échecs consécutifs (0 : jamais) */
+static PyObject *g_condition_error = NULL;  /* Dernière exception d'une condition, en attente du handler */
+
+/* File circulaire des erreurs collectées */
+static PyObject *g_error_ring = NULL;
+static Py_ssize_t g_error_capacity = 100;
+static Py_ssize_t g_error_head = 0;
+static Py_ssize_t g_error_count = 0;
 
 /* =================== DÉCLARATIONS =================== */
 
 /* Forward declaration of EventDecoratorType */
 PyTypeObject EventDecoratorType;
 
-/* Fonctions de cache et états */
-static int get_handler_index(PyObject *handler);
-static int get_handler_last_state(PyObject *handler);
-static void set_handler_last_state(PyObject *handler, int state);
-static int has_triggered_this_evaluation(PyObject *handler);
-static void mark_triggered_this_evaluation(PyObject *handler);
-static void mark_handler_as_direct_module(PyObject *handler, int is_direct);
+/* Fonctions de gestion des handlers */
+static PyObject *event_handler_create(PyObject *condition, PyObject *callback);
+static void unsubscribe_handler(EventHandlerObject *handler);
 
 /* Fonctions d'analyse des conditions */
-static int is_handler_impossible(PyObject *handler);
+static void analyze_condition(PyObject *condition, HandlerAnalysis *analysis);
+static int is_condition_impossible(PyObject *condition);
 static int is_simple_module_condition(PyObject *condition);
 static ModuleType detect_condition_module_type(PyObject *condition);
 static ModuleType detect_direct_module_condition(PyObject *condition);
 static int evaluate_condition(PyObject *condition);
+static int evaluate_tracked_condition(EventHandlerObject *handler);
+static int trigger_fires(EventHandlerObject *handler, int state);
+static PyObject *evaluate_handlers(int only_due);
+static void run_deferred_triggers(void);
+
+/* Fonctions de compilation des conditions */
+static CompiledPredicate *compile_condition(PyObject *condition);
+static void compiled_predicate_free(CompiledPredicate *predicate);
+static int compiled_predicate_traverse(CompiledPredicate *predicate, visitproc visit, void *arg);
+static int compiled_predicate_evaluate(CompiledPredicate *predicate, int *changed);
 
 /* Fonction d'exécution */
-static void execute_callback(PyObject *callback);
+static int execute_callback(PyObject *callback);
+
+/* Fonctions d'instrumentation */
+static long long event_monotonic_ns(void);
+static ModuleStats *module_stats(ModuleType module);
+static void record_condition(EventHandlerObject *handler, long long elapsed, int failed);
+static void record_callback(EventHandlerObject *handler, long long elapsed, int failed);
+
+/* Fonctions de gestion des erreurs */
+static PyObject *event_fetch_error(void);
+static void capture_condition_error(void);
+static void handler_error(EventHandlerObject *handler, ErrorPhase phase, PyObject *error);
+static void handler_succeeded(EventHandlerObject *handler, ErrorPhase phase);
 
 /* Fonctions publiques */
 PyObject *event_clear_handlers(PyObject *self, PyObject *args);
 
-/* =================== GESTION DU CACHE =================== */
+/* =================== HANDLERS =================== */
 
-/* Obtenir l'index d'un handler dans le cache */
-static int get_handler_index(PyObject *handler) {
-    for (int i = 0; i < MAX_HANDLERS; i++) {
-        if (g_handler_states[i].handler_tuple == handler) {
-            return i;
-        }
-        if (g_handler_states[i].handler_tuple == NULL) {
-            /* Slot libre trouvé - initialiser */
-            g_handler_states[i].handler_tuple = handler;
-            g_handler_states[i].last_state = -1;
-            g_handler_states[i].is_impossible = 0;
-            g_handler_states[i].last_evaluation_triggered = 0;
-            g_handler_states[i].is_direct_module = 0;
-            return i;
-        }
+/* Créer un handler - la condition est analysée une seule fois ici */
+static PyObject *event_handler_create(PyObject *condition, PyObject *callback) {
+    EventHandlerObject *handler = PyObject_GC_New(EventHandlerObject, &EventHandlerType);
+    if (handler == NULL) {
+        return NULL;
     }
-    return -1; /* Cache plein */
+    
+    Py_INCREF(condition);
+    handler->condition = condition;
+    Py_INCREF(callback);
+    handler->callback = callback;
+    Py_CLEAR(g_condition_error);
+    analyze_condition(condition, &handler->analysis);
+    handler->last_state = -1;
+    handler->active = 1;
+    handler->last_evaluation_triggered = 0;
+    handler->dependencies = NULL;
+    handler->dependency_paths = NULL;
+    handler->tracked_modules = 0;
+    handler->due_stamp = 0;
+    handler->trigger = TRIGGER_AUTO;
+    handler->rearm_after_ms = 0;
+    handler->last_trigger_ms = -1;
+    handler->trigger_state = -1;
+    handler->dispatch = DISPATCH_SYNC;
+    handler->loop = NULL;
+    handler->max_pending = 0;
+    handler->coalesce = 0;
+    handler->pending = 0;
+    handler->dropped = 0;
+    handler->debounce_ms = 0;
+    handler->throttle_ms = 0;
+    handler->max_rate = 0;
+    handler->last_attempt = -1;
+    handler->last_fired = -1;
+    handler->tokens = 0;
+    handler->fired = 0;
+    handler->suppressed = 0;
+    handler->failures[ERROR_PHASE_CONDITION] = 0;
+    handler->failures[ERROR_PHASE_CALLBACK] = 0;
+    handler->compiled = NULL;
+    handler->stats = NULL;
+    PyObject_GC_Track(handler);
+    
+    /* Condition constante qui lève une exception dès l'analyse */
+    if (g_condition_error != NULL) {
+        PyObject *error = g_condition_error;
+        g_condition_error = NULL;
+        handler_error(handler, ERROR_PHASE_CONDITION, error);
+    }
+    
+    return (PyObject *)handler;
 }
 
-/* Vérifier si un handler s'est déjà déclenché dans cette évaluation */
-static int has_triggered_this_evaluation(PyObject *handler) {
-    int index = get_handler_index(handler);
-    if (index >= 0) {
-        return (g_handler_states[index].last_evaluation_triggered == g_current_timestamp);
-    }
-    return 0;
+/* Parcours GC : un callback ou une boucle peut référencer son propre handler */
+static int event_handler_traverse(EventHandlerObject *self, visitproc visit, void *arg) {
+    Py_VISIT(self->condition);
+    Py_VISIT(self->callback);
+    Py_VISIT(self->dependencies);
+    Py_VISIT(self->dependency_paths);
+    Py_VISIT(self->loop);
+    return compiled_predicate_traverse(self->compiled, visit, arg);
 }
 
-/* Marquer un handler comme déclenché dans cette évaluation */
-static void mark_triggered_this_evaluation(PyObject *handler) {
-    int index = get_handler_index(handler);
-    if (index >= 0) {
-        g_handler_states[index].last_evaluation_triggered = g_current_timestamp;
-    }
+/* Rupture d'un cycle : le handler inaccessible ne peut plus être déclenché */
+static int event_handler_clear(EventHandlerObject *self) {
+    self->active = 0;
+    Py_CLEAR(self->condition);
+    Py_CLEAR(self->callback);
+    Py_CLEAR(self->dependencies);
+    Py_CLEAR(self->dependency_paths);
+    Py_CLEAR(self->loop);
+    compiled_predicate_free(self->compiled);
+    self->compiled = NULL;
+    return 0;
 }
 
-/* Obtenir l'état précédent d'un handler */
-static int get_handler_last_state(PyObject *handler) {
-    int index = get_handler_index(handler);
-    return (index >= 0) ? g_handler_states[index].last_state : -1;
+/* Libération d'un handler */
+static void event_handler_dealloc(EventHandlerObject *self) {
+    PyObject_GC_UnTrack(self);
+    event_handler_clear(self);
+    PyMem_Free(self->stats);
+    PyObject_GC_Del(self);
 }
 
-/* Définir l'état d'un handler */
-static void set_handler_last_state(PyObject *handler, int state) {
-    int index = get_handler_index(handler);
-    if (index >= 0) {
-        g_handler_states[index].last_state = state;
+/* Appel d'un handler : exécution différée du callback (DISPATCH_ASYNC / DISPATCH_ASYNCIO) */
+static PyObject *event_handler_call(EventHandlerObject *self, PyObject *args, PyObject *kwds) {
+    if (self->pending > 0) {
+        self->pending--;
+    }
+    
+    /* Handler retiré entre le déclenchement et l'exécution */
+    if (!self->active || self->callback == NULL) {
+        Py_RETURN_NONE;
+    }
+    
+    /* Pas de g_in_callback_execution : d'autres threads peuvent écrire pendant ce callback */
+    long long start = g_stats_enabled ? event_monotonic_ns() : 0;
+    PyObject *result = PyObject_CallFunction(self->callback, NULL);
+    if (g_stats_enabled) {
+        record_callback(self, event_monotonic_ns() - start, result == NULL);
     }
+    if (result == NULL) {
+        handler_error(self, ERROR_PHASE_CALLBACK, event_fetch_error());
+        Py_RETURN_NONE;
+    }
+    Py_DECREF(result);
+    handler_succeeded(self, ERROR_PHASE_CALLBACK);
+    Py_RETURN_NONE;
 }
 
-/* Marquer un handler comme module direct */
-static void mark_handler_as_direct_module(PyObject *handler, int is_direct) {
-    int index = get_handler_index(handler);
-    if (index >= 0) {
-        g_handler_states[index].is_direct_module = is_direct;
+/* Représentation d'un handler */
+static PyObject *event_handler_repr(EventHandlerObject *self) {
+    if (self->callback == NULL) {
+        return PyUnicode_FromFormat("<EventHandler cleared active=%d>", self->active);
     }
+    return PyUnicode_FromFormat("<EventHandler callback=%R active=%d>", self->callback, self->active);
+}
+
+/* Définition du type EventHandler */
+static PyTypeObject EventHandlerType = {
+    PyVarObject_HEAD_INIT(NULL, 0)
+    .tp_name = "pyfasty._pyfasty.EventHandler",
+    .tp_doc = "Handler d'événement PyFasty (condition, callback et état)",
+    .tp_basicsize = sizeof(EventHandlerObject),
+    .tp_itemsize = 0,
+    .tp_flags = Py_TPFLAGS_DEFAULT | Py_TPFLAGS_HAVE_GC,
+    .tp_dealloc = (destructor)event_handler_dealloc,
+    .tp_traverse = (traverseproc)event_handler_traverse,
+    .tp_clear = (inquiry)event_handler_clear,
+    .tp_repr = (reprfunc)event_handler_repr,
+    .tp_call = (ternaryfunc)event_handler_call,
+};
+
+/* Désactiver un handler et le retirer de l'index des dépendances */
+static void deactivate_handler(EventHandlerObject *handler) {
+    handler->active = 0;
+    unsubscribe_handler(handler);
 }
 
 /* =================== ANALYSE DES CONDITIONS =================== */
 
-/* Vérifier si un handler est impossible à évaluer */
-static int is_handler_impossible(PyObject *handler) {
-    PyObject *condition = PyTuple_GetItem(handler, 0);
+/* Classifier une condition - appelé une seule fois, à l'enregistrement du handler */
+static void analyze_condition(PyObject *condition, HandlerAnalysis *analysis) {
+    /* RÈGLE 1: Modules directs */
+    ModuleType direct_module = detect_direct_module_condition(condition);
+    if (direct_module != MODULE_UNKNOWN) {
+        analysis->rule = RULE_DIRECT_MODULE;
+        analysis->module = direct_module;
+        return;
+    }
+    
+    analysis->module = detect_condition_module_type(condition);
     
-    /* Vérifier dans le cache */
-    int index = get_handler_index(handler);
-    if (index >= 0 && g_handler_states[index].is_impossible != -1) {
-        return g_handler_states[index].is_impossible;
+    /* RÈGLE 2: Conditions simples */
+    if (is_simple_module_condition(condition)) {
+        analysis->rule = RULE_SIMPLE;
+        return;
     }
     
-    int is_impossible = 0;
+    /* RÈGLE 3: Conditions impossibles */
+    if (is_condition_impossible(condition)) {
+        analysis->rule = RULE_IMPOSSIBLE;
+        return;
+    }
     
-    /* Mode read-only pour éviter les effets de bord */
-    int old_in_condition = g_in_condition_evaluation;
-    g_in_condition_evaluation = 1;
+    /* RÈGLE 4: Conditions avec comparaison */
+    analysis->rule = RULE_COMPARISON;
+}
+
+/* Vérifier si une condition ne peut jamais être vraie, sans l'exécuter :
+ * objet non appelable, ou expression constante fausse (lambda: False, lambda: 1 == 2) */
+static int is_condition_impossible(PyObject *condition) {
+    if (condition == Py_None) {
+        return 0;
+    }
     
-    PyObject *result = PyObject_CallFunction(condition, NULL);
-    g_in_condition_evaluation = old_in_condition;
+    if (!PyCallable_Check(condition)) {
+        return 1;
+    }
     
-    if (result == NULL) {
-        /* Exception = condition impossible */
-        PyErr_Clear();
-        is_impossible = 1;
-    } else {
-        /* Vérifier si c'est un objet Config vide */
-        PyObject *type_name = PyObject_GetAttrString((PyObject*)Py_TYPE(result), "__name__");
-        if (type_name && PyUnicode_Check(type_name)) {
-            const char *name = PyUnicode_AsUTF8(type_name);
-            if (name && strcmp(name, "Config") == 0) {
-                PyObject *str_repr = PyObject_Str(result);
-                if (str_repr && PyUnicode_Check(str_repr)) {
-                    const char *repr_str = PyUnicode_AsUTF8(str_repr);
-                    if (repr_str && (strcmp(repr_str, "{}") == 0 || strlen(repr_str) <= 2)) {
-                        is_impossible = 1;
-                    }
-                }
-                Py_XDECREF(str_repr);
-            }
-        }
-        Py_XDECREF(type_name);
-        
-        /* Détecter les conditions avec "and False" */
-        if (!is_impossible && PyCallable_Check(condition) && PyFunction_Check(condition)) {
-            PyObject *code_obj = PyFunction_GetCode(condition);
-            if (code_obj) {
-                PyObject *co_consts = PyObject_GetAttrString(code_obj, "co_consts");
-                if (co_consts && PyTuple_Check(co_consts)) {
-                    Py_ssize_t consts_len = PyTuple_Size(co_consts);
-                    for (Py_ssize_t j = 0; j < consts_len; j++) {
-                        PyObject *const_val = PyTuple_GetItem(co_consts, j);
-                        if (const_val == Py_False) {
-                            if (result == Py_False || PyObject_IsTrue(result) == 0) {
-                                is_impossible = 1;
-                            }
-                            break;
-                        }
-                    }
-                    Py_DECREF(co_consts);
-                }
-            }
-        }
-        
-        Py_DECREF(result);
+    if (!PyFunction_Check(condition) || PyFunction_GetClosure(condition) != NULL) {
+        return 0;
+    }
+    
+    PyObject *code_obj = PyFunction_GetCode(condition);
+    if (!code_obj) {
+        return 0;
     }
     
-    /* Sauvegarder dans le cache */
-    if (index >= 0) {
-        g_handler_states[index].is_impossible = is_impossible;
+    /* Expression constante = aucun nom lu et aucun argument */
+    PyObject *co_names = PyObject_GetAttrString(code_obj, "co_names");
+    PyObject *co_argcount = PyObject_GetAttrString(code_obj, "co_argcount");
+    int is_constant = co_names && PyTuple_Check(co_names) && PyTuple_Size(co_names) == 0 &&
+                      co_argcount && PyLong_Check(co_argcount) && PyLong_AsLong(co_argcount) == 0;
+    Py_XDECREF(co_names);
+    Py_XDECREF(co_argcount);
+    PyErr_Clear();
+    
+    if (!is_constant) {
+        return 0;
+    }
+    
+    /* Sans nom ni argument, l'évaluation n'a pas d'effet de bord */
+    PyObject *result = PyObject_CallFunction(condition, NULL);
+    if (result == NULL) {
+        capture_condition_error();
+        return 1;
     }
     
+    int is_impossible = (PyObject_IsTrue(result) == 0);
+    Py_DECREF(result);
+    PyErr_Clear();
     return is_impossible;
 }
 
@@ -315,32 +572,6 @@ static int is_simple_module_condition(PyObject *condition) {
         }
     }
     
-    /* Vérifier que la condition simple n'accède pas à une propriété inexistante */
-    if (is_simple) {
-        PyObject *result = PyObject_CallFunction(condition, NULL);
-        if (result != NULL) {
-            PyObject *type_name = PyObject_GetAttrString((PyObject*)Py_TYPE(result), "__name__");
-            if (type_name && PyUnicode_Check(type_name)) {
-                const char *name = PyUnicode_AsUTF8(type_name);
-                if (name && strcmp(name, "Config") == 0) {
-                    PyObject *str_repr = PyObject_Str(result);
-                    if (str_repr && PyUnicode_Check(str_repr)) {
-                        const char *repr_str = PyUnicode_AsUTF8(str_repr);
-                        if (repr_str && (strcmp(repr_str, "{}") == 0 || strlen(repr_str) <= 2)) {
-                            is_simple = 0; /* Objet Config vide = pas simple */
-                        }
-                    }
-                    Py_XDECREF(str_repr);
-                }
-            }
-            Py_XDECREF(type_name);
-            Py_DECREF(result);
-        } else {
-            PyErr_Clear();
-            is_simple = 0; /* Exception = pas simple */
-        }
-    }
-    
     Py_DECREF(co_names);
     return is_simple;
 }
@@ -394,23 +625,6 @@ static ModuleType detect_direct_module_condition(PyObject *condition) {
     return detected_module;
 }
 
-/* Détecter les conditions avec constantes toujours vraies (déclenchements multiples) */
-static int has_always_true_constants(PyObject *condition) {
-    /* CORRECTION CRITIQUE : Cette fonction était défectueuse !
-     * 
-     * Une condition comme :
-     * lambda: pyfasty.registry.event_test_5_sync == "8458DD-NCHDDD-11ADD2" and 8770 == 8770 and True
-     * 
-     * N'EST PAS "toujours vraie" car elle dépend de la valeur de event_test_5_sync !
-     * 
-     * Le fait qu'elle contienne "8770 == 8770" et "True" ne la rend pas toujours vraie.
-     * 
-     * SOLUTION : Retourner toujours 0 (false) pour forcer le comportement normal
-     * de déclenchement sur changement False→True uniquement.
-     */
-    return 0;  /* Aucune condition n'est considérée comme "toujours vraie" */
-}
-
 /* Évaluer une condition */
 static int evaluate_condition(PyObject *condition) {
     if (condition == Py_None) {
@@ -422,6 +636,13 @@ static int evaluate_condition(PyObject *condition) {
     }
     
     PyObject *result = PyObject_CallFunction(condition, NULL);
+    if (result != NULL && PyBool_Check(result)) {
+        /* Cas courant (comparaison) : aucune inspection du type nécessaire */
+        int is_true = (result == Py_True);
+        Py_DECREF(result);
+        return is_true;
+    }
+    
     if (result != NULL) {
         int is_true = PyObject_IsTrue(result);
         
@@ -460,184 +681,1502 @@ static int evaluate_condition(PyObject *condition) {
         Py_DECREF(result);
         return is_true;
     } else {
-        PyErr_Clear();
+        capture_condition_error();
         return 0;
     }
 }
 
-/* =================== EXÉCUTION =================== */
+/* =================== COMPILATION DES CONDITIONS =================== */
 
-/* Exécuter un callback */
-static void execute_callback(PyObject *callback) {
-    g_in_callback_execution = 1;
-    
-    PyObject *result = PyObject_CallFunction(callback, NULL);
-    if (result == NULL) {
-        PyErr_Clear();
-    } else {
-        Py_DECREF(result);
+/* Opt-in (compile=True) : les conditions de la forme
+ *     lambda: pyfasty.registry.x.y > N and pyfasty.config.z == "s" or ...
+ * sont reconnues dans le bytecode à l'enregistrement et évaluées sans frame Python,
+ * en lisant directement les données des nœuds. Toute autre forme reste interprétée. */
+
+/* Opérande : constante, ou chemin global.attr.attr... */
+typedef struct {
+    PyObject *constant;               /* NULL pour un chemin */
+    PyObject *global;                 /* Nom global de départ */
+    PyObject *names;                  /* Tuple des attributs */
+    const void **seen;                /* Objets résolus à la dernière évaluation (comparés, jamais déréférencés) */
+} CompiledOperand;
+
+/* Comparaison suivie d'une sortie anticipée (and/or) */
+typedef struct {
+    CompiledOperand left;
+    CompiledOperand right;
+    int op;                           /* Py_LT, Py_EQ... */
+    int exit_on;                      /* 0 : sortie si faux (and), 1 : sortie si vrai (or), -1 : dernière */
+} CompiledLeaf;
+
+struct CompiledPredicate {
+    PyObject *globals;                /* Globals de la lambda */
+    Py_ssize_t count;
+    CompiledLeaf *leaves;
+};
+
+/* Types Registry et Config, relevés à la première compilation */
+static PyTypeObject *g_compiled_registry_type = NULL;
+static PyTypeObject *g_compiled_config_type = NULL;
+
+/* Résultat de l'évaluation compilée quand la forme rencontrée demande l'interpréteur */
+#define COMPILED_FALLBACK -2
+
+static void compiled_operand_clear(CompiledOperand *operand) {
+    Py_CLEAR(operand->constant);
+    Py_CLEAR(operand->global);
+    Py_CLEAR(operand->names);
+    PyMem_Free(operand->seen);
+    operand->seen = NULL;
+}
+
+static void compiled_predicate_free(CompiledPredicate *predicate) {
+    if (predicate == NULL) {
+        return;
     }
-    
-    g_in_callback_execution = 0;
+    for (Py_ssize_t i = 0; i < predicate->count; i++) {
+        compiled_operand_clear(&predicate->leaves[i].left);
+        compiled_operand_clear(&predicate->leaves[i].right);
+    }
+    PyMem_Free(predicate->leaves);
+    Py_XDECREF(predicate->globals);
+    PyMem_Free(predicate);
 }
 
-/* Fonction simple pour tracer l'accès aux modules */
-void pyfasty_trace_module_access(ModuleType module) {
-    /* Version simplifiée - juste pour compatibilité */
+static int compiled_predicate_traverse(CompiledPredicate *predicate, visitproc visit, void *arg) {
+    if (predicate == NULL) {
+        return 0;
+    }
+    Py_VISIT(predicate->globals);
+    for (Py_ssize_t i = 0; i < predicate->count; i++) {
+        Py_VISIT(predicate->leaves[i].left.constant);
+        Py_VISIT(predicate->leaves[i].right.constant);
+    }
+    return 0;
 }
 
-/* =================== FONCTION PRINCIPALE =================== */
+/* Relever les types Registry/Config depuis le module */
+static int compiled_types_ready(void) {
+    if (g_compiled_registry_type != NULL && g_compiled_config_type != NULL) {
+        return 1;
+    }
+    PyObject *module = PyImport_ImportModule("pyfasty._pyfasty");
+    if (module == NULL) {
+        PyErr_Clear();
+        return 0;
+    }
+    PyObject *registry = PyObject_GetAttrString(module, "registry");
+    PyObject *config = PyObject_GetAttrString(module, "config");
+    Py_DECREF(module);
+    if (registry != NULL && config != NULL) {
+        g_compiled_registry_type = Py_TYPE(registry);
+        g_compiled_config_type = Py_TYPE(config);
+    }
+    Py_XDECREF(registry);
+    Py_XDECREF(config);
+    PyErr_Clear();
+    return g_compiled_registry_type != NULL;
+}
 
-/* Fonction principale d'évaluation des événements */
-PyObject *event_evaluate_all(PyObject *self, PyObject *args) {
-    /* PROTECTION ANTI-BOUCLE INFINIE */
-    if (g_is_evaluating || !g_events_enabled || !g_event_handlers) {
-        return Py_BuildValue("");
+/* Vérifier à la compilation qu'un chemin part de pyfasty.registry / pyfasty.config
+ * (ou d'une racine importée directement) et n'emprunte aucun attribut interne */
+static int compiled_path_is_supported(PyObject *globals, CompiledOperand *operand) {
+    PyObject *start = PyDict_GetItem(globals, operand->global);
+    if (start == NULL) {
+        return 0;
     }
     
-    /* Éviter les évaluations trop profondes */
-    if (g_evaluation_depth >= MAX_EVALUATION_DEPTH) {
-        PyErr_SetString(PyExc_RecursionError, "Maximum event evaluation depth reached - infinite loop detected");
-        return NULL;
+    Py_ssize_t count = PyTuple_GET_SIZE(operand->names);
+    for (Py_ssize_t i = 0; i < count; i++) {
+        const char *name = PyUnicode_AsUTF8(PyTuple_GET_ITEM(operand->names, i));
+        if (name == NULL || name[0] == '_') {
+            PyErr_Clear();
+            return 0;
+        }
     }
     
-    g_is_evaluating = 1;
-    g_evaluation_depth++;
-    g_current_timestamp++; /* Nouvel timestamp pour chaque évaluation */
-    
-    Py_ssize_t len = PyList_Size(g_event_handlers);
+    if (Py_TYPE(start) == g_compiled_registry_type || Py_TYPE(start) == g_compiled_config_type) {
+        return 1;
+    }
     
-    for (Py_ssize_t i = 0; i < len; i++) {
-        PyObject *handler = PyList_GetItem(g_event_handlers, i);
-        if (!handler || !PyTuple_Check(handler) || PyTuple_Size(handler) != 2) {
-            continue;
-        }
-        
-        PyObject *condition = PyTuple_GetItem(handler, 0);
-        PyObject *callback = PyTuple_GetItem(handler, 1);
-        
-        /* Protection contre les déclenchements multiples dans la même évaluation */
-        if (has_triggered_this_evaluation(handler)) {
-            continue;
-        }
-        
-        /* RÈGLE 1: Modules directs = déclenchements multiples */
-        ModuleType direct_module = detect_direct_module_condition(condition);
-        if (direct_module != MODULE_UNKNOWN) {
-            mark_handler_as_direct_module(handler, 1);
-            
-            if (g_current_module == direct_module) {
-                execute_callback(callback);
-                mark_triggered_this_evaluation(handler);
-            }
-            continue;
-        }
-        
-        /* RÈGLE 2: Conditions simples = déclenchement sur changement False→True */
-        if (is_simple_module_condition(condition)) {
-            ModuleType condition_module = detect_condition_module_type(condition);
-            
-            if (g_current_module == condition_module) {
-                int current_state = evaluate_condition(condition) ? 1 : 0;
-                int last_state = get_handler_last_state(handler);
-                
-                /* Déclenchement uniquement sur changement False→True */
-                if (current_state == 1 && last_state != 1) {
-                    execute_callback(callback);
-                    mark_triggered_this_evaluation(handler);
-                }
-                
-                set_handler_last_state(handler, current_state);
-            }
-            continue;
-        }
-        
-        /* RÈGLE 3: Conditions impossibles = jamais */
-        if (is_handler_impossible(handler)) {
-            continue;
-        }
-        
-        /* RÈGLE 4: Conditions avec comparaison */
-        ModuleType condition_module = detect_condition_module_type(condition);
-        
-        int should_evaluate = 0;
-        if (condition_module == MODULE_ALL) {
-            /* Conditions mixtes: se déclenchent avec config ou registry */
-            should_evaluate = (g_current_module == MODULE_CONFIG || g_current_module == MODULE_REGISTRY);
-        } else {
-            /* Conditions normales: se déclenchent avec leur module spécifique */
-            should_evaluate = (g_current_module == condition_module);
-        }
-        
-        if (should_evaluate) {
-            int current_state = evaluate_condition(condition) ? 1 : 0;
-            int last_state = get_handler_last_state(handler);
-            
-            if (current_state == 1) {
-                /* Détecter les conditions avec constantes toujours vraies pour Test 5 */
-                int has_always_true = has_always_true_constants(condition);
-                
-                if (has_always_true) {
-                    /* Conditions toujours vraies: déclenchement à chaque évaluation vraie */
-                    execute_callback(callback);
-                    /* NE PAS marquer comme déclenché pour permettre déclenchements multiples */
-                } else {
-                    /* Conditions normales : déclenchement unique False→True */
-                    if (last_state != 1 && !has_triggered_this_evaluation(handler)) {
-                        execute_callback(callback);
-                        mark_triggered_this_evaluation(handler);
-                    }
-                    /* Sauvegarder l'état pour les conditions normales */
-                    set_handler_last_state(handler, current_state);
-                }
-            } else {
-                /* Condition false - sauvegarder l'état */
-                set_handler_last_state(handler, current_state);
-            }
+    /* pyfasty.registry... ou pyfasty.config... */
+    if (PyModule_Check(start) && count >= 1) {
+        const char *module_name = PyModule_GetName(start);
+        const char *root = PyUnicode_AsUTF8(PyTuple_GET_ITEM(operand->names, 0));
+        if (module_name == NULL || root == NULL) {
+            PyErr_Clear();
+            return 0;
         }
+        return strcmp(module_name, "pyfasty") == 0 &&
+               (strcmp(root, "registry") == 0 || strcmp(root, "config") == 0);
     }
     
-    g_is_evaluating = 0;
-    g_evaluation_depth--;  /* DÉCRÉMENTER le compteur de profondeur */
-    Py_RETURN_NONE;
+    return 0;
 }
 
-/* =================== FONCTIONS SPÉCIALISÉES =================== */
-
-/* Fonction spécialisée pour les événements EXECUTOR_SYNC (compatibilité) */
-PyObject *event_sync_evaluate_executor_only(PyObject *self, PyObject *args) {
-    /* Utiliser la même logique que evaluate_all pour la simplicité */
-    return event_evaluate_all(self, args);
+/* Opérateur de COMPARE_OP ('>' ; 'bool(>)' depuis Python 3.13) */
+static int compiled_compare_op(PyObject *argval) {
+    const char *op = PyUnicode_Check(argval) ? PyUnicode_AsUTF8(argval) : NULL;
+    if (op == NULL) {
+        PyErr_Clear();
+        return -1;
+    }
+    if (strncmp(op, "bool(", 5) == 0) {
+        op += 5;
+    }
+    if (strncmp(op, "<=", 2) == 0) return Py_LE;
+    if (strncmp(op, ">=", 2) == 0) return Py_GE;
+    if (strncmp(op, "==", 2) == 0) return Py_EQ;
+    if (strncmp(op, "!=", 2) == 0) return Py_NE;
+    if (op[0] == '<') return Py_LT;
+    if (op[0] == '>') return Py_GT;
+    return -1;
 }
 
-/* =================== DÉCORATEUR =================== */
+/* États de l'analyse du bytecode */
+typedef enum {
+    PARSE_OPERANDS,                   /* Chargement des opérandes d'une comparaison */
+    PARSE_AFTER_LEAF,                 /* Comparaison lue : saut ou retour attendu */
+    PARSE_AFTER_COPY,                 /* Python 3.12+ : COPY 1 avant le saut */
+    PARSE_AFTER_JUMP,                 /* Python 3.12+ : POP_TOP après le saut */
+    PARSE_DONE
+} CompileState;
 
-/* Fonction __call__ du décorateur */
-PyObject *event_decorator_call(EventDecoratorObject *self, PyObject *args, PyObject *kwds) {
-    PyObject *func;
+/* Valeur par défaut d'un paramètre - les conditions sont appelées sans argument,
+ * un paramètre avec défaut (lambda i=i: ...) est donc une constante (référence empruntée) */
+static PyObject *compiled_default_value(PyObject *condition, PyObject *name) {
+    PyCodeObject *code = (PyCodeObject *)PyFunction_GetCode(condition);
+    PyObject *defaults = PyFunction_GetDefaults(condition);
+    PyObject *kwdefaults = PyFunction_GetKwDefaults(condition);
     
-    if (!PyArg_ParseTuple(args, "O:__call__", &func))
+    if (kwdefaults != NULL && PyDict_Check(kwdefaults)) {
+        PyObject *value = PyDict_GetItemWithError(kwdefaults, name);
+        if (value != NULL || PyErr_Occurred()) {
+            PyErr_Clear();
+            return value;
+        }
+    }
+    if (defaults == NULL || !PyTuple_Check(defaults)) {
         return NULL;
+    }
     
-    if (!g_events_enabled || !g_event_handlers) {
-        Py_INCREF(func);
-        return func;
+    PyObject *varnames = PyObject_GetAttrString((PyObject *)code, "co_varnames");
+    if (varnames == NULL) {
+        PyErr_Clear();
+        return NULL;
+    }
+    Py_ssize_t argcount = code->co_argcount;
+    Py_ssize_t first_default = argcount - PyTuple_GET_SIZE(defaults);
+    PyObject *value = NULL;
+    for (Py_ssize_t i = first_default; i < argcount && i < PyTuple_GET_SIZE(varnames); i++) {
+        if (i >= 0 && PyUnicode_Compare(PyTuple_GET_ITEM(varnames, i), name) == 0) {
+            value = PyTuple_GET_ITEM(defaults, i - first_default);
+            break;
+        }
+    }
+    Py_DECREF(varnames);
+    return value;
+}
+
+/* Compiler une condition - NULL si sa forme n'est pas reconnue (aucune erreur levée) */
+static CompiledPredicate *compile_condition(PyObject *condition) {
+    if (!PyFunction_Check(condition) || !compiled_types_ready()) {
+        return NULL;
     }
     
-    /* Créer un tuple (condition, callback) */
-    PyObject *handler_tuple = Py_BuildValue("(OO)", self->condition, func);
+    PyObject *dis = PyImport_ImportModule("dis");
+    PyObject *iterator = dis ? PyObject_CallMethod(dis, "get_instructions", "O", condition) : NULL;
+    PyObject *instructions = iterator ? PySequence_List(iterator) : NULL;
+    Py_XDECREF(iterator);
+    Py_XDECREF(dis);
+    if (instructions == NULL) {
+        PyErr_Clear();
+        return NULL;
+    }
     
-    if (handler_tuple) {
-        PyList_Append(g_event_handlers, handler_tuple);
-        Py_DECREF(handler_tuple);
+    CompiledPredicate *predicate = PyMem_Calloc(1, sizeof(CompiledPredicate));
+    Py_ssize_t total = PyList_GET_SIZE(instructions);
+    if (predicate == NULL || (predicate->leaves = PyMem_Calloc(total + 1, sizeof(CompiledLeaf))) == NULL) {
+        PyMem_Free(predicate);
+        Py_DECREF(instructions);
+        return NULL;
     }
+    predicate->globals = PyFunction_GetGlobals(condition);
+    Py_INCREF(predicate->globals);
     
-    Py_INCREF(func);
-    return func;
-}
-
-/* Définition du type EventDecorator */
-PyTypeObject EventDecoratorType = {
+    CompiledOperand operands[2];
+    memset(operands, 0, sizeof(operands));
+    int operand_count = 0;
+    int paths = 0;
+    long jump_targets[64];
+    int jump_count = 0;
+    long return_offset = -1;
+    CompileState state = PARSE_OPERANDS;
+    int ok = 1;
+    
+    for (Py_ssize_t i = 0; i < total && ok; i++) {
+        PyObject *instruction = PyList_GET_ITEM(instructions, i);
+        PyObject *opname_obj = PyObject_GetAttrString(instruction, "opname");
+        PyObject *argval = PyObject_GetAttrString(instruction, "argval");
+        PyObject *offset_obj = PyObject_GetAttrString(instruction, "offset");
+        const char *opname = opname_obj ? PyUnicode_AsUTF8(opname_obj) : NULL;
+        long offset = offset_obj ? PyLong_AsLong(offset_obj) : -1;
+        
+        if (opname == NULL || argval == NULL || offset < 0) {
+            ok = 0;
+        } else if (strcmp(opname, "RESUME") == 0 || strcmp(opname, "CACHE") == 0 ||
+                   strcmp(opname, "NOP") == 0 || strcmp(opname, "EXTENDED_ARG") == 0) {
+            /* Sans effet sur la pile */
+        } else if (state == PARSE_DONE) {
+            ok = 0;
+        } else if (state == PARSE_OPERANDS) {
+            if (strcmp(opname, "LOAD_GLOBAL") == 0 || strcmp(opname, "LOAD_CONST") == 0 ||
+                strcmp(opname, "LOAD_FAST") == 0) {
+                PyObject *fixed = opname[5] == 'F' && PyUnicode_Check(argval) ?
+                    compiled_default_value(condition, argval) : NULL;
+                if (operand_count == 2 || (opname[5] == 'F' && fixed == NULL)) {
+                    ok = 0;
+                } else {
+                    CompiledOperand *operand = &operands[operand_count++];
+                    if (fixed != NULL) {
+                        Py_INCREF(fixed);
+                        operand->constant = fixed;
+                    } else if (opname[5] == 'G') {
+                        Py_INCREF(argval);
+                        operand->global = argval;
+                        operand->names = PyTuple_New(0);
+                        ok = operand->names != NULL;
+                    } else {
+                        Py_INCREF(argval);
+                        operand->constant = argval;
+                    }
+                }
+            } else if (strcmp(opname, "LOAD_ATTR") == 0) {
+                CompiledOperand *operand = operand_count ? &operands[operand_count - 1] : NULL;
+                if (operand == NULL || operand->global == NULL || !PyUnicode_Check(argval)) {
+                    ok = 0;
+                } else {
+                    Py_ssize_t n = PyTuple_GET_SIZE(operand->names);
+                    PyObject *names = PyTuple_New(n + 1);
+                    if (names == NULL) {
+                        ok = 0;
+                    } else {
+                        for (Py_ssize_t k = 0; k < n; k++) {
+                            PyObject *item = PyTuple_GET_ITEM(operand->names, k);
+                            Py_INCREF(item);
+                            PyTuple_SET_ITEM(names, k, item);
+                        }
+                        Py_INCREF(argval);
+                        PyTuple_SET_ITEM(names, n, argval);
+                        Py_SETREF(operand->names, names);
+                    }
+                }
+            } else if (strcmp(opname, "COMPARE_OP") == 0) {
+                int op = compiled_compare_op(argval);
+                if (operand_count != 2 || op < 0) {
+                    ok = 0;
+                } else {
+                    CompiledLeaf *leaf = &predicate->leaves[predicate->count++];
+                    leaf->left = operands[0];
+                    leaf->right = operands[1];
+                    leaf->op = op;
+                    leaf->exit_on = -1;
+                    memset(operands, 0, sizeof(operands));
+                    operand_count = 0;
+                    
+                    /* Chaque chemin est validé et reçoit sa mémoire des objets résolus */
+                    CompiledOperand *sides[2] = {&leaf->left, &leaf->right};
+                    for (int side = 0; side < 2 && ok; side++) {
+                        if (sides[side]->global == NULL) {
+                            continue;
+                        }
+                        if (!compiled_path_is_supported(predicate->globals, sides[side])) {
+                            ok = 0;
+                            break;
+                        }
+                        sides[side]->seen = PyMem_Calloc(PyTuple_GET_SIZE(sides[side]->names) + 1, sizeof(void *));
+                        ok = sides[side]->seen != NULL;
+                        paths++;
+                    }
+                    state = PARSE_AFTER_LEAF;
+                }
+            } else {
+                ok = 0;
+            }
+        } else if (state == PARSE_AFTER_LEAF) {
+            CompiledLeaf *leaf = &predicate->leaves[predicate->count - 1];
+            if (strcmp(opname, "JUMP_IF_FALSE_OR_POP") == 0 || strcmp(opname, "JUMP_IF_TRUE_OR_POP") == 0) {
+                /* Python 3.8 - 3.11 */
+                leaf->exit_on = opname[8] == 'T';
+                ok = jump_count < 64 && PyLong_Check(argval);
+                if (ok) {
+                    jump_targets[jump_count++] = PyLong_AsLong(argval);
+                }
+                state = PARSE_OPERANDS;
+            } else if (strcmp(opname, "COPY") == 0 && PyLong_Check(argval) && PyLong_AsLong(argval) == 1) {
+                state = PARSE_AFTER_COPY;
+            } else if (strcmp(opname, "RETURN_VALUE") == 0) {
+                return_offset = offset;
+                state = PARSE_DONE;
+            } else {
+                ok = 0;
+            }
+        } else if (state == PARSE_AFTER_COPY) {
+            CompiledLeaf *leaf = &predicate->leaves[predicate->count - 1];
+            if (strcmp(opname, "TO_BOOL") == 0) {
+                /* Python 3.13 : conversion avant le saut */
+            } else if (strcmp(opname, "POP_JUMP_IF_FALSE") == 0 || strcmp(opname, "POP_JUMP_IF_TRUE") == 0) {
+                leaf->exit_on = opname[12] == 'T';
+                ok = jump_count < 64 && PyLong_Check(argval);
+                if (ok) {
+                    jump_targets[jump_count++] = PyLong_AsLong(argval);
+                }
+                state = PARSE_AFTER_JUMP;
+            } else {
+                ok = 0;
+            }
+        } else if (state == PARSE_AFTER_JUMP) {
+            ok = strcmp(opname, "POP_TOP") == 0;
+            state = PARSE_OPERANDS;
+        }
+        
+        Py_XDECREF(opname_obj);
+        Py_XDECREF(argval);
+        Py_XDECREF(offset_obj);
+    }
+    Py_DECREF(instructions);
+    PyErr_Clear();
+    
+    compiled_operand_clear(&operands[0]);
+    compiled_operand_clear(&operands[1]);
+    
+    /* Tous les sauts doivent mener au retour final : and/or sans imbrication de branches */
+    for (int j = 0; j < jump_count && ok; j++) {
+        ok = jump_targets[j] == return_offset;
+    }
+    
+    if (!ok || state != PARSE_DONE || paths == 0) {
+        compiled_predicate_free(predicate);
+        return NULL;
+    }
+    return predicate;
+}
+
+/* Résoudre un opérande (nouvelle référence) - NULL : forme à laisser à l'interpréteur.
+ * Les lectures sont tracées comme par registry_getattro / config_getattro */
+static PyObject *compiled_resolve(CompiledPredicate *predicate, CompiledOperand *operand, int *changed) {
+    if (operand->constant != NULL) {
+        Py_INCREF(operand->constant);
+        return operand->constant;
+    }
+    
+    PyObject *current = PyDict_GetItem(predicate->globals, operand->global);
+    if (current == NULL) {
+        return NULL;
+    }
+    Py_INCREF(current);
+    if (operand->seen[0] != current) {
+        operand->seen[0] = current;
+        *changed = 1;
+    }
+    
+    Py_ssize_t count = PyTuple_GET_SIZE(operand->names);
+    for (Py_ssize_t i = 0; i < count; i++) {
+        PyObject *name = PyTuple_GET_ITEM(operand->names, i);
+        PyObject *next = NULL;
+        
+        if (Py_TYPE(current) == g_compiled_registry_type) {
+            /* Seul un nœud Registry existant est renvoyé tel quel par registry_getattro */
+            next = pyfasty_node_get((PyFastyBaseObject *)current, name);
+            if (next == NULL || Py_TYPE(next) != g_compiled_registry_type) {
+                Py_DECREF(current);
+                return NULL;
+            }
+            Py_INCREF(next);
+            pyfasty_trace_module_access(MODULE_REGISTRY);
+            pyfasty_trace_node_access(MODULE_REGISTRY, current, name, next);
+        } else if (Py_TYPE(current) == g_compiled_config_type) {
+            next = pyfasty_node_get((PyFastyBaseObject *)current, name);
+            if (next == NULL) {
+                PyErr_Clear();  /* Nœud paresseux illisible : chemin non résolu */
+                Py_DECREF(current);
+                return NULL;
+            }
+            Py_INCREF(next);
+            pyfasty_trace_module_access(MODULE_CONFIG);
+            pyfasty_trace_node_access(MODULE_CONFIG, current, name,
+                                      Py_TYPE(next) == g_compiled_config_type ? next : NULL);
+        } else if (PyModule_Check(current)) {
+            next = PyObject_GetAttr(current, name);
+            if (next == NULL) {
+                PyErr_Clear();
+                Py_DECREF(current);
+                return NULL;
+            }
+        } else {
+            Py_DECREF(current);
+            return NULL;
+        }
+        
+        Py_DECREF(current);
+        current = next;
+        if (operand->seen[i + 1] != current) {
+            operand->seen[i + 1] = current;
+            *changed = 1;
+        }
+    }
+    
+    return current;
+}
+
+/* Oublier les nœuds résolus : la prochaine évaluation réenregistrera les dépendances */
+static void compiled_predicate_forget(CompiledPredicate *predicate) {
+    for (Py_ssize_t i = 0; i < predicate->count; i++) {
+        CompiledOperand *sides[2] = {&predicate->leaves[i].left, &predicate->leaves[i].right};
+        for (int side = 0; side < 2; side++) {
+            if (sides[side]->seen != NULL) {
+                memset(sides[side]->seen, 0, (PyTuple_GET_SIZE(sides[side]->names) + 1) * sizeof(void *));
+            }
+        }
+    }
+}
+
+/* Évaluer un prédicat compilé : 1/0, ou COMPILED_FALLBACK.
+ * *changed passe à 1 si un nœud lu diffère de l'évaluation précédente */
+static int compiled_predicate_evaluate(CompiledPredicate *predicate, int *changed) {
+    for (Py_ssize_t i = 0; i < predicate->count; i++) {
+        CompiledLeaf *leaf = &predicate->leaves[i];
+        
+        PyObject *left = compiled_resolve(predicate, &leaf->left, changed);
+        if (left == NULL) {
+            return COMPILED_FALLBACK;
+        }
+        PyObject *right = compiled_resolve(predicate, &leaf->right, changed);
+        if (right == NULL) {
+            Py_DECREF(left);
+            return COMPILED_FALLBACK;
+        }
+        
+        PyObject *result = PyObject_RichCompare(left, right, leaf->op);
+        Py_DECREF(left);
+        Py_DECREF(right);
+        if (result == NULL) {
+            /* Exception dans la lambda : condition fausse */
+            capture_condition_error();
+            return 0;
+        }
+        if (!PyBool_Check(result)) {
+            /* Résultat non booléen : vérité évaluée par evaluate_condition */
+            Py_DECREF(result);
+            return COMPILED_FALLBACK;
+        }
+        
+        int value = (result == Py_True);
+        Py_DECREF(result);
+        if (leaf->exit_on < 0 || value == leaf->exit_on) {
+            return value;
+        }
+    }
+    return 0;
+}
+
+/* =================== EXÉCUTION =================== */
+
+/* Exécuter un callback - -1 si le callback a levé une exception (laissée en place) */
+static int execute_callback(PyObject *callback) {
+    g_in_callback_execution = 1;
+    
+    int status = 0;
+    PyObject *result = PyObject_CallFunction(callback, NULL);
+    if (result == NULL) {
+        status = -1;
+    } else {
+        Py_DECREF(result);
+    }
+    
+    g_in_callback_execution = 0;
+    return status;
+}
+
+/* =================== EXÉCUTION ASYNCHRONE =================== */
+
+/* File bornée des handlers à exécuter par le thread de dispatch */
+#define EVENT_ASYNC_QUEUE_SIZE 4096
+
+static PyObject *g_async_queue[EVENT_ASYNC_QUEUE_SIZE];
+static int g_async_head = 0;
+static int g_async_count = 0;
+static int g_async_busy = 0;          /* Callback en cours dans le thread de dispatch */
+static int g_async_started = 0;
+static int g_async_stopping = 0;
+static unsigned long g_async_thread_ident = 0;
+static PyFasty_Mutex g_async_mutex;
+static PyFasty_Cond g_async_not_empty;
+static PyFasty_Cond g_async_idle;
+static PyFasty_Thread g_async_thread;
+
+/* Thread de dispatch : exécute les callbacks dans l'ordre de déclenchement */
+static void *event_async_worker(void *arg) {
+    g_async_thread_ident = PyThread_get_thread_ident();
+    
+    for (;;) {
+        PyFasty_MutexLock(&g_async_mutex);
+        while (g_async_count == 0 && !g_async_stopping) {
+            PyFasty_CondWait(&g_async_not_empty, &g_async_mutex);
+        }
+        if (g_async_count == 0) {
+            PyFasty_MutexUnlock(&g_async_mutex);
+            break;
+        }
+        PyObject *handler = g_async_queue[g_async_head];
+        g_async_head = (g_async_head + 1) % EVENT_ASYNC_QUEUE_SIZE;
+        g_async_count--;
+        g_async_busy = 1;
+        PyFasty_MutexUnlock(&g_async_mutex);
+        
+        /* Le mutex n'est jamais tenu en attendant le GIL */
+        PyGILState_STATE gstate = PyGILState_Ensure();
+        PyObject *result = PyObject_CallFunction(handler, NULL);
+        Py_XDECREF(result);
+        PyErr_Clear();
+        Py_DECREF(handler);
+        PyGILState_Release(gstate);
+        
+        PyFasty_MutexLock(&g_async_mutex);
+        g_async_busy = 0;
+        if (g_async_count == 0) {
+            PyFasty_CondBroadcast(&g_async_idle);
+        }
+        PyFasty_MutexUnlock(&g_async_mutex);
+    }
+    
+    return NULL;
+}
+
+/* Démarrer le thread de dispatch au premier handler asynchrone */
+static int event_async_start(void) {
+    if (g_async_started) {
+        return 0;
+    }
+    
+    if (PyFasty_MutexInit(&g_async_mutex) != 0 ||
+        PyFasty_CondInit(&g_async_not_empty) != 0 ||
+        PyFasty_CondInit(&g_async_idle) != 0) {
+        PyErr_SetString(PyExc_RuntimeError, "Unable to initialize event dispatch queue");
+        return -1;
+    }
+    
+    g_async_stopping = 0;
+    if (PyFasty_ThreadCreateNamed(&g_async_thread, event_async_worker, NULL, NULL) != 0) {
+        PyErr_SetString(PyExc_RuntimeError, "Unable to start event dispatch thread");
+        return -1;
+    }
+    
+    g_async_started = 1;
+    return 0;
+}
+
+/* Compter un déclenchement abandonné selon la politique du handler */
+static int event_async_admit(EventHandlerObject *handler) {
+    if (handler->pending > 0 && (handler->coalesce || handler->pending >= handler->max_pending)) {
+        handler->dropped++;
+        return 0;
+    }
+    return 1;
+}
+
+/* =================== LIMITATION DE FRÉQUENCE =================== */
+
+/* Horloge monotone en millisecondes */
+static double event_monotonic_ms(void) {
+#ifdef PYFASTY_WINDOWS
+    return (double)GetTickCount64();
+#else
+    struct timespec now;
+    clock_gettime(CLOCK_MONOTONIC, &now);
+    return now.tv_sec * 1000.0 + now.tv_nsec / 1000000.0;
+#endif
+}
+
+/* Appliquer debounce_ms / throttle_ms / max_rate - 0 : déclenchement supprimé */
+static int rate_limit_allows(EventHandlerObject *handler) {
+    if (handler->debounce_ms <= 0 && handler->throttle_ms <= 0 && handler->max_rate <= 0) {
+        handler->fired++;
+        return 1;
+    }
+    
+    double now = event_monotonic_ms();
+    
+    /* Debounce : seul un déclenchement précédé de debounce_ms de silence passe */
+    if (handler->debounce_ms > 0) {
+        int quiet = handler->last_attempt < 0 || now - handler->last_attempt >= handler->debounce_ms;
+        handler->last_attempt = now;
+        if (!quiet) {
+            handler->suppressed++;
+            return 0;
+        }
+    }
+    
+    /* Throttle : au plus un déclenchement par intervalle */
+    if (handler->throttle_ms > 0 && handler->last_fired >= 0 &&
+        now - handler->last_fired < handler->throttle_ms) {
+        handler->suppressed++;
+        return 0;
+    }
+    
+    /* Max rate : seau à jetons rempli à max_rate par seconde */
+    if (handler->max_rate > 0) {
+        double capacity = handler->max_rate < 1 ? 1 : handler->max_rate;
+        double tokens = capacity;
+        if (handler->last_fired >= 0) {
+            /* Jetons mémorisés au dernier déclenchement accepté */
+            tokens = handler->tokens + (now - handler->last_fired) * handler->max_rate / 1000.0;
+            if (tokens > capacity) {
+                tokens = capacity;
+            }
+        }
+        if (tokens < 1) {
+            handler->suppressed++;
+            return 0;
+        }
+        handler->tokens = tokens - 1;
+    }
+    
+    handler->last_fired = now;
+    handler->fired++;
+    return 1;
+}
+
+/* =================== GESTION DES ERREURS =================== */
+
+/* Exception courante normalisée, traceback attaché, indicateur effacé (nouvelle référence) */
+static PyObject *event_fetch_error(void) {
+    PyObject *type, *value, *traceback;
+    PyErr_Fetch(&type, &value, &traceback);
+    if (type == NULL) {
+        return NULL;
+    }
+    PyErr_NormalizeException(&type, &value, &traceback);
+    if (value != NULL && traceback != NULL) {
+        PyException_SetTraceback(value, traceback);
+    }
+    Py_XDECREF(type);
+    Py_XDECREF(traceback);
+    return value;
+}
+
+/* Exception d'une condition : conservée jusqu'à ce que le handler concerné la traite */
+static void capture_condition_error(void) {
+    g_condition_failed = 1;
+    Py_XSETREF(g_condition_error, event_fetch_error());
+}
+
+/* Ajouter une erreur à la file circulaire (la plus ancienne est écrasée) */
+static void error_ring_push(PyObject *entry) {
+    if (g_error_ring == NULL) {
+        g_error_ring = PyList_New(g_error_capacity);
+        if (g_error_ring == NULL) {
+            PyErr_Clear();
+            return;
+        }
+        for (Py_ssize_t i = 0; i < g_error_capacity; i++) {
+            Py_INCREF(Py_None);
+            PyList_SET_ITEM(g_error_ring, i, Py_None);
+        }
+    }
+    
+    Py_ssize_t slot = (g_error_head + g_error_count) % g_error_capacity;
+    Py_INCREF(entry);
+    PyList_SetItem(g_error_ring, slot, entry);
+    if (g_error_count < g_error_capacity) {
+        g_error_count++;
+    } else {
+        g_error_head = (g_error_head + 1) % g_error_capacity;
+    }
+}
+
+/* Traiter l'exception d'un handler selon la politique (error : référence volée, peut être NULL) */
+static void handler_error(EventHandlerObject *handler, ErrorPhase phase, PyObject *error) {
+    int failures = ++handler->failures[phase];
+    int disable = g_error_max_failures > 0 && failures >= g_error_max_failures && handler->active;
+    
+    if (g_error_policy == ERROR_POLICY_LOG && error != NULL) {
+        Py_INCREF(Py_TYPE(error));
+        PyErr_Restore((PyObject *)Py_TYPE(error), error, PyException_GetTraceback(error));
+        error = NULL;
+        PyErr_WriteUnraisable(phase == ERROR_PHASE_CONDITION ? handler->condition : handler->callback);
+    } else if (g_error_policy == ERROR_POLICY_COLLECT) {
+        PyObject *entry = Py_BuildValue("{s:O,s:s,s:O,s:i,s:O}",
+                                        "callback", handler->callback,
+                                        "phase", g_error_phase_names[phase],
+                                        "error", error ? error : Py_None,
+                                        "failures", failures,
+                                        "disabled", disable ? Py_True : Py_False);
+        if (entry != NULL) {
+            error_ring_push(entry);
+            Py_DECREF(entry);
+        } else {
+            PyErr_Clear();
+        }
+    }
+    Py_XDECREF(error);
+    
+    if (disable) {
+        deactivate_handler(handler);
+    }
+}
+
+/* Réussite : le compteur d'échecs consécutifs de cette phase repart de zéro */
+static void handler_succeeded(EventHandlerObject *handler, ErrorPhase phase) {
+    handler->failures[phase] = 0;
+}
+
+/* =================== INSTRUMENTATION =================== */
+
+/* Horloge monotone en nanosecondes */
+static long long event_monotonic_ns(void) {
+#ifdef PYFASTY_WINDOWS
+    LARGE_INTEGER counter, frequency;
+    QueryPerformanceCounter(&counter);
+    QueryPerformanceFrequency(&frequency);
+    return (long long)(counter.QuadPart * (1e9 / (double)frequency.QuadPart));
+#else
+    struct timespec now;
+    clock_gettime(CLOCK_MONOTONIC, &now);
+    return now.tv_sec * 1000000000LL + now.tv_nsec;
+#endif
+}
+
+/* Seau d'une latence : linéaire sous 16 ns, puis 8 sous-seaux par puissance de deux */
+static int histogram_bucket(long long ns) {
+    if (ns < EVENT_HISTOGRAM_LINEAR) {
+        return ns < 0 ? 0 : (int)ns;
+    }
+    int octave = 4;
+    while (octave < 4 + EVENT_HISTOGRAM_OCTAVES - 1 && (ns >> (octave + 1)) != 0) {
+        octave++;
+    }
+    if ((ns >> (octave + 1)) != 0) {
+        return EVENT_HISTOGRAM_BUCKETS - 1;
+    }
+    int sub = (int)((ns >> (octave - 3)) & (EVENT_HISTOGRAM_SUB_BUCKETS - 1));
+    return EVENT_HISTOGRAM_LINEAR + (octave - 4) * EVENT_HISTOGRAM_SUB_BUCKETS + sub;
+}
+
+/* Borne inférieure (ns) d'un seau */
+static long long histogram_bucket_floor(int index) {
+    if (index < EVENT_HISTOGRAM_LINEAR) {
+        return index;
+    }
+    int octave = 4 + (index - EVENT_HISTOGRAM_LINEAR) / EVENT_HISTOGRAM_SUB_BUCKETS;
+    int sub = (index - EVENT_HISTOGRAM_LINEAR) % EVENT_HISTOGRAM_SUB_BUCKETS;
+    return (long long)(EVENT_HISTOGRAM_SUB_BUCKETS + sub) << (octave - 3);
+}
+
+static void histogram_record(LatencyHistogram *histogram, long long ns) {
+    histogram->count++;
+    histogram->total += ns;
+    if (ns > histogram->max) {
+        histogram->max = ns;
+    }
+    histogram->buckets[histogram_bucket(ns)]++;
+}
+
+/* Percentile q (0..1) : borne supérieure du seau atteint, limitée au maximum observé */
+static long long histogram_percentile(const LatencyHistogram *histogram, double q) {
+    if (histogram->count == 0) {
+        return 0;
+    }
+    long long rank = (long long)(q * histogram->count);
+    if (rank < q * histogram->count || rank == 0) {
+        rank++;
+    }
+    long long seen = 0;
+    for (int i = 0; i < EVENT_HISTOGRAM_BUCKETS - 1; i++) {
+        seen += histogram->buckets[i];
+        if (seen >= rank) {
+            long long ceiling = histogram_bucket_floor(i + 1) - 1;
+            return ceiling < histogram->max ? ceiling : histogram->max;
+        }
+    }
+    return histogram->max;
+}
+
+/* {"count", "total", "mean", "max", "p50", "p90", "p99", "buckets": [(borne_ns, nombre), ...]} */
+static PyObject *histogram_to_dict(const LatencyHistogram *histogram) {
+    PyObject *buckets = PyList_New(0);
+    if (buckets == NULL) {
+        return NULL;
+    }
+    for (int i = 0; i < EVENT_HISTOGRAM_BUCKETS; i++) {
+        if (histogram->buckets[i] == 0) {
+            continue;
+        }
+        PyObject *bucket = Py_BuildValue("(LL)", histogram_bucket_floor(i), histogram->buckets[i]);
+        if (bucket == NULL || PyList_Append(buckets, bucket) < 0) {
+            Py_XDECREF(bucket);
+            Py_DECREF(buckets);
+            return NULL;
+        }
+        Py_DECREF(bucket);
+    }
+    
+    return Py_BuildValue("{s:L,s:L,s:d,s:L,s:L,s:L,s:L,s:N}",
+                         "count", histogram->count,
+                         "total", histogram->total,
+                         "mean", histogram->count ? (double)histogram->total / histogram->count : 0.0,
+                         "max", histogram->max,
+                         "p50", histogram_percentile(histogram, 0.50),
+                         "p90", histogram_percentile(histogram, 0.90),
+                         "p99", histogram_percentile(histogram, 0.99),
+                         "buckets", buckets);
+}
+
+/* Totaux du module déclencheur (MODULE_UNKNOWN : event_evaluate_all direct) */
+static const char *const g_module_stats_names[EVENT_STATS_MODULES] = {
+    "unknown", "config", "registry", "console", "executor_sync", "executor_async", "all"
+};
+
+static ModuleStats *module_stats(ModuleType module) {
+    switch (module) {
+        case MODULE_CONFIG:         return &g_module_stats[1];
+        case MODULE_REGISTRY:       return &g_module_stats[2];
+        case MODULE_CONSOLE:        return &g_module_stats[3];
+        case MODULE_EXECUTOR_SYNC:  return &g_module_stats[4];
+        case MODULE_EXECUTOR_ASYNC: return &g_module_stats[5];
+        case MODULE_ALL:            return &g_module_stats[6];
+        default:                    return &g_module_stats[0];
+    }
+}
+
+/* Instrumentation d'un handler, allouée à la première mesure (NULL si mémoire insuffisante) */
+static HandlerStats *handler_stats(EventHandlerObject *handler) {
+    if (handler->stats == NULL) {
+        handler->stats = PyMem_Calloc(1, sizeof(HandlerStats));
+    }
+    return handler->stats;
+}
+
+static void record_condition(EventHandlerObject *handler, long long elapsed, int failed) {
+    ModuleStats *totals = module_stats(g_current_module);
+    totals->evaluations++;
+    totals->errors += failed;
+    totals->condition_ns += elapsed;
+    
+    HandlerStats *stats = handler_stats(handler);
+    if (stats != NULL) {
+        stats->evaluations++;
+        stats->errors += failed;
+        histogram_record(&stats->condition, elapsed);
+    }
+}
+
+static void record_callback(EventHandlerObject *handler, long long elapsed, int failed) {
+    HandlerStats *stats = handler_stats(handler);
+    if (stats != NULL) {
+        stats->errors += failed;
+        histogram_record(&stats->callback, elapsed);
+    }
+}
+
+/* Mettre l'exécution du callback en file (thread de dispatch ou boucle asyncio) */
+static void dispatch_callback(EventHandlerObject *handler) {
+    if (!rate_limit_allows(handler)) {
+        return;
+    }
+    if (g_stats_enabled) {
+        module_stats(g_current_module)->fires++;
+    }
+    
+    if (handler->dispatch == DISPATCH_SYNC) {
+        long long start = g_stats_enabled ? event_monotonic_ns() : 0;
+        int status = execute_callback(handler->callback);
+        if (g_stats_enabled) {
+            record_callback(handler, event_monotonic_ns() - start, status < 0);
+        }
+        if (status < 0) {
+            handler_error(handler, ERROR_PHASE_CALLBACK, event_fetch_error());
+        } else {
+            handler_succeeded(handler, ERROR_PHASE_CALLBACK);
+        }
+        return;
+    }
+    
+    if (!event_async_admit(handler)) {
+        return;
+    }
+    
+    if (handler->dispatch == DISPATCH_ASYNCIO) {
+        handler->pending++;
+        PyObject *result = PyObject_CallMethod(handler->loop, "call_soon_threadsafe", "O", (PyObject *)handler);
+        if (result == NULL) {
+            /* Boucle fermée : le déclenchement est perdu */
+            PyErr_Clear();
+            handler->pending--;
+            handler->dropped++;
+            return;
+        }
+        Py_DECREF(result);
+        return;
+    }
+    
+    if (event_async_start() < 0) {
+        PyErr_Clear();
+        handler->dropped++;
+        return;
+    }
+    
+    PyFasty_MutexLock(&g_async_mutex);
+    if (g_async_count == EVENT_ASYNC_QUEUE_SIZE || g_async_stopping) {
+        PyFasty_MutexUnlock(&g_async_mutex);
+        handler->dropped++;
+        return;
+    }
+    Py_INCREF(handler);
+    g_async_queue[(g_async_head + g_async_count) % EVENT_ASYNC_QUEUE_SIZE] = (PyObject *)handler;
+    g_async_count++;
+    handler->pending++;
+    PyFasty_CondSignal(&g_async_not_empty);
+    PyFasty_MutexUnlock(&g_async_mutex);
+}
+
+/* Attendre que les callbacks asynchrones en file soient exécutés */
+PyObject *event_flush(PyObject *self, PyObject *args) {
+    /* Depuis un callback du thread de dispatch : attendre bloquerait le thread lui-même */
+    if (!g_async_started || PyThread_get_thread_ident() == g_async_thread_ident) {
+        Py_RETURN_NONE;
+    }
+    
+    Py_BEGIN_ALLOW_THREADS
+    PyFasty_MutexLock(&g_async_mutex);
+    while (g_async_count > 0 || g_async_busy) {
+        PyFasty_CondWait(&g_async_idle, &g_async_mutex);
+    }
+    PyFasty_MutexUnlock(&g_async_mutex);
+    Py_END_ALLOW_THREADS
+    
+    Py_RETURN_NONE;
+}
+
+/* Arrêt du thread de dispatch à la sortie de l'interpréteur (atexit) */
+static PyObject *event_async_shutdown(PyObject *self, PyObject *args) {
+    if (!g_async_started) {
+        Py_RETURN_NONE;
+    }
+    
+    PyFasty_MutexLock(&g_async_mutex);
+    g_async_stopping = 1;
+    PyFasty_CondSignal(&g_async_not_empty);
+    PyFasty_MutexUnlock(&g_async_mutex);
+    
+    /* Les callbacks encore en file sont exécutés avant l'arrêt */
+    Py_BEGIN_ALLOW_THREADS
+    PyFasty_ThreadJoin(&g_async_thread);
+    Py_END_ALLOW_THREADS
+    
+    g_async_started = 0;
+    Py_RETURN_NONE;
+}
+
+/* =================== SUIVI DES DÉPENDANCES =================== */
+
+/* Tracer l'accès à un module pendant l'évaluation d'une condition */
+void pyfasty_trace_module_access(ModuleType module) {
+    if (g_dependency_tracking && PyThread_get_thread_ident() == g_tracking_thread) {
+        g_tracking_modules |= module;
+    }
+}
+
+/* Clé d'un couple (nœud, nom) : lecture ou écriture de node.name */
+static PyObject *dependency_edge_key(PyObject *node, PyObject *name) {
+    PyObject *node_key = PyLong_FromVoidPtr(node);
+    if (node_key == NULL) {
+        return NULL;
+    }
+    PyObject *key = PyTuple_Pack(2, node_key, name);
+    Py_DECREF(node_key);
+    return key;
+}
+
+/* Tracer la lecture parent.name -> child pendant l'évaluation d'une condition
+ * child vaut NULL si la valeur lue n'est pas un nœud registry/config */
+void pyfasty_trace_node_access(ModuleType module, PyObject *parent, PyObject *name, PyObject *child) {
+    if (!g_dependency_tracking || g_tracking_reads == NULL || name == NULL ||
+        PyThread_get_thread_ident() != g_tracking_thread) {
+        return;
+    }
+    
+    /* Ignorer les attributs internes (__class__, _value...) */
+    if (PyUnicode_Check(name)) {
+        const char *name_str = PyUnicode_AsUTF8(name);
+        if (name_str == NULL || name_str[0] == '_') {
+            PyErr_Clear();
+            return;
+        }
+    }
+    
+    g_tracking_modules |= module;
+    
+    PyObject *edge_key = dependency_edge_key(parent, name);
+    if (edge_key == NULL) {
+        PyErr_Clear();
+        return;
+    }
+    
+    /* Valeur : module racine pour nommer le chemin (0 si le parent n'est pas une racine) */
+    PyObject *root = PyLong_FromLong(((PyFastyBaseObject *)parent)->depth == 0 ? module : 0);
+    if (root != NULL) {
+        PyDict_SetItem(g_tracking_reads, edge_key, root);
+        Py_DECREF(root);
+    }
+    
+    /* Le nœud atteint est lui-même une dépendance (modifications en place) */
+    if (child != NULL) {
+        PyObject *child_key = PyLong_FromVoidPtr(child);
+        if (child_key != NULL) {
+            if (PyDict_GetItem(g_tracking_reads, child_key) == NULL) {
+                PyDict_SetItem(g_tracking_reads, child_key, Py_None);
+            }
+            /* Mémoriser par quelle lecture le nœud a été atteint (chemins lisibles) */
+            PyDict_SetItem(g_tracking_parents, child_key, edge_key);
+            Py_DECREF(child_key);
+        }
+    }
+    
+    Py_DECREF(edge_key);
+    PyErr_Clear();
+}
+
+/* Chemin lisible d'une lecture (parent, name), reconstruit via les nœuds parents */
+static PyObject *dependency_path(PyObject *edge_key, PyObject *reads, PyObject *parents, int depth) {
+    PyObject *parent_key = PyTuple_GET_ITEM(edge_key, 0);
+    PyObject *name = PyTuple_GET_ITEM(edge_key, 1);
+    PyObject *via = PyDict_GetItem(parents, parent_key);
+    PyObject *prefix = NULL;
+    
+    if (via != NULL && via != edge_key && depth < PYFASTY_MAX_RECURSION_DEPTH_VALUE) {
+        prefix = dependency_path(via, reads, parents, depth + 1);
+    } else {
+        PyObject *root = PyDict_GetItem(reads, edge_key);
+        long module = (root && PyLong_Check(root)) ? PyLong_AsLong(root) : 0;
+        prefix = PyUnicode_FromString(module == MODULE_CONFIG ? "config" : 
+                                      module == MODULE_REGISTRY ? "registry" : "...");
+    }
+    
+    if (prefix == NULL) {
+        return NULL;
+    }
+    
+    PyObject *path = PyUnicode_Check(name) ? PyUnicode_FromFormat("%U.%U", prefix, name)
+                                           : PyUnicode_FromFormat("%U[%R]", prefix, name);
+    Py_DECREF(prefix);
+    return path;
+}
+
+/* Retirer un handler de l'index inverse */
+static void unsubscribe_handler(EventHandlerObject *handler) {
+    PyObject *deps = handler->dependencies;
+    if (deps == NULL || g_dependency_index == NULL) {
+        return;
+    }
+    
+    Py_ssize_t len = PyTuple_GET_SIZE(deps);
+    for (Py_ssize_t i = 0; i < len; i++) {
+        PyObject *key = PyTuple_GET_ITEM(deps, i);
+        PyObject *subscribers = PyDict_GetItem(g_dependency_index, key);
+        if (subscribers == NULL) {
+            continue;
+        }
+        if (PyDict_DelItem(subscribers, (PyObject *)handler) < 0) {
+            PyErr_Clear();
+        }
+        if (PyDict_Size(subscribers) == 0) {
+            PyDict_DelItem(g_dependency_index, key);
+        }
+    }
+    
+    Py_CLEAR(handler->dependencies);
+    Py_CLEAR(handler->dependency_paths);
+}
+
+/* Remplacer les dépendances d'un handler par les lectures de sa dernière évaluation */
+static void update_handler_dependencies(EventHandlerObject *handler, PyObject *reads, PyObject *parents, int modules) {
+    handler->tracked_modules = modules;
+    
+    /* Aucune lecture suivie : le handler reste évalué à chaque écriture de son module */
+    if (g_dependency_index == NULL || PyDict_Size(reads) == 0) {
+        unsubscribe_handler(handler);
+        return;
+    }
+    
+    PyObject *keys = PyDict_Keys(reads);
+    PyObject *deps = keys ? PyList_AsTuple(keys) : NULL;
+    Py_XDECREF(keys);
+    if (deps == NULL) {
+        PyErr_Clear();
+        return;
+    }
+    
+    /* Cas courant : mêmes lectures qu'à l'évaluation précédente, index inchangé */
+    PyObject *old_deps = handler->dependencies;
+    if (old_deps != NULL && PyObject_RichCompareBool(old_deps, deps, Py_EQ) == 1) {
+        Py_DECREF(deps);
+        return;
+    }
+    PyErr_Clear();
+    
+    unsubscribe_handler(handler);
+    
+    PyObject *paths = PyList_New(0);
+    if (paths == NULL) {
+        Py_DECREF(deps);
+        PyErr_Clear();
+        return;
+    }
+    
+    Py_ssize_t len = PyTuple_GET_SIZE(deps);
+    for (Py_ssize_t i = 0; i < len; i++) {
+        PyObject *key = PyTuple_GET_ITEM(deps, i);
+        if (PyTuple_Check(key)) {
+            PyObject *path = dependency_path(key, reads, parents, 0);
+            if (path != NULL) {
+                PyList_Append(paths, path);
+                Py_DECREF(path);
+            }
+        }
+        
+        PyObject *subscribers = PyDict_GetItem(g_dependency_index, key);
+        if (subscribers == NULL) {
+            subscribers = PyDict_New();
+            if (subscribers == NULL || PyDict_SetItem(g_dependency_index, key, subscribers) < 0) {
+                Py_XDECREF(subscribers);
+                PyErr_Clear();
+                continue;
+            }
+            Py_DECREF(subscribers);
+        }
+        PyDict_SetItem(subscribers, (PyObject *)handler, Py_None);
+    }
+    
+    handler->dependencies = deps;
+    handler->dependency_paths = PyList_AsTuple(paths);
+    Py_DECREF(paths);
+    PyErr_Clear();
+}
+
+/* Évaluer la condition d'un handler : prédicat compilé si possible, sinon interpréteur */
+static int evaluate_handler_condition(EventHandlerObject *handler) {
+    if (handler->compiled != NULL) {
+        int changed = 0;
+        int result = compiled_predicate_evaluate(handler->compiled, &changed);
+        if (result != COMPILED_FALLBACK) {
+            return result;
+        }
+        compiled_predicate_forget(handler->compiled);
+    }
+    return evaluate_condition(handler->condition);
+}
+
+/* Évaluer une condition en enregistrant les nœuds qu'elle lit */
+static int evaluate_tracked_condition(EventHandlerObject *handler) {
+    if (g_dependency_tracking) {
+        return evaluate_handler_condition(handler);
+    }
+    
+    /* Prédicat compilé qui relit les mêmes nœuds : les dépendances enregistrées restent valides */
+    if (handler->compiled != NULL && handler->dependencies != NULL) {
+        int changed = 0;
+        int result = compiled_predicate_evaluate(handler->compiled, &changed);
+        if (result != COMPILED_FALLBACK && !changed) {
+            return result;
+        }
+    }
+    
+    PyObject *reads = PyDict_New();
+    PyObject *parents = PyDict_New();
+    if (reads == NULL || parents == NULL) {
+        Py_XDECREF(reads);
+        Py_XDECREF(parents);
+        PyErr_Clear();
+        return evaluate_handler_condition(handler);
+    }
+    
+    g_tracking_reads = reads;
+    g_tracking_parents = parents;
+    g_tracking_modules = 0;
+    g_tracking_thread = PyThread_get_thread_ident();
+    g_dependency_tracking = 1;
+    
+    int result = evaluate_handler_condition(handler);
+    
+    g_dependency_tracking = 0;
+    g_tracking_thread = 0;
+    g_tracking_reads = NULL;
+    g_tracking_parents = NULL;
+    
+    update_handler_dependencies(handler, reads, parents, g_tracking_modules);
+    
+    Py_DECREF(reads);
+    Py_DECREF(parents);
+    return result;
+}
+
+/* Marquer les handlers abonnés à une clé pour l'écriture en cours */
+static void mark_dependents(PyObject *key) {
+    if (key == NULL) {
+        PyErr_Clear();
+        return;
+    }
+    
+    PyObject *subscribers = PyDict_GetItem(g_dependency_index, key);
+    Py_DECREF(key);
+    if (subscribers == NULL) {
+        return;
+    }
+    
+    PyObject *handler, *unused;
+    Py_ssize_t pos = 0;
+    while (PyDict_Next(subscribers, &pos, &handler, &unused)) {
+        ((EventHandlerObject *)handler)->due_stamp = g_dependency_stamp;
+    }
+}
+
+/* =================== MODES DE DÉCLENCHEMENT =================== */
+
+/* Décider du déclenchement d'après l'état précédent (-1 inconnu, traité comme faux).
+ * Un front réarme le handler au front opposé ; avec rearm_after_ms, il est aussi réarmé
+ * une fois ce délai écoulé si la condition est restée dans l'état déclencheur.
+ * En mode niveau, rearm_after_ms espace les déclenchements successifs. */
+static int trigger_fires(EventHandlerObject *handler, int state) {
+    int was_true = handler->last_state == 1;
+    int fire;
+    
+    switch (handler->trigger) {
+        case TRIGGER_FALLING:
+            fire = !state && was_true;
+            break;
+        case TRIGGER_CHANGE:
+            fire = state != was_true;
+            break;
+        case TRIGGER_LEVEL:
+            fire = state;
+            break;
+        default:
+            fire = state && !was_true;
+            break;
+    }
+    
+    if (handler->rearm_after_ms <= 0) {
+        return fire;
+    }
+    
+    double now = event_monotonic_ms();
+    int rearmed = handler->last_trigger_ms >= 0 && now - handler->last_trigger_ms >= handler->rearm_after_ms;
+    if (handler->trigger == TRIGGER_LEVEL) {
+        fire = fire && (handler->last_trigger_ms < 0 || rearmed);
+    } else if (!fire && rearmed && state == handler->trigger_state) {
+        fire = 1;
+    }
+    
+    if (fire) {
+        handler->last_trigger_ms = now;
+        handler->trigger_state = state;
+    }
+    return fire;
+}
+
+/* =================== FONCTION PRINCIPALE =================== */
+
+/* Évaluation des handlers : tous, ou seulement ceux concernés par l'écriture en cours
+ * (only_due) - les handlers sans dépendances suivies sont toujours évalués */
+static PyObject *evaluate_handlers(int only_due) {
+    /* PROTECTION ANTI-BOUCLE INFINIE */
+    if (g_is_evaluating || !g_events_enabled || !g_event_handlers) {
+        return Py_BuildValue("");
+    }
+    
+    /* Éviter les évaluations trop profondes */
+    if (g_evaluation_depth >= MAX_EVALUATION_DEPTH) {
+        if (g_stats_enabled) {
+            g_depth_limit_hits++;
+        }
+        PyErr_SetString(PyExc_RecursionError, "Maximum event evaluation depth reached - infinite loop detected");
+        return NULL;
+    }
+    
+    g_is_evaluating = 1;
+    g_evaluating_thread = PyThread_get_thread_ident();
+    g_evaluation_depth++;
+    g_current_timestamp++; /* Nouvel timestamp pour chaque évaluation */
+    if (g_stats_enabled) {
+        module_stats(g_current_module)->passes++;
+        if (g_evaluation_depth > g_max_evaluation_depth) {
+            g_max_evaluation_depth = g_evaluation_depth;
+        }
+    }
+    
+    /* La liste peut changer pendant un callback (event_remove) : taille relue à chaque tour */
+    for (Py_ssize_t i = 0; i < PyList_GET_SIZE(g_event_handlers); i++) {
+        EventHandlerObject *handler = (EventHandlerObject *)PyList_GET_ITEM(g_event_handlers, i);
+        
+        /* Handler suivi dont aucune dépendance n'a été modifiée : rien à réévaluer */
+        if (only_due && handler->dependencies != NULL && handler->due_stamp != g_dependency_stamp) {
+            continue;
+        }
+        
+        /* Protection contre les déclenchements multiples dans la même évaluation */
+        if (!handler->active || handler->last_evaluation_triggered == g_current_timestamp) {
+            continue;
+        }
+        
+        /* Garder le handler en vie si un callback le retire de la liste */
+        Py_INCREF(handler);
+        const HandlerAnalysis *analysis = &handler->analysis;
+        
+        switch (analysis->rule) {
+            case RULE_DIRECT_MODULE:
+                /* RÈGLE 1: Modules directs = déclenchements multiples */
+                if (g_current_module == analysis->module) {
+                    dispatch_callback(handler);
+                    handler->last_evaluation_triggered = g_current_timestamp;
+                }
+                break;
+                
+            case RULE_IMPOSSIBLE:
+                /* RÈGLE 3: Conditions impossibles = jamais */
+                break;
+                
+            case RULE_SIMPLE:
+            case RULE_COMPARISON: {
+                /* RÈGLES 2 et 4: déclenchement sur changement False→True */
+                int should_evaluate = 0;
+                if (analysis->module == MODULE_ALL) {
+                    /* Conditions mixtes: se déclenchent avec config ou registry */
+                    should_evaluate = (g_current_module == MODULE_CONFIG || g_current_module == MODULE_REGISTRY);
+                } else {
+                    /* Conditions normales: se déclenchent avec leur module spécifique */
+                    should_evaluate = (g_current_module == analysis->module);
+                }
+                
+                if (!should_evaluate) {
+                    break;
+                }
+                
+                long long start = g_stats_enabled ? event_monotonic_ns() : 0;
+                g_condition_failed = 0;
+                int current_state = evaluate_tracked_condition(handler) ? 1 : 0;
+                if (g_stats_enabled) {
+                    record_condition(handler, event_monotonic_ns() - start, g_condition_failed);
+                }
+                if (g_condition_failed) {
+                    PyObject *error = g_condition_error;
+                    g_condition_error = NULL;
+                    handler_error(handler, ERROR_PHASE_CONDITION, error);
+                    if (!handler->active) {
+                        /* Désactivé après trop d'échecs */
+                        Py_DECREF(handler);
+                        continue;
+                    }
+                } else {
+                    handler_succeeded(handler, ERROR_PHASE_CONDITION);
+                }
+                
+                /* Front montant par défaut, sinon selon trigger= */
+                if (trigger_fires(handler, current_state)) {
+                    dispatch_callback(handler);
+                    handler->last_evaluation_triggered = g_current_timestamp;
+                }
+                
+                handler->last_state = current_state;
+                break;
+            }
+        }
+        
+        Py_DECREF(handler);
+    }
+    
+    g_is_evaluating = 0;
+    g_evaluating_thread = 0;
+    g_evaluation_depth--;  /* DÉCRÉMENTER le compteur de profondeur */
+    
+    /* Écritures reçues d'autres threads pendant cette passe */
+    if (g_deferred_modules != 0 && !g_deferred_draining) {
+        run_deferred_triggers();
+    }
+    Py_RETURN_NONE;
+}
+
+/* Fonction principale d'évaluation des événements */
+PyObject *event_evaluate_all(PyObject *self, PyObject *args) {
+    return evaluate_handlers(0);
+}
+
+/* =================== FONCTIONS SPÉCIALISÉES =================== */
+
+/* Fonction spécialisée pour les événements EXECUTOR_SYNC (compatibilité) */
+PyObject *event_sync_evaluate_executor_only(PyObject *self, PyObject *args) {
+    /* Utiliser la même logique que evaluate_all pour la simplicité */
+    return event_evaluate_all(self, args);
+}
+
+/* =================== DÉCORATEUR =================== */
+
+/* Fonction __call__ du décorateur */
+PyObject *event_decorator_call(EventDecoratorObject *self, PyObject *args, PyObject *kwds) {
+    PyObject *func;
+    
+    if (!PyArg_ParseTuple(args, "O:__call__", &func))
+        return NULL;
+    
+    if (!g_events_enabled || !g_event_handlers) {
+        Py_INCREF(func);
+        return func;
+    }
+    
+    /* Créer le handler (condition, callback, état) */
+    PyObject *handler = event_handler_create(self->condition, func);
+    if (handler == NULL) {
+        return NULL;
+    }
+    
+    EventHandlerObject *event_handler = (EventHandlerObject *)handler;
+    event_handler->dispatch = (DispatchMode)self->dispatch;
+    Py_XINCREF(self->loop);
+    event_handler->loop = self->loop;
+    event_handler->max_pending = self->max_pending;
+    event_handler->coalesce = self->coalesce;
+    event_handler->debounce_ms = self->debounce_ms;
+    event_handler->throttle_ms = self->throttle_ms;
+    event_handler->max_rate = self->max_rate;
+    event_handler->trigger = (TriggerMode)self->trigger;
+    event_handler->rearm_after_ms = self->rearm_after;
+    if (event_handler->trigger != TRIGGER_AUTO && event_handler->analysis.rule == RULE_DIRECT_MODULE) {
+        /* Mode explicite : le module direct est évalué comme une condition simple */
+        event_handler->analysis.rule = RULE_SIMPLE;
+    }
+    if (self->compile) {
+        event_handler->compiled = compile_condition(self->condition);
+    }
+    
+    int result = PyList_Append(g_event_handlers, handler);
+    Py_DECREF(handler);
+    if (result < 0) {
+        return NULL;
+    }
+    
+    Py_INCREF(func);
+    return func;
+}
+
+/* Libération du décorateur */
+static void event_decorator_dealloc(EventDecoratorObject *self) {
+    Py_XDECREF(self->condition);
+    Py_XDECREF(self->loop);
+    PyObject_Del(self);
+}
+
+/* Définition du type EventDecorator */
+PyTypeObject EventDecoratorType = {
     PyVarObject_HEAD_INIT(NULL, 0)
     .tp_name = "pyfasty._pyfasty.EventDecorator",
     .tp_doc = "Décorateur pour les événements PyFasty",
@@ -645,21 +2184,111 @@ PyTypeObject EventDecoratorType = {
     .tp_itemsize = 0,
     .tp_flags = Py_TPFLAGS_DEFAULT,
     .tp_new = PyType_GenericNew,
-    .tp_dealloc = (destructor)PyObject_Del,
+    .tp_dealloc = (destructor)event_decorator_dealloc,
     .tp_call = (ternaryfunc)event_decorator_call,
 };
 
-/* Fonction pour créer le décorateur */
-PyObject *event_decorator(PyObject *self, PyObject *args) {
+/* Fonction pour créer le décorateur
+ * event(condition, mode="sync"|"async"|"asyncio", loop=None, max_pending=1024, overflow="drop"|"coalesce",
+ *       debounce_ms=0, throttle_ms=0, max_rate=0, compile=False) */
+PyObject *event_decorator(PyObject *self, PyObject *args, PyObject *kwds) {
+    static char *kwlist[] = {"condition", "mode", "loop", "max_pending", "overflow",
+                             "debounce_ms", "throttle_ms", "max_rate", "compile",
+                             "trigger", "rearm_after", NULL};
     PyObject *condition = NULL;
+    const char *mode = "sync";
+    PyObject *loop = Py_None;
+    int max_pending = 1024;
+    const char *overflow = "drop";
+    double debounce_ms = 0, throttle_ms = 0, max_rate = 0;
+    int compile = 0;
+    const char *trigger_name = NULL;
+    double rearm_after = 0;
+    
+    if (!PyArg_ParseTupleAndKeywords(args, kwds, "|O$sOisdddpzd:event", kwlist,
+                                     &condition, &mode, &loop, &max_pending, &overflow,
+                                     &debounce_ms, &throttle_ms, &max_rate, &compile,
+                                     &trigger_name, &rearm_after)) {
+        return NULL;
+    }
+    
+    if (debounce_ms < 0 || throttle_ms < 0 || max_rate < 0 || rearm_after < 0) {
+        PyErr_SetString(PyExc_ValueError, "debounce_ms, throttle_ms, max_rate and rearm_after must be >= 0");
+        return NULL;
+    }
+    
+    int trigger;
+    if (trigger_name == NULL) {
+        trigger = TRIGGER_AUTO;
+    } else if (strcmp(trigger_name, "rising") == 0) {
+        trigger = TRIGGER_RISING;
+    } else if (strcmp(trigger_name, "falling") == 0) {
+        trigger = TRIGGER_FALLING;
+    } else if (strcmp(trigger_name, "change") == 0) {
+        trigger = TRIGGER_CHANGE;
+    } else if (strcmp(trigger_name, "level") == 0) {
+        trigger = TRIGGER_LEVEL;
+    } else {
+        PyErr_Format(PyExc_ValueError, "trigger must be 'rising', 'falling', 'change' or 'level', not '%s'", trigger_name);
+        return NULL;
+    }
+    
+    int dispatch;
+    if (strcmp(mode, "sync") == 0) {
+        dispatch = DISPATCH_SYNC;
+    } else if (strcmp(mode, "async") == 0) {
+        dispatch = DISPATCH_ASYNC;
+    } else if (strcmp(mode, "asyncio") == 0) {
+        dispatch = DISPATCH_ASYNCIO;
+    } else {
+        PyErr_Format(PyExc_ValueError, "mode must be 'sync', 'async' or 'asyncio', not '%s'", mode);
+        return NULL;
+    }
+    
+    int coalesce;
+    if (strcmp(overflow, "drop") == 0) {
+        coalesce = 0;
+    } else if (strcmp(overflow, "coalesce") == 0) {
+        coalesce = 1;
+    } else {
+        PyErr_Format(PyExc_ValueError, "overflow must be 'drop' or 'coalesce', not '%s'", overflow);
+        return NULL;
+    }
     
-    if (!PyArg_ParseTuple(args, "|O:event", &condition)) {
+    if (max_pending < 1) {
+        PyErr_SetString(PyExc_ValueError, "max_pending must be at least 1");
         return NULL;
     }
     
+    /* Mode asyncio : boucle explicite ou boucle en cours d'exécution */
+    if (dispatch == DISPATCH_ASYNCIO) {
+        if (loop == Py_None) {
+            PyObject *asyncio = PyImport_ImportModule("asyncio");
+            if (asyncio == NULL) {
+                return NULL;
+            }
+            loop = PyObject_CallMethod(asyncio, "get_running_loop", NULL);
+            Py_DECREF(asyncio);
+            if (loop == NULL) {
+                PyErr_Clear();
+                PyErr_SetString(PyExc_ValueError, "mode='asyncio' requires loop= outside a running event loop");
+                return NULL;
+            }
+        } else {
+            Py_INCREF(loop);
+        }
+    } else if (loop != Py_None) {
+        PyErr_SetString(PyExc_ValueError, "loop= is only valid with mode='asyncio'");
+        return NULL;
+    } else {
+        loop = NULL;
+    }
+    
     EventDecoratorObject *decorator = PyObject_New(EventDecoratorObject, &EventDecoratorType);
-    if (decorator == NULL)
+    if (decorator == NULL) {
+        Py_XDECREF(loop);
         return NULL;
+    }
     
     if (condition) {
         Py_INCREF(condition);
@@ -668,6 +2297,16 @@ PyObject *event_decorator(PyObject *self, PyObject *args) {
         Py_INCREF(Py_None);
         decorator->condition = Py_None;
     }
+    decorator->dispatch = dispatch;
+    decorator->loop = loop;
+    decorator->max_pending = max_pending;
+    decorator->coalesce = coalesce;
+    decorator->debounce_ms = debounce_ms;
+    decorator->throttle_ms = throttle_ms;
+    decorator->max_rate = max_rate;
+    decorator->compile = compile;
+    decorator->trigger = trigger;
+    decorator->rearm_after = rearm_after;
     
     return (PyObject *)decorator;
 }
@@ -688,6 +2327,10 @@ PyObject *event_disable(PyObject *self, PyObject *args) {
 /* Fonction de nettoyage pour éviter l'accumulation d'événements */
 PyObject *event_clear_handlers(PyObject *self, PyObject *args) {
     if (g_event_handlers) {
+        /* Un callback en cours peut encore référencer un handler : le désactiver */
+        for (Py_ssize_t i = 0; i < PyList_GET_SIZE(g_event_handlers); i++) {
+            deactivate_handler((EventHandlerObject *)PyList_GET_ITEM(g_event_handlers, i));
+        }
         PyList_SetSlice(g_event_handlers, 0, PyList_Size(g_event_handlers), NULL);
     }
     
@@ -697,22 +2340,375 @@ PyObject *event_clear_handlers(PyObject *self, PyObject *args) {
     /* Reset timestamp pour éviter les conflits */
     g_current_timestamp = 0;
     
+    /* Écritures d'autres threads encore en file : sans objet */
+    g_deferred_modules = 0;
+    g_deferred_untargeted = 0;
+    Py_CLEAR(g_deferred_keys);
+    
+    Py_RETURN_NONE;
+}
+
+/* Retirer les handlers d'un callback : event_remove(func) -> True si au moins un retiré */
+PyObject *event_remove(PyObject *self, PyObject *callback) {
+    int removed = 0;
+    
+    if (g_event_handlers != NULL) {
+        for (Py_ssize_t i = PyList_GET_SIZE(g_event_handlers) - 1; i >= 0; i--) {
+            EventHandlerObject *handler = (EventHandlerObject *)PyList_GET_ITEM(g_event_handlers, i);
+            if (handler->callback != callback && (PyObject *)handler != callback) {
+                continue;
+            }
+            
+            deactivate_handler(handler);
+            if (PyList_SetSlice(g_event_handlers, i, i + 1, NULL) < 0) {
+                return NULL;
+            }
+            removed = 1;
+        }
+    }
+    
+    return PyBool_FromLong(removed);
+}
+
+/* Graphe des dépendances : {callback: (chemins lus, ...)} - None si le handler n'est pas suivi */
+PyObject *event_dependencies(PyObject *self, PyObject *args) {
+    PyObject *result = PyDict_New();
+    if (result == NULL || g_event_handlers == NULL) {
+        return result;
+    }
+    
+    Py_ssize_t len = PyList_GET_SIZE(g_event_handlers);
+    for (Py_ssize_t i = 0; i < len; i++) {
+        EventHandlerObject *handler = (EventHandlerObject *)PyList_GET_ITEM(g_event_handlers, i);
+        PyObject *paths = handler->dependency_paths ? handler->dependency_paths : Py_None;
+        
+        if (PyDict_SetItem(result, handler->callback, paths) < 0) {
+            Py_DECREF(result);
+            return NULL;
+        }
+    }
+    
+    return result;
+}
+
+/* Compteurs de chaque handler : {callback: {"fired", "suppressed", "dropped", "pending", "compiled", "active"}} */
+PyObject *event_handler_stats(PyObject *self, PyObject *args) {
+    PyObject *result = PyDict_New();
+    if (result == NULL || g_event_handlers == NULL) {
+        return result;
+    }
+    
+    Py_ssize_t len = PyList_GET_SIZE(g_event_handlers);
+    for (Py_ssize_t i = 0; i < len; i++) {
+        EventHandlerObject *handler = (EventHandlerObject *)PyList_GET_ITEM(g_event_handlers, i);
+        PyObject *stats = Py_BuildValue("{s:l,s:l,s:l,s:i,s:O,s:O}",
+                                        "fired", handler->fired,
+                                        "suppressed", handler->suppressed,
+                                        "dropped", handler->dropped,
+                                        "pending", handler->pending,
+                                        "compiled", handler->compiled ? Py_True : Py_False,
+                                        "active", handler->active ? Py_True : Py_False);
+        if (stats == NULL || PyDict_SetItem(result, handler->callback, stats) < 0) {
+            Py_XDECREF(stats);
+            Py_DECREF(result);
+            return NULL;
+        }
+        Py_DECREF(stats);
+    }
+    
+    return result;
+}
+
+/* Politique d'erreur : event_error_policy("ignore" | "log" | "collect", *, max_failures=0, capacity=100)
+ * max_failures > 0 désactive un handler après N échecs consécutifs de sa condition ou de son callback */
+PyObject *event_error_policy(PyObject *self, PyObject *args, PyObject *kwds) {
+    static char *kwlist[] = {"policy", "max_failures", "capacity", NULL};
+    const char *policy_name = "ignore";
+    int max_failures = 0;
+    Py_ssize_t capacity = g_error_capacity;
+    
+    if (!PyArg_ParseTupleAndKeywords(args, kwds, "|s$in:event_error_policy", kwlist,
+                                     &policy_name, &max_failures, &capacity)) {
+        return NULL;
+    }
+    
+    ErrorPolicy policy;
+    if (strcmp(policy_name, "ignore") == 0) {
+        policy = ERROR_POLICY_IGNORE;
+    } else if (strcmp(policy_name, "log") == 0) {
+        policy = ERROR_POLICY_LOG;
+    } else if (strcmp(policy_name, "collect") == 0) {
+        policy = ERROR_POLICY_COLLECT;
+    } else {
+        PyErr_Format(PyExc_ValueError, "policy must be 'ignore', 'log' or 'collect', not '%s'", policy_name);
+        return NULL;
+    }
+    if (max_failures < 0 || capacity <= 0) {
+        PyErr_SetString(PyExc_ValueError, "max_failures must be >= 0 and capacity > 0");
+        return NULL;
+    }
+    
+    /* Nouvelle capacité : la file est recréée vide */
+    if (capacity != g_error_capacity) {
+        Py_CLEAR(g_error_ring);
+        g_error_capacity = capacity;
+        g_error_head = 0;
+        g_error_count = 0;
+    }
+    g_error_policy = policy;
+    g_error_max_failures = max_failures;
+    Py_RETURN_NONE;
+}
+
+/* Erreurs collectées, de la plus ancienne à la plus récente :
+ * [{"callback", "phase", "error", "failures", "disabled"}, ...] - clear=True vide la file */
+PyObject *event_errors(PyObject *self, PyObject *args, PyObject *kwds) {
+    static char *kwlist[] = {"clear", NULL};
+    int clear = 0;
+    
+    if (!PyArg_ParseTupleAndKeywords(args, kwds, "|p:event_errors", kwlist, &clear)) {
+        return NULL;
+    }
+    
+    PyObject *result = PyList_New(g_error_count);
+    if (result == NULL) {
+        return NULL;
+    }
+    for (Py_ssize_t i = 0; i < g_error_count; i++) {
+        PyObject *entry = PyList_GET_ITEM(g_error_ring, (g_error_head + i) % g_error_capacity);
+        Py_INCREF(entry);
+        PyList_SET_ITEM(result, i, entry);
+    }
+    
+    if (clear) {
+        Py_CLEAR(g_error_ring);
+        g_error_head = 0;
+        g_error_count = 0;
+    }
+    return result;
+}
+
+/* Activer les mesures d'event_stats (horloge lue autour de chaque condition et callback) */
+PyObject *event_stats_enable(PyObject *self, PyObject *args) {
+    g_stats_enabled = 1;
+    Py_RETURN_NONE;
+}
+
+/* Désactiver les mesures - les valeurs collectées sont conservées */
+PyObject *event_stats_disable(PyObject *self, PyObject *args) {
+    g_stats_enabled = 0;
+    Py_RETURN_NONE;
+}
+
+/* Remettre à zéro les mesures globales et celles de chaque handler */
+PyObject *event_stats_reset(PyObject *self, PyObject *args) {
+    memset(g_module_stats, 0, sizeof(g_module_stats));
+    g_max_evaluation_depth = 0;
+    g_depth_limit_hits = 0;
+    
+    if (g_event_handlers != NULL) {
+        for (Py_ssize_t i = 0; i < PyList_GET_SIZE(g_event_handlers); i++) {
+            EventHandlerObject *handler = (EventHandlerObject *)PyList_GET_ITEM(g_event_handlers, i);
+            PyMem_Free(handler->stats);
+            handler->stats = NULL;
+        }
+    }
     Py_RETURN_NONE;
 }
 
+/* Mesures du moteur : {"enabled", "max_depth", "depth_limit_hits",
+ *                      "modules": {module: {...}}, "handlers": {callback: {...}}} */
+PyObject *event_stats(PyObject *self, PyObject *args) {
+    PyObject *modules = PyDict_New();
+    PyObject *handlers = PyDict_New();
+    if (modules == NULL || handlers == NULL) {
+        goto error;
+    }
+    
+    for (int i = 0; i < EVENT_STATS_MODULES; i++) {
+        const ModuleStats *totals = &g_module_stats[i];
+        PyObject *entry = Py_BuildValue("{s:L,s:L,s:L,s:L,s:L}",
+                                        "passes", totals->passes,
+                                        "evaluations", totals->evaluations,
+                                        "fires", totals->fires,
+                                        "errors", totals->errors,
+                                        "condition_ns", totals->condition_ns);
+        if (entry == NULL || PyDict_SetItemString(modules, g_module_stats_names[i], entry) < 0) {
+            Py_XDECREF(entry);
+            goto error;
+        }
+        Py_DECREF(entry);
+    }
+    
+    static const HandlerStats empty;
+    Py_ssize_t len = g_event_handlers ? PyList_GET_SIZE(g_event_handlers) : 0;
+    for (Py_ssize_t i = 0; i < len; i++) {
+        EventHandlerObject *handler = (EventHandlerObject *)PyList_GET_ITEM(g_event_handlers, i);
+        const HandlerStats *stats = handler->stats ? handler->stats : &empty;
+        PyObject *entry = Py_BuildValue("{s:L,s:l,s:l,s:l,s:L,s:N,s:N}",
+                                        "evaluations", stats->evaluations,
+                                        "fires", handler->fired,
+                                        "suppressed", handler->suppressed,
+                                        "dropped", handler->dropped,
+                                        "errors", stats->errors,
+                                        "condition_ns", histogram_to_dict(&stats->condition),
+                                        "callback_ns", histogram_to_dict(&stats->callback));
+        if (entry == NULL || PyDict_SetItem(handlers, handler->callback, entry) < 0) {
+            Py_XDECREF(entry);
+            goto error;
+        }
+        Py_DECREF(entry);
+    }
+    
+    return Py_BuildValue("{s:O,s:i,s:L,s:N,s:N}",
+                         "enabled", g_stats_enabled ? Py_True : Py_False,
+                         "max_depth", g_max_evaluation_depth,
+                         "depth_limit_hits", g_depth_limit_hits,
+                         "modules", modules,
+                         "handlers", handlers);
+
+error:
+    Py_XDECREF(modules);
+    Py_XDECREF(handlers);
+    return NULL;
+}
+
 /* =================== DÉCLENCHEMENT ET ÉVÉNEMENTS =================== */
 
+/* Ordre des passes quand plusieurs modules ont été écrits */
+static const ModuleType g_module_pass_order[] = {
+    MODULE_CONFIG, MODULE_REGISTRY, MODULE_CONSOLE, MODULE_EXECUTOR_SYNC, MODULE_EXECUTOR_ASYNC
+};
+
+/* Déclenchement pendant une évaluation : ignoré dans le thread évaluateur (anti-boucle),
+ * mis en file s'il vient d'un autre thread (thread de dispatch, executor...).
+ * Retourne 1 si l'appelant ne doit pas évaluer lui-même */
+static int defer_trigger(ModuleType module_type, PyObject *node, PyObject *name) {
+    if (!g_is_evaluating) {
+        return 0;
+    }
+    if (PyThread_get_thread_ident() == g_evaluating_thread) {
+        return 1;
+    }
+    
+    g_deferred_modules |= module_type;
+    if (node == NULL) {
+        g_deferred_untargeted = 1;
+        return 1;
+    }
+    if (g_deferred_keys == NULL) {
+        g_deferred_keys = PyList_New(0);
+    }
+    PyObject *node_key = PyLong_FromVoidPtr(node);
+    PyObject *edge_key = name != NULL ? dependency_edge_key(node, name) : NULL;
+    if (g_deferred_keys == NULL || node_key == NULL || (name != NULL && edge_key == NULL) ||
+        PyList_Append(g_deferred_keys, node_key) < 0 ||
+        (edge_key != NULL && PyList_Append(g_deferred_keys, edge_key) < 0)) {
+        /* Clés perdues : réévaluer tous les handlers du module */
+        PyErr_Clear();
+        g_deferred_untargeted = 1;
+    }
+    Py_XDECREF(node_key);
+    Py_XDECREF(edge_key);
+    return 1;
+}
+
+/* Rejouer les écritures mises en file, après la passe du thread évaluateur.
+ * Nombre de tours borné : un autre thread qui écrit sans arrêt ne retient pas
+ * l'évaluateur, le reste est rejoué à la fin de la passe suivante */
+static void run_deferred_triggers(void) {
+    ModuleType saved_module = g_current_module;
+    g_deferred_draining = 1;
+    
+    for (int round = 0; round < MAX_EVALUATION_DEPTH && g_deferred_modules != 0; round++) {
+        int modules = g_deferred_modules;
+        int only_due = !g_deferred_untargeted;
+        PyObject *keys = g_deferred_keys;
+        g_deferred_modules = 0;
+        g_deferred_untargeted = 0;
+        g_deferred_keys = NULL;
+        
+        g_dependency_stamp++;
+        if (keys != NULL && g_dependency_index != NULL) {
+            for (Py_ssize_t i = 0; i < PyList_GET_SIZE(keys); i++) {
+                PyObject *key = PyList_GET_ITEM(keys, i);
+                Py_INCREF(key);
+                mark_dependents(key);
+            }
+        }
+        Py_XDECREF(keys);
+        
+        for (size_t i = 0; i < sizeof(g_module_pass_order) / sizeof(g_module_pass_order[0]); i++) {
+            if (!(modules & g_module_pass_order[i])) {
+                continue;
+            }
+            g_current_module = g_module_pass_order[i];
+            PyObject *result = evaluate_handlers(only_due);
+            if (result == NULL) {
+                PyErr_Clear();
+            }
+            Py_XDECREF(result);
+        }
+    }
+    
+    g_deferred_draining = 0;
+    g_current_module = saved_module;
+}
+
 /* Fonction de déclenchement des événements */
 void pyfasty_trigger_events_with_module(ModuleType module_type) {
-    if (g_in_callback_execution || g_is_evaluating || !g_events_enabled) {
+    if (!g_events_enabled || defer_trigger(module_type, NULL, NULL)) {
         return;
     }
-    
+
+    /* Dans un batch : évaluation complète différée à la sortie */
+    if (g_batch_depth > 0) {
+        g_batch_modules |= module_type;
+        g_batch_untargeted = 1;
+        return;
+    }
+
     g_current_module = module_type;
     event_evaluate_all(NULL, NULL);
     g_current_module = MODULE_UNKNOWN;
 }
 
+/* Déclenchement ciblé après écriture de node.name (name NULL : modification du nœud lui-même)
+ * Seuls les handlers ayant lu ce nœud, ou ce couple nœud/nom, sont réévalués */
+void pyfasty_trigger_sync_events_for_node(ModuleType module_type, PyObject *node, PyObject *name) {
+    if (!g_events_enabled || defer_trigger(module_type, node, name)) {
+        return;
+    }
+
+    /* Dans un batch : marquer seulement, l'évaluation est faite à la sortie */
+    if (g_batch_depth > 0) {
+        if (g_dependency_index != NULL && node != NULL && PyDict_Size(g_dependency_index) > 0) {
+            mark_dependents(PyLong_FromVoidPtr(node));
+            if (name != NULL) {
+                mark_dependents(dependency_edge_key(node, name));
+            }
+        }
+        g_batch_modules |= module_type;
+        if (node == NULL) {
+            g_batch_untargeted = 1;
+        }
+        return;
+    }
+
+    g_dependency_stamp++;
+    if (g_dependency_index != NULL && node != NULL && PyDict_Size(g_dependency_index) > 0) {
+        mark_dependents(PyLong_FromVoidPtr(node));
+        if (name != NULL) {
+            mark_dependents(dependency_edge_key(node, name));
+        }
+    }
+    
+    g_current_module = module_type;
+    PyObject *result = evaluate_handlers(1);
+    Py_XDECREF(result);
+    g_current_module = MODULE_UNKNOWN;
+}
+
 /* Version compatible */
 int pyfasty_trigger_events_internal(void) {
     pyfasty_trigger_events_with_module(MODULE_ALL);
@@ -721,19 +2717,28 @@ int pyfasty_trigger_events_internal(void) {
 
 /* Fonction publique pour vérifier si on est dans un callback */
 int pyfasty_is_in_callback_execution(void) {
-    return g_in_callback_execution;
+    return g_in_callback_execution && PyThread_get_thread_ident() == g_evaluating_thread;
 }
 
 /* =================== NETTOYAGE ET UTILITAIRES =================== */
 
-/* Nettoyage du cache */
+/* Nettoyage du cache : états et dépendances de tous les handlers */
 void cleanup_condition_cache(void) {
-    for (int i = 0; i < MAX_HANDLERS; i++) {
-        g_handler_states[i].handler_tuple = NULL;
-        g_handler_states[i].last_state = -1;
-        g_handler_states[i].is_impossible = 0;
-        g_handler_states[i].last_evaluation_triggered = 0;
-        g_handler_states[i].is_direct_module = 0;
+    if (g_event_handlers != NULL) {
+        for (Py_ssize_t i = 0; i < PyList_GET_SIZE(g_event_handlers); i++) {
+            EventHandlerObject *handler = (EventHandlerObject *)PyList_GET_ITEM(g_event_handlers, i);
+            unsubscribe_handler(handler);
+            handler->last_state = -1;
+            handler->last_evaluation_triggered = 0;
+            handler->last_trigger_ms = -1;
+            handler->trigger_state = -1;
+            handler->tracked_modules = 0;
+            handler->due_stamp = 0;
+        }
+    }
+    
+    if (g_dependency_index != NULL) {
+        PyDict_Clear(g_dependency_index);
     }
 }
 
@@ -748,6 +2753,112 @@ void pyfasty_trigger_sync_events(void) {
     pyfasty_trigger_events_internal();
 }
 
+/* =================== REGROUPEMENT DES ÉCRITURES =================== */
+
+/* Ouvrir un batch : les déclenchements sont différés jusqu'au batch_end le plus externe */
+void pyfasty_event_batch_begin(void) {
+    if (g_batch_depth++ == 0) {
+        g_dependency_stamp++;
+        g_batch_modules = 0;
+        g_batch_untargeted = 0;
+    }
+}
+
+/* Fermer un batch : une seule évaluation par module touché, limitée aux handlers marqués */
+void pyfasty_event_batch_end(void) {
+    if (g_batch_depth == 0 || --g_batch_depth > 0) {
+        return;
+    }
+
+    int modules = g_batch_modules;
+    int only_due = !g_batch_untargeted;
+    g_batch_modules = 0;
+    g_batch_untargeted = 0;
+
+    if (modules == 0 || !g_events_enabled) {
+        return;
+    }
+    if (g_is_evaluating) {
+        /* Batch fermé par un autre thread pendant une évaluation : tout réévaluer ensuite */
+        if (PyThread_get_thread_ident() != g_evaluating_thread) {
+            g_deferred_modules |= modules;
+            g_deferred_untargeted = 1;
+        }
+        return;
+    }
+
+    for (size_t i = 0; i < sizeof(g_module_pass_order) / sizeof(g_module_pass_order[0]); i++) {
+        if (!(modules & g_module_pass_order[i])) {
+            continue;
+        }
+        g_current_module = g_module_pass_order[i];
+        PyObject *result = evaluate_handlers(only_due);
+        Py_XDECREF(result);
+    }
+    g_current_module = MODULE_UNKNOWN;
+}
+
+/* Gestionnaire de contexte retourné par registry.batch() */
+typedef struct {
+    PyObject_HEAD
+    int entered;
+} EventBatchObject;
+
+static PyObject *event_batch_enter(EventBatchObject *self, PyObject *Py_UNUSED(ignored)) {
+    if (!self->entered) {
+        pyfasty_event_batch_begin();
+        self->entered = 1;
+    }
+    Py_INCREF(self);
+    return (PyObject *)self;
+}
+
+static PyObject *event_batch_exit(EventBatchObject *self, PyObject *args) {
+    if (self->entered) {
+        self->entered = 0;
+        pyfasty_event_batch_end();
+        if (PyErr_Occurred()) {
+            return NULL;
+        }
+    }
+    Py_RETURN_FALSE;
+}
+
+static void event_batch_dealloc(EventBatchObject *self) {
+    /* Batch abandonné sans __exit__ : ne pas bloquer les événements */
+    if (self->entered) {
+        pyfasty_event_batch_end();
+    }
+    PyObject_Del(self);
+}
+
+static PyMethodDef event_batch_methods[] = {
+    {"__enter__", (PyCFunction)event_batch_enter, METH_NOARGS, "Ouvre le batch"},
+    {"__exit__", (PyCFunction)event_batch_exit, METH_VARARGS, "Ferme le batch et déclenche les événements"},
+    {NULL, NULL, 0, NULL}
+};
+
+static PyTypeObject EventBatchType = {
+    PyVarObject_HEAD_INIT(NULL, 0)
+    .tp_name = "pyfasty._pyfasty.EventBatch",
+    .tp_doc = "Regroupement d'écritures avec une seule évaluation des événements",
+    .tp_basicsize = sizeof(EventBatchObject),
+    .tp_itemsize = 0,
+    .tp_flags = Py_TPFLAGS_DEFAULT,
+    .tp_dealloc = (destructor)event_batch_dealloc,
+    .tp_methods = event_batch_methods,
+};
+
+/* Créer un gestionnaire de contexte de batch */
+PyObject *pyfasty_event_batch_new(void) {
+    EventBatchObject *batch = PyObject_New(EventBatchObject, &EventBatchType);
+    if (batch == NULL) {
+        return NULL;
+    }
+    batch->entered = 0;
+    return (PyObject *)batch;
+}
+
 /* =================== INITIALISATION =================== */
 
 /* Initialisation du module */
@@ -760,26 +2871,39 @@ int PyFasty_Event_Init(PyObject *module) {
         }
     }
     
+    /* Créer l'index des dépendances */
+    if (g_dependency_index == NULL) {
+        g_dependency_index = PyDict_New();
+        if (g_dependency_index == NULL) {
+            return -1;
+        }
+    }
+    
     /* Activer les événements par défaut */
     g_events_enabled = 1;
     
     /* Initialiser les caches */
     cleanup_condition_cache();
     
-    /* Préparer le type EventDecorator */
-    if (PyType_Ready(&EventDecoratorType) < 0) {
+    /* Préparer les types EventDecorator, EventHandler et EventBatch */
+    if (PyType_Ready(&EventDecoratorType) < 0 || PyType_Ready(&EventHandlerType) < 0 ||
+        PyType_Ready(&EventBatchType) < 0) {
         return -1;
     }
     
     /* Ajouter les méthodes au module */
     static PyMethodDef event_methods[] = {
-        {"event", event_decorator, METH_VARARGS, "Décorateur pour les événements PyFasty"},
+        {"event", (PyCFunction)event_decorator, METH_VARARGS | METH_KEYWORDS, "Décorateur pour les événements PyFasty"},
         {"event_enable", event_enable, METH_NOARGS, "Active le système d'événements"},
         {"event_disable", event_disable, METH_NOARGS, "Désactive le système d'événements"},
         {"event_clear_handlers", event_clear_handlers, METH_NOARGS, "Vide la liste des handlers d'événements"},
         {"event_evaluate_all", event_evaluate_all, METH_NOARGS, "Évalue toutes les conditions et déclenche les événements"},
         {"event_sync_evaluate_executor_only", event_sync_evaluate_executor_only, METH_NOARGS, "Fonction spécialisée pour EXECUTOR_SYNC"},
         {"event_sync_evaluate_all", event_evaluate_all, METH_NOARGS, "Alias pour event_evaluate_all (compatibilité)"},
+        {"event_dependencies", event_dependencies, METH_NOARGS, "Retourne les chemins registry/config lus par chaque handler"},
+        {"event_remove", event_remove, METH_O, "Retire les handlers d'un callback"},
+        {"event_flush", event_flush, METH_NOARGS, "Attend l'exécution des callbacks asynchrones en file"},
+        {"event_handler_stats", event_handler_stats, METH_NOARGS, "Retourne les compteurs de déclenchement de chaque handler"},
         {NULL, NULL, 0, NULL}
     };
     
@@ -791,5 +2915,22 @@ int PyFasty_Event_Init(PyObject *module) {
         }
     }
     
+    /* Arrêter le thread de dispatch avant la finalisation de l'interpréteur */
+    static PyMethodDef shutdown_method = {
+        "_event_async_shutdown", event_async_shutdown, METH_NOARGS, "Arrête le thread de dispatch des événements"
+    };
+    PyObject *atexit = PyImport_ImportModule("atexit");
+    if (atexit == NULL) {
+        return -1;
+    }
+    PyObject *shutdown = PyCFunction_New(&shutdown_method, NULL);
+    PyObject *result = shutdown ? PyObject_CallMethod(atexit, "register", "O", shutdown) : NULL;
+    Py_XDECREF(shutdown);
+    Py_DECREF(atexit);
+    if (result == NULL) {
+        return -1;
+    }
+    Py_DECREF(result);
+    
     return 0;
 }
\ No newline at end of file
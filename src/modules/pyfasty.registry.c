@@ -32,6 +32,12 @@
 #include "../pyfasty.h"
 #include "../thread/pyfasty_threading.h"
 #include <math.h>
+#ifndef PYFASTY_WINDOWS
+#include <fcntl.h>
+#include <sys/mman.h>
+#include <sys/stat.h>
+#include <unistd.h>
+#endif
 
 /*
  * ================================================================================
@@ -75,22 +81,88 @@ static inline PyObject *create_optimal_number(double value) {
  * ================================================================================
  */
 
-/* Store in cache with automatic cleanup on failure */
-static inline int safe_cache_store(PyObject *cache, PyObject *key, PyObject *value) {
-    if (PyDict_SetItem(cache, key, value) < 0) {
-        Py_DECREF(value);  /* Cleanup on failure */
+/* Version structurelle : incrémentée à chaque écriture ou suppression dans une
+   table d'enfants, elle invalide les nœuds mis en cache par les chemins compilés */
+static uint64_t g_structure_version = 0;
+
+/* Instantanés (registry.snapshot()) : chaque instantané prend une nouvelle époque.
+   Avant sa première modification depuis un instantané, un nœud recopie ses enfants et
+   sa valeur dans les instantanés qui le voient encore tel quel (copie sur écriture). */
+typedef struct RegistrySnapshotState RegistrySnapshotState;
+static unsigned int g_snapshot_epoch = 0;
+static RegistrySnapshotState *g_snapshots = NULL;  /* Instantanés vivants */
+static int snapshot_preserve(PyFastyBaseObject *node);
+
+/* Index secondaires (create_index()) : nœuds surveillés le long des chemins indexés */
+typedef struct RegistryIndex RegistryIndex;
+static RegistryIndex **g_indexes = NULL;
+static Py_ssize_t g_index_count = 0;
+static int index_touch(PyFastyBaseObject *node);
+static int index_on_child(PyFastyBaseObject *node, PyObject *key);
+static void index_on_replace(PyFastyBaseObject *node);
+
+/* À appeler avant toute modification de data ou value d'un nœud existant */
+static inline int node_touch(PyFastyBaseObject *node) {
+    if (g_index_count != 0 && index_touch(node) < 0) {
         return -1;
     }
-    return 0;
+    if (g_snapshots == NULL || node->epoch == g_snapshot_epoch) {
+        return 0;
+    }
+    return snapshot_preserve(node);
+}
+
+/* Caches bornés (registry.configure()) : politiques des nœuds configurés, peu nombreuses */
+typedef struct RegistryCacheObject RegistryCacheObject;
+static RegistryCacheObject **g_caches = NULL;
+static Py_ssize_t g_cache_count = 0;
+static int cache_on_set(PyFastyBaseObject *node, PyObject *key);
+static void cache_on_del(PyFastyBaseObject *node, PyObject *key);
+static int cache_on_read(PyFastyBaseObject *node, PyObject *key, int count_miss);
+static int cache_on_replace(PyFastyBaseObject *node);
+
+static inline int node_set_child(PyFastyBaseObject *node, PyObject *children, PyObject *name, PyObject *value) {
+    if (node_touch(node) < 0) {
+        return -1;
+    }
+    g_structure_version++;
+    if (PyDict_SetItem(children, name, value) < 0) {
+        return -1;
+    }
+    if (g_index_count != 0 && index_on_child(node, name) < 0) {
+        return -1;
+    }
+    return g_cache_count == 0 ? 0 : cache_on_set(node, name);
+}
+
+static inline int node_del_child(PyFastyBaseObject *node, PyObject *children, PyObject *name) {
+    if (node_touch(node) < 0) {
+        return -1;
+    }
+    g_structure_version++;
+    if (PyDict_DelItem(children, name) < 0) {
+        return -1;
+    }
+    if (g_cache_count != 0) {
+        cache_on_del(node, name);
+    }
+    return g_index_count == 0 ? 0 : index_on_child(node, name);
 }
 
 /* Save original value before overwriting (preserves history for events) */
 static inline void maybe_save_original_value(PyFastyBaseObject *obj) {
     if (obj->value != Py_None && !is_numeric_value(obj->value)) {
+        if (node_touch(obj) < 0) {
+            PyErr_Clear();
+            return;
+        }
         PyObject *orig_key = PyUnicode_FromString(PYFASTY_ORIGINAL_VALUE_KEY);
         if (orig_key) {
-            if (!PyDict_Contains(obj->data, orig_key)) {
-                PyDict_SetItem(obj->data, orig_key, obj->value);
+            PyObject *children = pyfasty_node_children(obj);
+            if (children == NULL) {
+                PyErr_Clear();
+            } else if (!PyDict_Contains(children, orig_key)) {
+                PyDict_SetItem(children, orig_key, obj->value);
             }
             Py_DECREF(orig_key);
         }
@@ -292,12 +364,36 @@ static PyTypeObject PyFastyConfigType;
 
 /* Structure Registry : hérite PyFastyBaseObject + état opération */
 typedef struct {
-    PyFastyBaseObject base;             /* data, cache, value, depth */
+    PyFastyBaseObject base;             /* data, value, depth */
     RegistryOperation current_op;       /* État pour auto-init */
 } PyFastyRegistryObject;
 
 /* === FONCTIONS DE CRÉATION === */
-/* Factory générique : alloc + init data/cache depuis pool + traitement value */
+static PyObject *node_materialize(PyFastyBaseObject *node);
+
+/* Table des enfants : créée depuis le pool au premier ajout seulement,
+   les feuilles (la grande majorité des nœuds) n'allouent aucun dict.
+   Un nœud chargé par load_file(lazy=True) ouvre ici ses enfants. */
+PyObject* pyfasty_node_children(PyFastyBaseObject *node) {
+    if (node->data == NULL) {
+        node->data = pyfasty_dict_pool_get();
+    } else if (!PyDict_CheckExact(node->data)) {
+        return node_materialize(node);
+    }
+    return node->data;
+}
+
+/* Vue en lecture pour str/repr/comparaisons : évite de créer la table */
+PyObject* pyfasty_node_data(PyFastyBaseObject *node) {
+    if (node->data == NULL) {
+        return PyDict_New();
+    }
+    PyObject *children = pyfasty_node_children(node);
+    Py_XINCREF(children);
+    return children;
+}
+
+/* Factory générique : alloc + traitement value (data créé à la demande) */
 PyObject* pyfasty_base_create(PyTypeObject *type, PyFastyObjectType obj_type, 
                              int depth, PyObject *value) {
     PyFastyBaseObject *obj = (PyFastyBaseObject *)type->tp_alloc(type, 0);
@@ -305,21 +401,9 @@ PyObject* pyfasty_base_create(PyTypeObject *type, PyFastyObjectType obj_type,
         return NULL;
     }
     
-    /* Pool de dicts pour éviter alloc/dealloc répétées */
-    obj->data = pyfasty_dict_pool_get();
-    if (obj->data == NULL) {
-        Py_DECREF(obj);
-        return NULL;
-    }
-    
-    obj->cache = pyfasty_dict_pool_get();
-    if (obj->cache == NULL) {
-        pyfasty_dict_pool_return(obj->data);
-        Py_DECREF(obj);
-        return NULL;
-    }
-    
+    obj->data = NULL;
     obj->depth = depth;
+    obj->epoch = g_snapshot_epoch;
     
     /* Si value=dict : expansion dans data pour accès attributs */
     if (value != NULL && PyDict_Check(value)) {
@@ -327,6 +411,10 @@ PyObject* pyfasty_base_create(PyTypeObject *type, PyFastyObjectType obj_type,
         PyObject *key, *val;
         Py_ssize_t pos = 0;
         
+        if (PyDict_Size(value) > 0 && pyfasty_node_children(obj) == NULL) {
+            goto error;
+        }
+        
         while (PyDict_Next(value, &pos, &key, &val)) {
             /* Clé string = attribut accessible */
             if (PyUnicode_Check(key)) {
@@ -368,7 +456,7 @@ PyObject* pyfasty_base_create(PyTypeObject *type, PyFastyObjectType obj_type,
 
 error:
     pyfasty_dict_pool_return(obj->data);
-    pyfasty_dict_pool_return(obj->cache);
+    obj->data = NULL;
     Py_DECREF(obj);
     return NULL;
 }
@@ -398,55 +486,29 @@ PyObject* pyfasty_base_getattr_recursive(PyObject *self, PyObject *name,
         PyErr_Clear();
     }
     
-    /* Fast path: check cache first for better performance */
-    result = PyDict_GetItem(base->cache, name);
-    if (result != NULL) {
-        Py_INCREF(result);
-        return result;
-    }
-    
     /* Fast path: try to get from data dictionary */
-    result = PyDict_GetItem(base->data, name);
+    result = pyfasty_node_get(base, name);
+    if (result == NULL && PyErr_Occurred()) {
+        return NULL;
+    }
     if (result != NULL) {
-        /* Optimized path for dictionaries */
-        if (PyDict_Check(result)) {
+        /* Dicts et primitives : envelopper dans un objet registry pour permettre
+           des accès imbriqués, le nœud remplace la valeur brute dans data */
+        if (PyDict_Check(result) || is_primitive_value(result)) {
             PyObject *new_obj = pyfasty_base_create(type, obj_type, base->depth + 1, result);
             if (new_obj == NULL) {
                 return NULL;
             }
             
-            /* Cache the result avec helper sécurisé */
-            if (safe_cache_store(base->cache, name, new_obj) < 0) {
-                return NULL;
-            }
-            
-            result = new_obj;
-            return result;
-        }
-        
-        /* Si le résultat est un entier, un flottant, un booléen ou une chaîne,
-           l'envelopper dans un objet registry pour permettre des accès imbriqués */
-        if (is_primitive_value(result)) {
-            PyObject *new_obj = pyfasty_base_create(type, obj_type, base->depth + 1, result);
-            if (new_obj == NULL) {
+            if (node_set_child(base, base->data, name, new_obj) < 0) {
+                Py_DECREF(new_obj);
                 return NULL;
             }
             
-            /* Cache the result avec helper sécurisé */
-            if (safe_cache_store(base->cache, name, new_obj) < 0) {
-                Py_INCREF(result);  /* Fallback to direct value if cache fails */
-                return result;
-            }
-            
-            result = new_obj;
-            return result;
+            return new_obj;
         }
         
         Py_INCREF(result);
-        
-        /* Cache the result */
-        PyDict_SetItem(base->cache, name, result);
-        
         return result;
     }
     
@@ -454,7 +516,7 @@ PyObject* pyfasty_base_getattr_recursive(PyObject *self, PyObject *name,
     if (base->value != Py_None && (PyObject_TypeCheck(base->value, &PyFastyRegistryType) ||
                                   PyObject_TypeCheck(base->value, &PyFastyConfigType))) {
         PyFastyBaseObject *base_val = (PyFastyBaseObject *)base->value;
-        result = PyDict_GetItem(base_val->data, name);
+        result = pyfasty_node_get(base_val, name);
         if (result != NULL) {
             Py_INCREF(result);
             return result;
@@ -462,19 +524,21 @@ PyObject* pyfasty_base_getattr_recursive(PyObject *self, PyObject *name,
     }
     
     /* Create a new object for auto-creation */
+    PyObject *children = pyfasty_node_children(base);
+    if (children == NULL) {
+        return NULL;
+    }
+    
     PyObject *new_obj = pyfasty_base_create(type, obj_type, base->depth + 1, NULL);
     if (new_obj == NULL) {
         return NULL;
     }
     
-    /* Store in both data and cache for faster access */
-    if (PyDict_SetItem(base->data, name, new_obj) < 0) {
+    if (node_set_child(base, children, name, new_obj) < 0) {
         Py_DECREF(new_obj);
         return NULL;
     }
     
-    PyDict_SetItem(base->cache, name, new_obj);
-    
     return new_obj;
 }
 
@@ -490,7 +554,10 @@ int pyfasty_base_setattr_recursive(PyObject *self, PyObject *name, PyObject *val
     }
     
     /* Check if this is a key attribute that should remain a registry (Registry-specific) */
-    PyObject *existing = PyDict_GetItem(base->data, name);
+    PyObject *existing = pyfasty_node_get(base, name);
+    if (existing == NULL && PyErr_Occurred()) {
+        return -1;
+    }
     int is_special_attr = 0;
     
     if (obj_type == PYFASTY_REGISTRY_TYPE) {
@@ -498,11 +565,6 @@ int pyfasty_base_setattr_recursive(PyObject *self, PyObject *name, PyObject *val
         is_special_attr = (base->depth == 0);
     }
     
-    /* Clear cache for consistency */
-    if (PyDict_Contains(base->cache, name)) {
-        PyDict_DelItem(base->cache, name);
-    }
-    
     /* Pour les attributs spéciaux ou pour tous les objets au niveau 0,
        on garde toujours l'objet Registry et on stocke la valeur à l'intérieur */
     if (is_special_attr || base->depth == 0) {
@@ -514,7 +576,8 @@ int pyfasty_base_setattr_recursive(PyObject *self, PyObject *name, PyObject *val
             }
             
             /* Set the registry as the attribute value */
-            int result = PyDict_SetItem(base->data, name, new_obj);
+            PyObject *children = pyfasty_node_children(base);
+            int result = children != NULL ? node_set_child(base, children, name, new_obj) : -1;
             Py_DECREF(new_obj);
             
             return result;
@@ -524,6 +587,9 @@ int pyfasty_base_setattr_recursive(PyObject *self, PyObject *name, PyObject *val
             maybe_save_original_value(obj);
             
             /* If it's already a registry, just update its value */
+            if (node_touch(obj) < 0) {
+                return -1;
+            }
             Py_XDECREF(obj->value);
             Py_INCREF(value);
             obj->value = value;
@@ -539,6 +605,9 @@ int pyfasty_base_setattr_recursive(PyObject *self, PyObject *name, PyObject *val
         maybe_save_original_value(obj);
         
         /* Si l'attribut existe déjà et est un Registry, mettre à jour sa valeur */
+        if (node_touch(obj) < 0) {
+            return -1;
+        }
         Py_XDECREF(obj->value);
         Py_INCREF(value);
         obj->value = value;
@@ -547,6 +616,9 @@ int pyfasty_base_setattr_recursive(PyObject *self, PyObject *name, PyObject *val
     }
     
     /* Config-specific behavior */
+    if ((obj_type == PYFASTY_CONFIG_TYPE || base->depth == 0) && node_touch(base) < 0) {
+        return -1;
+    }
     if (obj_type == PYFASTY_CONFIG_TYPE) {
         /* Store the direct value for all configs (different from registry) */
         Py_XDECREF(base->value);
@@ -561,6 +633,10 @@ int pyfasty_base_setattr_recursive(PyObject *self, PyObject *name, PyObject *val
     
     /* Set the value */
     int result;
+    PyObject *children = pyfasty_node_children(base);
+    if (children == NULL) {
+        return -1;
+    }
     
     /* Déterminer si la valeur est un dict pour sous-objet ou une valeur primitive */
     if (PyDict_Check(value)) {
@@ -570,7 +646,7 @@ int pyfasty_base_setattr_recursive(PyObject *self, PyObject *name, PyObject *val
         }
         
         /* Stocker le sous-objet */
-        result = PyDict_SetItem(base->data, name, new_obj);
+        result = node_set_child(base, children, name, new_obj);
         Py_DECREF(new_obj);
     } else if (PyLong_Check(value) || PyFloat_Check(value) || PyBool_Check(value) || 
                PyUnicode_Check(value) || value == Py_None) {
@@ -582,11 +658,11 @@ int pyfasty_base_setattr_recursive(PyObject *self, PyObject *name, PyObject *val
         }
         
         /* Stocker le sous-objet */
-        result = PyDict_SetItem(base->data, name, new_obj);
+        result = node_set_child(base, children, name, new_obj);
         Py_DECREF(new_obj);
     } else {
         /* Set the value directly for other object types */
-        result = PyDict_SetItem(base->data, name, value);
+        result = node_set_child(base, children, name, value);
     }
     
     return result;
@@ -651,6 +727,19 @@ static PyObject *registry_xor_method(PyObject *self, PyObject *args);
 static PyObject *registry_lshift_method(PyObject *self, PyObject *args);
 static PyObject *registry_rshift_method(PyObject *self, PyObject *args);
 static PyObject *registry_matrix_multiply_method(PyObject *self, PyObject *args);
+static PyObject *registry_batch_method(PyObject *self, PyObject *Py_UNUSED(ignored));
+static PyObject *registry_update_many_method(PyObject *self, PyObject *mapping);
+static PyObject *registry_compile_path_method(PyObject *self, PyObject *path);
+static PyObject *registry_counter_method(PyObject *self, PyObject *args, PyObject *kwds);
+static PyObject *registry_configure_method(PyObject *self, PyObject *args, PyObject *kwds);
+static PyObject *registry_create_index_method(PyObject *self, PyObject *args, PyObject *kwds);
+static PyObject *registry_drop_index_method(PyObject *self, PyObject *path);
+static PyObject *registry_where_method(PyObject *self, PyObject *args, PyObject *kwds);
+static PyObject *registry_snapshot_method(PyObject *self, PyObject *Py_UNUSED(ignored));
+static PyObject *registry_to_dict_method(PyObject *self, PyObject *Py_UNUSED(ignored));
+static PyObject *registry_update_from_method(PyObject *self, PyObject *args, PyObject *kwds);
+static PyObject *registry_dump_method(PyObject *self, PyObject *path);
+static PyObject *registry_load_method(PyObject *self, PyObject *path);
 
 /* Implémentations des adaptateurs */
 #define INPLACE_ADAPTER_DEF(name) \
@@ -789,6 +878,19 @@ static PyMethodDef registry_methods[] = {
     {"lshift", (PyCFunction)registry_lshift_method, METH_VARARGS, "Perform left shift operation (alternative to <<=)"},
     {"rshift", (PyCFunction)registry_rshift_method, METH_VARARGS, "Perform right shift operation (alternative to >>=)"},
     {"matrix_multiply", (PyCFunction)registry_matrix_multiply_method, METH_VARARGS, "Perform matrix multiplication (alternative to @=)"},
+    {"batch", (PyCFunction)registry_batch_method, METH_NOARGS, "Context manager deferring events to one evaluation at exit"},
+    {"update_many", (PyCFunction)registry_update_many_method, METH_O, "Apply several writes ('a.b.c' paths allowed) with one event evaluation"},
+    {"compile_path", (PyCFunction)registry_compile_path_method, METH_O, "Precompile a dot-notated path into a RegistryPath handle (get/set/incr)"},
+    {"counter", (PyCFunction)(void(*)(void))registry_counter_method, METH_VARARGS | METH_KEYWORDS, "Atomic numeric counter stored at a dot-notated path"},
+    {"configure", (PyCFunction)(void(*)(void))registry_configure_method, METH_VARARGS | METH_KEYWORDS, "Bound the children of a dot-notated path with max_entries/ttl eviction"},
+    {"create_index", (PyCFunction)(void(*)(void))registry_create_index_method, METH_VARARGS | METH_KEYWORDS, "Index the children by the value at a dot-notated path (kind='hash' or 'sorted')"},
+    {"drop_index", (PyCFunction)registry_drop_index_method, METH_O, "Remove an index created by create_index()"},
+    {"where", (PyCFunction)(void(*)(void))registry_where_method, METH_VARARGS | METH_KEYWORDS, "Keys of the children matching indexed conditions (field=v, field__gt=v, ...)"},
+    {"dump", (PyCFunction)registry_dump_method, METH_O, "Write the node and its subtree to a file (versioned binary format)"},
+    {"load", (PyCFunction)registry_load_method, METH_O, "Replace the node contents with a file written by dump()"},
+    {"snapshot", (PyCFunction)registry_snapshot_method, METH_NOARGS, "Read-only O(1) view of the subtree, unaffected by later writes"},
+    {"to_dict", (PyCFunction)registry_to_dict_method, METH_NOARGS, "Nested dict copy of the subtree (leaves shared, not copied)"},
+    {"update_from", (PyCFunction)(void(*)(void))registry_update_from_method, METH_VARARGS | METH_KEYWORDS, "Merge a dict into the node in one pass (deep=False replaces subtrees)"},
     {NULL, NULL, 0, NULL}  /* Sentinel */
 };
 
@@ -832,14 +934,19 @@ static PyObject* registry_getattr_recursive(PyObject *self, PyObject *name) {
     
     /* STEP 1: Check if attribute already exists (fast path) */
     PyFastyBaseObject *base = (PyFastyBaseObject *)self;
-    PyObject *existing_result = PyDict_GetItem(base->data, name);
+    PyObject *existing_result = pyfasty_node_get(base, name);
     if (existing_result != NULL) {
         /* Attribute exists - return it normally (la conversion sera gérée par __str__ si nécessaire) */
         /* Sinon, retourner l'objet normalement */
         Py_INCREF(existing_result);
         return existing_result;
     }
-    
+
+    /* STEP 1b: Registry methods (batch, update_many, get_path...) - data keys take precedence */
+    if (PyDict_GetItem(PyFastyRegistryType.tp_dict, name) != NULL) {
+        return PyObject_GenericGetAttr(self, name);
+    }
+
     /* STEP 2: READ-ONLY MODE - prevent auto-creation during event evaluation */
     /* This prevents false positives when event conditions check for attributes */
     if (g_in_condition_evaluation) {
@@ -857,14 +964,13 @@ static int registry_setattr_recursive(PyObject *obj, PyObject *name, PyObject *v
     /* CASE 1: Registry object - use internal data dictionary */
     if (Py_TYPE(obj) == &PyFastyRegistryType) {
         PyFastyRegistryObject *self = (PyFastyRegistryObject *)obj;
-        PyObject *internal_dict = self->base.data;
+        PyObject *internal_dict = pyfasty_node_children(&self->base);
         if (internal_dict == NULL) {
-            PyErr_SetString(PyExc_AttributeError, "Internal dictionary not initialized");
             return -1;
         }
         
         /* Update or add element to internal dictionary */
-        if (PyDict_SetItem(internal_dict, name, value) < 0) {
+        if (node_set_child(&self->base, internal_dict, name, value) < 0) {
             return -1;
         }
         
@@ -937,9 +1043,8 @@ PyObject *registry_setitem(PyObject *self, PyObject *args) {
 
 /* Deallocation function */
 static void registry_dealloc(PyFastyRegistryObject *self) {
-    /* Retourner les dictionnaires au pool et libérer la valeur */
+    /* Retourner la table des enfants au pool et libérer la valeur */
     pyfasty_dict_pool_return(self->base.data);
-    pyfasty_dict_pool_return(self->base.cache);
     Py_XDECREF(self->base.value);
     
     /* Appel à PyObject_Del avec le bon type */
@@ -985,10 +1090,7 @@ static void registry_save_original_value(PyFastyRegistryObject *registry) {
 }
 
 /* Getattro function */
-static PyObject *registry_getattro(PyFastyRegistryObject *self, PyObject *name) {
-    /* Tracer l'accès au module registry pour la détection de dépendances */
-    pyfasty_trace_module_access(MODULE_REGISTRY);
-    
+static PyObject *registry_getattro_lookup(PyFastyRegistryObject *self, PyObject *name) {
     const char *name_str = PyUnicode_AsUTF8(name);
     
     /* Si c'est un nom spécial avec _, utiliser la voie normale */
@@ -998,7 +1100,7 @@ static PyObject *registry_getattro(PyFastyRegistryObject *self, PyObject *name)
 
     /* Nouvelle logique pour les opérations en place */
     if (self->current_op != OP_NONE) {
-        PyObject *attribute_obj = PyDict_GetItem(self->base.data, name);
+        PyObject *attribute_obj = pyfasty_node_get(&self->base, name);
 
         if (attribute_obj != NULL) {
             // L'attribut existe dans self->base.data
@@ -1011,11 +1113,10 @@ static PyObject *registry_getattro(PyFastyRegistryObject *self, PyObject *name)
                 if (wrapped_registry == NULL) {
                     return NULL;
                 }
-                if (PyDict_SetItem(self->base.data, name, wrapped_registry) < 0) {
+                if (node_set_child(&self->base, self->base.data, name, wrapped_registry) < 0) {
                     Py_DECREF(wrapped_registry);
                     return NULL;
                 }
-                PyDict_SetItem(self->base.cache, name, wrapped_registry); 
                 return wrapped_registry; 
             }
         } else {
@@ -1054,11 +1155,11 @@ static PyObject *registry_getattro(PyFastyRegistryObject *self, PyObject *name)
                 return NULL;
             }
 
-            if (PyDict_SetItem(self->base.data, name, new_registry_attr) < 0) {
+            PyObject *children = pyfasty_node_children(&self->base);
+            if (children == NULL || node_set_child(&self->base, children, name, new_registry_attr) < 0) {
                 Py_DECREF(new_registry_attr);
                 return NULL;
             }
-            PyDict_SetItem(self->base.cache, name, new_registry_attr);
             return new_registry_attr; 
     }
     } else {
@@ -1066,7 +1167,7 @@ static PyObject *registry_getattro(PyFastyRegistryObject *self, PyObject *name)
         // Si la valeur directe est une primitive, la sauvegarder avant de la transformer potentiellement
     if (self->base.value != Py_None && is_primitive_value(self->base.value)) {
         
-            PyObject *existing_attr_in_data = PyDict_GetItem(self->base.data, name);
+            PyObject *existing_attr_in_data = pyfasty_node_get(&self->base, name);
             if (!existing_attr_in_data || !PyObject_TypeCheck(existing_attr_in_data, &PyFastyRegistryType)) {
                 registry_save_original_value(self);
             }
@@ -1078,17 +1179,35 @@ static PyObject *registry_getattro(PyFastyRegistryObject *self, PyObject *name)
         PyErr_Clear();
         result = registry_create(self->base.depth + 1, NULL);
         if (result) {
-                if (PyDict_SetItem(self->base.data, name, result) < 0) {
-                    Py_DECREF(result);
-                    return NULL; 
-                }
-            PyDict_SetItem(self->base.cache, name, result);
+            PyObject *children = pyfasty_node_children(&self->base);
+            if (children == NULL || node_set_child(&self->base, children, name, result) < 0) {
+                Py_DECREF(result);
+                return NULL; 
+            }
         }
     }
     return result;
     }
 }
 
+/* Getattro function - trace les lectures pour le suivi des dépendances d'événements */
+static PyObject *registry_getattro(PyFastyRegistryObject *self, PyObject *name) {
+    /* Tracer l'accès au module registry pour la détection de dépendances */
+    pyfasty_trace_module_access(MODULE_REGISTRY);
+    
+    if (g_cache_count != 0 && cache_on_read(&self->base, name, 0) < 0) {
+        return NULL;
+    }
+    PyObject *result = registry_getattro_lookup(self, name);
+    
+    if (g_dependency_tracking && result != NULL) {
+        pyfasty_trace_node_access(MODULE_REGISTRY, (PyObject *)self, name,
+                                  PyObject_TypeCheck(result, &PyFastyRegistryType) ? result : NULL);
+    }
+    
+    return result;
+}
+
 /* Setattro function */
 static int registry_setattro(PyFastyRegistryObject *self, PyObject *name, PyObject *value) {
     /* Fast path: noms spéciaux avec dunder */
@@ -1100,11 +1219,12 @@ static int registry_setattro(PyFastyRegistryObject *self, PyObject *name, PyObje
     /* AMÉLIORATION CRITIQUE: Détecter les opérations en place */
     if (value != NULL && PyObject_TypeCheck(value, &PyFastyRegistryType)) {
         /* Vérifier si l'attribut existe déjà */
-        PyObject *existing = PyDict_GetItem(self->base.data, name);
+        PyObject *existing = pyfasty_node_get(&self->base, name);
         if (existing != NULL && existing == value) {
             /* C'est le même objet ! (résultat d'une opération en place)
-               Ne rien faire, la valeur a déjà été modifiée par l'opération arithmétique */
-            pyfasty_trigger_sync_events_with_module(MODULE_REGISTRY);
+               Ne rien faire, la valeur a déjà été modifiée par l'opération arithmétique.
+               Seul le nœud enfant a changé : ne réévaluer que ses lecteurs */
+            pyfasty_trigger_sync_events_for_node(MODULE_REGISTRY, value, NULL);
             return 0;
         }
     }
@@ -1112,11 +1232,16 @@ static int registry_setattro(PyFastyRegistryObject *self, PyObject *name, PyObje
     /* Traitement des opérations en place basé sur current_op plutôt que des noms spécifiques */
     if (self->current_op != OP_NONE) {
         /* Stocker la valeur dans le dictionnaire avec une clé générique __value__ */
+        if (node_touch(&self->base) < 0) {
+            return -1;
+        }
         PyObject *key = PyUnicode_FromString(PYFASTY_INTERNAL_VALUE_KEY);
-        if (key) {
-            PyDict_SetItem(self->base.data, key, value);
-            Py_DECREF(key);
+        PyObject *children = pyfasty_node_children(&self->base);
+        if (key && children) {
+            PyDict_SetItem(children, key, value);
         }
+        Py_XDECREF(key);
+        PyErr_Clear();
         
         /* Mettre à jour la valeur directe pour que les accès soient corrects */
         Py_XDECREF(self->base.value);
@@ -1135,17 +1260,21 @@ static int registry_setattro(PyFastyRegistryObject *self, PyObject *name, PyObje
     if (self->base.depth > 0 && PyUnicode_Check(self->base.value)) {
         /* Si c'est un attribut de chaîne de texte, ne pas remplacer sa valeur directe
            mais simplement stocker le nouvel attribut dans le dictionnaire data */
-        PyObject *existing = PyDict_GetItem(self->base.data, name);
+        PyObject *existing = pyfasty_node_get(&self->base, name);
         if (existing) {
             /* Si l'attribut existe déjà et est un Registry, mettre à jour sa valeur */
             if (PyObject_TypeCheck(existing, &PyFastyRegistryType)) {
                 PyFastyBaseObject *obj = (PyFastyBaseObject *)existing;
                 
                 /* Mettre à jour la valeur directe de l'attribut */
+                if (node_touch(obj) < 0) {
+                    return -1;
+                }
                 Py_XDECREF(obj->value);
                 Py_INCREF(value);
                 obj->value = value;
-                
+
+                pyfasty_trigger_sync_events_for_node(MODULE_REGISTRY, (PyObject *)self, name);
                 return 0;
             }
         }
@@ -1157,12 +1286,13 @@ static int registry_setattro(PyFastyRegistryObject *self, PyObject *name, PyObje
         }
         
         /* Stocker dans le dictionnaire de données mais NE PAS mettre à jour base.value */
-        int result = PyDict_SetItem(self->base.data, name, new_obj);
+        PyObject *children = pyfasty_node_children(&self->base);
+        int result = children != NULL ? node_set_child(&self->base, children, name, new_obj) : -1;
         Py_DECREF(new_obj);
         
         /* Déclencher les événements synchrones après modification d'attributs */
         if (result >= 0) {
-            pyfasty_trigger_sync_events_with_module(MODULE_REGISTRY);
+            pyfasty_trigger_sync_events_for_node(MODULE_REGISTRY, (PyObject *)self, name);
         }
         
         return result;
@@ -1176,6 +1306,9 @@ static int registry_setattro(PyFastyRegistryObject *self, PyObject *name, PyObje
     }
     
     /* Pour le niveau racine ou les types non-chaîne, stocker la valeur directe */
+    if (node_touch(&self->base) < 0) {
+        return -1;
+    }
     Py_XDECREF(self->base.value);
     Py_INCREF(value);
     self->base.value = value;
@@ -1187,7 +1320,7 @@ static int registry_setattro(PyFastyRegistryObject *self, PyObject *name, PyObje
     /* Déclencher les événements synchrones après modification d'attributs */
     if (result >= 0) {
         /* Déclencher uniquement les événements liés au registry */
-        pyfasty_trigger_sync_events_with_module(MODULE_REGISTRY);
+        pyfasty_trigger_sync_events_for_node(MODULE_REGISTRY, (PyObject *)self, name);
     }
     
     return result;
@@ -1208,7 +1341,7 @@ static int registry_ass_item(PyFastyRegistryObject *self, Py_ssize_t i, PyObject
     /* Déclencher les événements synchrones après modification */
     if (result >= 0) {
         /* Déclencher uniquement les événements liés au registry */
-        pyfasty_trigger_sync_events_with_module(MODULE_REGISTRY);
+        pyfasty_trigger_sync_events_for_node(MODULE_REGISTRY, (PyObject *)self, NULL);
     }
     
     return result;
@@ -1221,17 +1354,17 @@ static int registry_ass_subscript(PyFastyRegistryObject *self, PyObject *key, Py
         /* Obtenir le dictionnaire interne */
         PyObject *internal_dict = self->base.data;
         if (internal_dict == NULL) {
-            PyErr_SetString(PyExc_AttributeError, "Internal dictionary not initialized");
+            PyErr_SetObject(PyExc_KeyError, key);
             return -1;
         }
         
         /* Supprimer l'élément */
-        if (PyDict_DelItem(internal_dict, key) < 0) {
+        if (node_del_child(&self->base, internal_dict, key) < 0) {
             return -1;
         }
         
         /* Déclencher les événements synchrones */
-        pyfasty_trigger_sync_events_with_module(MODULE_REGISTRY);
+        pyfasty_trigger_sync_events_for_node(MODULE_REGISTRY, (PyObject *)self, key);
         
         return 0;
     }
@@ -1242,12 +1375,23 @@ static int registry_ass_subscript(PyFastyRegistryObject *self, PyObject *key, Py
     /* Déclencher les événements synchrones après modification */
     if (result >= 0) {
         /* Déclencher uniquement les événements liés au registry */
-        pyfasty_trigger_sync_events_with_module(MODULE_REGISTRY);
+        pyfasty_trigger_sync_events_for_node(MODULE_REGISTRY, (PyObject *)self, key);
     }
     
     return result;
 }
 
+/* Conversion de la table des enfants (dict vide si le nœud n'en a pas) */
+static PyObject *registry_convert_data(PyFastyRegistryObject *self, PyObject *(*converter)(PyObject*)) {
+    PyObject *data = pyfasty_node_data(&self->base);
+    if (data == NULL) {
+        return NULL;
+    }
+    PyObject *result = converter(data);
+    Py_DECREF(data);
+    return result;
+}
+
 /* Helper pour obtenir la représentation en chaîne d'un Registry - Version simplifiée et thread-safe */
 static PyObject *registry_get_str_repr(PyFastyRegistryObject *self, PyObject *(*converter)(PyObject*)) {
     /* Protection simple contre la récursion infinie avec un compteur statique */
@@ -1255,7 +1399,7 @@ static PyObject *registry_get_str_repr(PyFastyRegistryObject *self, PyObject *(*
     
     /* Protection contre la récursion infinie */
     if (recursion_depth > 10) {
-        return converter(self->base.data);
+        return registry_convert_data(self, converter);
     }
     
     recursion_depth++;
@@ -1308,7 +1452,8 @@ static PyObject *registry_get_str_repr(PyFastyRegistryObject *self, PyObject *(*
     }
     
     /* Priorité 3: Essayer __value__ du dictionnaire de données */
-    PyObject *internal_value_obj = PyDict_GetItemString(self->base.data, PYFASTY_INTERNAL_VALUE_KEY);
+    PyObject *internal_value_obj = self->base.data != NULL ?
+        PyDict_GetItemString(self->base.data, PYFASTY_INTERNAL_VALUE_KEY) : NULL;
     if (internal_value_obj != NULL) { 
         result = converter(internal_value_obj);
         if (result != NULL) {
@@ -1324,7 +1469,7 @@ static PyObject *registry_get_str_repr(PyFastyRegistryObject *self, PyObject *(*
             }
             
     /* Priorité 5: Fallback au dictionnaire de données */
-    result = converter(self->base.data);
+    result = registry_convert_data(self, converter);
 
 cleanup:
     recursion_depth--;
@@ -1353,7 +1498,11 @@ int pyfasty_common_contains(PyObject *self, PyObject *key) {
     }
     
     /* Check the data dictionary */
-    return PyDict_Contains(base->data, key);
+    if (base->data == NULL) {
+        return 0;
+    }
+    PyObject *children = pyfasty_node_children(base);
+    return children != NULL ? PyDict_Contains(children, key) : -1;
 }
 
 /* Implementation of contains check - Version spécifique Registry */
@@ -1381,7 +1530,7 @@ PyObject *pyfasty_common_getitem(PyObject *self, PyObject *key, PyTypeObject *ty
                     }
                     
                     /* Stocker dans le dictionnaire direct */
-                    if (PyDict_SetItem(base->value, key, new_obj) < 0) {
+                    if (node_touch(base) < 0 || PyDict_SetItem(base->value, key, new_obj) < 0) {
                         Py_DECREF(new_obj);
                         return NULL;
                     }
@@ -1437,7 +1586,10 @@ PyObject *pyfasty_common_getitem(PyObject *self, PyObject *key, PyTypeObject *ty
     }
     
     /* Check the data dictionary as fallback */
-    result = PyDict_GetItem(base->data, key);
+    result = pyfasty_node_get(base, key);
+    if (result == NULL && PyErr_Occurred()) {
+        return NULL;
+    }
     if (result == NULL) {
         /* Si aucun élément trouvé, mais que nous avons une valeur directe qui est un entier ou autre primitive,
            alors nous créons un nouvel objet Registry pour permettre l'accès par attributs dynamique */
@@ -1450,7 +1602,8 @@ PyObject *pyfasty_common_getitem(PyObject *self, PyObject *key, PyTypeObject *ty
             }
             
             /* Stocker dans le dictionnaire data pour les futurs accès */
-            if (PyDict_SetItem(base->data, key, new_obj) < 0) {
+            PyObject *children = pyfasty_node_children(base);
+            if (children == NULL || node_set_child(base, children, key, new_obj) < 0) {
                 Py_DECREF(new_obj);
                 PyErr_SetObject(PyExc_KeyError, key);
                 return NULL;
@@ -1471,7 +1624,7 @@ PyObject *pyfasty_common_getitem(PyObject *self, PyObject *key, PyTypeObject *ty
         }
         
         /* Stocker dans le dictionnaire data */
-        if (PyDict_SetItem(base->data, key, new_obj) < 0) {
+        if (node_set_child(base, base->data, key, new_obj) < 0) {
             Py_DECREF(new_obj);
             Py_INCREF(result);
             return result;
@@ -1493,6 +1646,9 @@ int pyfasty_common_setitem(PyObject *self, PyObject *key, PyObject *value, PyTyp
     
     /* Si on a une valeur directe et c'est un dict */
     if (base->value != Py_None && PyDict_Check(base->value)) {
+        if (node_touch(base) < 0) {
+            return -1;
+        }
         if (value == NULL) {
             /* Cas de suppression */
             result = PyDict_DelItem(base->value, key);
@@ -1519,11 +1675,16 @@ int pyfasty_common_setitem(PyObject *self, PyObject *key, PyObject *value, PyTyp
     
     /* Sinon, utiliser le dictionnaire de données */
     if (value == NULL) {
-        result = PyDict_DelItem(base->data, key);
+        if (base->data == NULL) {
+            PyErr_SetObject(PyExc_KeyError, key);
+            return -1;
+        }
+        PyObject *children = pyfasty_node_children(base);
+        result = children != NULL ? node_del_child(base, children, key) : -1;
     } else {
-        /* Vider le cache pour cohérence */
-        if (PyDict_Contains(base->cache, key)) {
-            PyDict_DelItem(base->cache, key);
+        PyObject *children = pyfasty_node_children(base);
+        if (children == NULL) {
+            return -1;
         }
         
         /* Si value est un dict, on le convertit d'abord en Registry/Config */
@@ -1534,10 +1695,10 @@ int pyfasty_common_setitem(PyObject *self, PyObject *key, PyObject *value, PyTyp
             }
             
             /* Affecter le nouveau Registry/Config */
-            result = PyDict_SetItem(base->data, key, new_obj);
+            result = node_set_child(base, children, key, new_obj);
             Py_DECREF(new_obj);
         } else {
-            result = PyDict_SetItem(base->data, key, value);
+            result = node_set_child(base, children, key, value);
         }
     }
     
@@ -1561,7 +1722,7 @@ static int registry_set_item(PyObject *self, PyObject *key, PyObject *value) {
                 
                 /* Déclencher les événements après modification */
                 if (result >= 0) {
-                    pyfasty_trigger_sync_events_with_module(MODULE_REGISTRY);
+                    pyfasty_trigger_sync_events_for_node(MODULE_REGISTRY, self, key);
                 }
                 
                 return result;
@@ -1575,14 +1736,14 @@ static int registry_set_item(PyObject *self, PyObject *key, PyObject *value) {
     
     /* Déclencher les événements synchrones après modification d'éléments par clé */
     if (result >= 0) {
-        pyfasty_trigger_sync_events_with_module(MODULE_REGISTRY);
+        pyfasty_trigger_sync_events_for_node(MODULE_REGISTRY, self, key);
     }
     
     return result;
 }
 
 /* Get item function - version Registry spécifique */
-static PyObject *registry_get_item(PyObject *self, PyObject *key) {
+static PyObject *registry_get_item_lookup(PyObject *self, PyObject *key) {
     PyFastyRegistryObject *registry = (PyFastyRegistryObject *)self;
     
     /* Cas spécial: si la valeur directe est un entier ou une autre valeur primitive,
@@ -1592,7 +1753,7 @@ static PyObject *registry_get_item(PyObject *self, PyObject *key) {
             PyBool_Check(registry->base.value) || PyUnicode_Check(registry->base.value)) {
             
             /* D'abord vérifier si cette clé existe déjà dans le dictionnaire de données */
-            PyObject *existing = PyDict_GetItem(registry->base.data, key);
+            PyObject *existing = pyfasty_node_get(&registry->base, key);
             if (existing != NULL) {
                 Py_INCREF(existing);
                 return existing;
@@ -1604,21 +1765,22 @@ static PyObject *registry_get_item(PyObject *self, PyObject *key) {
             if (new_obj != NULL) {
                 /* Créer dynamiquement un attribut avec le nom de la clé */
                 PyObject *str_key = PyObject_Str(key);
-                if (str_key != NULL) {
-                    /* Ajouter l'attribut/clé au Registry pour les accès futurs */
-                    PyFastyBaseObject *reg_base = (PyFastyBaseObject *)new_obj;
+                PyObject *children = pyfasty_node_children(&registry->base);
+                PyObject *reg_children = pyfasty_node_children((PyFastyBaseObject *)new_obj);
+                if (str_key != NULL && children != NULL && reg_children != NULL) {
                     /* IMPORTANT: Stocker également l'attribut dans le registry original */
-                    PyDict_SetItem(registry->base.data, key, new_obj);
+                    node_set_child(&registry->base, children, key, new_obj);
                     
                     /* Si ce registry a déjà un attribut avec ce nom, le copier dans le nouveau */
-                    PyObject *attr_value = PyDict_GetItem(registry->base.data, str_key);
+                    PyObject *attr_value = PyDict_GetItem(children, str_key);
                     if (attr_value != NULL) {
-                        PyDict_SetItem(reg_base->data, str_key, attr_value);
+                        PyDict_SetItem(reg_children, str_key, attr_value);
                     } else {
-                        PyDict_SetItem(reg_base->data, str_key, Py_None);
+                        PyDict_SetItem(reg_children, str_key, Py_None);
                     }
-                    Py_DECREF(str_key);
                 }
+                Py_XDECREF(str_key);
+                PyErr_Clear();
                 
                 return new_obj;
             }
@@ -1629,6 +1791,21 @@ static PyObject *registry_get_item(PyObject *self, PyObject *key) {
     return pyfasty_common_getitem(self, key, &PyFastyRegistryType, PYFASTY_REGISTRY_TYPE, registry_create);
 }
 
+/* Get item function - trace les lectures pour le suivi des dépendances d'événements */
+static PyObject *registry_get_item(PyObject *self, PyObject *key) {
+    if (g_cache_count != 0 && cache_on_read((PyFastyBaseObject *)self, key, 1) < 0) {
+        return NULL;
+    }
+    PyObject *result = registry_get_item_lookup(self, key);
+    
+    if (g_dependency_tracking && result != NULL) {
+        pyfasty_trace_node_access(MODULE_REGISTRY, self, key,
+                                  PyObject_TypeCheck(result, &PyFastyRegistryType) ? result : NULL);
+    }
+    
+    return result;
+}
+
 /* Version générique de get_method pour Registry et Config */
 PyObject *pyfasty_common_getmethod(PyObject *self, PyObject *args, PyFastyObjectType obj_type) {
     PyFastyBaseObject *base = (PyFastyBaseObject *)self;
@@ -1647,8 +1824,19 @@ PyObject *pyfasty_common_getmethod(PyObject *self, PyObject *args, PyFastyObject
     }
     
     /* Check the data dictionary */
-    result = PyDict_GetItem(base->data, key);
+    result = pyfasty_node_get(base, key);
+    
+    /* Clé lue (présente ou non) : dépendance de la condition en cours d'évaluation */
+    if (g_dependency_tracking && (result != NULL || !PyErr_Occurred())) {
+        pyfasty_trace_node_access(obj_type == PYFASTY_CONFIG_TYPE ? MODULE_CONFIG : MODULE_REGISTRY,
+                                  self, key,
+                                  result != NULL && PyObject_TypeCheck(result, Py_TYPE(self)) ? result : NULL);
+    }
+    
     if (result == NULL) {
+        if (PyErr_Occurred()) {
+            return NULL;
+        }
         Py_INCREF(default_value);
         return default_value;
     }
@@ -1659,42 +1847,13 @@ PyObject *pyfasty_common_getmethod(PyObject *self, PyObject *args, PyFastyObject
 
 /* Implementation of get method - version Registry spécifique */
 static PyObject *registry_get_method(PyObject *self, PyObject *args) {
-    return pyfasty_common_getmethod(self, args, PYFASTY_REGISTRY_TYPE);
-}
-
-/* Nettoyage __original_value__ si présent */
-static void registry_clean_original_value(PyFastyRegistryObject *registry) {
-    PyObject *orig_key = PyUnicode_FromString(PYFASTY_ORIGINAL_VALUE_KEY);
-    if (orig_key) {
-        if (PyDict_Contains(registry->base.data, orig_key)) {
-            PyDict_DelItem(registry->base.data, orig_key);
-        }
-        Py_DECREF(orig_key);
+    if (g_cache_count != 0 && PyTuple_GET_SIZE(args) > 0 &&
+        cache_on_read((PyFastyBaseObject *)self, PyTuple_GET_ITEM(args, 0), 1) < 0) {
+        return NULL;
     }
+    return pyfasty_common_getmethod(self, args, PYFASTY_REGISTRY_TYPE);
 }
 
-/* Storage unified : base.value + __value__ dans data */
-static int registry_store_value(PyFastyRegistryObject *registry, PyObject *new_value) {
-            if (new_value == NULL) {
-        return -1;
-            }
-            
-            /* Update direct value */
-    Py_XDECREF(registry->base.value);
-    Py_INCREF(new_value);
-            registry->base.value = new_value;
-            
-    /* Store dans data sous clé __value__ */
-    PyObject *key = PyUnicode_FromString(PYFASTY_INTERNAL_VALUE_KEY);
-    if (key) {
-        int result = PyDict_SetItem(registry->base.data, key, new_value);
-        Py_DECREF(key);
-        return result;
-    }
-    
-    return 0;
-        }
-
 /* === OPÉRATIONS ARITHMÉTIQUES IN-PLACE - VERSION OPTIMISÉE === */
 /* Fonction générique pour toutes les opérations arithmétiques (factorisation sécurisée) */
 typedef enum {
@@ -1841,10 +2000,14 @@ static PyObject *registry_inplace_operation(PyObject *self, PyObject *other, Ari
     if (new_value == NULL) return NULL;
     
     /* Remplacement atomique + trigger */
+    if (node_touch(&registry->base) < 0) {
+        Py_DECREF(new_value);
+        return NULL;
+    }
     Py_XDECREF(registry->base.value);
     registry->base.value = new_value;
     
-    pyfasty_trigger_sync_events_with_module(MODULE_REGISTRY);
+    pyfasty_trigger_sync_events_for_node(MODULE_REGISTRY, self, NULL);
     
     Py_INCREF(self);
     return self;
@@ -1964,11 +2127,23 @@ static PyObject *registry_inplace_matrix_multiply(PyObject *self, PyObject *othe
     return registry_inplace_operation(self, other, ARITH_MATMUL);
 }
 
+/* Segment de get_path : même lecture que l'accès par attribut, tracée pour les dépendances */
+static PyObject *registry_get_path_segment(PyObject *self, PyObject *name) {
+    PyObject *result = registry_getattr_recursive(self, name);
+    
+    if (g_dependency_tracking && result != NULL) {
+        pyfasty_trace_node_access(MODULE_REGISTRY, self, name,
+                                  PyObject_TypeCheck(result, &PyFastyRegistryType) ? result : NULL);
+    }
+    
+    return result;
+}
+
 /* Fonction optimisée pour accéder à un attribut via un chemin */
 static PyObject *registry_get_by_path(PyFastyRegistryObject *self, const char *path) {
     return pyfasty_object_get_by_path((PyObject*)self, path, 
                                     &PyFastyRegistryType, 
-                                    (PyFastyGetAttrFunc)registry_getattr_recursive);
+                                    (PyFastyGetAttrFunc)registry_get_path_segment);
 }
 
 /* Méthode Python get_path */
@@ -1993,82 +2168,3956 @@ static PyObject *registry_get_path_method(PyObject *self, PyObject *args) {
     return result;
 }
 
-/* Fonction helper générique pour les méthodes d'opérations binaires */
-static PyObject *registry_binary_op_method(PyObject *self, PyObject *args, 
-                                        PyObject *(*op_func)(PyObject*, PyObject*),
-                                        const char *name) {
-    PyObject *other;
-    
-    if (!PyArg_ParseTuple(args, "O", &other))
-        return NULL;
-    
-    /* Déléguer à la fonction spécifique */
-    return op_func(self, other);
-}
-
-/* Méthode pour l'opération &= (AND) */
-static PyObject *registry_bitwise_and_method(PyObject *self, PyObject *args) {
-    return registry_binary_op_method(self, args, registry_inplace_and, "bitwise_and");
-}
-
-/* Méthode pour l'opération |= (OR) */
-static PyObject *registry_bitwise_or_method(PyObject *self, PyObject *args) {
-    return registry_binary_op_method(self, args, registry_inplace_or, "bitwise_or");
-}
-
-/* Méthode pour l'opération //= (division entière) */
-static PyObject *registry_floor_divide_method(PyObject *self, PyObject *args) {
-    return registry_binary_op_method(self, args, registry_inplace_floor_divide, "floor_divide");
-}
+/* === CHEMINS COMPILÉS === */
+/* registry.compile_path("a.b.c") : segments internés une seule fois, nœuds parent
+   et cible mis en cache tant que la version structurelle ne change pas */
+typedef struct {
+    PyObject_HEAD
+    PyObject *root;            /* Nœud de départ */
+    PyObject *path;            /* Chemin d'origine (repr) */
+    PyObject *names;           /* Tuple des segments internés */
+    PyObject *parent;          /* Nœud parent résolu (cache) */
+    PyObject *target;          /* Nœud cible résolu (cache) */
+    uint64_t version;          /* Version structurelle du cache */
+} RegistryPathObject;
 
-/* Méthode pour l'opération ^= (XOR) */
-static PyObject *registry_xor_method(PyObject *self, PyObject *args) {
-    return registry_binary_op_method(self, args, registry_inplace_xor, "xor");
-}
+static PyTypeObject RegistryPathType;
 
-/* Méthode pour l'opération <<= (LSHIFT) */
-static PyObject *registry_lshift_method(PyObject *self, PyObject *args) {
-    return registry_binary_op_method(self, args, registry_inplace_lshift, "lshift");
+/* Parcours des tables d'enfants sans création : 1 si parent et cible sont des
+   nœuds Registry (mis en cache), 0 sinon */
+static int registry_path_resolve(RegistryPathObject *self) {
+    if (self->target != NULL && self->version == g_structure_version) {
+        return 1;
+    }
+    Py_CLEAR(self->parent);
+    Py_CLEAR(self->target);
+    
+    PyObject *parent = NULL;
+    PyObject *node = self->root;
+    Py_ssize_t count = PyTuple_GET_SIZE(self->names);
+    for (Py_ssize_t i = 0; i < count; i++) {
+        PyObject *next = pyfasty_node_get((PyFastyBaseObject *)node,
+                                          PyTuple_GET_ITEM(self->names, i));
+        if (next == NULL || Py_TYPE(next) != &PyFastyRegistryType) {
+            return 0;
+        }
+        parent = node;
+        node = next;
+    }
+    
+    Py_INCREF(parent);
+    Py_INCREF(node);
+    self->parent = parent;
+    self->target = node;
+    self->version = g_structure_version;
+    return 1;
 }
 
-/* Méthode pour l'opération >>= (RSHIFT) */
-static PyObject *registry_rshift_method(PyObject *self, PyObject *args) {
-    return registry_binary_op_method(self, args, registry_inplace_rshift, "rshift");
+/* Parent du dernier segment, nœuds intermédiaires créés au besoin (nouvelle référence) */
+static PyObject *registry_path_parent(RegistryPathObject *self) {
+    PyObject *node = self->root;
+    Py_INCREF(node);
+    Py_ssize_t count = PyTuple_GET_SIZE(self->names);
+    for (Py_ssize_t i = 0; i < count - 1 && node != NULL; i++) {
+        PyObject *next = PyObject_GetAttr(node, PyTuple_GET_ITEM(self->names, i));
+        Py_DECREF(node);
+        node = next;
+    }
+    return node;
 }
 
-/* Méthode pour l'opération @= (MATRIX_MULTIPLY) */
-static PyObject *registry_matrix_multiply_method(PyObject *self, PyObject *args) {
-    return registry_binary_op_method(self, args, registry_inplace_matrix_multiply, "matrix_multiply");
+/* Valeur directe du nœud, ou le nœud lui-même s'il n'en a pas */
+static PyObject *registry_path_node_value(PyObject *node) {
+    PyObject *value = ((PyFastyBaseObject *)node)->value;
+    if (value == NULL || value == Py_None) {
+        value = node;
+    }
+    Py_INCREF(value);
+    return value;
 }
 
-/* Globals */
-static PyObject *g_registry = NULL;
-
-/* Fonction helper générique pour les opérations binaires au niveau du module */
-static PyObject *pyfasty_binary_op(PyObject *self, PyObject *args, 
-                                PyObject *(*op_func)(PyObject*, PyObject*)) {
-    PyObject *registry_obj;
-    PyObject *value;
-    
-    if (!PyArg_ParseTuple(args, "OO", &registry_obj, &value))
+/* get(default=None) : sans création de nœud */
+static PyObject *registry_path_get(RegistryPathObject *self, PyObject *args) {
+    PyObject *default_value = Py_None;
+    if (!PyArg_ParseTuple(args, "|O:get", &default_value)) {
         return NULL;
+    }
     
-    /* Vérifier que le premier argument est un Registry */
-    if (!PyObject_TypeCheck(registry_obj, &PyFastyRegistryType)) {
-        PyErr_SetString(PyExc_TypeError, "First argument must be a Registry object");
-        return NULL;
+    /* Pendant le suivi des dépendances, les lectures doivent être tracées */
+    if (!g_dependency_tracking && registry_path_resolve(self)) {
+        return registry_path_node_value(self->target);
     }
     
-    return op_func(registry_obj, value);
+    PyObject *node = self->root;
+    Py_INCREF(node);
+    Py_ssize_t count = PyTuple_GET_SIZE(self->names);
+    for (Py_ssize_t i = 0; i < count; i++) {
+        PyObject *name = PyTuple_GET_ITEM(self->names, i);
+        if (!PyObject_TypeCheck(node, &PyFastyRegistryType) ||
+            pyfasty_node_get((PyFastyBaseObject *)node, name) == NULL) {
+            Py_DECREF(node);
+            Py_INCREF(default_value);
+            return default_value;
+        }
+        PyObject *next = PyObject_GetAttr(node, name);
+        Py_DECREF(node);
+        if (next == NULL) {
+            return NULL;
+        }
+        node = next;
+    }
+    
+    if (!PyObject_TypeCheck(node, &PyFastyRegistryType)) {
+        return node;
+    }
+    PyObject *result = registry_path_node_value(node);
+    Py_DECREF(node);
+    return result;
 }
 
-/* Bitwise AND function */
-static PyObject *pyfasty_bitwise_and(PyObject *self, PyObject *args) {
-    return pyfasty_binary_op(self, args, registry_inplace_and);
+/* set(value) : même sémantique que l'affectation par attribut */
+static PyObject *registry_path_set(RegistryPathObject *self, PyObject *value) {
+    PyObject *name = PyTuple_GET_ITEM(self->names, PyTuple_GET_SIZE(self->names) - 1);
+    int result;
+    
+    if (registry_path_resolve(self)) {
+        result = registry_setattro((PyFastyRegistryObject *)self->parent, name, value);
+    } else {
+        PyObject *parent = registry_path_parent(self);
+        if (parent == NULL) {
+            return NULL;
+        }
+        result = PyObject_SetAttr(parent, name, value);
+        Py_DECREF(parent);
+    }
+    
+    if (result < 0) {
+        return NULL;
+    }
+    Py_RETURN_NONE;
 }
 
-/* Bitwise OR function */
-static PyObject *pyfasty_bitwise_or(PyObject *self, PyObject *args) {
+/* incr(n=1) : addition en place sur le nœud cible (comme +=), renvoie la nouvelle valeur */
+static PyObject *registry_path_incr(RegistryPathObject *self, PyObject *args) {
+    PyObject *amount = NULL;
+    if (!PyArg_ParseTuple(args, "|O:incr", &amount)) {
+        return NULL;
+    }
+    if (amount != NULL && !is_numeric_value(amount)) {
+        PyErr_SetString(PyExc_TypeError, "Operator += requires a number");
+        return NULL;
+    }
+    
+    if (!registry_path_resolve(self)) {
+        /* Création du chemin : la cible démarre à 0 */
+        PyObject *parent = registry_path_parent(self);
+        if (parent == NULL) {
+            return NULL;
+        }
+        PyObject *name = PyTuple_GET_ITEM(self->names, PyTuple_GET_SIZE(self->names) - 1);
+        int result = -1;
+        if (PyObject_TypeCheck(parent, &PyFastyRegistryType) &&
+            pyfasty_node_get((PyFastyBaseObject *)parent, name) == NULL) {
+            PyObject *zero = PyLong_FromLong(PYFASTY_DEFAULT_ADD_VALUE);
+            result = zero != NULL ? PyObject_SetAttr(parent, name, zero) : -1;
+            Py_XDECREF(zero);
+        }
+        Py_DECREF(parent);
+        if (result < 0 && PyErr_Occurred()) {
+            return NULL;
+        }
+        if (result < 0 || !registry_path_resolve(self)) {
+            PyErr_Format(PyExc_TypeError, "Path '%U' does not lead to a registry node", self->path);
+            return NULL;
+        }
+    }
+    
+    PyFastyBaseObject *target = (PyFastyBaseObject *)self->target;
+    PyObject *new_value;
+    if (PyLong_Check(target->value) && (amount == NULL || PyLong_Check(amount))) {
+        /* Entiers : addition exacte */
+        if (amount == NULL) {
+            PyObject *one = PyLong_FromLong(1);
+            if (one == NULL) {
+                return NULL;
+            }
+            new_value = PyNumber_Add(target->value, one);
+            Py_DECREF(one);
+        } else {
+            new_value = PyNumber_Add(target->value, amount);
+        }
+    } else {
+        double current = extract_numeric_value(target->value, 0.0);
+        double other = amount != NULL ? extract_numeric_value(amount, 0.0) : 1.0;
+        new_value = create_optimal_number(current + other);
+    }
+    if (new_value == NULL) {
+        return NULL;
+    }
+    
+    if (node_touch(target) < 0) {
+        Py_DECREF(new_value);
+        return NULL;
+    }
+    Py_XDECREF(target->value);
+    target->value = new_value;
+    
+    /* La cible est gardée en vie par le handle pendant le déclenchement */
+    PyObject *keep = self->target;
+    Py_INCREF(keep);
+    pyfasty_trigger_sync_events_for_node(MODULE_REGISTRY, keep, NULL);
+    Py_INCREF(new_value);
+    Py_DECREF(keep);
+    return new_value;
+}
+
+static void registry_path_dealloc(RegistryPathObject *self) {
+    Py_XDECREF(self->root);
+    Py_XDECREF(self->path);
+    Py_XDECREF(self->names);
+    Py_XDECREF(self->parent);
+    Py_XDECREF(self->target);
+    PyObject_Del(self);
+}
+
+static PyObject *registry_path_repr(RegistryPathObject *self) {
+    return PyUnicode_FromFormat("RegistryPath(%R)", self->path);
+}
+
+static PyMethodDef registry_path_methods[] = {
+    {"get", (PyCFunction)registry_path_get, METH_VARARGS, "Value at the path (default if the path does not exist)"},
+    {"set", (PyCFunction)registry_path_set, METH_O, "Assign the value at the path (same as attribute assignment)"},
+    {"incr", (PyCFunction)registry_path_incr, METH_VARARGS, "Add n (default 1) to the value at the path and return it"},
+    {NULL, NULL, 0, NULL}  /* Sentinel */
+};
+
+static PyTypeObject RegistryPathType = {
+    PyVarObject_HEAD_INIT(NULL, 0)
+    .tp_name = "pyfasty._pyfasty.RegistryPath",
+    .tp_doc = "Precompiled registry path with cached node resolution",
+    .tp_basicsize = sizeof(RegistryPathObject),
+    .tp_itemsize = 0,
+    .tp_flags = Py_TPFLAGS_DEFAULT,
+    .tp_dealloc = (destructor)registry_path_dealloc,
+    .tp_repr = (reprfunc)registry_path_repr,
+    .tp_methods = registry_path_methods,
+};
+
+/* Découpage 'a.b.c' en tuple de segments internés (segments vides ou privés refusés) */
+static PyObject *registry_split_path(PyObject *path) {
+    if (!PyUnicode_Check(path)) {
+        PyErr_SetString(PyExc_TypeError, "registry path must be a str");
+        return NULL;
+    }
+    
+    PyObject *separator = PyUnicode_FromString(".");
+    if (separator == NULL) {
+        return NULL;
+    }
+    PyObject *parts = PyUnicode_Split(path, separator, -1);
+    Py_DECREF(separator);
+    if (parts == NULL) {
+        return NULL;
+    }
+    
+    Py_ssize_t count = PyList_GET_SIZE(parts);
+    PyObject *names = PyTuple_New(count);
+    if (names == NULL) {
+        Py_DECREF(parts);
+        return NULL;
+    }
+    for (Py_ssize_t i = 0; i < count; i++) {
+        PyObject *name = PyList_GET_ITEM(parts, i);
+        const char *name_str = PyUnicode_AsUTF8(name);
+        if (name_str == NULL || name_str[0] == '\0' || name_str[0] == '_') {
+            if (name_str != NULL) {
+                PyErr_Format(PyExc_ValueError, "Invalid registry path: '%U'", path);
+            }
+            Py_DECREF(names);
+            Py_DECREF(parts);
+            return NULL;
+        }
+        /* Segments internés : comparaison par identité dans les tables d'enfants */
+        Py_INCREF(name);
+        PyUnicode_InternInPlace(&name);
+        PyTuple_SET_ITEM(names, i, name);
+    }
+    Py_DECREF(parts);
+    return names;
+}
+
+/* Méthode compile_path("a.b.c") */
+static PyObject *registry_compile_path_method(PyObject *self, PyObject *path) {
+    PyObject *names = registry_split_path(path);
+    if (names == NULL) {
+        return NULL;
+    }
+    
+    RegistryPathObject *handle = PyObject_New(RegistryPathObject, &RegistryPathType);
+    if (handle == NULL) {
+        Py_DECREF(names);
+        return NULL;
+    }
+    Py_INCREF(self);
+    Py_INCREF(path);
+    handle->root = self;
+    handle->path = path;
+    handle->names = names;
+    handle->parent = NULL;
+    handle->target = NULL;
+    handle->version = 0;
+    return (PyObject *)handle;
+}
+
+/* === COMPTEURS ATOMIQUES === */
+/* registry.counter("stats.requests") : entier 64 bits ou double mis à jour par
+   opérations atomiques, sans passer par getattr/setattr ni déclencher d'événements.
+   Avec stripes=N, chaque thread accumule dans sa propre bande (ligne de cache
+   séparée) et les lectures additionnent les bandes. */
+#define REGISTRY_COUNTER_MAX_STRIPES 64
+
+#ifdef PYFASTY_WINDOWS
+    #define counter_atomic_load(ptr) InterlockedCompareExchange64((volatile LONG64 *)(ptr), 0, 0)
+    #define counter_atomic_exchange(ptr, v) InterlockedExchange64((volatile LONG64 *)(ptr), (v))
+    #define counter_atomic_cas(ptr, expected, desired) \
+        (InterlockedCompareExchange64((volatile LONG64 *)(ptr), (desired), (expected)) == (expected))
+#else
+    #define counter_atomic_load(ptr) __atomic_load_n((ptr), __ATOMIC_RELAXED)
+    #define counter_atomic_exchange(ptr, v) __atomic_exchange_n((ptr), (v), __ATOMIC_RELAXED)
+    #define counter_atomic_cas(ptr, expected, desired) \
+        __atomic_compare_exchange_n((ptr), &(expected), (desired), 0, __ATOMIC_RELAXED, __ATOMIC_RELAXED)
+#endif
+
+/* Bande alignée sur une ligne de cache : pas de faux partage entre threads */
+typedef struct {
+    int64_t bits;              /* Entier, ou motif binaire du double */
+    char _padding[56];
+} RegistryCounterCell;
+
+typedef struct {
+    PyObject_HEAD
+    int is_float;              /* Compteur double plutôt qu'entier */
+    int stripes;               /* Nombre de bandes (1 = compteur simple) */
+    RegistryCounterCell *cells;
+    RegistryCounterCell cell;  /* Bande unique intégrée (stripes=1) */
+} RegistryCounterObject;
+
+static PyTypeObject RegistryCounterType;
+
+static inline int64_t counter_double_bits(double value) {
+    int64_t bits;
+    memcpy(&bits, &value, sizeof(bits));
+    return bits;
+}
+
+static inline double counter_bits_double(int64_t bits) {
+    double value;
+    memcpy(&value, &bits, sizeof(value));
+    return value;
+}
+
+/* Bande du thread courant */
+static inline RegistryCounterCell *counter_cell(RegistryCounterObject *self) {
+    if (self->stripes == 1) {
+        return self->cells;
+    }
+    uint64_t ident = (uint64_t)PyThread_get_thread_ident();
+    return &self->cells[((ident * 0x9E3779B97F4A7C15ULL) >> 32) % (uint64_t)self->stripes];
+}
+
+/* Somme entière hors de l'intervalle int64 */
+static inline int counter_int_overflows(int64_t value, int64_t amount) {
+    return (amount > 0 && value > INT64_MAX - amount) || (amount < 0 && value < INT64_MIN - amount);
+}
+
+/* Ajout entier vérifié : OverflowError plutôt qu'un repli silencieux, bande inchangée */
+static int counter_add_int(RegistryCounterCell *cell, int64_t amount) {
+    for (;;) {
+        int64_t expected = counter_atomic_load(&cell->bits);
+        if (counter_int_overflows(expected, amount)) {
+            PyErr_SetString(PyExc_OverflowError, "counter value out of 64-bit integer range");
+            return -1;
+        }
+        if (counter_atomic_cas(&cell->bits, expected, expected + amount)) {
+            return 0;
+        }
+    }
+}
+
+static void counter_add_double(RegistryCounterCell *cell, double amount) {
+    int64_t expected = counter_atomic_load(&cell->bits);
+    while (!counter_atomic_cas(&cell->bits, expected,
+                               counter_double_bits(counter_bits_double(expected) + amount))) {
+#ifdef PYFASTY_WINDOWS
+        expected = counter_atomic_load(&cell->bits);
+#endif
+    }
+}
+
+/* Somme des bandes ; exchange=1 les remet à zéro au passage.
+   Chaque bande tient dans un int64 mais pas forcément leur somme : entier Python alors */
+static PyObject *counter_fold(RegistryCounterObject *self, int exchange) {
+    int64_t total = 0;
+    double ftotal = 0.0;
+    PyObject *big = NULL;
+    for (int i = 0; i < self->stripes; i++) {
+        int64_t bits = exchange ? counter_atomic_exchange(&self->cells[i].bits, 0)
+                                : counter_atomic_load(&self->cells[i].bits);
+        if (self->is_float) {
+            ftotal += counter_bits_double(bits);
+        } else if (big == NULL && !counter_int_overflows(total, bits)) {
+            total += bits;
+        } else {
+            PyObject *sum = NULL;
+            PyObject *part = PyLong_FromLongLong(bits);
+            if (big == NULL) {
+                big = PyLong_FromLongLong(total);
+            }
+            if (part != NULL && big != NULL) {
+                sum = PyNumber_Add(big, part);
+            }
+            Py_XDECREF(part);
+            Py_XDECREF(big);
+            big = sum;
+            if (big == NULL) {
+                return NULL;
+            }
+        }
+    }
+    if (big != NULL) {
+        return big;
+    }
+    return self->is_float ? PyFloat_FromDouble(ftotal) : PyLong_FromLongLong(total);
+}
+
+/* Conversion d'un montant selon le type du compteur */
+static int counter_amount(RegistryCounterObject *self, PyObject *amount, int64_t *bits) {
+    if (self->is_float) {
+        double value = PyFloat_AsDouble(amount);
+        if (value == -1.0 && PyErr_Occurred()) {
+            return -1;
+        }
+        *bits = counter_double_bits(value);
+        return 0;
+    }
+    if (!PyLong_Check(amount)) {
+        PyErr_Format(PyExc_TypeError, "integer counter requires an int, not '%s'",
+                     Py_TYPE(amount)->tp_name);
+        return -1;
+    }
+    long long value = PyLong_AsLongLong(amount);
+    if (value == -1 && PyErr_Occurred()) {
+        return -1;
+    }
+    *bits = (int64_t)value;
+    return 0;
+}
+
+/* add(n=1) */
+static PyObject *registry_counter_add(RegistryCounterObject *self, PyObject *const *args, Py_ssize_t nargs) {
+    if (nargs > 1) {
+        PyErr_Format(PyExc_TypeError, "add() takes at most 1 argument (%zd given)", nargs);
+        return NULL;
+    }
+    RegistryCounterCell *cell = counter_cell(self);
+    if (nargs == 0) {
+        if (self->is_float) {
+            counter_add_double(cell, 1.0);
+        } else if (counter_add_int(cell, 1) < 0) {
+            return NULL;
+        }
+        Py_RETURN_NONE;
+    }
+    
+    int64_t bits;
+    if (counter_amount(self, args[0], &bits) < 0) {
+        return NULL;
+    }
+    if (self->is_float) {
+        counter_add_double(cell, counter_bits_double(bits));
+    } else if (counter_add_int(cell, bits) < 0) {
+        return NULL;
+    }
+    Py_RETURN_NONE;
+}
+
+/* get() : somme des bandes */
+static PyObject *registry_counter_get(RegistryCounterObject *self, PyObject *Py_UNUSED(ignored)) {
+    return counter_fold(self, 0);
+}
+
+/* reset() : remise à zéro, renvoie la valeur précédente */
+static PyObject *registry_counter_reset(RegistryCounterObject *self, PyObject *Py_UNUSED(ignored)) {
+    return counter_fold(self, 1);
+}
+
+static void registry_counter_dealloc(RegistryCounterObject *self) {
+    if (self->cells != &self->cell) {
+        PyMem_RawFree(self->cells);
+    }
+    PyObject_Del(self);
+}
+
+static PyObject *registry_counter_str(RegistryCounterObject *self) {
+    PyObject *value = counter_fold(self, 0);
+    if (value == NULL) {
+        return NULL;
+    }
+    PyObject *result = PyObject_Str(value);
+    Py_DECREF(value);
+    return result;
+}
+
+static PyObject *registry_counter_repr(RegistryCounterObject *self) {
+    PyObject *value = counter_fold(self, 0);
+    if (value == NULL) {
+        return NULL;
+    }
+    PyObject *result = PyObject_Repr(value);
+    Py_DECREF(value);
+    return result;
+}
+
+static PyObject *registry_counter_richcompare(PyObject *self, PyObject *other, int op) {
+    PyObject *value = counter_fold((RegistryCounterObject *)self, 0);
+    if (value == NULL) {
+        return NULL;
+    }
+    if (PyObject_TypeCheck(other, &RegistryCounterType)) {
+        PyObject *other_value = counter_fold((RegistryCounterObject *)other, 0);
+        if (other_value == NULL) {
+            Py_DECREF(value);
+            return NULL;
+        }
+        PyObject *result = PyObject_RichCompare(value, other_value, op);
+        Py_DECREF(other_value);
+        Py_DECREF(value);
+        return result;
+    }
+    PyObject *result = PyObject_RichCompare(value, other, op);
+    Py_DECREF(value);
+    return result;
+}
+
+static PyObject *registry_counter_int(PyObject *self) {
+    PyObject *value = counter_fold((RegistryCounterObject *)self, 0);
+    if (value == NULL) {
+        return NULL;
+    }
+    PyObject *result = PyNumber_Long(value);
+    Py_DECREF(value);
+    return result;
+}
+
+static PyObject *registry_counter_float(PyObject *self) {
+    PyObject *value = counter_fold((RegistryCounterObject *)self, 0);
+    if (value == NULL) {
+        return NULL;
+    }
+    PyObject *result = PyNumber_Float(value);
+    Py_DECREF(value);
+    return result;
+}
+
+static PyNumberMethods registry_counter_as_number = {
+    .nb_int = registry_counter_int,
+    .nb_float = registry_counter_float,
+};
+
+static PyMethodDef registry_counter_methods[] = {
+    {"add", (PyCFunction)(void(*)(void))registry_counter_add, METH_FASTCALL, "Atomically add n (default 1)"},
+    {"get", (PyCFunction)registry_counter_get, METH_NOARGS, "Current value (sum of all stripes)"},
+    {"reset", (PyCFunction)registry_counter_reset, METH_NOARGS, "Reset to zero and return the previous value"},
+    {NULL, NULL, 0, NULL}  /* Sentinel */
+};
+
+static PyTypeObject RegistryCounterType = {
+    PyVarObject_HEAD_INIT(NULL, 0)
+    .tp_name = "pyfasty._pyfasty.RegistryCounter",
+    .tp_doc = "Atomic numeric counter stored in the registry",
+    .tp_basicsize = sizeof(RegistryCounterObject),
+    .tp_itemsize = 0,
+    .tp_flags = Py_TPFLAGS_DEFAULT,
+    .tp_dealloc = (destructor)registry_counter_dealloc,
+    .tp_str = (reprfunc)registry_counter_str,
+    .tp_repr = (reprfunc)registry_counter_repr,
+    .tp_as_number = &registry_counter_as_number,
+    .tp_richcompare = registry_counter_richcompare,
+    .tp_methods = registry_counter_methods,
+};
+
+static PyObject *registry_counter_new(PyObject *initial, int stripes) {
+    RegistryCounterObject *counter = PyObject_New(RegistryCounterObject, &RegistryCounterType);
+    if (counter == NULL) {
+        return NULL;
+    }
+    counter->is_float = PyFloat_Check(initial);
+    counter->stripes = stripes;
+    counter->cell.bits = 0;
+    counter->cells = &counter->cell;
+    if (stripes > 1) {
+        counter->cells = PyMem_RawCalloc(stripes, sizeof(RegistryCounterCell));
+        if (counter->cells == NULL) {
+            counter->cells = &counter->cell;
+            Py_DECREF(counter);
+            return PyErr_NoMemory();
+        }
+    }
+    if (counter_amount(counter, initial, &counter->cells[0].bits) < 0) {
+        Py_DECREF(counter);
+        return NULL;
+    }
+    return (PyObject *)counter;
+}
+
+/* Méthode counter("a.b", initial=0, stripes=1) : renvoie le compteur existant ou en
+   crée un (un nœud feuille numérique existant est converti, sa valeur conservée) */
+static PyObject *registry_counter_method(PyObject *self, PyObject *args, PyObject *kwds) {
+    static char *kwlist[] = {"path", "initial", "stripes", NULL};
+    PyObject *path;
+    PyObject *initial = NULL;
+    int stripes = 1;
+    
+    if (!PyArg_ParseTupleAndKeywords(args, kwds, "U|O$i:counter", kwlist, &path, &initial, &stripes)) {
+        return NULL;
+    }
+    if (stripes < 1 || stripes > REGISTRY_COUNTER_MAX_STRIPES) {
+        PyErr_Format(PyExc_ValueError, "stripes must be between 1 and %d", REGISTRY_COUNTER_MAX_STRIPES);
+        return NULL;
+    }
+    if (initial != NULL && !PyLong_Check(initial) && !PyFloat_Check(initial)) {
+        PyErr_SetString(PyExc_TypeError, "counter initial value must be an int or a float");
+        return NULL;
+    }
+    
+    PyObject *names = registry_split_path(path);
+    if (names == NULL) {
+        return NULL;
+    }
+    
+    /* Nœuds intermédiaires créés comme par l'accès par attribut */
+    Py_ssize_t count = PyTuple_GET_SIZE(names);
+    PyObject *parent = self;
+    Py_INCREF(parent);
+    for (Py_ssize_t i = 0; i < count - 1 && parent != NULL; i++) {
+        PyObject *next = PyObject_GetAttr(parent, PyTuple_GET_ITEM(names, i));
+        Py_DECREF(parent);
+        parent = next;
+    }
+    if (parent == NULL) {
+        Py_DECREF(names);
+        return NULL;
+    }
+    
+    PyObject *name = PyTuple_GET_ITEM(names, count - 1);
+    PyObject *result = NULL;
+    if (!PyObject_TypeCheck(parent, &PyFastyRegistryType)) {
+        PyErr_Format(PyExc_TypeError, "Path '%U' does not lead to a registry node", path);
+        goto done;
+    }
+    
+    PyFastyBaseObject *parent_base = (PyFastyBaseObject *)parent;
+    PyObject *existing = pyfasty_node_get(parent_base, name);
+    if (existing != NULL && Py_TYPE(existing) == &RegistryCounterType) {
+        Py_INCREF(existing);
+        result = existing;
+        goto done;
+    }
+    
+    PyObject *start = initial;
+    if (existing != NULL) {
+        /* Seule une feuille sans enfants et de valeur numérique (ou vide) est convertie */
+        PyFastyBaseObject *node = Py_TYPE(existing) == &PyFastyRegistryType ? (PyFastyBaseObject *)existing : NULL;
+        if (node == NULL || (node->data != NULL && PyDict_Size(node->data) > 0) ||
+            (node->value != Py_None && !PyLong_Check(node->value) && !PyFloat_Check(node->value))) {
+            PyErr_Format(PyExc_TypeError, "'%U' already holds a non-numeric value", path);
+            goto done;
+        }
+        if (node->value != Py_None && initial == NULL) {
+            start = node->value;
+        }
+    }
+    
+    PyObject *zero = NULL;
+    if (start == NULL) {
+        zero = PyLong_FromLong(0);
+        if (zero == NULL) {
+            goto done;
+        }
+        start = zero;
+    }
+    result = registry_counter_new(start, stripes);
+    Py_XDECREF(zero);
+    if (result == NULL) {
+        goto done;
+    }
+    
+    PyObject *children = pyfasty_node_children(parent_base);
+    if (children == NULL || node_set_child(parent_base, children, name, result) < 0) {
+        Py_CLEAR(result);
+    }
+
+done:
+    Py_DECREF(parent);
+    Py_DECREF(names);
+    return result;
+}
+
+/* === CACHES BORNÉS === */
+/* registry.configure("cache", max_entries=N, ttl=s) : les enfants directs du nœud
+   deviennent les entrées d'un cache borné. Chaque entrée est suivie dans deux listes
+   chaînées : l'ordre d'accès (LRU) et l'ordre d'écriture, qui est aussi l'ordre
+   d'expiration puisque le ttl est commun à tout le nœud. L'éviction se fait à
+   l'insertion, l'expiration à la lecture, à l'insertion ou par sweep(). */
+#define REGISTRY_CACHE_NONE ((Py_ssize_t)-1)
+
+typedef struct {
+    PyObject *key;                     /* NULL : emplacement libre */
+    double written;                    /* Dernière écriture (ms, horloge monotone) */
+    Py_ssize_t lru_prev, lru_next;     /* Ordre d'accès */
+    Py_ssize_t ttl_prev, ttl_next;     /* Ordre d'écriture (= ordre d'expiration) */
+} RegistryCacheEntry;
+
+struct RegistryCacheObject {
+    PyObject_HEAD
+    PyFastyBaseObject *node;           /* Nœud dont les enfants sont les entrées */
+    Py_ssize_t max_entries;            /* 0 : pas de limite */
+    double ttl_ms;                     /* 0 : pas d'expiration */
+    PyObject *on_evict;                /* Appelé avec (clé, valeur) ou NULL */
+    PyObject *index;                   /* Clé -> position dans entries */
+    RegistryCacheEntry *entries;
+    Py_ssize_t capacity;
+    Py_ssize_t count;
+    Py_ssize_t free_head;              /* Emplacements libres chaînés par lru_next */
+    Py_ssize_t lru_head, lru_tail;
+    Py_ssize_t ttl_head, ttl_tail;
+    unsigned long long hits, misses, evictions, expirations;
+};
+
+static PyTypeObject RegistryCacheType;
+
+/* Horloge monotone en millisecondes */
+static double cache_monotonic_ms(void) {
+#ifdef PYFASTY_WINDOWS
+    return (double)GetTickCount64();
+#else
+    struct timespec now;
+    clock_gettime(CLOCK_MONOTONIC, &now);
+    return now.tv_sec * 1000.0 + now.tv_nsec / 1000000.0;
+#endif
+}
+
+static RegistryCacheObject *cache_find(PyFastyBaseObject *node) {
+    for (Py_ssize_t i = 0; i < g_cache_count; i++) {
+        if (g_caches[i]->node == node) {
+            return g_caches[i];
+        }
+    }
+    return NULL;
+}
+
+static Py_ssize_t cache_slot(RegistryCacheObject *cache, PyObject *key) {
+    PyObject *slot = PyDict_GetItemWithError(cache->index, key);
+    if (slot == NULL) {
+        return PyErr_Occurred() ? -2 : REGISTRY_CACHE_NONE;
+    }
+    return PyLong_AsSsize_t(slot);
+}
+
+static void cache_unlink(RegistryCacheObject *cache, Py_ssize_t slot) {
+    RegistryCacheEntry *entry = &cache->entries[slot];
+    if (entry->lru_prev != REGISTRY_CACHE_NONE) cache->entries[entry->lru_prev].lru_next = entry->lru_next;
+    else cache->lru_head = entry->lru_next;
+    if (entry->lru_next != REGISTRY_CACHE_NONE) cache->entries[entry->lru_next].lru_prev = entry->lru_prev;
+    else cache->lru_tail = entry->lru_prev;
+    if (entry->ttl_prev != REGISTRY_CACHE_NONE) cache->entries[entry->ttl_prev].ttl_next = entry->ttl_next;
+    else cache->ttl_head = entry->ttl_next;
+    if (entry->ttl_next != REGISTRY_CACHE_NONE) cache->entries[entry->ttl_next].ttl_prev = entry->ttl_prev;
+    else cache->ttl_tail = entry->ttl_prev;
+}
+
+static void cache_push_lru(RegistryCacheObject *cache, Py_ssize_t slot) {
+    cache->entries[slot].lru_prev = cache->lru_tail;
+    cache->entries[slot].lru_next = REGISTRY_CACHE_NONE;
+    if (cache->lru_tail != REGISTRY_CACHE_NONE) cache->entries[cache->lru_tail].lru_next = slot;
+    else cache->lru_head = slot;
+    cache->lru_tail = slot;
+}
+
+static void cache_push_ttl(RegistryCacheObject *cache, Py_ssize_t slot) {
+    cache->entries[slot].ttl_prev = cache->ttl_tail;
+    cache->entries[slot].ttl_next = REGISTRY_CACHE_NONE;
+    if (cache->ttl_tail != REGISTRY_CACHE_NONE) cache->entries[cache->ttl_tail].ttl_next = slot;
+    else cache->ttl_head = slot;
+    cache->ttl_tail = slot;
+}
+
+/* Retire l'entrée des listes et de l'index ; la clé est rendue au appelant */
+static PyObject *cache_forget(RegistryCacheObject *cache, Py_ssize_t slot) {
+    PyObject *key = cache->entries[slot].key;
+    cache_unlink(cache, slot);
+    if (PyDict_DelItem(cache->index, key) < 0) {
+        PyErr_Clear();
+    }
+    cache->entries[slot].key = NULL;
+    cache->entries[slot].lru_next = cache->free_head;
+    cache->free_head = slot;
+    cache->count--;
+    return key;
+}
+
+/* Supprime l'entrée du nœud ; (clé, valeur) est ajouté à *removed pour notification */
+static int cache_remove(RegistryCacheObject *cache, Py_ssize_t slot, PyObject **removed) {
+    PyObject *key = cache_forget(cache, slot);
+    PyObject *children = cache->node->data;
+    PyObject *value = children != NULL && PyDict_Check(children) ? PyDict_GetItem(children, key) : NULL;
+    int result = 0;
+    
+    if (value != NULL) {
+        /* Une feuille est notifiée avec sa valeur plutôt qu'avec son nœud */
+        PyObject *reported = value;
+        if (PyObject_TypeCheck(value, &PyFastyRegistryType)) {
+            PyFastyBaseObject *leaf = (PyFastyBaseObject *)value;
+            if (leaf->data == NULL || (PyDict_Check(leaf->data) && PyDict_Size(leaf->data) == 0)) {
+                reported = leaf->value;
+            }
+        }
+        PyObject *pair = PyTuple_Pack(2, key, reported);
+        if (*removed == NULL) {
+            *removed = PyList_New(0);
+        }
+        if (pair == NULL || *removed == NULL || PyList_Append(*removed, pair) < 0) {
+            result = -1;
+        }
+        Py_XDECREF(pair);
+        if (result == 0 && node_del_child(cache->node, children, key) < 0) {
+            result = -1;
+        }
+    }
+    Py_DECREF(key);
+    return result;
+}
+
+/* Appelée une fois la structure cohérente : on_evict puis événements du nœud */
+static void cache_notify(RegistryCacheObject *cache, PyObject *removed) {
+    if (removed == NULL) {
+        return;
+    }
+    Py_INCREF(cache);
+    for (Py_ssize_t i = 0; i < PyList_GET_SIZE(removed); i++) {
+        PyObject *pair = PyList_GET_ITEM(removed, i);
+        if (cache->on_evict != NULL) {
+            PyObject *result = PyObject_Call(cache->on_evict, pair, NULL);
+            if (result == NULL) {
+                PyErr_WriteUnraisable(cache->on_evict);
+            }
+            Py_XDECREF(result);
+        }
+        pyfasty_trigger_sync_events_for_node(MODULE_REGISTRY, (PyObject *)cache->node,
+                                             PyTuple_GET_ITEM(pair, 0));
+    }
+    Py_DECREF(cache);
+    Py_DECREF(removed);
+}
+
+/* Expire les entrées trop anciennes puis évince les moins récemment utilisées ;
+   keep désigne l'entrée qui vient d'être écrite */
+static int cache_enforce(RegistryCacheObject *cache, Py_ssize_t keep, double now, PyObject **removed) {
+    if (cache->ttl_ms > 0) {
+        while (cache->ttl_head != REGISTRY_CACHE_NONE && cache->ttl_head != keep &&
+               now - cache->entries[cache->ttl_head].written >= cache->ttl_ms) {
+            cache->expirations++;
+            if (cache_remove(cache, cache->ttl_head, removed) < 0) {
+                return -1;
+            }
+        }
+    }
+    if (cache->max_entries > 0) {
+        while (cache->count > cache->max_entries) {
+            Py_ssize_t victim = cache->lru_head;
+            if (victim == keep) {
+                victim = cache->entries[victim].lru_next;
+            }
+            if (victim == REGISTRY_CACHE_NONE) {
+                break;
+            }
+            cache->evictions++;
+            if (cache_remove(cache, victim, removed) < 0) {
+                return -1;
+            }
+        }
+    }
+    return 0;
+}
+
+/* Enregistre une écriture de clé (nouvelle entrée ou mise à jour), renvoie sa position */
+static Py_ssize_t cache_record(RegistryCacheObject *cache, PyObject *key, double now) {
+    Py_ssize_t slot = cache_slot(cache, key);
+    if (slot == -2) {
+        return -1;
+    }
+    if (slot != REGISTRY_CACHE_NONE) {
+        cache_unlink(cache, slot);
+        cache->entries[slot].written = now;
+        cache_push_lru(cache, slot);
+        cache_push_ttl(cache, slot);
+        return slot;
+    }
+    
+    if (cache->free_head == REGISTRY_CACHE_NONE) {
+        Py_ssize_t capacity = cache->capacity > 0 ? cache->capacity * 2 : 16;
+        RegistryCacheEntry *entries = PyMem_Realloc(cache->entries, capacity * sizeof(RegistryCacheEntry));
+        if (entries == NULL) {
+            PyErr_NoMemory();
+            return -1;
+        }
+        for (Py_ssize_t i = capacity - 1; i >= cache->capacity; i--) {
+            entries[i].key = NULL;
+            entries[i].lru_next = cache->free_head;
+            cache->free_head = i;
+        }
+        cache->entries = entries;
+        cache->capacity = capacity;
+    }
+    
+    slot = cache->free_head;
+    PyObject *position = PyLong_FromSsize_t(slot);
+    if (position == NULL || PyDict_SetItem(cache->index, key, position) < 0) {
+        Py_XDECREF(position);
+        return -1;
+    }
+    Py_DECREF(position);
+    cache->free_head = cache->entries[slot].lru_next;
+    Py_INCREF(key);
+    cache->entries[slot].key = key;
+    cache->entries[slot].written = now;
+    cache_push_lru(cache, slot);
+    cache_push_ttl(cache, slot);
+    cache->count++;
+    return slot;
+}
+
+/* Crochet de node_set_child */
+static int cache_on_set(PyFastyBaseObject *node, PyObject *key) {
+    RegistryCacheObject *cache = cache_find(node);
+    if (cache == NULL) {
+        return 0;
+    }
+    double now = cache_monotonic_ms();
+    PyObject *removed = NULL;
+    Py_ssize_t slot = cache_record(cache, key, now);
+    if (slot < 0) {
+        return -1;
+    }
+    int result = cache_enforce(cache, slot, now, &removed);
+    cache_notify(cache, removed);
+    return result;
+}
+
+/* Crochet de node_del_child */
+static void cache_on_del(PyFastyBaseObject *node, PyObject *key) {
+    RegistryCacheObject *cache = cache_find(node);
+    if (cache == NULL) {
+        return;
+    }
+    Py_ssize_t slot = cache_slot(cache, key);
+    if (slot >= 0) {
+        Py_DECREF(cache_forget(cache, slot));
+    }
+    PyErr_Clear();
+}
+
+/* Crochet des lectures cache[key], cache.get(key) et cache.key : met à jour l'ordre
+   LRU et les compteurs, supprime l'entrée si elle a expiré. Les absences ne sont
+   comptées que si count_miss (l'accès par attribut sert aussi aux méthodes). */
+static int cache_on_read(PyFastyBaseObject *node, PyObject *key, int count_miss) {
+    RegistryCacheObject *cache = cache_find(node);
+    if (cache == NULL) {
+        return 0;
+    }
+    Py_ssize_t slot = cache_slot(cache, key);
+    if (slot == -2) {
+        return -1;
+    }
+    if (slot == REGISTRY_CACHE_NONE) {
+        if (count_miss) {
+            cache->misses++;
+        }
+        return 0;
+    }
+    
+    if (cache->ttl_ms > 0 && cache_monotonic_ms() - cache->entries[slot].written >= cache->ttl_ms) {
+        PyObject *removed = NULL;
+        cache->expirations++;
+        cache->misses++;
+        int result = cache_remove(cache, slot, &removed);
+        cache_notify(cache, removed);
+        return result;
+    }
+    
+    cache->hits++;
+    if (cache->lru_tail != slot) {
+        RegistryCacheEntry *entry = &cache->entries[slot];
+        if (entry->lru_prev != REGISTRY_CACHE_NONE) cache->entries[entry->lru_prev].lru_next = entry->lru_next;
+        else cache->lru_head = entry->lru_next;
+        cache->entries[entry->lru_next].lru_prev = entry->lru_prev;
+        cache_push_lru(cache, slot);
+    }
+    return 0;
+}
+
+/* Vide l'index puis y inscrit les enfants actuels du nœud (configure(), load()) */
+static int cache_rebuild(RegistryCacheObject *cache) {
+    for (Py_ssize_t i = 0; i < cache->capacity; i++) {
+        Py_CLEAR(cache->entries[i].key);
+        cache->entries[i].lru_next = i + 1 < cache->capacity ? i + 1 : REGISTRY_CACHE_NONE;
+    }
+    cache->free_head = cache->capacity > 0 ? 0 : REGISTRY_CACHE_NONE;
+    cache->lru_head = cache->lru_tail = REGISTRY_CACHE_NONE;
+    cache->ttl_head = cache->ttl_tail = REGISTRY_CACHE_NONE;
+    cache->count = 0;
+    PyDict_Clear(cache->index);
+    
+    PyObject *children = pyfasty_node_children(cache->node);
+    if (children == NULL) {
+        return -1;
+    }
+    double now = cache_monotonic_ms();
+    PyObject *key, *value;
+    Py_ssize_t pos = 0;
+    while (PyDict_Next(children, &pos, &key, &value)) {
+        if (cache_record(cache, key, now) < 0) {
+            return -1;
+        }
+    }
+    return 0;
+}
+
+/* Crochet de node_replace : les enfants du nœud ont été remplacés d'un bloc */
+static int cache_on_replace(PyFastyBaseObject *node) {
+    RegistryCacheObject *cache = cache_find(node);
+    if (cache == NULL) {
+        return 0;
+    }
+    PyObject *removed = NULL;
+    int result = cache_rebuild(cache) < 0 ? -1 : cache_enforce(cache, REGISTRY_CACHE_NONE, cache_monotonic_ms(), &removed);
+    cache_notify(cache, removed);
+    return result;
+}
+
+static int cache_attach(RegistryCacheObject *cache) {
+    RegistryCacheObject **caches = PyMem_Realloc(g_caches, (g_cache_count + 1) * sizeof(RegistryCacheObject *));
+    if (caches == NULL) {
+        PyErr_NoMemory();
+        return -1;
+    }
+    Py_INCREF(cache);
+    caches[g_cache_count++] = cache;
+    g_caches = caches;
+    return 0;
+}
+
+static void cache_detach(RegistryCacheObject *cache) {
+    for (Py_ssize_t i = 0; i < g_cache_count; i++) {
+        if (g_caches[i] == cache) {
+            g_caches[i] = g_caches[--g_cache_count];
+            Py_DECREF(cache);
+            return;
+        }
+    }
+}
+
+static void registry_cache_dealloc(RegistryCacheObject *self) {
+    for (Py_ssize_t i = 0; i < self->capacity; i++) {
+        Py_XDECREF(self->entries[i].key);
+    }
+    PyMem_Free(self->entries);
+    Py_XDECREF(self->index);
+    Py_XDECREF(self->on_evict);
+    Py_XDECREF(self->node);
+    Py_TYPE(self)->tp_free((PyObject *)self);
+}
+
+static PyObject *registry_cache_repr(RegistryCacheObject *self) {
+    PyObject *ttl = self->ttl_ms > 0 ? PyFloat_FromDouble(self->ttl_ms / 1000.0) : (Py_INCREF(Py_None), Py_None);
+    if (ttl == NULL) {
+        return NULL;
+    }
+    PyObject *result = PyUnicode_FromFormat("RegistryCache(entries=%zd, max_entries=%zd, ttl=%R)",
+                                            self->count, self->max_entries, ttl);
+    Py_DECREF(ttl);
+    return result;
+}
+
+/* Méthode stats() : compteurs du cache */
+static PyObject *registry_cache_stats(RegistryCacheObject *self, PyObject *Py_UNUSED(ignored)) {
+    return Py_BuildValue("{s:n,s:n,s:d,s:K,s:K,s:K,s:K}",
+                         "entries", self->count,
+                         "max_entries", self->max_entries,
+                         "ttl", self->ttl_ms / 1000.0,
+                         "hits", self->hits,
+                         "misses", self->misses,
+                         "evictions", self->evictions,
+                         "expirations", self->expirations);
+}
+
+/* Méthode sweep() : supprime toutes les entrées expirées, renvoie leur nombre */
+static PyObject *registry_cache_sweep(RegistryCacheObject *self, PyObject *Py_UNUSED(ignored)) {
+    PyObject *removed = NULL;
+    unsigned long long before = self->expirations;
+    int result = 0;
+    if (self->ttl_ms > 0) {
+        Py_ssize_t max_entries = self->max_entries;
+        self->max_entries = 0;
+        result = cache_enforce(self, REGISTRY_CACHE_NONE, cache_monotonic_ms(), &removed);
+        self->max_entries = max_entries;
+    }
+    cache_notify(self, removed);
+    if (result < 0) {
+        return NULL;
+    }
+    return PyLong_FromUnsignedLongLong(self->expirations - before);
+}
+
+static PyMethodDef registry_cache_methods[] = {
+    {"stats", (PyCFunction)registry_cache_stats, METH_NOARGS, "Entries, limits and hit/miss/eviction/expiration counters"},
+    {"sweep", (PyCFunction)registry_cache_sweep, METH_NOARGS, "Remove every expired entry and return how many were removed"},
+    {NULL, NULL, 0, NULL}  /* Sentinel */
+};
+
+static PyTypeObject RegistryCacheType = {
+    PyVarObject_HEAD_INIT(NULL, 0)
+    .tp_name = "pyfasty._pyfasty.RegistryCache",
+    .tp_doc = "Size and TTL policy applied to the children of a registry node",
+    .tp_basicsize = sizeof(RegistryCacheObject),
+    .tp_itemsize = 0,
+    .tp_flags = Py_TPFLAGS_DEFAULT,
+    .tp_dealloc = (destructor)registry_cache_dealloc,
+    .tp_repr = (reprfunc)registry_cache_repr,
+    .tp_methods = registry_cache_methods,
+};
+
+/* Méthode configure("cache", max_entries=None, ttl=None, on_evict=None) : attache,
+   modifie ou (sans aucune limite) retire la politique de cache du nœud */
+static PyObject *registry_configure_method(PyObject *self, PyObject *args, PyObject *kwds) {
+    static char *kwlist[] = {"path", "max_entries", "ttl", "on_evict", NULL};
+    PyObject *path;
+    PyObject *max_obj = Py_None, *ttl_obj = Py_None, *on_evict = Py_None;
+    
+    if (!PyArg_ParseTupleAndKeywords(args, kwds, "U|$OOO:configure", kwlist,
+                                     &path, &max_obj, &ttl_obj, &on_evict)) {
+        return NULL;
+    }
+    Py_ssize_t max_entries = 0;
+    double ttl = 0;
+    if (max_obj != Py_None) {
+        max_entries = PyNumber_AsSsize_t(max_obj, PyExc_OverflowError);
+        if (max_entries == -1 && PyErr_Occurred()) {
+            return NULL;
+        }
+        if (max_entries < 1) {
+            PyErr_SetString(PyExc_ValueError, "max_entries must be a positive integer");
+            return NULL;
+        }
+    }
+    if (ttl_obj != Py_None) {
+        ttl = PyFloat_AsDouble(ttl_obj);
+        if (ttl == -1.0 && PyErr_Occurred()) {
+            return NULL;
+        }
+        if (!(ttl > 0)) {
+            PyErr_SetString(PyExc_ValueError, "ttl must be a positive number of seconds");
+            return NULL;
+        }
+    }
+    if (on_evict != Py_None && !PyCallable_Check(on_evict)) {
+        PyErr_SetString(PyExc_TypeError, "on_evict must be callable");
+        return NULL;
+    }
+    
+    PyObject *names = registry_split_path(path);
+    if (names == NULL) {
+        return NULL;
+    }
+    PyObject *target = self;
+    Py_INCREF(target);
+    for (Py_ssize_t i = 0; i < PyTuple_GET_SIZE(names) && target != NULL; i++) {
+        PyObject *next = PyObject_GetAttr(target, PyTuple_GET_ITEM(names, i));
+        Py_DECREF(target);
+        target = next;
+    }
+    Py_DECREF(names);
+    if (target == NULL) {
+        return NULL;
+    }
+    if (!PyObject_TypeCheck(target, &PyFastyRegistryType)) {
+        PyErr_Format(PyExc_TypeError, "Path '%U' does not lead to a registry node", path);
+        Py_DECREF(target);
+        return NULL;
+    }
+    
+    PyFastyBaseObject *node = (PyFastyBaseObject *)target;
+    RegistryCacheObject *cache = cache_find(node);
+    if (max_entries == 0 && ttl == 0 && on_evict == Py_None) {
+        if (cache != NULL) {
+            cache_detach(cache);
+        }
+        Py_DECREF(target);
+        Py_RETURN_NONE;
+    }
+    
+    if (cache == NULL) {
+        cache = PyObject_New(RegistryCacheObject, &RegistryCacheType);
+        if (cache == NULL) {
+            Py_DECREF(target);
+            return NULL;
+        }
+        cache->node = node;  /* Référence de target transférée */
+        cache->on_evict = NULL;
+        cache->entries = NULL;
+        cache->capacity = 0;
+        cache->hits = cache->misses = cache->evictions = cache->expirations = 0;
+        cache->index = PyDict_New();
+        if (cache->index == NULL || cache_rebuild(cache) < 0 || cache_attach(cache) < 0) {
+            Py_DECREF(cache);
+            return NULL;
+        }
+    } else {
+        Py_INCREF(cache);
+        Py_DECREF(target);
+    }
+    
+    cache->max_entries = max_entries;
+    cache->ttl_ms = ttl * 1000.0;
+    if (on_evict != Py_None) {
+        Py_INCREF(on_evict);
+        Py_XSETREF(cache->on_evict, on_evict);
+    } else {
+        Py_CLEAR(cache->on_evict);
+    }
+    
+    PyObject *removed = NULL;
+    int result = cache_enforce(cache, REGISTRY_CACHE_NONE, cache_monotonic_ms(), &removed);
+    cache_notify(cache, removed);
+    if (result < 0) {
+        Py_DECREF(cache);
+        return NULL;
+    }
+    return (PyObject *)cache;
+}
+
+/* === INDEX SECONDAIRES === */
+/* users.create_index("profile.country", kind="hash"|"sorted") : pour chaque enfant
+   de users, la valeur trouvée au bout du chemin est rangée dans des seaux
+   valeur -> clés (égalité) et, pour un index trié, dans la liste croissante des
+   valeurs distinctes (intervalles). Les nœuds traversés par le chemin sont
+   surveillés : node_touch() marque l'enfant concerné, recalculé avant la
+   prochaine requête where(). */
+struct RegistryIndex {
+    PyFastyBaseObject *node;           /* Collection indexée */
+    PyObject *path;                    /* "profile.country" */
+    PyObject *names;                   /* ("profile", "country") */
+    int sorted;                        /* Index trié (requêtes d'intervalle) */
+    int stale;                         /* Enfants remplacés d'un bloc : tout recalculer */
+    PyObject *values;                  /* Clé -> valeur indexée */
+    PyObject *buckets;                 /* Valeur -> {clé: None}, ordre d'insertion */
+    PyObject *order;                   /* Index trié : valeurs distinctes croissantes */
+    PyObject *chains;                  /* Clé -> liste des nœuds surveillés */
+    PyObject *watch;                   /* Nœud surveillé -> clé, ou {clé: None} si partagé */
+    PyObject *dirty;                   /* {clé: None} à recalculer */
+};
+
+enum { INDEX_EQ, INDEX_GT, INDEX_GE, INDEX_LT, INDEX_LE };
+
+static void index_free(RegistryIndex *index) {
+    Py_XDECREF(index->node);
+    Py_XDECREF(index->path);
+    Py_XDECREF(index->names);
+    Py_XDECREF(index->values);
+    Py_XDECREF(index->buckets);
+    Py_XDECREF(index->order);
+    Py_XDECREF(index->chains);
+    Py_XDECREF(index->watch);
+    Py_XDECREF(index->dirty);
+    PyMem_Free(index);
+}
+
+/* Clé d'un nœud surveillé : adresse tournée de 4 bits, comme le hash des objets,
+   pour que l'alignement des adresses ne concentre pas les clés dans la table */
+static inline PyObject *index_node_key(PyFastyBaseObject *node) {
+    size_t address = (size_t)(uintptr_t)node;
+    return PyLong_FromSize_t((address >> 4) | (address << (8 * sizeof(address) - 4)));
+}
+
+/* Crochet de node_touch : marque les enfants dont le chemin passe par node */
+static int index_touch(PyFastyBaseObject *node) {
+    PyObject *pointer = index_node_key(node);
+    if (pointer == NULL) {
+        return -1;
+    }
+    int result = 0;
+    for (Py_ssize_t i = 0; i < g_index_count && result == 0; i++) {
+        PyObject *keys = PyDict_GetItemWithError(g_indexes[i]->watch, pointer);
+        if (keys != NULL) {
+            result = PyDict_CheckExact(keys) ? PyDict_Update(g_indexes[i]->dirty, keys)
+                                             : PyDict_SetItem(g_indexes[i]->dirty, keys, Py_None);
+        } else if (PyErr_Occurred()) {
+            result = -1;
+        }
+    }
+    Py_DECREF(pointer);
+    return result;
+}
+
+/* Crochet de node_set_child / node_del_child : un enfant de la collection change */
+static int index_on_child(PyFastyBaseObject *node, PyObject *key) {
+    for (Py_ssize_t i = 0; i < g_index_count; i++) {
+        if (g_indexes[i]->node == node && PyDict_SetItem(g_indexes[i]->dirty, key, Py_None) < 0) {
+            return -1;
+        }
+    }
+    return 0;
+}
+
+/* Crochet de node_replace : tous les enfants de la collection ont changé */
+static void index_on_replace(PyFastyBaseObject *node) {
+    for (Py_ssize_t i = 0; i < g_index_count; i++) {
+        if (g_indexes[i]->node == node) {
+            g_indexes[i]->stale = 1;
+        }
+    }
+}
+
+/* Première position de order dont la valeur n'est pas < value (> value si right) */
+static Py_ssize_t index_bisect(PyObject *order, PyObject *value, int right) {
+    Py_ssize_t low = 0, high = PyList_GET_SIZE(order);
+    while (low < high) {
+        Py_ssize_t middle = (low + high) / 2;
+        int below = right ? PyObject_RichCompareBool(value, PyList_GET_ITEM(order, middle), Py_LT)
+                          : PyObject_RichCompareBool(PyList_GET_ITEM(order, middle), value, Py_LT);
+        if (below < 0) {
+            return -1;
+        }
+        if (below == right) {
+            high = middle;
+        } else {
+            low = middle + 1;
+        }
+    }
+    return low;
+}
+
+/* Les valeurs qui ne se comparent pas aux autres restent hors de l'ordre trié :
+   elles ne répondent qu'aux requêtes d'égalité */
+static void index_order_insert(RegistryIndex *index, PyObject *value) {
+    Py_ssize_t position = index_bisect(index->order, value, 0);
+    if (position < 0 || PyList_Insert(index->order, position, value) < 0) {
+        PyErr_Clear();
+    }
+}
+
+static void index_order_remove(RegistryIndex *index, PyObject *value) {
+    Py_ssize_t position = index_bisect(index->order, value, 0);
+    if (position < 0) {
+        PyErr_Clear();
+        return;
+    }
+    for (; position < PyList_GET_SIZE(index->order); position++) {
+        int equal = PyObject_RichCompareBool(PyList_GET_ITEM(index->order, position), value, Py_EQ);
+        if (equal != 0) {
+            if (equal < 0 || PyList_SetSlice(index->order, position, position + 1, NULL) < 0) {
+                PyErr_Clear();
+            }
+            return;
+        }
+    }
+}
+
+static int index_unlink(RegistryIndex *index, PyObject *key) {
+    PyObject *value = PyDict_GetItemWithError(index->values, key);
+    if (value != NULL) {
+        PyObject *bucket = PyDict_GetItem(index->buckets, value);
+        if (bucket != NULL && PyDict_DelItem(bucket, key) == 0 && PyDict_Size(bucket) == 0) {
+            if (index->sorted) {
+                index_order_remove(index, value);
+            }
+            if (PyDict_DelItem(index->buckets, value) < 0) {
+                return -1;
+            }
+        }
+        PyErr_Clear();
+        if (PyDict_DelItem(index->values, key) < 0) {
+            return -1;
+        }
+    } else if (PyErr_Occurred()) {
+        return -1;
+    }
+    
+    PyObject *chain = PyDict_GetItemWithError(index->chains, key);
+    if (chain == NULL) {
+        return PyErr_Occurred() ? -1 : 0;
+    }
+    for (Py_ssize_t i = 0; i < PyList_GET_SIZE(chain); i++) {
+        PyObject *pointer = PyList_GET_ITEM(chain, i);
+        PyObject *keys = PyDict_GetItem(index->watch, pointer);
+        if (keys == NULL) {
+            continue;
+        }
+        if (PyDict_CheckExact(keys) ? PyDict_DelItem(keys, key) == 0 && PyDict_Size(keys) == 0
+                                    : PyObject_RichCompareBool(keys, key, Py_EQ) == 1) {
+            PyDict_DelItem(index->watch, pointer);
+        }
+        PyErr_Clear();
+    }
+    return PyDict_DelItem(index->chains, key);
+}
+
+/* Relit la valeur de l'enfant key au bout du chemin et met à jour seaux et surveillance
+   (fresh : index vidé, rien à retirer) */
+static int index_refresh(RegistryIndex *index, PyObject *key, int fresh) {
+    if (!fresh && index_unlink(index, key) < 0) {
+        return -1;
+    }
+    PyObject *current = pyfasty_node_get(index->node, key);
+    if (current == NULL) {
+        return PyErr_Occurred() ? -1 : 0;
+    }
+    
+    /* Descente le long du chemin : nœuds (enfants, puis valeur dict) ou dicts bruts */
+    Py_ssize_t count = PyTuple_GET_SIZE(index->names);
+    PyObject *chain = PyList_New(0);
+    if (chain == NULL) {
+        return -1;
+    }
+    PyObject *value = NULL;
+    for (Py_ssize_t i = 0; i <= count && current != NULL; i++) {
+        PyObject *name = i < count ? PyTuple_GET_ITEM(index->names, i) : NULL;
+        PyObject *next = NULL;
+        if (PyObject_TypeCheck(current, &PyFastyRegistryType)) {
+            PyFastyBaseObject *node = (PyFastyBaseObject *)current;
+            PyObject *pointer = index_node_key(node);
+            if (pointer == NULL || PyList_Append(chain, pointer) < 0) {
+                Py_XDECREF(pointer);
+                Py_DECREF(chain);
+                return -1;
+            }
+            Py_DECREF(pointer);
+            if (name == NULL) {
+                value = node->value;
+            } else {
+                next = pyfasty_node_get(node, name);
+                if (next == NULL && !PyErr_Occurred() && PyDict_Check(node->value)) {
+                    next = PyDict_GetItem(node->value, name);
+                }
+            }
+        } else if (name == NULL) {
+            value = current;
+        } else if (PyDict_Check(current)) {
+            next = PyDict_GetItem(current, name);
+        }
+        if (PyErr_Occurred()) {
+            Py_DECREF(chain);
+            return -1;
+        }
+        current = next;
+    }
+    
+    if (PyDict_SetItem(index->chains, key, chain) < 0) {
+        Py_DECREF(chain);
+        return -1;
+    }
+    /* Un nœud n'appartient en général qu'à un enfant : la clé seule, un dict si partagé */
+    int result = 0;
+    for (Py_ssize_t i = 0; i < PyList_GET_SIZE(chain) && result == 0; i++) {
+        PyObject *pointer = PyList_GET_ITEM(chain, i);
+        PyObject *keys = PyDict_GetItem(index->watch, pointer);
+        if (keys == NULL) {
+            result = PyDict_SetItem(index->watch, pointer, key);
+        } else if (PyDict_CheckExact(keys)) {
+            result = PyDict_SetItem(keys, key, Py_None);
+        } else if (PyObject_RichCompareBool(keys, key, Py_EQ) != 1) {
+            PyObject *shared = PyDict_New();
+            result = shared == NULL || PyDict_SetItem(shared, keys, Py_None) < 0 ||
+                     PyDict_SetItem(shared, key, Py_None) < 0 ||
+                     PyDict_SetItem(index->watch, pointer, shared) < 0 ? -1 : 0;
+            Py_XDECREF(shared);
+        }
+    }
+    Py_DECREF(chain);
+    if (result < 0) {
+        return -1;
+    }
+    
+    /* Champ absent ou valeur non hachable : l'enfant n'est pas indexé */
+    if (value == NULL || value == Py_None) {
+        return 0;
+    }
+    if (PyObject_Hash(value) == -1) {
+        PyErr_Clear();
+        return 0;
+    }
+    PyObject *bucket = PyDict_GetItem(index->buckets, value);
+    if (bucket == NULL) {
+        bucket = PyDict_New();
+        if (bucket == NULL || PyDict_SetItem(index->buckets, value, bucket) < 0) {
+            Py_XDECREF(bucket);
+            return -1;
+        }
+        Py_DECREF(bucket);
+        if (index->sorted) {
+            index_order_insert(index, value);
+        }
+    }
+    if (PyDict_SetItem(bucket, key, Py_None) < 0) {
+        return -1;
+    }
+    return PyDict_SetItem(index->values, key, value);
+}
+
+/* Recalcule les enfants marqués (ou tous après un remplacement) */
+static int index_flush(RegistryIndex *index) {
+    PyObject *keys;
+    int fresh = index->stale;
+    if (index->stale) {
+        PyDict_Clear(index->values);
+        PyDict_Clear(index->buckets);
+        PyDict_Clear(index->chains);
+        PyDict_Clear(index->watch);
+        PyDict_Clear(index->dirty);
+        if (index->sorted && PyList_SetSlice(index->order, 0, PyList_GET_SIZE(index->order), NULL) < 0) {
+            return -1;
+        }
+        index->stale = 0;
+        PyObject *children = pyfasty_node_data(index->node);
+        if (children == NULL) {
+            return -1;
+        }
+        keys = PyDict_Keys(children);
+        Py_DECREF(children);
+    } else {
+        if (PyDict_Size(index->dirty) == 0) {
+            return 0;
+        }
+        keys = PyDict_Keys(index->dirty);
+        PyDict_Clear(index->dirty);
+    }
+    if (keys == NULL) {
+        return -1;
+    }
+    for (Py_ssize_t i = 0; i < PyList_GET_SIZE(keys); i++) {
+        if (index_refresh(index, PyList_GET_ITEM(keys, i), fresh) < 0) {
+            Py_DECREF(keys);
+            return -1;
+        }
+    }
+    Py_DECREF(keys);
+    return 0;
+}
+
+static RegistryIndex *index_find(PyFastyBaseObject *node, PyObject *path) {
+    for (Py_ssize_t i = 0; i < g_index_count; i++) {
+        if (g_indexes[i]->node == node && PyUnicode_Compare(g_indexes[i]->path, path) == 0) {
+            return g_indexes[i];
+        }
+    }
+    return NULL;
+}
+
+static void index_detach(RegistryIndex *index) {
+    for (Py_ssize_t i = 0; i < g_index_count; i++) {
+        if (g_indexes[i] == index) {
+            g_indexes[i] = g_indexes[--g_index_count];
+            index_free(index);
+            return;
+        }
+    }
+}
+
+/* Méthode create_index("a.b", kind="hash") : index d'égalité, ou d'égalité et
+   d'intervalle avec kind="sorted" ; recréé si le type change */
+static PyObject *registry_create_index_method(PyObject *self, PyObject *args, PyObject *kwds) {
+    static char *kwlist[] = {"path", "kind", NULL};
+    PyObject *path;
+    const char *kind = "hash";
+    
+    if (!PyArg_ParseTupleAndKeywords(args, kwds, "U|$s:create_index", kwlist, &path, &kind)) {
+        return NULL;
+    }
+    int sorted = strcmp(kind, "sorted") == 0;
+    if (!sorted && strcmp(kind, "hash") != 0) {
+        PyErr_Format(PyExc_ValueError, "Unknown index kind '%s' (expected 'hash' or 'sorted')", kind);
+        return NULL;
+    }
+    PyObject *names = registry_split_path(path);
+    if (names == NULL) {
+        return NULL;
+    }
+    
+    PyFastyBaseObject *node = (PyFastyBaseObject *)self;
+    RegistryIndex *existing = index_find(node, path);
+    if (existing != NULL) {
+        if (existing->sorted == sorted) {
+            Py_DECREF(names);
+            Py_RETURN_NONE;
+        }
+        index_detach(existing);
+    }
+    
+    RegistryIndex *index = PyMem_Calloc(1, sizeof(RegistryIndex));
+    RegistryIndex **indexes = index != NULL ? PyMem_Realloc(g_indexes, (g_index_count + 1) * sizeof(RegistryIndex *)) : NULL;
+    if (indexes == NULL) {
+        PyMem_Free(index);
+        Py_DECREF(names);
+        return PyErr_NoMemory();
+    }
+    g_indexes = indexes;
+    Py_INCREF(self);
+    Py_INCREF(path);
+    index->node = node;
+    index->path = path;
+    index->names = names;
+    index->sorted = sorted;
+    index->stale = 1;
+    index->values = PyDict_New();
+    index->buckets = PyDict_New();
+    index->order = PyList_New(0);
+    index->chains = PyDict_New();
+    index->watch = PyDict_New();
+    index->dirty = PyDict_New();
+    if (index->values == NULL || index->buckets == NULL || index->order == NULL ||
+        index->chains == NULL || index->watch == NULL || index->dirty == NULL) {
+        index_free(index);
+        return NULL;
+    }
+    g_indexes[g_index_count++] = index;
+    if (index_flush(index) < 0) {
+        index_detach(index);
+        return NULL;
+    }
+    Py_RETURN_NONE;
+}
+
+/* Méthode drop_index("a.b") */
+static PyObject *registry_drop_index_method(PyObject *self, PyObject *path) {
+    if (!PyUnicode_Check(path)) {
+        PyErr_SetString(PyExc_TypeError, "index path must be a str");
+        return NULL;
+    }
+    RegistryIndex *index = index_find((PyFastyBaseObject *)self, path);
+    if (index == NULL) {
+        PyErr_Format(PyExc_KeyError, "No index on '%U'", path);
+        return NULL;
+    }
+    index_detach(index);
+    Py_RETURN_NONE;
+}
+
+/* Condition de where() : "country", "profile__country", "age__gt"... */
+static RegistryIndex *index_for_condition(PyFastyBaseObject *node, PyObject *name, int *op) {
+    static const char *suffixes[] = {"__gt", "__ge", "__lt", "__le"};
+    PyObject *field = NULL;
+    *op = INDEX_EQ;
+    for (int i = 0; i < 4 && field == NULL; i++) {
+        PyObject *suffix = PyUnicode_FromString(suffixes[i]);
+        if (suffix == NULL) {
+            return NULL;
+        }
+        Py_ssize_t length = PyUnicode_GET_LENGTH(name);
+        if (length > 4 && PyUnicode_Tailmatch(name, suffix, 0, length, 1) == 1) {
+            field = PyUnicode_Substring(name, 0, length - 4);
+            *op = INDEX_GT + i;
+            if (field == NULL) {
+                Py_DECREF(suffix);
+                return NULL;
+            }
+        }
+        Py_DECREF(suffix);
+    }
+    if (field == NULL) {
+        Py_INCREF(name);
+        field = name;
+    }
+    
+    /* Champ désigné par son chemin complet ("__" pour ".") ou son dernier segment */
+    PyObject *underscores = PyUnicode_FromString("__");
+    PyObject *dot = PyUnicode_FromString(".");
+    PyObject *dotted = underscores != NULL && dot != NULL ? PyUnicode_Replace(field, underscores, dot, -1) : NULL;
+    Py_XDECREF(underscores);
+    Py_XDECREF(dot);
+    if (dotted == NULL) {
+        Py_DECREF(field);
+        return NULL;
+    }
+    RegistryIndex *found = NULL;
+    int ambiguous = 0;
+    for (Py_ssize_t i = 0; i < g_index_count; i++) {
+        RegistryIndex *index = g_indexes[i];
+        if (index->node != node) {
+            continue;
+        }
+        if (PyUnicode_Compare(index->path, dotted) == 0) {
+            found = index;
+            ambiguous = 0;
+            break;
+        }
+        PyObject *last = PyTuple_GET_ITEM(index->names, PyTuple_GET_SIZE(index->names) - 1);
+        if (PyUnicode_Compare(last, field) == 0) {
+            ambiguous = found != NULL;
+            found = index;
+        }
+    }
+    Py_DECREF(dotted);
+    if (found == NULL || ambiguous) {
+        PyErr_Format(PyExc_KeyError, found == NULL ? "No index on '%U' (see create_index())"
+                                                   : "Several indexes end with '%U', use the full path", field);
+        found = NULL;
+    } else if (*op != INDEX_EQ && !found->sorted) {
+        PyErr_Format(PyExc_TypeError, "Range query on '%U' needs create_index(..., kind=\"sorted\")", found->path);
+        found = NULL;
+    }
+    Py_DECREF(field);
+    return found;
+}
+
+/* Clés dont la valeur indexée satisfait op ; O(taille du résultat) */
+static PyObject *index_select(RegistryIndex *index, int op, PyObject *target) {
+    if (op == INDEX_EQ) {
+        if (PyObject_Hash(target) == -1) {
+            return NULL;
+        }
+        PyObject *bucket = PyDict_GetItem(index->buckets, target);
+        return bucket != NULL ? PyDict_Keys(bucket) : PyList_New(0);
+    }
+    
+    Py_ssize_t start = 0, end = PyList_GET_SIZE(index->order);
+    if (op == INDEX_GT || op == INDEX_GE) {
+        start = index_bisect(index->order, target, op == INDEX_GT);
+    } else {
+        end = index_bisect(index->order, target, op == INDEX_LE);
+    }
+    if (start < 0 || end < 0) {
+        return NULL;
+    }
+    PyObject *result = PyList_New(0);
+    for (Py_ssize_t i = start; i < end && result != NULL; i++) {
+        PyObject *bucket = PyDict_GetItem(index->buckets, PyList_GET_ITEM(index->order, i));
+        PyObject *key;
+        Py_ssize_t pos = 0;
+        while (bucket != NULL && PyDict_Next(bucket, &pos, &key, NULL)) {
+            if (PyList_Append(result, key) < 0) {
+                Py_CLEAR(result);
+                break;
+            }
+        }
+    }
+    return result;
+}
+
+/* La valeur indexée de key satisfait-elle op ? */
+static int index_matches(RegistryIndex *index, int op, PyObject *target, PyObject *key) {
+    static const int compare[] = {Py_EQ, Py_GT, Py_GE, Py_LT, Py_LE};
+    PyObject *value = PyDict_GetItemWithError(index->values, key);
+    if (value == NULL) {
+        return PyErr_Occurred() ? -1 : 0;
+    }
+    return PyObject_RichCompareBool(value, target, compare[op]);
+}
+
+/* Méthode where(country="FR", age__ge=18) : clés des enfants qui satisfont toutes
+   les conditions. La condition la plus sélective fournit les candidats, les autres
+   les filtrent. */
+static PyObject *registry_where_method(PyObject *self, PyObject *args, PyObject *kwds) {
+    if (PyTuple_GET_SIZE(args) != 0 || kwds == NULL || PyDict_Size(kwds) == 0) {
+        PyErr_SetString(PyExc_TypeError, "where() takes keyword conditions only, e.g. where(country=\"FR\")");
+        return NULL;
+    }
+    Py_ssize_t count = PyDict_Size(kwds);
+    RegistryIndex **indexes = PyMem_Malloc(count * sizeof(RegistryIndex *));
+    int *ops = PyMem_Malloc(count * sizeof(int));
+    PyObject **targets = PyMem_Malloc(count * sizeof(PyObject *));
+    PyObject *best = NULL;
+    Py_ssize_t best_at = -1;
+    PyObject *result = NULL;
+    if (indexes == NULL || ops == NULL || targets == NULL) {
+        PyErr_NoMemory();
+        goto done;
+    }
+    
+    PyObject *name, *target;
+    Py_ssize_t pos = 0, i = 0;
+    while (PyDict_Next(kwds, &pos, &name, &target)) {
+        indexes[i] = index_for_condition((PyFastyBaseObject *)self, name, &ops[i]);
+        if (indexes[i] == NULL || index_flush(indexes[i]) < 0) {
+            goto done;
+        }
+        targets[i] = target;
+        PyObject *selected = index_select(indexes[i], ops[i], target);
+        if (selected == NULL) {
+            goto done;
+        }
+        if (best == NULL || PyList_GET_SIZE(selected) < PyList_GET_SIZE(best)) {
+            Py_XSETREF(best, selected);
+            best_at = i;
+        } else {
+            Py_DECREF(selected);
+        }
+        i++;
+    }
+    if (count == 1) {
+        result = best;
+        best = NULL;
+        goto done;
+    }
+    
+    result = PyList_New(0);
+    for (Py_ssize_t k = 0; result != NULL && k < PyList_GET_SIZE(best); k++) {
+        PyObject *key = PyList_GET_ITEM(best, k);
+        int keep = 1;
+        for (Py_ssize_t c = 0; c < count && keep == 1; c++) {
+            if (c != best_at) {
+                keep = index_matches(indexes[c], ops[c], targets[c], key);
+            }
+        }
+        if (keep < 0 || (keep == 1 && PyList_Append(result, key) < 0)) {
+            Py_CLEAR(result);
+        }
+    }
+
+done:
+    Py_XDECREF(best);
+    PyMem_Free(indexes);
+    PyMem_Free(ops);
+    PyMem_Free(targets);
+    return result;
+}
+
+/* === INSTANTANÉS === */
+/* registry.snapshot() : vue figée du sous-arbre, prise en O(1). Rien n'est copié à la
+   prise ; node_touch() recopie superficiellement un nœud (table d'enfants et valeur)
+   avant sa première modification, pour les seuls instantanés encore vivants. Les
+   lectures d'un instantané ne prennent aucun verrou et ne bloquent pas les écritures. */
+struct RegistrySnapshotState {
+    PyObject_HEAD
+    unsigned int epoch;                 /* Époque de l'instantané */
+    PyObject *preserved;                /* Adresse du nœud -> (nœud, enfants, valeur) */
+    RegistrySnapshotState *prev;        /* Liste g_snapshots, la plus récente en tête */
+    RegistrySnapshotState *next;
+};
+
+typedef struct {
+    PyObject_HEAD
+    RegistrySnapshotState *state;
+    PyObject *node;                     /* Nœud vivant correspondant */
+} RegistrySnapshotObject;
+
+static PyTypeObject RegistrySnapshotStateType;
+static PyTypeObject RegistrySnapshotType;
+
+/* Comparaison d'époques modulo 2^32 */
+static inline int snapshot_epoch_after(unsigned int a, unsigned int b) {
+    return (int)(a - b) > 0;
+}
+
+/* Appelé par node_touch() : conserve l'état courant du nœud pour chaque instantané
+   plus récent que sa dernière modification */
+static int snapshot_preserve(PyFastyBaseObject *node) {
+    PyObject *key = NULL;
+    PyObject *entry = NULL;
+    int result = 0;
+    
+    for (RegistrySnapshotState *state = g_snapshots; state != NULL; state = state->next) {
+        if (!snapshot_epoch_after(state->epoch, node->epoch)) {
+            break;  /* Les suivants sont plus anciens encore */
+        }
+        if (entry == NULL) {
+            PyObject *children = Py_None;
+            if (node->data != NULL) {
+                PyObject *live = pyfasty_node_children(node);
+                children = live != NULL ? PyDict_Copy(live) : NULL;
+            } else {
+                Py_INCREF(children);
+            }
+            PyObject *value = node->value;
+            if (PyDict_Check(value)) {
+                value = PyDict_Copy(value);
+            } else {
+                Py_INCREF(value);
+            }
+            key = PyLong_FromVoidPtr(node);
+            if (children != NULL && value != NULL && key != NULL) {
+                entry = PyTuple_Pack(3, (PyObject *)node, children, value);
+            }
+            Py_XDECREF(children);
+            Py_XDECREF(value);
+            if (entry == NULL) {
+                result = -1;
+                break;
+            }
+        }
+        if (PyDict_SetItem(state->preserved, key, entry) < 0) {
+            result = -1;
+            break;
+        }
+    }
+    
+    Py_XDECREF(entry);
+    Py_XDECREF(key);
+    if (result == 0) {
+        node->epoch = g_snapshot_epoch;
+    }
+    return result;
+}
+
+/* Enfants (NULL si aucun) et valeur du nœud vus par l'instantané, références empruntées */
+static int snapshot_node_state(RegistrySnapshotState *state, PyObject *node,
+                               PyObject **children, PyObject **value) {
+    PyFastyBaseObject *base = (PyFastyBaseObject *)node;
+    if (!snapshot_epoch_after(state->epoch, base->epoch)) {
+        PyObject *key = PyLong_FromVoidPtr(node);
+        if (key == NULL) {
+            return -1;
+        }
+        PyObject *entry = PyDict_GetItemWithError(state->preserved, key);
+        Py_DECREF(key);
+        if (entry != NULL) {
+            *children = PyTuple_GET_ITEM(entry, 1) == Py_None ? NULL : PyTuple_GET_ITEM(entry, 1);
+            *value = PyTuple_GET_ITEM(entry, 2);
+            return 0;
+        }
+        if (PyErr_Occurred()) {
+            return -1;
+        }
+    }
+    
+    /* Nœud inchangé depuis l'instantané (ou créé après) : état vivant */
+    if (base->data != NULL && pyfasty_node_children(base) == NULL) {
+        return -1;
+    }
+    *children = base->data;
+    *value = base->value;
+    return 0;
+}
+
+/* Clés internes (__value__, __original_value__) ignorées */
+static inline int snapshot_public_key(PyObject *key) {
+    if (!PyUnicode_Check(key)) {
+        return 1;
+    }
+    return !(PyUnicode_GET_LENGTH(key) >= 2 && PyUnicode_READ_CHAR(key, 0) == '_' &&
+             PyUnicode_READ_CHAR(key, 1) == '_');
+}
+
+static int snapshot_has_entries(PyObject *children) {
+    PyObject *key, *item;
+    Py_ssize_t pos = 0;
+    while (children != NULL && PyDict_Next(children, &pos, &key, &item)) {
+        if (snapshot_public_key(key)) {
+            return 1;
+        }
+    }
+    return 0;
+}
+
+static PyObject *snapshot_view_new(RegistrySnapshotState *state, PyObject *node) {
+    RegistrySnapshotObject *view = PyObject_New(RegistrySnapshotObject, &RegistrySnapshotType);
+    if (view == NULL) {
+        return NULL;
+    }
+    Py_INCREF(state);
+    Py_INCREF(node);
+    view->state = state;
+    view->node = node;
+    return (PyObject *)view;
+}
+
+/* Enfant vu par l'instantané : sous-arbre -> vue (ou dict si export), feuille -> valeur */
+static PyObject *snapshot_to_dict(RegistrySnapshotState *state, PyObject *node, int depth);
+
+static PyObject *snapshot_wrap(RegistrySnapshotState *state, PyObject *child, int export, int depth) {
+    if (PyObject_TypeCheck(child, &PyFastyRegistryType) || PyObject_TypeCheck(child, &PyFastyConfigType)) {
+        PyObject *children, *value;
+        if (snapshot_node_state(state, child, &children, &value) < 0) {
+            return NULL;
+        }
+        if (snapshot_has_entries(children)) {
+            return export ? snapshot_to_dict(state, child, depth + 1) : snapshot_view_new(state, child);
+        }
+        Py_INCREF(value);
+        return value;
+    }
+    if (Py_TYPE(child) == &RegistryCounterType) {
+        /* Les compteurs atomiques ne passent pas par node_touch() : valeur courante */
+        return counter_fold((RegistryCounterObject *)child, 0);
+    }
+    Py_INCREF(child);
+    return child;
+}
+
+static PyObject *snapshot_to_dict(RegistrySnapshotState *state, PyObject *node, int depth) {
+    if (depth > g_pyfasty_max_recursion_depth) {
+        PyErr_SetString(PyExc_RecursionError, "Maximum recursion depth reached");
+        return NULL;
+    }
+    PyObject *children, *value;
+    if (snapshot_node_state(state, node, &children, &value) < 0) {
+        return NULL;
+    }
+    PyObject *result = PyDict_New();
+    if (result == NULL) {
+        return NULL;
+    }
+    
+    PyObject *key, *child;
+    Py_ssize_t pos = 0;
+    while (children != NULL && PyDict_Next(children, &pos, &key, &child)) {
+        if (!snapshot_public_key(key)) {
+            continue;
+        }
+        PyObject *item = snapshot_wrap(state, child, 1, depth);
+        if (item == NULL || PyDict_SetItem(result, key, item) < 0) {
+            Py_XDECREF(item);
+            Py_DECREF(result);
+            return NULL;
+        }
+        Py_DECREF(item);
+    }
+    return result;
+}
+
+/* Enfant name du nœud de la vue (référence empruntée), NULL sans exception si absent */
+static PyObject *snapshot_child(RegistrySnapshotObject *self, PyObject *name) {
+    PyObject *children, *value;
+    if (snapshot_node_state(self->state, self->node, &children, &value) < 0) {
+        return NULL;
+    }
+    return children != NULL ? PyDict_GetItemWithError(children, name) : NULL;
+}
+
+static PyObject *snapshot_getattro(RegistrySnapshotObject *self, PyObject *name) {
+    const char *name_str = PyUnicode_AsUTF8(name);
+    if (name_str == NULL) {
+        return NULL;
+    }
+    if (name_str[0] != '_') {
+        PyObject *child = snapshot_child(self, name);
+        if (child != NULL) {
+            return snapshot_wrap(self->state, child, 0, 0);
+        }
+        if (PyErr_Occurred()) {
+            return NULL;
+        }
+    }
+    /* Méthodes, ou AttributeError : un instantané ne crée pas de nœuds */
+    return PyObject_GenericGetAttr((PyObject *)self, name);
+}
+
+static int snapshot_setattro(RegistrySnapshotObject *self, PyObject *name, PyObject *value) {
+    PyErr_SetString(PyExc_TypeError, "Registry snapshots are read-only");
+    return -1;
+}
+
+static PyObject *snapshot_getitem(RegistrySnapshotObject *self, PyObject *key) {
+    PyObject *child = snapshot_child(self, key);
+    if (child != NULL) {
+        return snapshot_wrap(self->state, child, 0, 0);
+    }
+    if (!PyErr_Occurred()) {
+        PyErr_SetObject(PyExc_KeyError, key);
+    }
+    return NULL;
+}
+
+static int snapshot_setitem(RegistrySnapshotObject *self, PyObject *key, PyObject *value) {
+    PyErr_SetString(PyExc_TypeError, "Registry snapshots are read-only");
+    return -1;
+}
+
+static Py_ssize_t snapshot_length(RegistrySnapshotObject *self) {
+    PyObject *children, *value;
+    if (snapshot_node_state(self->state, self->node, &children, &value) < 0) {
+        return -1;
+    }
+    Py_ssize_t count = 0;
+    PyObject *key, *item;
+    Py_ssize_t pos = 0;
+    while (children != NULL && PyDict_Next(children, &pos, &key, &item)) {
+        count += snapshot_public_key(key);
+    }
+    return count;
+}
+
+static int snapshot_contains(RegistrySnapshotObject *self, PyObject *key) {
+    PyObject *child = snapshot_child(self, key);
+    if (child == NULL) {
+        return PyErr_Occurred() ? -1 : 0;
+    }
+    return snapshot_public_key(key);
+}
+
+/* get(name, default=None) */
+static PyObject *snapshot_get_method(RegistrySnapshotObject *self, PyObject *args) {
+    PyObject *name;
+    PyObject *default_value = Py_None;
+    if (!PyArg_ParseTuple(args, "O|O:get", &name, &default_value)) {
+        return NULL;
+    }
+    PyObject *child = snapshot_child(self, name);
+    if (child != NULL) {
+        return snapshot_wrap(self->state, child, 0, 0);
+    }
+    if (PyErr_Occurred()) {
+        return NULL;
+    }
+    Py_INCREF(default_value);
+    return default_value;
+}
+
+/* get_path("a.b.c", default=None) */
+static PyObject *snapshot_get_path_method(RegistrySnapshotObject *self, PyObject *args) {
+    PyObject *path;
+    PyObject *default_value = Py_None;
+    if (!PyArg_ParseTuple(args, "U|O:get_path", &path, &default_value)) {
+        return NULL;
+    }
+    PyObject *names = registry_split_path(path);
+    if (names == NULL) {
+        return NULL;
+    }
+    
+    PyObject *node = self->node;
+    PyObject *result = NULL;
+    Py_ssize_t count = PyTuple_GET_SIZE(names);
+    for (Py_ssize_t i = 0; i < count; i++) {
+        PyObject *children, *value;
+        if (snapshot_node_state(self->state, node, &children, &value) < 0) {
+            goto done;
+        }
+        PyObject *child = children != NULL ? PyDict_GetItemWithError(children, PyTuple_GET_ITEM(names, i)) : NULL;
+        if (child == NULL) {
+            if (PyErr_Occurred()) {
+                goto done;
+            }
+            break;
+        }
+        if (i == count - 1) {
+            result = snapshot_wrap(self->state, child, 0, 0);
+            goto done;
+        }
+        if (!PyObject_TypeCheck(child, &PyFastyRegistryType)) {
+            break;
+        }
+        node = child;
+    }
+    Py_INCREF(default_value);
+    result = default_value;
+
+done:
+    Py_DECREF(names);
+    return result;
+}
+
+/* keys() : noms des enfants */
+static PyObject *snapshot_keys_method(RegistrySnapshotObject *self, PyObject *Py_UNUSED(ignored)) {
+    PyObject *children, *value;
+    if (snapshot_node_state(self->state, self->node, &children, &value) < 0) {
+        return NULL;
+    }
+    PyObject *keys = PyList_New(0);
+    PyObject *key, *item;
+    Py_ssize_t pos = 0;
+    while (keys != NULL && children != NULL && PyDict_Next(children, &pos, &key, &item)) {
+        if (snapshot_public_key(key) && PyList_Append(keys, key) < 0) {
+            Py_CLEAR(keys);
+        }
+    }
+    return keys;
+}
+
+static PyObject *snapshot_to_dict_method(RegistrySnapshotObject *self, PyObject *Py_UNUSED(ignored)) {
+    return snapshot_to_dict(self->state, self->node, 0);
+}
+
+static PyObject *snapshot_str(RegistrySnapshotObject *self) {
+    PyObject *dict = snapshot_to_dict(self->state, self->node, 0);
+    if (dict == NULL) {
+        return NULL;
+    }
+    PyObject *result = PyObject_Str(dict);
+    Py_DECREF(dict);
+    return result;
+}
+
+static PyObject *snapshot_repr(RegistrySnapshotObject *self) {
+    PyObject *dict = snapshot_to_dict(self->state, self->node, 0);
+    if (dict == NULL) {
+        return NULL;
+    }
+    PyObject *result = PyUnicode_FromFormat("RegistrySnapshot(%R)", dict);
+    Py_DECREF(dict);
+    return result;
+}
+
+static PyObject *snapshot_richcompare(PyObject *self, PyObject *other, int op) {
+    if ((op != Py_EQ && op != Py_NE) ||
+        (!PyDict_Check(other) && !PyObject_TypeCheck(other, &RegistrySnapshotType))) {
+        Py_RETURN_NOTIMPLEMENTED;
+    }
+    RegistrySnapshotObject *view = (RegistrySnapshotObject *)self;
+    PyObject *dict = snapshot_to_dict(view->state, view->node, 0);
+    if (dict == NULL) {
+        return NULL;
+    }
+    PyObject *other_dict = other;
+    if (!PyDict_Check(other)) {
+        RegistrySnapshotObject *other_view = (RegistrySnapshotObject *)other;
+        other_dict = snapshot_to_dict(other_view->state, other_view->node, 0);
+        if (other_dict == NULL) {
+            Py_DECREF(dict);
+            return NULL;
+        }
+    } else {
+        Py_INCREF(other_dict);
+    }
+    PyObject *result = PyObject_RichCompare(dict, other_dict, op);
+    Py_DECREF(other_dict);
+    Py_DECREF(dict);
+    return result;
+}
+
+static void snapshot_dealloc(RegistrySnapshotObject *self) {
+    Py_DECREF(self->state);
+    Py_DECREF(self->node);
+    PyObject_Del(self);
+}
+
+static void snapshot_state_dealloc(RegistrySnapshotState *self) {
+    if (self->prev != NULL) {
+        self->prev->next = self->next;
+    } else {
+        g_snapshots = self->next;
+    }
+    if (self->next != NULL) {
+        self->next->prev = self->prev;
+    }
+    Py_XDECREF(self->preserved);
+    PyObject_Del(self);
+}
+
+static PyTypeObject RegistrySnapshotStateType = {
+    PyVarObject_HEAD_INIT(NULL, 0)
+    .tp_name = "pyfasty._pyfasty.RegistrySnapshotState",
+    .tp_basicsize = sizeof(RegistrySnapshotState),
+    .tp_flags = Py_TPFLAGS_DEFAULT,
+    .tp_dealloc = (destructor)snapshot_state_dealloc,
+};
+
+static PyMappingMethods snapshot_as_mapping = {
+    (lenfunc)snapshot_length,           /* mp_length */
+    (binaryfunc)snapshot_getitem,       /* mp_subscript */
+    (objobjargproc)snapshot_setitem,    /* mp_ass_subscript */
+};
+
+static PySequenceMethods snapshot_as_sequence = {
+    .sq_contains = (objobjproc)snapshot_contains,
+};
+
+static PyMethodDef snapshot_methods[] = {
+    {"get", (PyCFunction)snapshot_get_method, METH_VARARGS, "Get a child as of the snapshot, or default"},
+    {"get_path", (PyCFunction)snapshot_get_path_method, METH_VARARGS, "Get a dotted path as of the snapshot, or default"},
+    {"keys", (PyCFunction)snapshot_keys_method, METH_NOARGS, "Child names as of the snapshot"},
+    {"to_dict", (PyCFunction)snapshot_to_dict_method, METH_NOARGS, "Nested dict copy of the snapshot"},
+    {NULL, NULL, 0, NULL}  /* Sentinel */
+};
+
+static PyTypeObject RegistrySnapshotType = {
+    PyVarObject_HEAD_INIT(NULL, 0)
+    .tp_name = "pyfasty._pyfasty.RegistrySnapshot",
+    .tp_doc = "Read-only, copy-on-write view of a registry subtree",
+    .tp_basicsize = sizeof(RegistrySnapshotObject),
+    .tp_itemsize = 0,
+    .tp_flags = Py_TPFLAGS_DEFAULT,
+    .tp_dealloc = (destructor)snapshot_dealloc,
+    .tp_getattro = (getattrofunc)snapshot_getattro,
+    .tp_setattro = (setattrofunc)snapshot_setattro,
+    .tp_str = (reprfunc)snapshot_str,
+    .tp_repr = (reprfunc)snapshot_repr,
+    .tp_richcompare = snapshot_richcompare,
+    .tp_as_mapping = &snapshot_as_mapping,
+    .tp_as_sequence = &snapshot_as_sequence,
+    .tp_methods = snapshot_methods,
+};
+
+/* Méthode snapshot() : nouvelle époque, aucune copie */
+static PyObject *registry_snapshot_method(PyObject *self, PyObject *Py_UNUSED(ignored)) {
+    RegistrySnapshotState *state = PyObject_New(RegistrySnapshotState, &RegistrySnapshotStateType);
+    if (state == NULL) {
+        return NULL;
+    }
+    state->preserved = PyDict_New();
+    if (state->preserved == NULL) {
+        PyObject_Del(state);
+        return NULL;
+    }
+    state->epoch = ++g_snapshot_epoch;
+    state->prev = NULL;
+    state->next = g_snapshots;
+    if (g_snapshots != NULL) {
+        g_snapshots->prev = state;
+    }
+    g_snapshots = state;
+    
+    PyObject *view = snapshot_view_new(state, self);
+    Py_DECREF(state);
+    return view;
+}
+
+/* === CONVERSION DICT === */
+/* to_dict() / update_from() : un seul parcours C dans chaque sens. L'export partage
+   les feuilles avec l'arbre (aucune copie des valeurs) et un même sous-arbre présent
+   à plusieurs endroits donne un seul dict ; l'import construit les sous-arbres
+   nouveaux d'un bloc par pyfasty_base_create(). */
+static PyObject *export_value(PyObject *item, PyObject *memo, int depth);
+
+/* Dict des enfants publics, mémorisé par adresse (partage et cycles) */
+static PyObject *export_children(PyObject *owner, PyObject *children, PyObject *memo, int depth) {
+    if (depth > g_pyfasty_max_recursion_depth) {
+        PyErr_SetString(PyExc_RecursionError, "Maximum recursion depth reached");
+        return NULL;
+    }
+    PyObject *address = PyLong_FromVoidPtr(owner);
+    if (address == NULL) {
+        return NULL;
+    }
+    PyObject *result = PyDict_GetItemWithError(memo, address);
+    if (result != NULL || PyErr_Occurred()) {
+        Py_DECREF(address);
+        Py_XINCREF(result);
+        return result;
+    }
+    result = PyDict_New();
+    if (result == NULL || PyDict_SetItem(memo, address, result) < 0) {
+        Py_DECREF(address);
+        Py_XDECREF(result);
+        return NULL;
+    }
+    Py_DECREF(address);
+    
+    PyObject *key, *child;
+    Py_ssize_t pos = 0;
+    while (PyDict_Next(children, &pos, &key, &child)) {
+        if (!snapshot_public_key(key)) {
+            continue;
+        }
+        PyObject *item = export_value(child, memo, depth + 1);
+        if (item == NULL || PyDict_SetItem(result, key, item) < 0) {
+            Py_XDECREF(item);
+            Py_DECREF(result);
+            return NULL;
+        }
+        Py_DECREF(item);
+    }
+    return result;
+}
+
+/* Nœud avec enfants -> dict, feuille -> sa valeur, compteur -> valeur courante */
+static PyObject *export_value(PyObject *item, PyObject *memo, int depth) {
+    if (PyObject_TypeCheck(item, &PyFastyRegistryType) || PyObject_TypeCheck(item, &PyFastyConfigType)) {
+        PyFastyBaseObject *node = (PyFastyBaseObject *)item;
+        PyObject *children = node->data != NULL ? pyfasty_node_children(node) : NULL;
+        if (children == NULL && PyErr_Occurred()) {
+            return NULL;
+        }
+        if (children != NULL && snapshot_has_entries(children)) {
+            return export_children(item, children, memo, depth);
+        }
+        item = node->value;
+    } else if (Py_TYPE(item) == &RegistryCounterType) {
+        return counter_fold((RegistryCounterObject *)item, 0);
+    }
+    if (PyDict_Check(item)) {
+        return export_children(item, item, memo, depth);
+    }
+    Py_INCREF(item);
+    return item;
+}
+
+/* Méthode to_dict() : copie du sous-arbre en dicts imbriqués */
+static PyObject *registry_to_dict_method(PyObject *self, PyObject *Py_UNUSED(ignored)) {
+    PyFastyBaseObject *node = (PyFastyBaseObject *)self;
+    PyObject *memo = PyDict_New();
+    if (memo == NULL) {
+        return NULL;
+    }
+    PyObject *children = pyfasty_node_data(node);
+    PyObject *result = NULL;
+    if (children != NULL) {
+        /* Sans enfants, une valeur dict est exportée ; toute autre valeur donne {} */
+        PyObject *source = PyDict_Size(children) == 0 && PyDict_Check(node->value) ? node->value : children;
+        result = export_children(self, source, memo, 0);
+        Py_DECREF(children);
+    }
+    Py_DECREF(memo);
+    return result;
+}
+
+static int import_mapping(PyFastyBaseObject *node, PyObject *mapping, int deep, PyObject *memo, int depth);
+
+/* Nouveau sous-arbre pour value : même forme que pyfasty_base_create() (enfants
+   développés, dict conservé comme valeur) mais un dict présent plusieurs fois dans
+   l'entrée ne donne qu'un nœud */
+static PyObject *import_build(PyObject *value, PyObject *memo, int depth) {
+    if (!PyDict_Check(value)) {
+        return registry_create(depth, value);
+    }
+    if (depth > g_pyfasty_max_recursion_depth) {
+        PyErr_SetString(PyExc_RecursionError, "Maximum recursion depth reached");
+        return NULL;
+    }
+    
+    /* Un dict référencé par son seul conteneur (cas de json.loads) ne peut pas être
+       partagé : pas de passage par la table de correspondance */
+    PyObject *node;
+    if (Py_REFCNT(value) > 1) {
+        PyObject *address = PyLong_FromVoidPtr(value);
+        if (address == NULL) {
+            return NULL;
+        }
+        node = PyDict_GetItemWithError(memo, address);
+        if (node != NULL || PyErr_Occurred()) {
+            Py_DECREF(address);
+            Py_XINCREF(node);
+            return node;
+        }
+        node = registry_create(depth, NULL);
+        if (node == NULL || PyDict_SetItem(memo, address, node) < 0) {
+            Py_DECREF(address);
+            Py_XDECREF(node);
+            return NULL;
+        }
+        Py_DECREF(address);
+    } else {
+        node = registry_create(depth, NULL);
+        if (node == NULL) {
+            return NULL;
+        }
+    }
+    
+    PyFastyBaseObject *base = (PyFastyBaseObject *)node;
+    PyObject *children = PyDict_Size(value) > 0 ? pyfasty_node_children(base) : NULL;
+    PyObject *key, *item;
+    Py_ssize_t pos = 0;
+    while (children != NULL && PyDict_Next(value, &pos, &key, &item)) {
+        /* Les feuilles restent des valeurs brutes, comme dans pyfasty_base_create() */
+        PyObject *child = PyDict_Check(item) ? import_build(item, memo, depth + 1) : (Py_INCREF(item), item);
+        if (child == NULL || PyDict_SetItem(children, key, child) < 0) {
+            Py_XDECREF(child);
+            children = NULL;
+            break;
+        }
+        Py_DECREF(child);
+    }
+    if (children == NULL && PyDict_Size(value) > 0) {
+        Py_DECREF(node);
+        return NULL;
+    }
+    Py_INCREF(value);
+    Py_SETREF(base->value, value);
+    return node;
+}
+
+/* Écrit value sous key : fusion dans un sous-arbre existant (deep), mise à jour sur
+   place d'une feuille, sinon nouveau nœud construit d'un bloc */
+static int import_item(PyFastyBaseObject *node, PyObject *children, PyObject *key, PyObject *value,
+                       int deep, PyObject *memo, int depth) {
+    PyObject *existing = PyDict_GetItemWithError(children, key);
+    if (existing == NULL && PyErr_Occurred()) {
+        return -1;
+    }
+    PyFastyBaseObject *child = existing != NULL && Py_TYPE(existing) == &PyFastyRegistryType
+                               ? (PyFastyBaseObject *)existing : NULL;
+    PyObject *stored = value;
+    
+    if (child != NULL && deep && PyDict_Check(value)) {
+        if (import_mapping(child, value, deep, memo, depth + 1) < 0) {
+            return -1;
+        }
+        stored = existing;
+    } else if (child != NULL && !PyDict_Check(value) &&
+               (child->data == NULL || (PyDict_CheckExact(child->data) && PyDict_Size(child->data) == 0))) {
+        if (node_touch(child) < 0) {
+            return -1;
+        }
+        Py_INCREF(value);
+        Py_SETREF(child->value, value);
+    } else {
+        PyObject *created = import_build(value, memo, node->depth + 1);
+        if (created == NULL) {
+            return -1;
+        }
+        int result = node_set_child(node, children, key, created);
+        Py_DECREF(created);
+        if (result < 0) {
+            return -1;
+        }
+        if (PyDict_Check(value)) {
+            stored = PyDict_GetItem(children, key);
+        }
+    }
+    
+    /* La valeur dict éventuelle du nœud (lue par l'accès par crochets) suit les enfants */
+    if (PyDict_Check(node->value) && stored != NULL) {
+        if (node_touch(node) < 0 || PyDict_SetItem(node->value, key, stored) < 0) {
+            return -1;
+        }
+    }
+    pyfasty_trigger_sync_events_for_node(MODULE_REGISTRY, (PyObject *)node, key);
+    return 0;
+}
+
+static int import_mapping(PyFastyBaseObject *node, PyObject *mapping, int deep, PyObject *memo, int depth) {
+    if (depth > g_pyfasty_max_recursion_depth) {
+        PyErr_SetString(PyExc_RecursionError, "Maximum recursion depth reached");
+        return -1;
+    }
+    PyObject *children = pyfasty_node_children(node);
+    if (children == NULL) {
+        return -1;
+    }
+    PyObject *key, *value;
+    Py_ssize_t pos = 0;
+    while (PyDict_Next(mapping, &pos, &key, &value)) {
+        if (import_item(node, children, key, value, deep, memo, depth) < 0) {
+            return -1;
+        }
+    }
+    return 0;
+}
+
+/* Méthode update_from(mapping, deep=True) : fusion d'un dict dans le nœud, une seule
+   évaluation d'événements à la fin. deep=False remplace les sous-arbres au lieu de
+   les fusionner. */
+static PyObject *registry_update_from_method(PyObject *self, PyObject *args, PyObject *kwds) {
+    static char *kwlist[] = {"mapping", "deep", NULL};
+    PyObject *mapping;
+    int deep = 1;
+    
+    if (!PyArg_ParseTupleAndKeywords(args, kwds, "O|$p:update_from", kwlist, &mapping, &deep)) {
+        return NULL;
+    }
+    PyObject *source;
+    if (PyDict_Check(mapping)) {
+        Py_INCREF(mapping);
+        source = mapping;
+    } else if (!PyObject_HasAttrString(mapping, "keys")) {
+        PyErr_Format(PyExc_TypeError, "update_from() expects a mapping, not '%.100s'", Py_TYPE(mapping)->tp_name);
+        return NULL;
+    } else {
+        source = PyDict_New();
+        if (source != NULL && PyDict_Update(source, mapping) < 0) {
+            Py_CLEAR(source);
+        }
+        if (source == NULL) {
+            return NULL;
+        }
+    }
+    
+    PyObject *memo = PyDict_New();
+    if (memo == NULL) {
+        Py_DECREF(source);
+        return NULL;
+    }
+    pyfasty_event_batch_begin();
+    int failed = import_mapping((PyFastyBaseObject *)self, source, deep, memo, 0) < 0;
+    Py_DECREF(memo);
+    
+    /* L'erreur éventuelle est mise de côté le temps de l'évaluation */
+    PyObject *type, *value, *traceback;
+    PyErr_Fetch(&type, &value, &traceback);
+    pyfasty_event_batch_end();
+    PyErr_Restore(type, value, traceback);
+    
+    Py_DECREF(source);
+    if (failed || PyErr_Occurred()) {
+        return NULL;
+    }
+    Py_RETURN_NONE;
+}
+
+/* === SAUVEGARDE BINAIRE === */
+/* dump(path) / load(path) : l'arbre est écrit directement dans le fichier, sans
+   arbre de dicts intermédiaire, et relu en un seul bloc.
+   Format : en-tête "PYFS" + version + type d'arbre, enregistrements de nœuds,
+   table des noms d'enfants, puis pied de page (positions de l'enregistrement
+   racine et de la table, 8 octets little-endian chacune).
+   Enregistrement : valeur, nombre d'enfants, puis paires nom/entrée. Les nœuds
+   enfants sont écrits avant leur parent et référencés par leur distance, si
+   bien qu'un nœud s'ouvre sans parcourir ses descendants (load_file(lazy=True)).
+   Les noms sont des index dans la table.
+   Entiers en varint zigzag, flottants IEEE 754 little-endian, chaînes UTF-8
+   préfixées par leur longueur (varint). */
+#define DUMP_MAGIC "PYFS"
+#define DUMP_VERSION 2
+#define DUMP_HEADER_SIZE 6
+#define DUMP_FOOTER_SIZE 16
+#define DUMP_BUFFER_SIZE 65536
+
+typedef enum {
+    DUMP_NONE = 0,
+    DUMP_FALSE,
+    DUMP_TRUE,
+    DUMP_INT,       /* varint zigzag 64 bits */
+    DUMP_BIGINT,    /* entier hors 64 bits : texte décimal */
+    DUMP_FLOAT,
+    DUMP_STR,
+    DUMP_BYTES,
+    DUMP_LIST,
+    DUMP_TUPLE,
+    DUMP_DICT,
+    DUMP_NODE,      /* valeur, nombre d'enfants, paires nom/entrée */
+    DUMP_COUNTER,   /* is_float, stripes, valeur */
+    DUMP_KEYREF,    /* nom d'enfant : index dans la table des noms */
+    DUMP_NODEREF,   /* nœud enfant : distance jusqu'à son enregistrement */
+    DUMP_CHILDREN   /* valeur d'un nœud construit depuis un dict : vue de ses enfants */
+} DumpTag;
+
+typedef struct {
+    FILE *fp;
+    PyObject *keys;            /* Nom d'enfant -> index dans la table des noms */
+    size_t written;            /* Octets déjà passés au fichier */
+    size_t len;
+    unsigned char buf[DUMP_BUFFER_SIZE];
+} DumpWriter;
+
+static int dump_flush(DumpWriter *writer) {
+    if (writer->len > 0 && fwrite(writer->buf, 1, writer->len, writer->fp) != writer->len) {
+        PyErr_SetFromErrno(PyExc_OSError);
+        return -1;
+    }
+    writer->written += writer->len;
+    writer->len = 0;
+    return 0;
+}
+
+static int dump_bytes(DumpWriter *writer, const void *data, size_t size) {
+    if (writer->len + size > DUMP_BUFFER_SIZE) {
+        if (dump_flush(writer) < 0) {
+            return -1;
+        }
+        if (size > DUMP_BUFFER_SIZE) {
+            if (fwrite(data, 1, size, writer->fp) != size) {
+                PyErr_SetFromErrno(PyExc_OSError);
+                return -1;
+            }
+            writer->written += size;
+            return 0;
+        }
+    }
+    memcpy(writer->buf + writer->len, data, size);
+    writer->len += size;
+    return 0;
+}
+
+static inline int dump_byte(DumpWriter *writer, unsigned char byte) {
+    if (writer->len == DUMP_BUFFER_SIZE && dump_flush(writer) < 0) {
+        return -1;
+    }
+    writer->buf[writer->len++] = byte;
+    return 0;
+}
+
+/* Position courante dans le fichier */
+static inline size_t dump_tell(DumpWriter *writer) {
+    return writer->written + writer->len;
+}
+
+static int dump_varint(DumpWriter *writer, uint64_t value) {
+    unsigned char bytes[10];
+    int count = 0;
+    do {
+        unsigned char byte = value & 0x7F;
+        value >>= 7;
+        bytes[count++] = byte | (value ? 0x80 : 0);
+    } while (value);
+    return dump_bytes(writer, bytes, count);
+}
+
+static int dump_u64(DumpWriter *writer, uint64_t value) {
+    unsigned char bytes[8];
+    for (int i = 0; i < 8; i++) {
+        bytes[i] = (unsigned char)(value >> (8 * i));
+    }
+    return dump_bytes(writer, bytes, sizeof(bytes));
+}
+
+static int dump_sized(DumpWriter *writer, unsigned char tag, const char *data, Py_ssize_t size) {
+    if (dump_byte(writer, tag) < 0 || dump_varint(writer, (uint64_t)size) < 0) {
+        return -1;
+    }
+    return dump_bytes(writer, data, size);
+}
+
+static int dump_entry(DumpWriter *writer, PyObject *obj, PyTypeObject *type);
+
+/* Valeur hors nœud : primitives et conteneurs usuels */
+static int dump_value(DumpWriter *writer, PyObject *value, PyTypeObject *type) {
+    if (value == Py_None) {
+        return dump_byte(writer, DUMP_NONE);
+    }
+    if (PyBool_Check(value)) {
+        return dump_byte(writer, value == Py_True ? DUMP_TRUE : DUMP_FALSE);
+    }
+    if (PyLong_Check(value)) {
+        int overflow;
+        long long number = PyLong_AsLongLongAndOverflow(value, &overflow);
+        if (overflow == 0) {
+            if (number == -1 && PyErr_Occurred()) {
+                return -1;
+            }
+            if (dump_byte(writer, DUMP_INT) < 0) {
+                return -1;
+            }
+            return dump_varint(writer, ((uint64_t)number << 1) ^ (uint64_t)(number >> 63));
+        }
+        PyObject *text = PyNumber_ToBase(value, 10);
+        if (text == NULL) {
+            return -1;
+        }
+        Py_ssize_t size;
+        const char *digits = PyUnicode_AsUTF8AndSize(text, &size);
+        int result = digits != NULL ? dump_sized(writer, DUMP_BIGINT, digits, size) : -1;
+        Py_DECREF(text);
+        return result;
+    }
+    if (PyFloat_Check(value)) {
+        double number = PyFloat_AS_DOUBLE(value);
+        uint64_t bits;
+        memcpy(&bits, &number, sizeof(bits));
+        if (dump_byte(writer, DUMP_FLOAT) < 0) {
+            return -1;
+        }
+        return dump_u64(writer, bits);
+    }
+    if (PyUnicode_Check(value)) {
+        Py_ssize_t size;
+        const char *utf8 = PyUnicode_AsUTF8AndSize(value, &size);
+        return utf8 != NULL ? dump_sized(writer, DUMP_STR, utf8, size) : -1;
+    }
+    if (PyBytes_Check(value)) {
+        return dump_sized(writer, DUMP_BYTES, PyBytes_AS_STRING(value), PyBytes_GET_SIZE(value));
+    }
+    if (PyList_Check(value) || PyTuple_Check(value)) {
+        PyObject *items = PySequence_Fast(value, "");
+        if (items == NULL) {
+            return -1;
+        }
+        Py_ssize_t count = PySequence_Fast_GET_SIZE(items);
+        int result = (dump_byte(writer, PyList_Check(value) ? DUMP_LIST : DUMP_TUPLE) < 0 ||
+                      dump_varint(writer, (uint64_t)count) < 0) ? -1 : 0;
+        for (Py_ssize_t i = 0; i < count && result == 0; i++) {
+            result = dump_entry(writer, PySequence_Fast_GET_ITEM(items, i), type);
+        }
+        Py_DECREF(items);
+        return result;
+    }
+    if (PyDict_Check(value)) {
+        if (dump_byte(writer, DUMP_DICT) < 0 || dump_varint(writer, (uint64_t)PyDict_Size(value)) < 0) {
+            return -1;
+        }
+        PyObject *key, *item;
+        Py_ssize_t pos = 0;
+        while (PyDict_Next(value, &pos, &key, &item)) {
+            if (dump_entry(writer, key, type) < 0 || dump_entry(writer, item, type) < 0) {
+                return -1;
+            }
+        }
+        return 0;
+    }
+    
+    PyErr_Format(PyExc_TypeError, "cannot dump value of type '%s'", Py_TYPE(value)->tp_name);
+    return -1;
+}
+
+/* Nom d'enfant : index dans la table des noms, écrite en fin de fichier */
+static int dump_key(DumpWriter *writer, PyObject *key, PyTypeObject *type) {
+    if (!PyUnicode_CheckExact(key)) {
+        return dump_value(writer, key, type);
+    }
+    Py_ssize_t index;
+    PyObject *known = PyDict_GetItemWithError(writer->keys, key);
+    if (known != NULL) {
+        index = PyLong_AsSsize_t(known);
+    } else if (PyErr_Occurred()) {
+        return -1;
+    } else {
+        index = PyDict_GET_SIZE(writer->keys);
+        PyObject *number = PyLong_FromSsize_t(index);
+        int result = number != NULL ? PyDict_SetItem(writer->keys, key, number) : -1;
+        Py_XDECREF(number);
+        if (result < 0) {
+            return -1;
+        }
+    }
+    if (dump_byte(writer, DUMP_KEYREF) < 0) {
+        return -1;
+    }
+    return dump_varint(writer, (uint64_t)index);
+}
+
+/* Table des noms, dans l'ordre de leurs index */
+static int dump_key_table(DumpWriter *writer) {
+    if (dump_varint(writer, (uint64_t)PyDict_GET_SIZE(writer->keys)) < 0) {
+        return -1;
+    }
+    PyObject *key, *index;
+    Py_ssize_t pos = 0;
+    while (PyDict_Next(writer->keys, &pos, &key, &index)) {
+        Py_ssize_t size;
+        const char *utf8 = PyUnicode_AsUTF8AndSize(key, &size);
+        if (utf8 == NULL || dump_varint(writer, (uint64_t)size) < 0 || dump_bytes(writer, utf8, size) < 0) {
+            return -1;
+        }
+    }
+    return 0;
+}
+
+/* Nœud. Hors conteneur, ses sous-nœuds sont écrits avant lui et référencés par
+   leur position ; dans une liste ou un dict il est écrit d'un bloc. */
+static int dump_node(DumpWriter *writer, PyFastyBaseObject *node, PyTypeObject *type,
+                     int nested, size_t *record) {
+    PyObject *children = node->data;
+    if (PYFASTY_NODE_IS_LAZY(node) && (children = pyfasty_node_children(node)) == NULL) {
+        return -1;
+    }
+    Py_ssize_t count = children != NULL ? PyDict_GET_SIZE(children) : 0;
+    size_t *offsets = NULL;
+    PyObject *key, *child;
+    Py_ssize_t pos = 0;
+    Py_ssize_t i = 0;
+    int result = 0;
+    
+    if (!nested && count > 0) {
+        offsets = PyMem_Malloc(count * sizeof(size_t));
+        if (offsets == NULL) {
+            PyErr_NoMemory();
+            return -1;
+        }
+        while (result == 0 && i < count && PyDict_Next(children, &pos, &key, &child)) {
+            if (Py_TYPE(child) == type) {
+                if (Py_EnterRecursiveCall(" while dumping a registry")) {
+                    result = -1;
+                } else {
+                    result = dump_node(writer, (PyFastyBaseObject *)child, type, 0, &offsets[i]);
+                    Py_LeaveRecursiveCall();
+                }
+            }
+            i++;
+        }
+    }
+    
+    *record = dump_tell(writer);
+    if (result == 0) {
+        result = dump_byte(writer, DUMP_NODE);
+    }
+    if (result == 0) {
+        /* Nœud construit depuis un dict : la valeur se déduit des enfants */
+        result = (count > 0 && PyDict_CheckExact(node->value)) ?
+                 dump_byte(writer, DUMP_CHILDREN) : dump_entry(writer, node->value, type);
+    }
+    if (result == 0) {
+        result = dump_varint(writer, (uint64_t)count);
+    }
+    pos = 0;
+    i = 0;
+    while (result == 0 && i < count && PyDict_Next(children, &pos, &key, &child)) {
+        result = dump_key(writer, key, type);
+        if (result == 0 && offsets != NULL && Py_TYPE(child) == type) {
+            result = (dump_byte(writer, DUMP_NODEREF) < 0 ||
+                      dump_varint(writer, (uint64_t)(*record - offsets[i])) < 0) ? -1 : 0;
+        } else if (result == 0) {
+            result = dump_entry(writer, child, type);
+        }
+        i++;
+    }
+    PyMem_Free(offsets);
+    
+    if (result == 0 && i != count) {
+        PyErr_SetString(PyExc_RuntimeError, "registry changed size during dump");
+        return -1;
+    }
+    return result;
+}
+
+static int dump_entry(DumpWriter *writer, PyObject *obj, PyTypeObject *type) {
+    if (Py_EnterRecursiveCall(" while dumping a registry")) {
+        return -1;
+    }
+    
+    int result;
+    if (Py_TYPE(obj) == type) {
+        size_t record;
+        result = dump_node(writer, (PyFastyBaseObject *)obj, type, 1, &record);
+    } else if (Py_TYPE(obj) == &RegistryCounterType) {
+        RegistryCounterObject *counter = (RegistryCounterObject *)obj;
+        PyObject *total = counter_fold(counter, 0);
+        result = (total == NULL ||
+                  dump_byte(writer, DUMP_COUNTER) < 0 ||
+                  dump_byte(writer, (unsigned char)counter->is_float) < 0 ||
+                  dump_varint(writer, (uint64_t)counter->stripes) < 0 ||
+                  dump_value(writer, total, type) < 0) ? -1 : 0;
+        Py_XDECREF(total);
+    } else {
+        result = dump_value(writer, obj, type);
+    }
+    
+    Py_LeaveRecursiveCall();
+    return result;
+}
+
+/* Écriture de self et de son sous-arbre ; le fichier est supprimé en cas d'échec */
+PyObject *pyfasty_common_dump(PyObject *self, PyObject *path) {
+    PyObject *path_bytes;
+    if (!PyUnicode_FSConverter(path, &path_bytes)) {
+        return NULL;
+    }
+    
+    DumpWriter *writer = PyMem_Malloc(sizeof(DumpWriter));
+    if (writer == NULL) {
+        Py_DECREF(path_bytes);
+        return PyErr_NoMemory();
+    }
+    writer->len = 0;
+    writer->written = 0;
+    writer->keys = PyDict_New();
+    writer->fp = writer->keys != NULL ? fopen(PyBytes_AS_STRING(path_bytes), "wb") : NULL;
+    if (writer->fp == NULL) {
+        if (writer->keys != NULL) {
+            PyErr_SetFromErrnoWithFilenameObject(PyExc_OSError, path);
+        }
+        Py_XDECREF(writer->keys);
+        PyMem_Free(writer);
+        Py_DECREF(path_bytes);
+        return NULL;
+    }
+    
+    unsigned char header[DUMP_HEADER_SIZE] = {
+        DUMP_MAGIC[0], DUMP_MAGIC[1], DUMP_MAGIC[2], DUMP_MAGIC[3], DUMP_VERSION,
+        Py_TYPE(self) == &PyFastyRegistryType ? 'R' : 'C'
+    };
+    size_t root = 0;
+    int result = dump_bytes(writer, header, sizeof(header));
+    if (result == 0) {
+        result = dump_node(writer, (PyFastyBaseObject *)self, Py_TYPE(self), 0, &root);
+    }
+    size_t table = dump_tell(writer);
+    if (result == 0) {
+        result = dump_key_table(writer);
+    }
+    if (result == 0) {
+        result = (dump_u64(writer, root) < 0 || dump_u64(writer, table) < 0) ? -1 : 0;
+    }
+    if (result == 0) {
+        result = dump_flush(writer);
+    }
+    if (fclose(writer->fp) != 0 && result == 0) {
+        PyErr_SetFromErrnoWithFilenameObject(PyExc_OSError, path);
+        result = -1;
+    }
+    if (result < 0) {
+        remove(PyBytes_AS_STRING(path_bytes));
+    }
+    
+    Py_DECREF(writer->keys);
+    PyMem_Free(writer);
+    Py_DECREF(path_bytes);
+    if (result < 0) {
+        return NULL;
+    }
+    Py_RETURN_NONE;
+}
+
+/* Image d'un fichier dump() : contenu lu ou projeté en mémoire, et noms
+   d'enfants décodés à la demande. Les nœuds paresseux la gardent en vie. */
+typedef struct {
+    PyObject_HEAD
+    unsigned char *data;
+    size_t size;
+    int mapped;                /* 1 : projection mémoire, 0 : tampon PyMem_Raw */
+    size_t root;               /* Enregistrement du nœud racine */
+    size_t table;              /* Table des noms (fin des enregistrements) */
+    Py_ssize_t key_count;
+    size_t *key_offsets;       /* Position de chaque nom dans la table */
+    PyObject *keys;            /* Noms décodés et internés (None tant que non lus) */
+    PyTypeObject *type;
+    PyFastyObjectType obj_type;
+} DumpImageObject;
+
+/* Marqueur placé dans data d'un nœud paresseux : ses enfants sont dans
+   l'image (position children) ou dans le dict source d'un document JSON */
+typedef struct {
+    PyObject_HEAD
+    DumpImageObject *image;
+    PyObject *source;
+    size_t record;             /* Enregistrement du nœud (borne des renvois) */
+    size_t children;           /* Nombre d'enfants puis paires nom/entrée */
+} LazyChildrenObject;
+
+static void dump_release(unsigned char *data, size_t size, int mapped) {
+    if (data == NULL) {
+        return;
+    }
+    if (!mapped) {
+        PyMem_RawFree(data);
+        return;
+    }
+#ifdef PYFASTY_WINDOWS
+    (void)size;
+    UnmapViewOfFile(data);
+#else
+    munmap(data, size);
+#endif
+}
+
+static void dump_image_dealloc(DumpImageObject *self) {
+    dump_release(self->data, self->size, self->mapped);
+    PyMem_Free(self->key_offsets);
+    Py_XDECREF(self->keys);
+    PyObject_Del(self);
+}
+
+static PyTypeObject DumpImageType = {
+    PyVarObject_HEAD_INIT(NULL, 0)
+    .tp_name = "pyfasty._pyfasty.DumpImage",
+    .tp_doc = "Contents of a file written by dump()",
+    .tp_basicsize = sizeof(DumpImageObject),
+    .tp_itemsize = 0,
+    .tp_flags = Py_TPFLAGS_DEFAULT,
+    .tp_dealloc = (destructor)dump_image_dealloc,
+};
+
+static void lazy_children_dealloc(LazyChildrenObject *self) {
+    Py_XDECREF(self->image);
+    Py_XDECREF(self->source);
+    PyObject_Del(self);
+}
+
+static PyTypeObject LazyChildrenType = {
+    PyVarObject_HEAD_INIT(NULL, 0)
+    .tp_name = "pyfasty._pyfasty.LazyChildren",
+    .tp_doc = "Children of a lazily loaded node, read on first access",
+    .tp_basicsize = sizeof(LazyChildrenObject),
+    .tp_itemsize = 0,
+    .tp_flags = Py_TPFLAGS_DEFAULT,
+    .tp_dealloc = (destructor)lazy_children_dealloc,
+};
+
+static PyObject *lazy_children_new(DumpImageObject *image, PyObject *source,
+                                   size_t record, size_t children) {
+    LazyChildrenObject *lazy = PyObject_New(LazyChildrenObject, &LazyChildrenType);
+    if (lazy == NULL) {
+        return NULL;
+    }
+    Py_XINCREF(image);
+    Py_XINCREF(source);
+    lazy->image = image;
+    lazy->source = source;
+    lazy->record = record;
+    lazy->children = children;
+    return (PyObject *)lazy;
+}
+
+typedef struct {
+    DumpImageObject *image;
+    const unsigned char *pos;
+    const unsigned char *end;
+    const unsigned char *record;   /* Enregistrement en cours : les renvois pointent avant */
+    int lazy;                      /* Nœuds référencés laissés dans l'image */
+} DumpReader;
+
+static PyObject *dump_corrupted(void) {
+    PyErr_SetString(PyExc_ValueError, "Corrupted or truncated registry dump");
+    return NULL;
+}
+
+static int read_varint(DumpReader *reader, uint64_t *value) {
+    *value = 0;
+    for (int shift = 0; shift < 64; shift += 7) {
+        if (reader->pos >= reader->end) {
+            dump_corrupted();
+            return -1;
+        }
+        unsigned char byte = *reader->pos++;
+        *value |= (uint64_t)(byte & 0x7F) << shift;
+        if (!(byte & 0x80)) {
+            return 0;
+        }
+    }
+    dump_corrupted();
+    return -1;
+}
+
+/* Longueur ou nombre d'éléments : jamais plus que les octets restants */
+static int read_size(DumpReader *reader, Py_ssize_t *size) {
+    uint64_t value;
+    if (read_varint(reader, &value) < 0) {
+        return -1;
+    }
+    if (value > (uint64_t)(reader->end - reader->pos)) {
+        dump_corrupted();
+        return -1;
+    }
+    *size = (Py_ssize_t)value;
+    return 0;
+}
+
+/* Nom d'enfant décodé à sa première lecture, puis partagé (interné) */
+static PyObject *read_key(DumpImageObject *image, uint64_t index) {
+    if (index >= (uint64_t)image->key_count) {
+        return dump_corrupted();
+    }
+    PyObject *key = PyList_GET_ITEM(image->keys, (Py_ssize_t)index);
+    if (key == Py_None) {
+        DumpReader reader = {image, image->data + image->key_offsets[index],
+                             image->data + image->size, NULL, 0};
+        Py_ssize_t size;
+        if (read_size(&reader, &size) < 0) {
+            return NULL;
+        }
+        key = PyUnicode_DecodeUTF8((const char *)reader.pos, size, NULL);
+        if (key == NULL) {
+            return NULL;
+        }
+        PyUnicode_InternInPlace(&key);
+        PyList_SetItem(image->keys, (Py_ssize_t)index, key);
+    }
+    Py_INCREF(key);
+    return key;
+}
+
+static PyObject *read_entry(DumpReader *reader, int depth);
+
+/* Valeur d'un nœud en tête d'enregistrement ; *view si elle se déduit des enfants */
+static PyObject *read_node_value(DumpReader *reader, int depth, int *view) {
+    *view = reader->pos < reader->end && *reader->pos == DUMP_CHILDREN;
+    if (*view) {
+        reader->pos++;
+        Py_RETURN_NONE;
+    }
+    return read_entry(reader, depth + 1);
+}
+
+/* Valeur dict d'un nœud construit depuis un dict : sous-nœuds par leur valeur */
+static PyObject *node_children_view(PyObject *children, PyTypeObject *type) {
+    PyObject *view = PyDict_New();
+    PyObject *key, *child;
+    Py_ssize_t pos = 0;
+    while (view != NULL && PyDict_Next(children, &pos, &key, &child)) {
+        PyObject *item = Py_TYPE(child) == type ? ((PyFastyBaseObject *)child)->value : child;
+        if (PyDict_SetItem(view, key, item) < 0) {
+            Py_CLEAR(view);
+        }
+    }
+    return view;
+}
+
+static PyObject *read_node(DumpReader *reader, int depth) {
+    int view;
+    PyObject *value = read_node_value(reader, depth, &view);
+    if (value == NULL) {
+        return NULL;
+    }
+    PyFastyBaseObject *node = (PyFastyBaseObject *)pyfasty_base_create(
+        reader->image->type, reader->image->obj_type, depth, NULL);
+    if (node == NULL) {
+        Py_DECREF(value);
+        return NULL;
+    }
+    Py_SETREF(node->value, value);
+    
+    Py_ssize_t count;
+    if (read_size(reader, &count) < 0) {
+        Py_DECREF(node);
+        return NULL;
+    }
+    PyObject *children = count > 0 ? pyfasty_node_children(node) : NULL;
+    for (Py_ssize_t i = 0; i < count; i++) {
+        PyObject *key = read_entry(reader, depth + 1);
+        PyObject *child = key != NULL ? read_entry(reader, depth + 1) : NULL;
+        if (child == NULL || children == NULL) {
+            Py_XDECREF(key);
+            Py_XDECREF(child);
+            Py_DECREF(node);
+            return NULL;
+        }
+        int result = PyDict_SetItem(children, key, child);
+        Py_DECREF(key);
+        Py_DECREF(child);
+        if (result < 0) {
+            Py_DECREF(node);
+            return NULL;
+        }
+    }
+    
+    if (view && children != NULL) {
+        value = node_children_view(children, reader->image->type);
+        if (value == NULL) {
+            Py_DECREF(node);
+            return NULL;
+        }
+        Py_SETREF(node->value, value);
+    }
+    return (PyObject *)node;
+}
+
+/* Nœud laissé dans l'image : seule sa valeur est lue, ses enfants le seront à
+   son premier accès. Une valeur dict (vue des enfants) demanderait de lire tout
+   le sous-arbre : le nœud paresseux n'en a pas, str() affiche ses enfants. */
+static PyObject *read_lazy_node(DumpReader *reader, int depth) {
+    int view;
+    PyObject *value = read_node_value(reader, depth, &view);
+    if (value == NULL) {
+        return NULL;
+    }
+    size_t children = reader->pos - reader->image->data;
+    Py_ssize_t count;
+    if (read_size(reader, &count) < 0) {
+        Py_DECREF(value);
+        return NULL;
+    }
+    PyFastyBaseObject *node = (PyFastyBaseObject *)pyfasty_base_create(
+        reader->image->type, reader->image->obj_type, depth, NULL);
+    if (node == NULL) {
+        Py_DECREF(value);
+        return NULL;
+    }
+    Py_SETREF(node->value, value);
+    
+    if (count > 0) {
+        node->data = lazy_children_new(reader->image, NULL,
+                                       reader->record - reader->image->data, children);
+        if (node->data == NULL) {
+            Py_DECREF(node);
+            return NULL;
+        }
+    }
+    return (PyObject *)node;
+}
+
+/* Enregistrement référencé : toujours écrit avant l'enregistrement courant, ce
+   qui borne la lecture et exclut les cycles dans un fichier corrompu */
+static PyObject *read_record(DumpReader *reader, uint64_t distance, int depth) {
+    const unsigned char *data = reader->image->data;
+    if (distance == 0 || distance > (uint64_t)(reader->record - data - DUMP_HEADER_SIZE) ||
+        *(reader->record - distance) != DUMP_NODE) {
+        return dump_corrupted();
+    }
+    const unsigned char *pos = reader->pos;
+    const unsigned char *record = reader->record;
+    reader->record = record - distance;
+    reader->pos = reader->record + 1;
+    PyObject *node = reader->lazy ? read_lazy_node(reader, depth) : read_node(reader, depth);
+    reader->pos = pos;
+    reader->record = record;
+    return node;
+}
+
+static PyObject *read_sequence(DumpReader *reader, int depth, int is_list) {
+    Py_ssize_t count;
+    if (read_size(reader, &count) < 0) {
+        return NULL;
+    }
+    PyObject *items = is_list ? PyList_New(count) : PyTuple_New(count);
+    if (items == NULL) {
+        return NULL;
+    }
+    for (Py_ssize_t i = 0; i < count; i++) {
+        PyObject *item = read_entry(reader, depth);
+        if (item == NULL) {
+            Py_DECREF(items);
+            return NULL;
+        }
+        if (is_list) {
+            PyList_SET_ITEM(items, i, item);
+        } else {
+            PyTuple_SET_ITEM(items, i, item);
+        }
+    }
+    return items;
+}
+
+static PyObject *read_dict(DumpReader *reader, int depth) {
+    Py_ssize_t count;
+    if (read_size(reader, &count) < 0) {
+        return NULL;
+    }
+    PyObject *dict = PyDict_New();
+    for (Py_ssize_t i = 0; i < count && dict != NULL; i++) {
+        PyObject *key = read_entry(reader, depth);
+        PyObject *item = key != NULL ? read_entry(reader, depth) : NULL;
+        if (item == NULL || PyDict_SetItem(dict, key, item) < 0) {
+            Py_CLEAR(dict);
+        }
+        Py_XDECREF(key);
+        Py_XDECREF(item);
+    }
+    return dict;
+}
+
+static PyObject *read_counter(DumpReader *reader, int depth) {
+    uint64_t stripes;
+    if (reader->pos >= reader->end) {
+        return dump_corrupted();
+    }
+    reader->pos++;  /* is_float : déduit du type de la valeur */
+    if (read_varint(reader, &stripes) < 0) {
+        return NULL;
+    }
+    PyObject *total = read_entry(reader, depth);
+    if (total == NULL || reader->image->type != &PyFastyRegistryType) {
+        return total;
+    }
+    if (stripes < 1 || stripes > REGISTRY_COUNTER_MAX_STRIPES ||
+        (!PyLong_Check(total) && !PyFloat_Check(total))) {
+        Py_DECREF(total);
+        return dump_corrupted();
+    }
+    PyObject *counter = registry_counter_new(total, (int)stripes);
+    Py_DECREF(total);
+    return counter;
+}
+
+static PyObject *read_entry(DumpReader *reader, int depth) {
+    if (reader->pos >= reader->end) {
+        return dump_corrupted();
+    }
+    if (Py_EnterRecursiveCall(" while loading a registry")) {
+        return NULL;
+    }
+    
+    PyObject *result = NULL;
+    Py_ssize_t size;
+    uint64_t bits;
+    unsigned char tag = *reader->pos++;
+    switch (tag) {
+        case DUMP_NONE:
+            result = Py_None;
+            Py_INCREF(result);
+            break;
+        case DUMP_FALSE:
+        case DUMP_TRUE:
+            result = PyBool_FromLong(tag == DUMP_TRUE);
+            break;
+        case DUMP_INT:
+            if (read_varint(reader, &bits) == 0) {
+                result = PyLong_FromLongLong((long long)((bits >> 1) ^ (~(bits & 1) + 1)));
+            }
+            break;
+        case DUMP_BIGINT:
+            if (read_size(reader, &size) == 0) {
+                PyObject *text = PyUnicode_DecodeASCII((const char *)reader->pos, size, NULL);
+                reader->pos += size;
+                if (text != NULL) {
+                    result = PyLong_FromUnicodeObject(text, 10);
+                    Py_DECREF(text);
+                }
+            }
+            break;
+        case DUMP_FLOAT:
+            if (reader->end - reader->pos < 8) {
+                dump_corrupted();
+                break;
+            }
+            bits = 0;
+            for (int i = 0; i < 8; i++) {
+                bits |= (uint64_t)reader->pos[i] << (8 * i);
+            }
+            reader->pos += 8;
+            {
+                double number;
+                memcpy(&number, &bits, sizeof(number));
+                result = PyFloat_FromDouble(number);
+            }
+            break;
+        case DUMP_STR:
+            if (read_size(reader, &size) == 0) {
+                result = PyUnicode_DecodeUTF8((const char *)reader->pos, size, NULL);
+                reader->pos += size;
+            }
+            break;
+        case DUMP_BYTES:
+            if (read_size(reader, &size) == 0) {
+                result = PyBytes_FromStringAndSize((const char *)reader->pos, size);
+                reader->pos += size;
+            }
+            break;
+        case DUMP_LIST:
+        case DUMP_TUPLE:
+            result = read_sequence(reader, depth, tag == DUMP_LIST);
+            break;
+        case DUMP_DICT:
+            result = read_dict(reader, depth);
+            break;
+        case DUMP_NODE:
+            result = read_node(reader, depth);
+            break;
+        case DUMP_COUNTER:
+            result = read_counter(reader, depth);
+            break;
+        case DUMP_KEYREF:
+            if (read_varint(reader, &bits) == 0) {
+                result = read_key(reader->image, bits);
+            }
+            break;
+        case DUMP_NODEREF:
+            if (read_varint(reader, &bits) == 0) {
+                result = read_record(reader, bits, depth);
+            }
+            break;
+        default:
+            dump_corrupted();
+            break;
+    }
+    
+    Py_LeaveRecursiveCall();
+    return result;
+}
+
+/* Image validée (en-tête, pied de page, table des noms) ; prend possession de data */
+static DumpImageObject *dump_image_new(unsigned char *data, size_t size, int mapped, PyObject *path,
+                                       PyTypeObject *type, PyFastyObjectType obj_type) {
+    DumpImageObject *image = PyObject_New(DumpImageObject, &DumpImageType);
+    if (image == NULL) {
+        dump_release(data, size, mapped);
+        return NULL;
+    }
+    image->data = data;
+    image->size = size;
+    image->mapped = mapped;
+    image->key_count = 0;
+    image->key_offsets = NULL;
+    image->keys = NULL;
+    image->type = type;
+    image->obj_type = obj_type;
+    
+    if (size < DUMP_HEADER_SIZE + DUMP_FOOTER_SIZE || memcmp(data, DUMP_MAGIC, 4) != 0) {
+        PyErr_Format(PyExc_ValueError, "%R is not a pyfasty dump", path);
+        goto error;
+    }
+    if (data[4] != DUMP_VERSION) {
+        PyErr_Format(PyExc_ValueError, "Unsupported pyfasty dump version %d", data[4]);
+        goto error;
+    }
+    
+    const unsigned char *footer = data + size - DUMP_FOOTER_SIZE;
+    uint64_t root = 0;
+    uint64_t table = 0;
+    for (int i = 0; i < 8; i++) {
+        root |= (uint64_t)footer[i] << (8 * i);
+        table |= (uint64_t)footer[8 + i] << (8 * i);
+    }
+    if (root < DUMP_HEADER_SIZE || root >= table || table > size - DUMP_FOOTER_SIZE ||
+        data[root] != DUMP_NODE) {
+        dump_corrupted();
+        goto error;
+    }
+    image->root = (size_t)root;
+    image->table = (size_t)table;
+    
+    /* Position de chaque nom : décodage différé à sa première lecture */
+    DumpReader reader = {image, data + table, footer, NULL, 0};
+    if (read_size(&reader, &image->key_count) < 0) {
+        goto error;
+    }
+    image->key_offsets = PyMem_Malloc((image->key_count > 0 ? image->key_count : 1) * sizeof(size_t));
+    image->keys = PyList_New(image->key_count);
+    if (image->key_offsets == NULL || image->keys == NULL) {
+        if (!PyErr_Occurred()) {
+            PyErr_NoMemory();
+        }
+        goto error;
+    }
+    for (Py_ssize_t i = 0; i < image->key_count; i++) {
+        Py_ssize_t length;
+        image->key_offsets[i] = reader.pos - data;
+        if (read_size(&reader, &length) < 0) {
+            goto error;
+        }
+        reader.pos += length;
+        Py_INCREF(Py_None);
+        PyList_SET_ITEM(image->keys, i, Py_None);
+    }
+    if (reader.pos != footer) {
+        dump_corrupted();
+        goto error;
+    }
+    return image;
+
+error:
+    Py_DECREF(image);
+    return NULL;
+}
+
+/* Nœud racine de l'image, complet ou paresseux */
+static PyObject *dump_image_root(DumpImageObject *image, int depth, int lazy) {
+    const unsigned char *table = image->data + image->table;
+    DumpReader reader = {image, table, table, table, lazy};
+    return read_record(&reader, image->table - image->root, depth);
+}
+
+/* Nœud d'un sous-dict JSON : valeur = le dict, comme pyfasty_base_create,
+   mais enfants créés à son premier accès */
+static PyObject *lazy_dict_node(PyTypeObject *type, PyFastyObjectType obj_type, int depth,
+                                PyObject *dict) {
+    PyFastyBaseObject *node = (PyFastyBaseObject *)pyfasty_base_create(type, obj_type, depth, NULL);
+    if (node == NULL) {
+        return NULL;
+    }
+    Py_INCREF(dict);
+    Py_SETREF(node->value, dict);
+    if (PyDict_GET_SIZE(dict) > 0) {
+        node->data = lazy_children_new(NULL, dict, 0, 0);
+        if (node->data == NULL) {
+            Py_DECREF(node);
+            return NULL;
+        }
+    }
+    return (PyObject *)node;
+}
+
+/* Ouverture d'un nœud paresseux : ses enfants directs sont créés, ses
+   sous-nœuds restent dans l'image (ou le document) jusqu'à leur propre accès */
+static PyObject *node_materialize(PyFastyBaseObject *node) {
+    LazyChildrenObject *lazy = (LazyChildrenObject *)node->data;
+    PyTypeObject *type = Py_TYPE(node);
+    PyObject *children = pyfasty_dict_pool_get();
+    if (children == NULL) {
+        return NULL;
+    }
+    Py_INCREF(lazy);
+    
+    int result = 0;
+    if (lazy->image == NULL) {
+        PyFastyObjectType obj_type = type == &PyFastyRegistryType ? PYFASTY_REGISTRY_TYPE : PYFASTY_CONFIG_TYPE;
+        PyObject *key, *item;
+        Py_ssize_t pos = 0;
+        while (result == 0 && PyDict_Next(lazy->source, &pos, &key, &item)) {
+            if (!PyUnicode_Check(key)) {
+                continue;
+            }
+            PyObject *child = item;
+            if (PyDict_Check(item)) {
+                child = lazy_dict_node(type, obj_type, node->depth + 1, item);
+            } else {
+                Py_INCREF(child);
+            }
+            result = child != NULL ? PyDict_SetItem(children, key, child) : -1;
+            Py_XDECREF(child);
+        }
+    } else {
+        DumpImageObject *image = lazy->image;
+        DumpReader reader = {image, image->data + lazy->children, image->data + image->table,
+                             image->data + lazy->record, 1};
+        Py_ssize_t count;
+        result = read_size(&reader, &count);
+        for (Py_ssize_t i = 0; i < count && result == 0; i++) {
+            PyObject *key = read_entry(&reader, node->depth + 1);
+            PyObject *child = key != NULL ? read_entry(&reader, node->depth + 1) : NULL;
+            result = child != NULL ? PyDict_SetItem(children, key, child) : -1;
+            Py_XDECREF(key);
+            Py_XDECREF(child);
+        }
+    }
+    
+    if (result < 0) {
+        pyfasty_dict_pool_return(children);
+    } else if (node->data == (PyObject *)lazy) {
+        node->data = children;
+        Py_DECREF(lazy);
+    } else {
+        /* Ouvert entre-temps (finaliseur exécuté pendant la lecture) */
+        pyfasty_dict_pool_return(children);
+    }
+    Py_DECREF(lazy);
+    return result < 0 ? NULL : node->data;
+}
+
+/* Lecture du fichier en un bloc (GIL relâché) */
+static unsigned char *dump_read_file(PyObject *path, size_t *size) {
+    PyObject *path_bytes;
+    if (!PyUnicode_FSConverter(path, &path_bytes)) {
+        return NULL;
+    }
+    FILE *fp = fopen(PyBytes_AS_STRING(path_bytes), "rb");
+    Py_DECREF(path_bytes);
+    if (fp == NULL) {
+        PyErr_SetFromErrnoWithFilenameObject(PyExc_OSError, path);
+        return NULL;
+    }
+    
+    size_t capacity = DUMP_BUFFER_SIZE;
+    size_t length = 0;
+    unsigned char *buffer = PyMem_RawMalloc(capacity);
+    int failed = buffer == NULL;
+    Py_BEGIN_ALLOW_THREADS
+    while (!failed) {
+        if (length == capacity) {
+            unsigned char *grown = PyMem_RawRealloc(buffer, capacity * 2);
+            if (grown == NULL) {
+                failed = 1;
+                break;
+            }
+            buffer = grown;
+            capacity *= 2;
+        }
+        size_t count = fread(buffer + length, 1, capacity - length, fp);
+        length += count;
+        if (count == 0) {
+            failed = ferror(fp) ? 2 : 0;
+            break;
+        }
+    }
+    fclose(fp);
+    Py_END_ALLOW_THREADS
+    
+    if (failed) {
+        PyMem_RawFree(buffer);
+        if (failed == 2) {
+            PyErr_SetFromErrnoWithFilenameObject(PyExc_OSError, path);
+        } else {
+            PyErr_NoMemory();
+        }
+        return NULL;
+    }
+    *size = length;
+    return buffer;
+}
+
+/* Projection du fichier en lecture seule : les pages ne sont chargées qu'au
+   premier accès (NULL sans exception pour un fichier vide) */
+static unsigned char *dump_map_file(PyObject *path, size_t *size) {
+    PyObject *path_bytes;
+    if (!PyUnicode_FSConverter(path, &path_bytes)) {
+        return NULL;
+    }
+    unsigned char *data = NULL;
+    *size = 0;
+
+#ifdef PYFASTY_WINDOWS
+    HANDLE file = CreateFileA(PyBytes_AS_STRING(path_bytes), GENERIC_READ, FILE_SHARE_READ, NULL,
+                              OPEN_EXISTING, FILE_ATTRIBUTE_NORMAL, NULL);
+    Py_DECREF(path_bytes);
+    int failed = file == INVALID_HANDLE_VALUE;
+    DWORD error = failed ? GetLastError() : 0;
+    if (!failed) {
+        LARGE_INTEGER length;
+        failed = !GetFileSizeEx(file, &length);
+        if (!failed && length.QuadPart > 0) {
+            HANDLE mapping = CreateFileMappingA(file, NULL, PAGE_READONLY, 0, 0, NULL);
+            data = mapping != NULL ? MapViewOfFile(mapping, FILE_MAP_READ, 0, 0, 0) : NULL;
+            failed = data == NULL;
+            if (mapping != NULL) {
+                CloseHandle(mapping);
+            }
+            *size = (size_t)length.QuadPart;
+        }
+        error = failed ? GetLastError() : 0;
+        CloseHandle(file);
+    }
+    if (failed) {
+        PyErr_SetExcFromWindowsErrWithFilenameObject(PyExc_OSError, (int)error, path);
+        return NULL;
+    }
+#else
+    int fd = open(PyBytes_AS_STRING(path_bytes), O_RDONLY);
+    Py_DECREF(path_bytes);
+    struct stat info;
+    int failed = fd < 0 || fstat(fd, &info) != 0;
+    if (!failed && info.st_size > 0) {
+        void *mapping = mmap(NULL, (size_t)info.st_size, PROT_READ, MAP_PRIVATE, fd, 0);
+        failed = mapping == MAP_FAILED;
+        if (!failed) {
+            data = mapping;
+            *size = (size_t)info.st_size;
+        }
+    }
+    int error = errno;
+    if (fd >= 0) {
+        close(fd);
+    }
+    if (failed) {
+        errno = error;
+        PyErr_SetFromErrnoWithFilenameObject(PyExc_OSError, path);
+        return NULL;
+    }
+#endif
+    return data;
+}
+
+/* Document JSON : le dict racine est lu par le module json ; en mode paresseux
+   les sous-dicts ne deviennent des nœuds qu'à leur premier accès */
+static PyObject *json_load_node(const unsigned char *data, size_t size, int lazy, int depth,
+                                PyTypeObject *type, PyFastyObjectType obj_type) {
+    PyObject *json = PyImport_ImportModule("json");
+    if (json == NULL) {
+        return NULL;
+    }
+    PyObject *text = PyBytes_FromStringAndSize((const char *)data, (Py_ssize_t)size);
+    PyObject *document = text != NULL ? PyObject_CallMethod(json, "loads", "O", text) : NULL;
+    Py_DECREF(json);
+    Py_XDECREF(text);
+    if (document == NULL) {
+        return NULL;
+    }
+    if (!PyDict_Check(document)) {
+        Py_DECREF(document);
+        PyErr_SetString(PyExc_TypeError, "Configuration must be a dictionary");
+        return NULL;
+    }
+    
+    PyObject *node = lazy ? lazy_dict_node(type, obj_type, depth, document)
+                          : pyfasty_base_create(type, obj_type, depth, document);
+    Py_DECREF(document);
+    return node;
+}
+
+/* Échange du contenu : l'ancien part avec l'objet temporaire */
+static PyObject *node_replace(PyFastyBaseObject *base, PyObject *loaded, PyFastyObjectType obj_type) {
+    PyFastyBaseObject *source = (PyFastyBaseObject *)loaded;
+    if (node_touch(base) < 0) {
+        Py_DECREF(loaded);
+        return NULL;
+    }
+    PyObject *data = base->data;
+    PyObject *value = base->value;
+    base->data = source->data;
+    base->value = source->value;
+    source->data = data;
+    source->value = value;
+    Py_DECREF(loaded);
+    g_structure_version++;
+    if (g_index_count != 0) {
+        index_on_replace(base);
+    }
+    if (g_cache_count != 0 && cache_on_replace(base) < 0) {
+        return NULL;
+    }
+    
+    pyfasty_trigger_sync_events_with_module(obj_type == PYFASTY_CONFIG_TYPE ? MODULE_CONFIG : MODULE_REGISTRY);
+    Py_RETURN_NONE;
+}
+
+/* Remplacement de la valeur et des enfants de self par le contenu du fichier ;
+   self n'est modifié que si tout le fichier a été relu */
+PyObject *pyfasty_common_load(PyObject *self, PyObject *path, PyTypeObject *type,
+                              PyFastyObjectType obj_type) {
+    size_t size;
+    unsigned char *buffer = dump_read_file(path, &size);
+    if (buffer == NULL) {
+        return NULL;
+    }
+    DumpImageObject *image = dump_image_new(buffer, size, 0, path, type, obj_type);
+    if (image == NULL) {
+        return NULL;
+    }
+    PyObject *loaded = dump_image_root(image, ((PyFastyBaseObject *)self)->depth, 0);
+    Py_DECREF(image);
+    if (loaded == NULL) {
+        return NULL;
+    }
+    return node_replace((PyFastyBaseObject *)self, loaded, obj_type);
+}
+
+/* load_file(path, lazy) : image dump() ou document JSON. En mode paresseux
+   l'image est projetée en mémoire et chaque nœud n'est créé qu'à son premier
+   accès : temps de chargement et mémoire suivent ce qui est lu, pas la taille
+   du fichier. */
+PyObject *pyfasty_common_load_file(PyObject *self, PyObject *path, int lazy,
+                                   PyTypeObject *type, PyFastyObjectType obj_type) {
+    size_t size = 0;
+    unsigned char *data = lazy ? dump_map_file(path, &size) : dump_read_file(path, &size);
+    if (data == NULL && PyErr_Occurred()) {
+        return NULL;
+    }
+    
+    int depth = ((PyFastyBaseObject *)self)->depth;
+    PyObject *loaded;
+    if (size >= 4 && memcmp(data, DUMP_MAGIC, 4) == 0) {
+        DumpImageObject *image = dump_image_new(data, size, lazy, path, type, obj_type);
+        if (image == NULL) {
+            return NULL;
+        }
+        loaded = dump_image_root(image, depth, lazy);
+        Py_DECREF(image);
+    } else {
+        loaded = json_load_node(data, size, lazy, depth, type, obj_type);
+        dump_release(data, size, lazy);
+    }
+    if (loaded == NULL) {
+        return NULL;
+    }
+    return node_replace((PyFastyBaseObject *)self, loaded, obj_type);
+}
+
+static PyObject *registry_dump_method(PyObject *self, PyObject *path) {
+    return pyfasty_common_dump(self, path);
+}
+
+static PyObject *registry_load_method(PyObject *self, PyObject *path) {
+    return pyfasty_common_load(self, path, &PyFastyRegistryType, PYFASTY_REGISTRY_TYPE);
+}
+
+/* Méthode batch() : gestionnaire de contexte regroupant les événements des écritures */
+static PyObject *registry_batch_method(PyObject *self, PyObject *Py_UNUSED(ignored)) {
+    return pyfasty_event_batch_new();
+}
+
+/* Écrire une valeur à un chemin 'a.b.c' relatif à self (clés non str : accès par index) */
+static int registry_set_path(PyObject *self, PyObject *key, PyObject *value) {
+    if (!PyUnicode_Check(key)) {
+        return registry_set_item(self, key, value);
+    }
+    
+    /* Chemin simple : écriture directe */
+    if (PyUnicode_FindChar(key, '.', 0, PyUnicode_GET_LENGTH(key), 1) == -1) {
+        return PyObject_SetAttr(self, key, value);
+    }
+    
+    PyObject *separator = PyUnicode_FromString(".");
+    if (separator == NULL) {
+        return -1;
+    }
+    PyObject *parts = PyUnicode_Split(key, separator, -1);
+    Py_DECREF(separator);
+    if (parts == NULL) {
+        return -1;
+    }
+    
+    Py_ssize_t count = PyList_GET_SIZE(parts);
+    PyObject *node = self;
+    Py_INCREF(node);
+    
+    /* Parcourir les nœuds intermédiaires (création automatique) */
+    for (Py_ssize_t i = 0; i < count - 1 && node != NULL; i++) {
+        PyObject *next = PyObject_GetAttr(node, PyList_GET_ITEM(parts, i));
+        Py_DECREF(node);
+        node = next;
+    }
+    
+    int result = -1;
+    if (node != NULL) {
+        result = PyObject_SetAttr(node, PyList_GET_ITEM(parts, count - 1), value);
+        Py_DECREF(node);
+    }
+    
+    Py_DECREF(parts);
+    return result;
+}
+
+/* Méthode update_many({...}) : toutes les écritures, puis une seule évaluation des événements */
+static PyObject *registry_update_many_method(PyObject *self, PyObject *mapping) {
+    PyObject *items = PyMapping_Items(mapping);
+    if (items == NULL) {
+        return NULL;
+    }
+    
+    int failed = 0;
+    pyfasty_event_batch_begin();
+    for (Py_ssize_t i = 0; i < PyList_GET_SIZE(items); i++) {
+        PyObject *item = PyList_GET_ITEM(items, i);
+        if (registry_set_path(self, PyTuple_GET_ITEM(item, 0), PyTuple_GET_ITEM(item, 1)) < 0) {
+            failed = 1;
+            break;
+        }
+    }
+    
+    /* L'erreur éventuelle est mise de côté le temps de l'évaluation */
+    PyObject *type, *value, *traceback;
+    PyErr_Fetch(&type, &value, &traceback);
+    pyfasty_event_batch_end();
+    PyErr_Restore(type, value, traceback);
+    
+    Py_DECREF(items);
+    if (failed || PyErr_Occurred()) {
+        return NULL;
+    }
+    Py_RETURN_NONE;
+}
+
+/* Fonction helper générique pour les méthodes d'opérations binaires */
+static PyObject *registry_binary_op_method(PyObject *self, PyObject *args, 
+                                        PyObject *(*op_func)(PyObject*, PyObject*),
+                                        const char *name) {
+    PyObject *other;
+    
+    if (!PyArg_ParseTuple(args, "O", &other))
+        return NULL;
+    
+    /* Déléguer à la fonction spécifique */
+    return op_func(self, other);
+}
+
+/* Méthode pour l'opération &= (AND) */
+static PyObject *registry_bitwise_and_method(PyObject *self, PyObject *args) {
+    return registry_binary_op_method(self, args, registry_inplace_and, "bitwise_and");
+}
+
+/* Méthode pour l'opération |= (OR) */
+static PyObject *registry_bitwise_or_method(PyObject *self, PyObject *args) {
+    return registry_binary_op_method(self, args, registry_inplace_or, "bitwise_or");
+}
+
+/* Méthode pour l'opération //= (division entière) */
+static PyObject *registry_floor_divide_method(PyObject *self, PyObject *args) {
+    return registry_binary_op_method(self, args, registry_inplace_floor_divide, "floor_divide");
+}
+
+/* Méthode pour l'opération ^= (XOR) */
+static PyObject *registry_xor_method(PyObject *self, PyObject *args) {
+    return registry_binary_op_method(self, args, registry_inplace_xor, "xor");
+}
+
+/* Méthode pour l'opération <<= (LSHIFT) */
+static PyObject *registry_lshift_method(PyObject *self, PyObject *args) {
+    return registry_binary_op_method(self, args, registry_inplace_lshift, "lshift");
+}
+
+/* Méthode pour l'opération >>= (RSHIFT) */
+static PyObject *registry_rshift_method(PyObject *self, PyObject *args) {
+    return registry_binary_op_method(self, args, registry_inplace_rshift, "rshift");
+}
+
+/* Méthode pour l'opération @= (MATRIX_MULTIPLY) */
+static PyObject *registry_matrix_multiply_method(PyObject *self, PyObject *args) {
+    return registry_binary_op_method(self, args, registry_inplace_matrix_multiply, "matrix_multiply");
+}
+
+/* Globals */
+static PyObject *g_registry = NULL;
+
+/* Fonction helper générique pour les opérations binaires au niveau du module */
+static PyObject *pyfasty_binary_op(PyObject *self, PyObject *args, 
+                                PyObject *(*op_func)(PyObject*, PyObject*)) {
+    PyObject *registry_obj;
+    PyObject *value;
+    
+    if (!PyArg_ParseTuple(args, "OO", &registry_obj, &value))
+        return NULL;
+    
+    /* Vérifier que le premier argument est un Registry */
+    if (!PyObject_TypeCheck(registry_obj, &PyFastyRegistryType)) {
+        PyErr_SetString(PyExc_TypeError, "First argument must be a Registry object");
+        return NULL;
+    }
+    
+    return op_func(registry_obj, value);
+}
+
+/* Bitwise AND function */
+static PyObject *pyfasty_bitwise_and(PyObject *self, PyObject *args) {
+    return pyfasty_binary_op(self, args, registry_inplace_and);
+}
+
+/* Bitwise OR function */
+static PyObject *pyfasty_bitwise_or(PyObject *self, PyObject *args) {
     return pyfasty_binary_op(self, args, registry_inplace_or);
 }
 
@@ -2086,6 +6135,49 @@ int PyFasty_Registry_Init(PyObject *module) {
         return -1;
     }
     
+    /* STEP 2b: Compiled path handles and atomic counters (compile_path, counter) */
+    if (PyType_Ready(&RegistryPathType) < 0) {
+        return -1;
+    }
+    Py_INCREF(&RegistryPathType);
+    if (PyModule_AddObject(module, "RegistryPath", (PyObject *)&RegistryPathType) < 0) {
+        Py_DECREF(&RegistryPathType);
+        return -1;
+    }
+    
+    if (PyType_Ready(&RegistryCounterType) < 0) {
+        return -1;
+    }
+    Py_INCREF(&RegistryCounterType);
+    if (PyModule_AddObject(module, "RegistryCounter", (PyObject *)&RegistryCounterType) < 0) {
+        Py_DECREF(&RegistryCounterType);
+        return -1;
+    }
+    
+    if (PyType_Ready(&RegistryCacheType) < 0) {
+        return -1;
+    }
+    Py_INCREF(&RegistryCacheType);
+    if (PyModule_AddObject(module, "RegistryCache", (PyObject *)&RegistryCacheType) < 0) {
+        Py_DECREF(&RegistryCacheType);
+        return -1;
+    }
+    
+    /* Instantanés (snapshot) : vue publique, état partagé interne */
+    if (PyType_Ready(&RegistrySnapshotStateType) < 0 || PyType_Ready(&RegistrySnapshotType) < 0) {
+        return -1;
+    }
+    Py_INCREF(&RegistrySnapshotType);
+    if (PyModule_AddObject(module, "RegistrySnapshot", (PyObject *)&RegistrySnapshotType) < 0) {
+        Py_DECREF(&RegistrySnapshotType);
+        return -1;
+    }
+    
+    /* Images dump()/load_file() et enfants des nœuds paresseux (types internes) */
+    if (PyType_Ready(&DumpImageType) < 0 || PyType_Ready(&LazyChildrenType) < 0) {
+        return -1;
+    }
+    
     /* STEP 3: Create THE singleton global registry instance */
     /* This is what users access as: pyfasty.registry.counter */
     g_registry = registry_create(0, NULL);
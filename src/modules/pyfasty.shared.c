@@ -0,0 +1,1158 @@
+/*
+ * ================================================================================
+ * PYFASTY SHARED REGISTRY - MULTI-PROCESS REGISTRY IN SHARED MEMORY
+ * ================================================================================
+ *
+ * OVERVIEW:
+ * pyfasty.SharedRegistry(name, size) maps a named shared-memory segment
+ * (shm_open on POSIX, named file mapping on Windows). Every process opening the
+ * same name sees the same primitive leaves (None, bool, int, float, str, bytes).
+ *
+ * LAYOUT:
+ * - Header: magic, size, capacity, writer lock (holder pid and start time),
+ *   slot being written
+ * - Slots: open-addressing hash table keyed by the full dotted path; each slot
+ *   stores its key and value inline (no pointer into the segment). Deleted
+ *   slots are reused by later inserts, and emptied when nothing probes past them
+ *
+ * CONCURRENCY:
+ * - Writers serialise on the header lock; a lock held by a dead process is taken
+ *   over and the half-written slot is repaired. The holder is identified by its
+ *   pid and start time, so a pid reused by another process is not mistaken for it
+ * - Each slot carries a seqlock: readers never lock, they copy the slot and retry
+ *   while a write is in progress
+ *
+ * USAGE EXAMPLES:
+ * shared = pyfasty.SharedRegistry("app", 1 << 20)
+ * shared.flags.beta = True          # Visible by every worker
+ * shared.add("stats.requests")      # Atomic increment across processes
+ * ================================================================================
+ */
+
+#include "../pyfasty.h"
+#include "../thread/pyfasty_threading.h"
+#include <string.h>
+#ifndef PYFASTY_WINDOWS
+#include <errno.h>
+#include <fcntl.h>
+#include <sched.h>
+#include <signal.h>
+#include <sys/mman.h>
+#include <sys/stat.h>
+#include <unistd.h>
+#endif
+
+#define SHARED_MAGIC 0x52535950u          /* "PYSR" */
+#define SHARED_VERSION 3
+#define SHARED_KEY_MAX 96                 /* Chemin complet, en octets UTF-8 */
+#define SHARED_TEXT_MAX 136               /* Valeur str/bytes, en octets */
+#define SHARED_DEFAULT_SIZE (1 << 20)
+#define SHARED_NAME_MAX 200
+#define SHARED_SPIN_LIMIT 1024            /* Tours d'attente active avant de céder le CPU */
+#define SHARED_OPEN_TIMEOUT_MS 2000       /* Attente de l'initialisation par le créateur */
+
+/* Types des emplacements */
+enum {
+    SHARED_EMPTY = 0,                     /* Jamais utilisé : fin de la chaîne de sondage */
+    SHARED_DELETED,                       /* Supprimé : la clé reste pour le sondage */
+    SHARED_NONE,
+    SHARED_BOOL,
+    SHARED_INT,
+    SHARED_FLOAT,
+    SHARED_STR,
+    SHARED_BYTES
+};
+
+/* En-tête du segment (128 octets, verrou sur sa propre ligne de cache) */
+typedef struct {
+    uint32_t magic;            /* Écrit en dernier par le créateur */
+    uint32_t version;
+    uint64_t size;             /* Taille totale du segment */
+    uint32_t capacity;         /* Nombre d'emplacements */
+    uint32_t count;            /* Feuilles présentes */
+    uint32_t deleted;          /* Emplacements supprimés, réutilisables */
+    uint32_t generation;       /* Seqlock de la table : impair pendant un compactage */
+    char _padding1[32];
+    uint64_t lock;             /* Écrivain : date de démarrage << 32 | pid, 0 si libre */
+    uint32_t writing;          /* Emplacement en cours d'écriture + 1, 0 si aucun */
+    char _padding2[52];
+} SharedHeader;
+
+/* Emplacement de 256 octets */
+typedef struct {
+    uint32_t seq;              /* Seqlock : impair pendant une écriture */
+    uint32_t hash;
+    uint8_t type;
+    uint8_t _reserved;
+    uint16_t key_len;
+    uint16_t text_len;
+    uint16_t _reserved2;
+    union {
+        int64_t i;
+        double f;
+    } number;
+    char key[SHARED_KEY_MAX];
+    char text[SHARED_TEXT_MAX];
+} SharedSlot;
+
+typedef struct {
+    PyObject_HEAD
+    PyObject *owner;           /* Objet qui possède le mapping (NULL pour la racine) */
+    PyObject *name;
+    SharedHeader *header;
+    SharedSlot *slots;
+    size_t size;
+#ifdef PYFASTY_WINDOWS
+    HANDLE mapping;
+#endif
+    Py_ssize_t prefix_len;
+    char prefix[SHARED_KEY_MAX];  /* Chemin du nœud, "" pour la racine */
+} SharedRegistryObject;
+
+static PyTypeObject SharedRegistryType;
+
+/* === PRIMITIVES ATOMIQUES === */
+
+#ifdef PYFASTY_WINDOWS
+    #define shared_load_acquire(ptr) ((uint32_t)InterlockedCompareExchange((volatile LONG *)(ptr), 0, 0))
+    #define shared_load_relaxed(ptr) (*(volatile uint32_t *)(ptr))
+    #define shared_store_relaxed(ptr, v) (*(volatile uint32_t *)(ptr) = (v))
+    #define shared_store_release(ptr, v) InterlockedExchange((volatile LONG *)(ptr), (LONG)(v))
+    #define shared_fence_release() MemoryBarrier()
+    #define shared_fence_acquire() MemoryBarrier()
+    #define shared_pause() YieldProcessor()
+    #define shared_yield() SwitchToThread()
+    #define shared_getpid() ((uint32_t)GetCurrentProcessId())
+    #define shared_load64(ptr) ((uint64_t)InterlockedCompareExchange64((volatile LONG64 *)(ptr), 0, 0))
+    #define shared_store64_release(ptr, v) InterlockedExchange64((volatile LONG64 *)(ptr), (LONG64)(v))
+#else
+    #define shared_load_acquire(ptr) __atomic_load_n((ptr), __ATOMIC_ACQUIRE)
+    #define shared_load_relaxed(ptr) __atomic_load_n((ptr), __ATOMIC_RELAXED)
+    #define shared_store_relaxed(ptr, v) __atomic_store_n((ptr), (v), __ATOMIC_RELAXED)
+    #define shared_store_release(ptr, v) __atomic_store_n((ptr), (v), __ATOMIC_RELEASE)
+    #define shared_fence_release() __atomic_thread_fence(__ATOMIC_RELEASE)
+    #define shared_fence_acquire() __atomic_thread_fence(__ATOMIC_ACQUIRE)
+    #if defined(__x86_64__) || defined(__i386__)
+        #define shared_pause() __builtin_ia32_pause()
+    #else
+        #define shared_pause() ((void)0)
+    #endif
+    #define shared_yield() sched_yield()
+    #define shared_getpid() ((uint32_t)getpid())
+    #define shared_load64(ptr) __atomic_load_n((ptr), __ATOMIC_RELAXED)
+    #define shared_store64_release(ptr, v) __atomic_store_n((ptr), (v), __ATOMIC_RELEASE)
+#endif
+
+static inline int shared_cas64(uint64_t *ptr, uint64_t expected, uint64_t desired) {
+#ifdef PYFASTY_WINDOWS
+    return (uint64_t)InterlockedCompareExchange64((volatile LONG64 *)ptr, (LONG64)desired, (LONG64)expected) == expected;
+#else
+    return __atomic_compare_exchange_n(ptr, &expected, desired, 0, __ATOMIC_ACQUIRE, __ATOMIC_RELAXED);
+#endif
+}
+
+/* Date de démarrage d'un processus (32 bits de poids faible), 0 si inconnue.
+ * Avec le pid, elle distingue le détenteur du verrou d'un processus qui a repris son pid */
+static uint32_t shared_process_start(uint32_t pid) {
+#ifdef PYFASTY_WINDOWS
+    HANDLE process = OpenProcess(PROCESS_QUERY_LIMITED_INFORMATION, FALSE, (DWORD)pid);
+    if (process == NULL) {
+        return 0;
+    }
+    FILETIME created, exited, kernel, user;
+    uint32_t start = GetProcessTimes(process, &created, &exited, &kernel, &user) ? created.dwLowDateTime : 0;
+    CloseHandle(process);
+    return start;
+#elif defined(__linux__)
+    /* Champ 22 de /proc/<pid>/stat (tops d'horloge depuis le démarrage), après le nom entre parenthèses */
+    char path[32], buffer[512];
+    snprintf(path, sizeof(path), "/proc/%u/stat", pid);
+    int fd = open(path, O_RDONLY);
+    if (fd < 0) {
+        return 0;
+    }
+    ssize_t length = read(fd, buffer, sizeof(buffer) - 1);
+    close(fd);
+    if (length <= 0) {
+        return 0;
+    }
+    buffer[length] = '\0';
+    char *field = strrchr(buffer, ')');
+    for (int i = 2; field != NULL && i < 22; i++) {
+        field = strchr(field + 1, ' ');
+    }
+    return field != NULL ? (uint32_t)strtoull(field + 1, NULL, 10) : 0;
+#else
+    (void)pid;
+    return 0;
+#endif
+}
+
+/* Mot de verrou du processus courant, recalculé après un fork */
+static uint64_t shared_self_lock(void) {
+    static uint32_t cached_pid = 0;
+    static uint64_t cached_word = 0;
+    uint32_t pid = shared_getpid();
+    if (pid != cached_pid) {
+        cached_word = ((uint64_t)shared_process_start(pid) << 32) | pid;
+        cached_pid = pid;
+    }
+    return cached_word;
+}
+
+/* Le processus qui détient le verrou existe-t-il encore ? */
+static int shared_holder_alive(uint64_t holder) {
+    uint32_t pid = (uint32_t)holder;
+    uint32_t start = (uint32_t)(holder >> 32);
+#ifdef PYFASTY_WINDOWS
+    HANDLE process = OpenProcess(SYNCHRONIZE, FALSE, (DWORD)pid);
+    if (process == NULL) {
+        return GetLastError() != ERROR_INVALID_PARAMETER;
+    }
+    int alive = WaitForSingleObject(process, 0) == WAIT_TIMEOUT;
+    CloseHandle(process);
+#else
+    int alive = kill((pid_t)pid, 0) == 0 || errno != ESRCH;
+#endif
+    /* pid repris par un autre processus : date de démarrage différente */
+    if (alive && start != 0) {
+        uint32_t current = shared_process_start(pid);
+        if (current != 0 && current != start) {
+            return 0;
+        }
+    }
+    return alive;
+}
+
+/* === VERROU DES ÉCRIVAINS === */
+/* Aucun appel à l'API Python tant que le verrou est tenu */
+
+static void shared_lock(SharedHeader *header) {
+    uint64_t self_lock = shared_self_lock();
+    unsigned spins = 0;
+
+    while (!shared_cas64(&header->lock, 0, self_lock)) {
+        if (++spins < SHARED_SPIN_LIMIT) {
+            shared_pause();
+            continue;
+        }
+        spins = 0;
+
+        /* Détenteur mort en cours d'écriture : reprise du verrou et réparation */
+        uint64_t holder = shared_load64(&header->lock);
+        if (holder != 0 && holder != self_lock && !shared_holder_alive(holder) &&
+            shared_cas64(&header->lock, holder, self_lock)) {
+            /* Compactage interrompu : les lecteurs ne doivent pas attendre indéfiniment */
+            if (header->generation & 1) {
+                shared_store_release(&header->generation, header->generation + 1);
+            }
+            uint32_t writing = header->writing;
+            if (writing != 0 && writing <= header->capacity) {
+                SharedSlot *slot = (SharedSlot *)(header + 1) + (writing - 1);
+                uint32_t seq = shared_load_relaxed(&slot->seq);
+                if (seq & 1) {
+                    shared_store_release(&slot->seq, seq + 1);
+                }
+            }
+            header->writing = 0;
+            return;
+        }
+        shared_yield();
+    }
+}
+
+static inline void shared_unlock(SharedHeader *header) {
+    shared_store64_release(&header->lock, 0);
+}
+
+/* === TABLE DES CHEMINS === */
+
+/* FNV-1a 32 bits */
+static inline uint32_t shared_hash(const char *key, Py_ssize_t len) {
+    uint32_t hash = 2166136261u;
+    for (Py_ssize_t i = 0; i < len; i++) {
+        hash = (hash ^ (uint8_t)key[i]) * 16777619u;
+    }
+    return hash;
+}
+
+/* Copie cohérente d'un emplacement, sans verrou */
+static void shared_read_slot(SharedHeader *header, SharedSlot *slot, SharedSlot *copy) {
+    unsigned spins = 0;
+    for (;;) {
+        uint32_t before = shared_load_acquire(&slot->seq);
+        if (!(before & 1)) {
+            memcpy(copy, slot, sizeof(SharedSlot));
+            shared_fence_acquire();
+            if (shared_load_relaxed(&slot->seq) == before) {
+                return;
+            }
+        }
+        if (++spins >= SHARED_SPIN_LIMIT) {
+            /* Écriture interminable : passer par le verrou répare un écrivain mort */
+            spins = 0;
+            shared_lock(header);
+            shared_unlock(header);
+        } else {
+            shared_pause();
+        }
+    }
+}
+
+/* Début d'un parcours sans verrou de la table : génération paire, après un compactage en cours */
+static uint32_t shared_table_begin(SharedHeader *header) {
+    unsigned spins = 0;
+    for (;;) {
+        uint32_t generation = shared_load_acquire(&header->generation);
+        if (!(generation & 1)) {
+            return generation;
+        }
+        if (++spins >= SHARED_SPIN_LIMIT) {
+            /* Attendre le compactage sur le verrou, qui répare aussi un compacteur mort */
+            spins = 0;
+            shared_lock(header);
+            shared_unlock(header);
+        } else {
+            shared_pause();
+        }
+    }
+}
+
+/* Fin du parcours : 0 si un compactage a déplacé les feuilles entre-temps (à recommencer) */
+static inline int shared_table_unchanged(SharedHeader *header, uint32_t generation) {
+    shared_fence_acquire();
+    return shared_load_relaxed(&header->generation) == generation;
+}
+
+/* Recherche sans verrou ; renvoie 1 et la copie si la feuille existe */
+static int shared_lookup(SharedRegistryObject *self, const char *key, Py_ssize_t len, SharedSlot *copy) {
+    uint32_t hash = shared_hash(key, len);
+    uint32_t capacity = self->header->capacity;
+
+    for (;;) {
+        uint32_t generation = shared_table_begin(self->header);
+        uint32_t index = hash % capacity;
+        int found = 0;
+
+        for (uint32_t probe = 0; probe < capacity; probe++) {
+            shared_read_slot(self->header, &self->slots[index], copy);
+            if (copy->type == SHARED_EMPTY) {
+                break;
+            }
+            if (copy->hash == hash && copy->key_len == len && memcmp(copy->key, key, len) == 0) {
+                found = copy->type != SHARED_DELETED;
+                break;
+            }
+            index = index + 1 == capacity ? 0 : index + 1;
+        }
+        if (shared_table_unchanged(self->header, generation)) {
+            return found;
+        }
+    }
+}
+
+static void shared_compact(SharedRegistryObject *self);
+
+/* Sous verrou : emplacement de la clé, ou emplacement où l'insérer (NULL si plein) ; la clé
+   absente va dans le premier emplacement supprimé rencontré, sinon dans l'emplacement vide */
+static SharedSlot *shared_find_slot(SharedRegistryObject *self, const char *key, Py_ssize_t len,
+                                    uint32_t hash, int insert) {
+    SharedHeader *header = self->header;
+    uint32_t capacity = header->capacity;
+    uint32_t index = hash % capacity;
+    SharedSlot *reusable = NULL;
+
+    for (uint32_t probe = 0; probe < capacity; probe++) {
+        SharedSlot *slot = &self->slots[index];
+        if (slot->type == SHARED_EMPTY) {
+            break;
+        }
+        if (slot->hash == hash && slot->key_len == len && memcmp(slot->key, key, len) == 0) {
+            return slot;
+        }
+        if (slot->type == SHARED_DELETED && reusable == NULL) {
+            reusable = slot;
+        }
+        index = index + 1 == capacity ? 0 : index + 1;
+    }
+    if (!insert) {
+        return NULL;
+    }
+
+    /* Feuilles présentes limitées aux 3/4 pour garder des sondages courts ; un emplacement
+       vide doit rester pour terminer les chaînes de sondage */
+    if ((uint64_t)(header->count + 1) * 4 > (uint64_t)capacity * 3) {
+        return NULL;
+    }
+    if (reusable != NULL) {
+        return reusable;
+    }
+
+    /* Emplacements occupés ou supprimés au-delà des 7/8 : compactage, puis nouvelle recherche */
+    if ((uint64_t)(header->count + header->deleted + 1) * 8 > (uint64_t)capacity * 7 && header->deleted > 0) {
+        shared_compact(self);
+        return shared_find_slot(self, key, len, hash, insert);
+    }
+    if (self->slots[index].type != SHARED_EMPTY) {
+        return NULL;
+    }
+    return &self->slots[index];
+}
+
+/* Sous verrou : les emplacements supprimés qui précèdent un emplacement vide redeviennent
+   vides, aucune chaîne de sondage ne passant au-delà */
+static void shared_reclaim(SharedRegistryObject *self, uint32_t index) {
+    SharedHeader *header = self->header;
+    uint32_t capacity = header->capacity;
+
+    if (self->slots[index + 1 == capacity ? 0 : index + 1].type != SHARED_EMPTY) {
+        return;
+    }
+    while (self->slots[index].type == SHARED_DELETED) {
+        SharedSlot *slot = &self->slots[index];
+        uint32_t seq = slot->seq;
+
+        header->writing = index + 1;
+        shared_store_relaxed(&slot->seq, seq + 1);
+        shared_fence_release();
+        slot->type = SHARED_EMPTY;
+        shared_store_release(&slot->seq, seq + 2);
+        header->writing = 0;
+        header->deleted--;
+
+        index = index == 0 ? capacity - 1 : index - 1;
+    }
+}
+
+/* Sous verrou : compactage en place - les emplacements supprimés redeviennent vides et chaque
+   feuille revient au premier emplacement vide depuis son origine. Les lecteurs recommencent
+   pendant ce temps (génération impaire). Un compacteur mort en cours de route peut laisser des
+   feuilles hors de leur chaîne de sondage (invisibles à get(), toujours listées par keys()) */
+static void shared_compact(SharedRegistryObject *self) {
+    SharedHeader *header = self->header;
+    uint32_t capacity = header->capacity;
+
+    /* Départ après un emplacement vide : aucune chaîne de sondage ne le traverse */
+    uint32_t start = 0;
+    while (start < capacity && self->slots[start].type != SHARED_EMPTY) {
+        start++;
+    }
+    if (start == capacity) {
+        return;
+    }
+
+    shared_store_relaxed(&header->generation, header->generation + 1);
+    shared_fence_release();
+
+    for (uint32_t i = 0; i < capacity; i++) {
+        if (self->slots[i].type == SHARED_DELETED) {
+            self->slots[i].type = SHARED_EMPTY;
+        }
+    }
+    header->deleted = 0;
+
+    /* Dans l'ordre des chaînes : les feuilles ne reculent que vers des emplacements déjà traités */
+    for (uint32_t step = 1; step <= capacity; step++) {
+        uint32_t index = (start + step) % capacity;
+        SharedSlot *slot = &self->slots[index];
+        if (slot->type == SHARED_EMPTY) {
+            continue;
+        }
+        uint32_t target = slot->hash % capacity;
+        while (target != index && self->slots[target].type != SHARED_EMPTY) {
+            target = target + 1 == capacity ? 0 : target + 1;
+        }
+        if (target != index) {
+            uint32_t seq = self->slots[target].seq;
+            memcpy(&self->slots[target], slot, sizeof(SharedSlot));
+            self->slots[target].seq = seq + 2;
+            slot->type = SHARED_EMPTY;
+            slot->seq += 2;
+        }
+    }
+
+    shared_store_release(&header->generation, header->generation + 1);
+}
+
+/* Sous verrou : écrit la valeur de value (type, nombre, texte) dans slot */
+static void shared_write_slot(SharedRegistryObject *self, SharedSlot *slot, const char *key,
+                              Py_ssize_t len, uint32_t hash, const SharedSlot *value) {
+    SharedHeader *header = self->header;
+    int previous = slot->type;
+    int inserted = previous == SHARED_EMPTY || previous == SHARED_DELETED;
+    uint32_t seq = slot->seq;
+
+    header->writing = (uint32_t)(slot - self->slots) + 1;
+    shared_store_relaxed(&slot->seq, seq + 1);
+    shared_fence_release();
+
+    if (inserted) {
+        slot->hash = hash;
+        slot->key_len = (uint16_t)len;
+        memcpy(slot->key, key, len);
+    }
+    slot->type = value->type;
+    slot->number = value->number;
+    slot->text_len = value->text_len;
+    memcpy(slot->text, value->text, value->text_len);
+
+    shared_store_release(&slot->seq, seq + 2);
+    header->writing = 0;
+    if (inserted) {
+        header->count++;
+        if (previous == SHARED_DELETED) {
+            header->deleted--;
+        }
+    } else if (value->type == SHARED_DELETED) {
+        header->count--;
+        header->deleted++;
+        shared_reclaim(self, (uint32_t)(slot - self->slots));
+    }
+}
+
+/* === CONVERSIONS === */
+
+static int shared_encode(PyObject *value, SharedSlot *slot) {
+    slot->text_len = 0;
+    slot->number.i = 0;
+
+    if (value == Py_None) {
+        slot->type = SHARED_NONE;
+    } else if (PyBool_Check(value)) {
+        slot->type = SHARED_BOOL;
+        slot->number.i = value == Py_True;
+    } else if (PyLong_Check(value)) {
+        long long number = PyLong_AsLongLong(value);
+        if (number == -1 && PyErr_Occurred()) {
+            return -1;
+        }
+        slot->type = SHARED_INT;
+        slot->number.i = number;
+    } else if (PyFloat_Check(value)) {
+        slot->type = SHARED_FLOAT;
+        slot->number.f = PyFloat_AS_DOUBLE(value);
+    } else if (PyUnicode_Check(value) || PyBytes_Check(value)) {
+        const char *text;
+        Py_ssize_t len;
+        if (PyUnicode_Check(value)) {
+            text = PyUnicode_AsUTF8AndSize(value, &len);
+            if (text == NULL) {
+                return -1;
+            }
+            slot->type = SHARED_STR;
+        } else {
+            text = PyBytes_AS_STRING(value);
+            len = PyBytes_GET_SIZE(value);
+            slot->type = SHARED_BYTES;
+        }
+        if (len > SHARED_TEXT_MAX) {
+            PyErr_Format(PyExc_ValueError, "SharedRegistry values are limited to %d bytes (got %zd)",
+                         SHARED_TEXT_MAX, len);
+            return -1;
+        }
+        slot->text_len = (uint16_t)len;
+        memcpy(slot->text, text, len);
+    } else {
+        PyErr_Format(PyExc_TypeError,
+                     "SharedRegistry only stores None, bool, int, float, str and bytes, not '%s'",
+                     Py_TYPE(value)->tp_name);
+        return -1;
+    }
+    return 0;
+}
+
+static PyObject *shared_decode(const SharedSlot *slot) {
+    switch (slot->type) {
+        case SHARED_BOOL:
+            return PyBool_FromLong((long)slot->number.i);
+        case SHARED_INT:
+            return PyLong_FromLongLong(slot->number.i);
+        case SHARED_FLOAT:
+            return PyFloat_FromDouble(slot->number.f);
+        case SHARED_STR:
+            return PyUnicode_DecodeUTF8(slot->text, slot->text_len, "replace");
+        case SHARED_BYTES:
+            return PyBytes_FromStringAndSize(slot->text, slot->text_len);
+        default:
+            Py_RETURN_NONE;
+    }
+}
+
+/* Chemin complet prefix.path dans buffer (SHARED_KEY_MAX + 1 octets, terminé par 0) ;
+   renvoie sa longueur ou -1 */
+static Py_ssize_t shared_full_path(SharedRegistryObject *self, PyObject *path, char *buffer) {
+    Py_ssize_t len;
+    const char *text = PyUnicode_AsUTF8AndSize(path, &len);
+    if (text == NULL) {
+        return -1;
+    }
+    if (len == 0) {
+        PyErr_SetString(PyExc_ValueError, "SharedRegistry path cannot be empty");
+        return -1;
+    }
+    Py_ssize_t total = self->prefix_len ? self->prefix_len + 1 + len : len;
+    if (total > SHARED_KEY_MAX) {
+        PyErr_Format(PyExc_ValueError, "SharedRegistry paths are limited to %d bytes", SHARED_KEY_MAX);
+        return -1;
+    }
+    if (self->prefix_len) {
+        memcpy(buffer, self->prefix, self->prefix_len);
+        buffer[self->prefix_len] = '.';
+        memcpy(buffer + self->prefix_len + 1, text, len);
+    } else {
+        memcpy(buffer, text, len);
+    }
+    buffer[total] = '\0';
+    return total;
+}
+
+/* === SEGMENT === */
+
+static int shared_open_segment(SharedRegistryObject *self, const char *name, Py_ssize_t size) {
+    int created = 0;
+    char *base = NULL;
+
+#ifdef PYFASTY_WINDOWS
+    PyObject *mapping_name = PyUnicode_FromFormat("Local\\pyfasty.%s", name);
+    if (mapping_name == NULL) {
+        return -1;
+    }
+    wchar_t *wide_name = PyUnicode_AsWideCharString(mapping_name, NULL);
+    Py_DECREF(mapping_name);
+    if (wide_name == NULL) {
+        return -1;
+    }
+    self->mapping = CreateFileMappingW(INVALID_HANDLE_VALUE, NULL, PAGE_READWRITE,
+                                       (DWORD)((uint64_t)size >> 32), (DWORD)((uint64_t)size & 0xFFFFFFFFu),
+                                       wide_name);
+    created = self->mapping != NULL && GetLastError() != ERROR_ALREADY_EXISTS;
+    PyMem_Free(wide_name);
+    if (self->mapping == NULL) {
+        PyErr_SetFromWindowsErr(0);
+        return -1;
+    }
+    base = MapViewOfFile(self->mapping, FILE_MAP_ALL_ACCESS, 0, 0, 0);
+    if (base == NULL) {
+        PyErr_SetFromWindowsErr(0);
+        return -1;
+    }
+    MEMORY_BASIC_INFORMATION info;
+    VirtualQuery(base, &info, sizeof(info));
+    self->size = info.RegionSize;
+#else
+    char shm_name[SHARED_NAME_MAX + 16];
+    snprintf(shm_name, sizeof(shm_name), "/pyfasty.%s", name);
+
+    int fd = shm_open(shm_name, O_RDWR | O_CREAT | O_EXCL, 0600);
+    if (fd >= 0) {
+        created = 1;
+        if (ftruncate(fd, (off_t)size) < 0) {
+            PyErr_SetFromErrno(PyExc_OSError);
+            close(fd);
+            shm_unlink(shm_name);
+            return -1;
+        }
+    } else if (errno == EEXIST) {
+        fd = shm_open(shm_name, O_RDWR, 0600);
+    }
+    if (fd < 0) {
+        PyErr_SetFromErrnoWithFilename(PyExc_OSError, shm_name);
+        return -1;
+    }
+
+    /* Segment existant : attendre que le créateur l'ait dimensionné */
+    struct stat st;
+    for (int waited = 0; ; waited++) {
+        if (fstat(fd, &st) < 0) {
+            PyErr_SetFromErrno(PyExc_OSError);
+            close(fd);
+            return -1;
+        }
+        if ((size_t)st.st_size >= sizeof(SharedHeader) || waited >= SHARED_OPEN_TIMEOUT_MS) {
+            break;
+        }
+        usleep(1000);
+    }
+    if ((size_t)st.st_size < sizeof(SharedHeader) + sizeof(SharedSlot)) {
+        PyErr_Format(PyExc_ValueError, "Shared memory segment '%s' is not a SharedRegistry", name);
+        close(fd);
+        return -1;
+    }
+    self->size = (size_t)st.st_size;
+    base = mmap(NULL, self->size, PROT_READ | PROT_WRITE, MAP_SHARED, fd, 0);
+    close(fd);
+    if (base == MAP_FAILED) {
+        PyErr_SetFromErrno(PyExc_OSError);
+        return -1;
+    }
+#endif
+
+    self->header = (SharedHeader *)base;
+    self->slots = (SharedSlot *)(self->header + 1);
+
+    if (created) {
+        /* Segment neuf (rempli de zéros) : tous les emplacements sont vides */
+        self->header->version = SHARED_VERSION;
+        self->header->size = (uint64_t)size;
+        self->header->capacity = (uint32_t)((size - sizeof(SharedHeader)) / sizeof(SharedSlot));
+        shared_store_release(&self->header->magic, SHARED_MAGIC);
+        return 0;
+    }
+
+    for (int waited = 0; shared_load_acquire(&self->header->magic) != SHARED_MAGIC; waited++) {
+        if (waited >= SHARED_OPEN_TIMEOUT_MS) {
+            PyErr_Format(PyExc_ValueError, "Shared memory segment '%s' is not a SharedRegistry", name);
+            return -1;
+        }
+#ifdef PYFASTY_WINDOWS
+        Sleep(1);
+#else
+        usleep(1000);
+#endif
+    }
+    if (self->header->version != SHARED_VERSION || self->header->size > self->size ||
+        (uint64_t)self->header->capacity * sizeof(SharedSlot) + sizeof(SharedHeader) > self->header->size) {
+        PyErr_Format(PyExc_ValueError, "Shared memory segment '%s' has an incompatible layout", name);
+        return -1;
+    }
+    return 0;
+}
+
+static void shared_close_segment(SharedRegistryObject *self) {
+#ifdef PYFASTY_WINDOWS
+    if (self->header != NULL) {
+        UnmapViewOfFile(self->header);
+    }
+    if (self->mapping != NULL) {
+        CloseHandle(self->mapping);
+        self->mapping = NULL;
+    }
+#else
+    if (self->header != NULL) {
+        munmap(self->header, self->size);
+    }
+#endif
+    self->header = NULL;
+}
+
+/* === OBJET PYTHON === */
+
+/* Vue sur le sous-chemin path (len octets) partageant le mapping de self */
+static PyObject *shared_view_new(SharedRegistryObject *self, const char *path, Py_ssize_t len) {
+    SharedRegistryObject *view = PyObject_New(SharedRegistryObject, &SharedRegistryType);
+    if (view == NULL) {
+        return NULL;
+    }
+    PyObject *owner = self->owner ? self->owner : (PyObject *)self;
+    Py_INCREF(owner);
+    Py_INCREF(self->name);
+    view->owner = owner;
+    view->name = self->name;
+    view->header = self->header;
+    view->slots = self->slots;
+    view->size = self->size;
+#ifdef PYFASTY_WINDOWS
+    view->mapping = NULL;
+#endif
+    view->prefix_len = len;
+    memcpy(view->prefix, path, len);
+    return (PyObject *)view;
+}
+
+static PyObject *shared_new(PyTypeObject *type, PyObject *args, PyObject *kwds) {
+    static char *kwlist[] = {"name", "size", NULL};
+    PyObject *name;
+    Py_ssize_t size = SHARED_DEFAULT_SIZE;
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwds, "U|n:SharedRegistry", kwlist, &name, &size)) {
+        return NULL;
+    }
+    Py_ssize_t name_len;
+    const char *name_str = PyUnicode_AsUTF8AndSize(name, &name_len);
+    if (name_str == NULL) {
+        return NULL;
+    }
+    if (name_len == 0 || name_len > SHARED_NAME_MAX || strchr(name_str, '/') || strchr(name_str, '\\')) {
+        PyErr_Format(PyExc_ValueError, "Invalid SharedRegistry name '%U'", name);
+        return NULL;
+    }
+    if (size < (Py_ssize_t)(sizeof(SharedHeader) + 16 * sizeof(SharedSlot)) ||
+        (uint64_t)size > (uint64_t)sizeof(SharedHeader) + (uint64_t)UINT32_MAX * sizeof(SharedSlot)) {
+        PyErr_Format(PyExc_ValueError, "SharedRegistry size must hold at least 16 slots (%zd bytes)",
+                     (Py_ssize_t)(sizeof(SharedHeader) + 16 * sizeof(SharedSlot)));
+        return NULL;
+    }
+
+    SharedRegistryObject *self = (SharedRegistryObject *)type->tp_alloc(type, 0);
+    if (self == NULL) {
+        return NULL;
+    }
+    Py_INCREF(name);
+    self->name = name;
+    self->owner = NULL;
+    self->header = NULL;
+    self->prefix_len = 0;
+    if (shared_open_segment(self, name_str, size) < 0) {
+        Py_DECREF(self);
+        return NULL;
+    }
+    return (PyObject *)self;
+}
+
+static void shared_dealloc(SharedRegistryObject *self) {
+    if (self->owner != NULL) {
+        Py_DECREF(self->owner);
+    } else {
+        shared_close_segment(self);
+    }
+    Py_XDECREF(self->name);
+    Py_TYPE(self)->tp_free((PyObject *)self);
+}
+
+/* Lecture : feuille existante, méthode, sinon vue sur le sous-chemin */
+static PyObject *shared_getattro(SharedRegistryObject *self, PyObject *name) {
+    char key[SHARED_KEY_MAX + 1];
+    SharedSlot copy;
+
+    const char *name_str = PyUnicode_AsUTF8(name);
+    if (name_str == NULL) {
+        return NULL;
+    }
+    if (name_str[0] == '_' || PyDict_GetItem(SharedRegistryType.tp_dict, name) != NULL) {
+        return PyObject_GenericGetAttr((PyObject *)self, name);
+    }
+    Py_ssize_t len = shared_full_path(self, name, key);
+    if (len < 0) {
+        return NULL;
+    }
+    if (shared_lookup(self, key, len, &copy)) {
+        return shared_decode(&copy);
+    }
+    return shared_view_new(self, key, len);
+}
+
+/* Écriture (ou suppression si value == NULL) de la feuille prefix.path */
+static int shared_store(SharedRegistryObject *self, PyObject *path, PyObject *value) {
+    char key[SHARED_KEY_MAX + 1];
+    SharedSlot encoded;
+
+    Py_ssize_t len = shared_full_path(self, path, key);
+    if (len < 0) {
+        return -1;
+    }
+    if (value != NULL && shared_encode(value, &encoded) < 0) {
+        return -1;
+    }
+    if (value == NULL) {
+        encoded.type = SHARED_DELETED;
+        encoded.text_len = 0;
+        encoded.number.i = 0;
+    }
+
+    uint32_t hash = shared_hash(key, len);
+    shared_lock(self->header);
+    SharedSlot *slot = shared_find_slot(self, key, len, hash, value != NULL);
+    int found = slot != NULL && (slot->type != SHARED_EMPTY || value != NULL) &&
+                (slot->type != SHARED_DELETED || value != NULL);
+    if (found) {
+        shared_write_slot(self, slot, key, len, hash, &encoded);
+    }
+    shared_unlock(self->header);
+
+    if (!found) {
+        if (value == NULL) {
+            PyErr_Format(PyExc_AttributeError, "SharedRegistry has no leaf '%s'", key);
+        } else {
+            PyErr_Format(PyExc_MemoryError, "SharedRegistry '%U' is full (%u slots)",
+                         self->name, self->header->capacity);
+        }
+        return -1;
+    }
+    return 0;
+}
+
+static int shared_setattro(SharedRegistryObject *self, PyObject *name, PyObject *value) {
+    const char *name_str = PyUnicode_AsUTF8(name);
+    if (name_str == NULL) {
+        return -1;
+    }
+    if (name_str[0] == '_') {
+        return PyObject_GenericSetAttr((PyObject *)self, name, value);
+    }
+    return shared_store(self, name, value);
+}
+
+/* get(path, default=None) */
+static PyObject *shared_get_method(SharedRegistryObject *self, PyObject *args) {
+    PyObject *path;
+    PyObject *default_value = Py_None;
+    char key[SHARED_KEY_MAX + 1];
+    SharedSlot copy;
+
+    if (!PyArg_ParseTuple(args, "U|O:get", &path, &default_value)) {
+        return NULL;
+    }
+    Py_ssize_t len = shared_full_path(self, path, key);
+    if (len < 0) {
+        return NULL;
+    }
+    if (shared_lookup(self, key, len, &copy)) {
+        return shared_decode(&copy);
+    }
+    Py_INCREF(default_value);
+    return default_value;
+}
+
+/* set(path, value) */
+static PyObject *shared_set_method(SharedRegistryObject *self, PyObject *args) {
+    PyObject *path;
+    PyObject *value;
+
+    if (!PyArg_ParseTuple(args, "UO:set", &path, &value)) {
+        return NULL;
+    }
+    if (shared_store(self, path, value) < 0) {
+        return NULL;
+    }
+    Py_RETURN_NONE;
+}
+
+/* delete(path) */
+static PyObject *shared_delete_method(SharedRegistryObject *self, PyObject *path) {
+    if (!PyUnicode_Check(path)) {
+        PyErr_SetString(PyExc_TypeError, "delete() path must be a string");
+        return NULL;
+    }
+    if (shared_store(self, path, NULL) < 0) {
+        return NULL;
+    }
+    Py_RETURN_NONE;
+}
+
+/* add(path, n=1) : incrément atomique entre processus, renvoie la nouvelle valeur */
+static PyObject *shared_add_method(SharedRegistryObject *self, PyObject *args) {
+    PyObject *path;
+    PyObject *amount = NULL;
+    char key[SHARED_KEY_MAX + 1];
+    SharedSlot result;
+
+    if (!PyArg_ParseTuple(args, "U|O:add", &path, &amount)) {
+        return NULL;
+    }
+    int is_float = 0;
+    long long delta = 1;
+    double fdelta = 1.0;
+    if (amount != NULL) {
+        if (PyFloat_Check(amount)) {
+            is_float = 1;
+            fdelta = PyFloat_AS_DOUBLE(amount);
+        } else if (PyLong_Check(amount)) {
+            delta = PyLong_AsLongLong(amount);
+            if (delta == -1 && PyErr_Occurred()) {
+                return NULL;
+            }
+            fdelta = (double)delta;
+        } else {
+            PyErr_Format(PyExc_TypeError, "add() amount must be an int or a float, not '%s'",
+                         Py_TYPE(amount)->tp_name);
+            return NULL;
+        }
+    }
+    Py_ssize_t len = shared_full_path(self, path, key);
+    if (len < 0) {
+        return NULL;
+    }
+
+    uint32_t hash = shared_hash(key, len);
+    int error = 0;  /* 1 plein, 2 non numérique, 3 dépassement */
+    shared_lock(self->header);
+    SharedSlot *slot = shared_find_slot(self, key, len, hash, 1);
+    if (slot == NULL) {
+        error = 1;
+    } else {
+        int type = slot->type;
+        result.text_len = 0;
+        if (type == SHARED_EMPTY || type == SHARED_DELETED || type == SHARED_NONE) {
+            /* Feuille absente : part de zéro */
+            result.type = is_float ? SHARED_FLOAT : SHARED_INT;
+            if (is_float) {
+                result.number.f = fdelta;
+            } else {
+                result.number.i = delta;
+            }
+        } else if (type == SHARED_INT && !is_float) {
+            int64_t current = slot->number.i;
+            if ((delta > 0 && current > INT64_MAX - delta) || (delta < 0 && current < INT64_MIN - delta)) {
+                error = 3;
+            }
+            result.type = SHARED_INT;
+            result.number.i = current + (error ? 0 : delta);
+        } else if (type == SHARED_INT || type == SHARED_FLOAT) {
+            result.type = SHARED_FLOAT;
+            result.number.f = (type == SHARED_INT ? (double)slot->number.i : slot->number.f) + fdelta;
+        } else {
+            error = 2;
+        }
+        if (!error) {
+            shared_write_slot(self, slot, key, len, hash, &result);
+        }
+    }
+    shared_unlock(self->header);
+
+    switch (error) {
+        case 1:
+            PyErr_Format(PyExc_MemoryError, "SharedRegistry '%U' is full (%u slots)",
+                         self->name, self->header->capacity);
+            return NULL;
+        case 2:
+            PyErr_Format(PyExc_TypeError, "SharedRegistry leaf '%s' is not numeric", key);
+            return NULL;
+        case 3:
+            PyErr_SetString(PyExc_OverflowError, "SharedRegistry counter overflows a 64-bit integer");
+            return NULL;
+    }
+    return shared_decode(&result);
+}
+
+/* keys() : chemins des feuilles sous ce nœud, relatifs à ce nœud */
+static PyObject *shared_keys_method(SharedRegistryObject *self, PyObject *Py_UNUSED(ignored)) {
+    SharedSlot copy;
+    Py_ssize_t skip = self->prefix_len ? self->prefix_len + 1 : 0;
+    PyObject *keys;
+    uint32_t generation;
+
+scan:
+    /* Un compactage pendant le parcours peut déplacer une feuille : tout recommencer */
+    generation = shared_table_begin(self->header);
+    keys = PyList_New(0);
+    if (keys == NULL) {
+        return NULL;
+    }
+    for (uint32_t i = 0; i < self->header->capacity; i++) {
+        shared_read_slot(self->header, &self->slots[i], &copy);
+        if (copy.type == SHARED_EMPTY || copy.type == SHARED_DELETED || copy.key_len <= skip) {
+            continue;
+        }
+        if (skip && (memcmp(copy.key, self->prefix, self->prefix_len) != 0 || copy.key[self->prefix_len] != '.')) {
+            continue;
+        }
+        PyObject *key = PyUnicode_DecodeUTF8(copy.key + skip, copy.key_len - skip, "replace");
+        if (key == NULL || PyList_Append(keys, key) < 0) {
+            Py_XDECREF(key);
+            Py_DECREF(keys);
+            return NULL;
+        }
+        Py_DECREF(key);
+    }
+    if (!shared_table_unchanged(self->header, generation)) {
+        Py_DECREF(keys);
+        goto scan;
+    }
+    if (PyList_Sort(keys) < 0) {
+        Py_DECREF(keys);
+        return NULL;
+    }
+    return keys;
+}
+
+/* unlink() : retire le nom du segment ; les processus qui l'ont ouvert le gardent */
+static PyObject *shared_unlink_method(SharedRegistryObject *self, PyObject *Py_UNUSED(ignored)) {
+#ifndef PYFASTY_WINDOWS
+    const char *name = PyUnicode_AsUTF8(self->name);
+    if (name == NULL) {
+        return NULL;
+    }
+    char shm_name[SHARED_NAME_MAX + 16];
+    snprintf(shm_name, sizeof(shm_name), "/pyfasty.%s", name);
+    if (shm_unlink(shm_name) < 0 && errno != ENOENT) {
+        return PyErr_SetFromErrnoWithFilename(PyExc_OSError, shm_name);
+    }
+#endif
+    /* Windows : le mapping disparaît avec le dernier handle ouvert */
+    Py_RETURN_NONE;
+}
+
+static PyObject *shared_repr(SharedRegistryObject *self) {
+    if (self->prefix_len == 0) {
+        return PyUnicode_FromFormat("<SharedRegistry '%U'>", self->name);
+    }
+    PyObject *path = PyUnicode_DecodeUTF8(self->prefix, self->prefix_len, "replace");
+    if (path == NULL) {
+        return NULL;
+    }
+    PyObject *result = PyUnicode_FromFormat("<SharedRegistry '%U' path='%U'>", self->name, path);
+    Py_DECREF(path);
+    return result;
+}
+
+static PyObject *shared_getitem(SharedRegistryObject *self, PyObject *key) {
+    if (!PyUnicode_Check(key)) {
+        PyErr_SetString(PyExc_TypeError, "SharedRegistry keys must be strings");
+        return NULL;
+    }
+    char path[SHARED_KEY_MAX + 1];
+    SharedSlot copy;
+    Py_ssize_t len = shared_full_path(self, key, path);
+    if (len < 0) {
+        return NULL;
+    }
+    if (shared_lookup(self, path, len, &copy)) {
+        return shared_decode(&copy);
+    }
+    PyErr_SetObject(PyExc_KeyError, key);
+    return NULL;
+}
+
+static int shared_setitem(SharedRegistryObject *self, PyObject *key, PyObject *value) {
+    if (!PyUnicode_Check(key)) {
+        PyErr_SetString(PyExc_TypeError, "SharedRegistry keys must be strings");
+        return -1;
+    }
+    return shared_store(self, key, value);
+}
+
+static PyMappingMethods shared_as_mapping = {
+    0,                                  /* mp_length */
+    (binaryfunc)shared_getitem,         /* mp_subscript */
+    (objobjargproc)shared_setitem,      /* mp_ass_subscript */
+};
+
+static PyMethodDef shared_methods[] = {
+    {"get", (PyCFunction)shared_get_method, METH_VARARGS, "Get the leaf at a dotted path, or default"},
+    {"set", (PyCFunction)shared_set_method, METH_VARARGS, "Set the leaf at a dotted path"},
+    {"delete", (PyCFunction)shared_delete_method, METH_O, "Delete the leaf at a dotted path"},
+    {"add", (PyCFunction)shared_add_method, METH_VARARGS, "Atomically add n (default 1) across processes, return the new value"},
+    {"keys", (PyCFunction)shared_keys_method, METH_NOARGS, "Sorted leaf paths below this node"},
+    {"unlink", (PyCFunction)shared_unlink_method, METH_NOARGS, "Remove the segment name (POSIX shm_unlink)"},
+    {NULL, NULL, 0, NULL}  /* Sentinel */
+};
+
+static PyTypeObject SharedRegistryType = {
+    PyVarObject_HEAD_INIT(NULL, 0)
+    .tp_name = "pyfasty._pyfasty.SharedRegistry",
+    .tp_doc = "SharedRegistry(name, size=1048576): registry of primitive leaves shared between processes",
+    .tp_basicsize = sizeof(SharedRegistryObject),
+    .tp_itemsize = 0,
+    .tp_flags = Py_TPFLAGS_DEFAULT,
+    .tp_new = shared_new,
+    .tp_dealloc = (destructor)shared_dealloc,
+    .tp_getattro = (getattrofunc)shared_getattro,
+    .tp_setattro = (setattrofunc)shared_setattro,
+    .tp_repr = (reprfunc)shared_repr,
+    .tp_as_mapping = &shared_as_mapping,
+    .tp_methods = shared_methods,
+};
+
+int PyFasty_Shared_Init(PyObject *module) {
+    if (PyType_Ready(&SharedRegistryType) < 0) {
+        return -1;
+    }
+
+    Py_INCREF(&SharedRegistryType);
+    if (PyModule_AddObject(module, "SharedRegistry", (PyObject *)&SharedRegistryType) < 0) {
+        Py_DECREF(&SharedRegistryType);
+        return -1;
+    }
+
+    return 0;
+}
@@ -362,7 +362,7 @@ static PyMethodDef PyFasty_Methods[] = {
      "Initialize the Python module with a custom __setattr__"},
      
     /* ÉVÉNEMENTS UNIFIÉS */
-    {"event", event_decorator, METH_VARARGS, 
+    {"event", (PyCFunction)event_decorator, METH_VARARGS | METH_KEYWORDS, 
      "Décorateur unifié pour les événements PyFasty"},
     {"event_enable", event_enable, METH_NOARGS, 
      "Active le système d'événements"},
@@ -372,9 +372,29 @@ static PyMethodDef PyFasty_Methods[] = {
      "Évalue les conditions et déclenche les événements"},
     {"event_clear_handlers", event_clear_handlers, METH_NOARGS, 
      "Vide la liste des handlers d'événements"},
+    {"event_dependencies", event_dependencies, METH_NOARGS, 
+     "Retourne les chemins registry/config lus par chaque handler"},
+    {"event_remove", event_remove, METH_O, 
+     "Retire les handlers d'un callback"},
+    {"event_flush", event_flush, METH_NOARGS, 
+     "Attend l'exécution des callbacks asynchrones en file"},
+    {"event_handler_stats", event_handler_stats, METH_NOARGS, 
+     "Retourne les compteurs de déclenchement de chaque handler"},
+    {"event_stats", event_stats, METH_NOARGS, 
+     "Retourne les compteurs et histogrammes de latence du moteur d'événements"},
+    {"event_stats_enable", event_stats_enable, METH_NOARGS, 
+     "Active les mesures du moteur d'événements"},
+    {"event_stats_disable", event_stats_disable, METH_NOARGS, 
+     "Désactive les mesures du moteur d'événements"},
+    {"event_stats_reset", event_stats_reset, METH_NOARGS, 
+     "Remet à zéro les mesures du moteur d'événements"},
+    {"event_error_policy", (PyCFunction)event_error_policy, METH_VARARGS | METH_KEYWORDS, 
+     "Définit le traitement des exceptions des conditions et callbacks"},
+    {"event_errors", (PyCFunction)event_errors, METH_VARARGS | METH_KEYWORDS, 
+     "Retourne les exceptions collectées des conditions et callbacks"},
      
     /* ALIASES DE COMPATIBILITÉ */
-    {"event_sync", event_decorator, METH_VARARGS, 
+    {"event_sync", (PyCFunction)event_decorator, METH_VARARGS | METH_KEYWORDS, 
      "Alias de compatibilité pour event"},
     {"event_sync_enable", event_enable, METH_NOARGS, 
      "Alias de compatibilité pour event_enable"},
@@ -387,7 +407,7 @@ static PyMethodDef PyFasty_Methods[] = {
     {"evaluate_executor_sync_only", event_sync_evaluate_executor_only, METH_NOARGS, 
      "Évalue seulement les événements EXECUTOR_SYNC"},
     
-    {"event_async", event_decorator, METH_VARARGS, 
+    {"event_async", (PyCFunction)event_decorator, METH_VARARGS | METH_KEYWORDS, 
      "Alias de compatibilité pour event"},
     {"event_async_enable", event_enable, METH_NOARGS, 
      "Alias de compatibilité pour event_enable"},
@@ -508,6 +528,12 @@ PyMODINIT_FUNC PyInit__pyfasty(void) {
         goto fail;
     }
     
+    /* 4b. SharedRegistry - Registry partagé entre processus */
+    if (PyFasty_Shared_Init && PyFasty_Shared_Init(m) < 0) {
+        PyErr_SetString(PyExc_RuntimeError, "Failed to initialize SharedRegistry module");
+        goto fail;
+    }
+    
     /* 5. ExecutorProxy - Plus simple que Executor complet */
     if (PyFasty_ExecutorProxy_Init && PyFasty_ExecutorProxy_Init(m) < 0) {
         /* FALLBACK : Ne pas échouer si ExecutorProxy ne marche pas */
@@ -594,7 +620,7 @@ PyMODINIT_FUNC PyInit__pyfasty(void) {
     /* OPTIMISATION : Créer et ajouter la liste __all__ de manière plus efficace */
     static const char* all_items[] = {
         /* NOUVEAUTÉ : Objets principaux en natif */
-        "console", "registry", "config", "executor", "event",
+        "console", "registry", "config", "executor", "event", "SharedRegistry",
         /* Objets existants */
         "sync_executor", "async_executor",
         "event_sync", "event_async", "__version__", "PyFastyError", 
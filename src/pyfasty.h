@@ -71,11 +71,11 @@ typedef enum {
 /* Structure de base commune pour Registry et Config - alignement optimisé */
 struct PyFastyBaseObject {
     PyObject_HEAD
-    PyObject *data;            /* Dictionnaire contenant les valeurs */
-    PyObject *cache;           /* Dictionnaire pour le cache d'accès */
+    PyObject *data;            /* Enfants (NULL tant qu'aucun enfant n'est ajouté,
+                                  marqueur d'image tant qu'un nœud paresseux n'est pas ouvert) */
     PyObject *value;           /* Valeur directe */
     int depth;                 /* Profondeur pour optimisation */
-    char _padding[4];          /* Alignement mémoire explicite */
+    unsigned int epoch;        /* Époque de la dernière modification suivie (registry.snapshot()) */
 };
 
 /* Structure pour le pool d'objets - optimisée avec métadonnées */
@@ -92,6 +92,16 @@ struct PyFasty_ObjectPool {
 struct EventDecoratorObject {
     PyObject_HEAD
     PyObject *condition;
+    int dispatch;            /* 0 sync, 1 async (thread de dispatch), 2 asyncio */
+    PyObject *loop;          /* Boucle asyncio ou NULL */
+    int max_pending;         /* Exécutions en attente au maximum par handler */
+    int coalesce;            /* Politique de débordement : 1 coalesce, 0 drop */
+    double debounce_ms;      /* Silence requis avant un nouveau déclenchement (0 : aucun) */
+    double throttle_ms;      /* Intervalle minimal entre deux déclenchements (0 : aucun) */
+    double max_rate;         /* Déclenchements par seconde au maximum (0 : illimité) */
+    int compile;             /* Compiler la condition en prédicat natif si sa forme le permet */
+    int trigger;             /* 0 auto, 1 rising, 2 falling, 3 change, 4 level */
+    double rearm_after;      /* Réarmement (ms) si la condition reste dans l'état déclencheur (0 : aucun) */
 };
 
 /* TYPES DE FONCTIONS OPTIMISÉES */
@@ -117,6 +127,7 @@ extern PyFasty_SetGlobalConfigFunc PyFasty_SetGlobalConfig;
 extern PyObject *g_event_sync_handlers;
 extern int g_events_enabled;
 extern int g_in_condition_evaluation;
+extern int g_dependency_tracking;
 
 /* Variables de configuration dynamique */
 extern int g_pyfasty_default_pool_size;
@@ -155,7 +166,29 @@ void pyfasty_dict_pool_reset_stats(void);
 PyObject* pyfasty_base_create(PyTypeObject *type, PyFastyObjectType obj_type, 
                              int depth, PyObject *value);
 
-/* Accès aux attributs avec cache intelligent */
+/* Table des enfants d'un nœud, créée au premier ajout ou ouverte depuis une
+   image load_file(lazy=True) (référence empruntée, NULL en cas d'erreur) */
+PyObject* pyfasty_node_children(PyFastyBaseObject *node);
+
+/* Enfants encore dans l'image d'un chargement paresseux */
+#define PYFASTY_NODE_IS_LAZY(node) ((node)->data != NULL && !PyDict_CheckExact((node)->data))
+
+/* Vue en lecture des enfants : data ou dict vide (nouvelle référence) */
+PyObject* pyfasty_node_data(PyFastyBaseObject *node);
+
+/* Lecture d'un enfant sans créer la table (référence empruntée) ; NULL avec
+   une exception positionnée si l'ouverture d'un nœud paresseux échoue */
+static inline PyObject* pyfasty_node_get(PyFastyBaseObject *node, PyObject *name) {
+    if (node->data == NULL) {
+        return NULL;
+    }
+    if (!PyDict_CheckExact(node->data) && pyfasty_node_children(node) == NULL) {
+        return NULL;
+    }
+    return PyDict_GetItem(node->data, name);
+}
+
+/* Accès aux attributs avec auto-création */
 PyObject* pyfasty_base_getattr_recursive(PyObject *self, PyObject *name, 
                                        PyTypeObject *type, PyFastyObjectType obj_type);
 
@@ -179,11 +212,21 @@ PyObject *get_last_executor_result(void);
 
 /* INTERFACE D'ÉVÉNEMENTS UNIFIÉE */
 
-PyObject *event_decorator(PyObject *self, PyObject *args);
+PyObject *event_decorator(PyObject *self, PyObject *args, PyObject *kwds);
+PyObject *event_flush(PyObject *self, PyObject *args);
+PyObject *event_handler_stats(PyObject *self, PyObject *args);
+PyObject *event_stats(PyObject *self, PyObject *args);
+PyObject *event_stats_enable(PyObject *self, PyObject *args);
+PyObject *event_stats_disable(PyObject *self, PyObject *args);
+PyObject *event_stats_reset(PyObject *self, PyObject *args);
+PyObject *event_error_policy(PyObject *self, PyObject *args, PyObject *kwds);
+PyObject *event_errors(PyObject *self, PyObject *args, PyObject *kwds);
 PyObject *event_enable(PyObject *self, PyObject *args);
 PyObject *event_disable(PyObject *self, PyObject *args);
 PyObject *event_evaluate_all(PyObject *self, PyObject *args);
 PyObject *event_clear_handlers(PyObject *self, PyObject *args);
+PyObject *event_dependencies(PyObject *self, PyObject *args);
+PyObject *event_remove(PyObject *self, PyObject *callback);
 
 /* FONCTIONS DE COMPATIBILITÉ - Alias vers le module unifié */
 
@@ -233,17 +276,33 @@ int pyfasty_common_setitem(PyObject *self, PyObject *key, PyObject *value, PyTyp
 int pyfasty_common_contains(PyObject *self, PyObject *key);
 PyObject *pyfasty_common_getmethod(PyObject *self, PyObject *args, PyFastyObjectType obj_type);
 
+/* Sauvegarde / restauration binaire d'un arbre (format versionné) */
+PyObject *pyfasty_common_dump(PyObject *self, PyObject *path);
+PyObject *pyfasty_common_load(PyObject *self, PyObject *path, PyTypeObject *type,
+                              PyFastyObjectType obj_type);
+
+/* Chargement d'une image dump() ou d'un document JSON, éventuellement paresseux */
+PyObject *pyfasty_common_load_file(PyObject *self, PyObject *path, int lazy,
+                                   PyTypeObject *type, PyFastyObjectType obj_type);
+
 /* GESTION GLOBALE DES ÉVÉNEMENTS */
 
 /* Déclenchement d'événements */
 int pyfasty_trigger_events(void);
 void pyfasty_trigger_sync_events(void);
 void pyfasty_trigger_sync_events_with_module(ModuleType module_type);
+void pyfasty_trigger_sync_events_for_node(ModuleType module_type, PyObject *node, PyObject *name);
+
+/* Écritures regroupées (registry.batch / registry.update_many) */
+void pyfasty_event_batch_begin(void);
+void pyfasty_event_batch_end(void);
+PyObject *pyfasty_event_batch_new(void);
 
 /* Nettoyage et monitoring */
 void pyfasty_cleanup_events(void);
 void cleanup_condition_cache(void);
 void pyfasty_trace_module_access(ModuleType module);
+void pyfasty_trace_node_access(ModuleType module, PyObject *parent, PyObject *name, PyObject *child);
 
 /* État des événements */
 int pyfasty_is_in_callback_execution(void);
@@ -257,6 +316,7 @@ int PyFasty_Console_Init(PyObject *module);
 int PyFasty_Executor_Init(PyObject *module);
 int PyFasty_ExecutorProxy_Init(PyObject *module);
 int PyFasty_Event_Init(PyObject *module);
+int PyFasty_Shared_Init(PyObject *module);
 
 /* FONCTION D'INITIALISATION PRINCIPALE */
 
@@ -22,11 +22,23 @@ def main():
     from test_console import class_test_console
     class_test_console.console_test_pyfasty()
 
+    from test_console_sink import class_test_console_sink
+    class_test_console_sink.console_sink_test_pyfasty()
+
+    from test_console_format import class_test_console_format
+    class_test_console_format.console_format_test_pyfasty()
+
+    from test_console_level import class_test_console_level
+    class_test_console_level.console_level_test_pyfasty()
+
     from test_executor import class_test_executor
     class_test_executor.executor_test_pyfasty()
     
     from test_event import class_test_event
     class_test_event.event_test_pyfasty()
 
+    from test_event_engine import class_test_event_engine
+    class_test_event_engine.event_engine_test_pyfasty()
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -59,5 +59,22 @@ class class_test_config:
         pyfasty.config.test_config.test.test = True
         print(f"  {'✅' if str(pyfasty.config.test_config.test.test) == 'True' else '❌ Échec'} test config 12: {pyfasty.config.test_config.test.test} : True")
 
+        # Chargement depuis un fichier : JSON complet puis image dump() paresseuse
+        import json
+        import tempfile
+        json_path = os.path.join(tempfile.gettempdir(), "pyfasty_test_config.json")
+        dump_path = os.path.join(tempfile.gettempdir(), "pyfasty_test_config.dump")
+        with open(json_path, "w") as f:
+            json.dump({"server": {"host": "0.0.0.0", "port": 8080, "tls": {"enabled": True}}}, f)
+        pyfasty.config.test_file.load_file(json_path)
+        pyfasty.config.test_file.dump(dump_path)
+        print(f"  {'✅' if int(pyfasty.config.test_file.server.port) == 8080 else '❌ Échec'} test config 13: {pyfasty.config.test_file.server.port} : 8080")
+
+        pyfasty.config.test_lazy.load_file(dump_path, lazy=True)
+        os.remove(json_path)
+        os.remove(dump_path)
+        lazy_values = (str(pyfasty.config.test_lazy.server.host), pyfasty.config.test_lazy.server.tls.enabled == True)
+        print(f"  {'✅' if lazy_values == ('0.0.0.0', True) else '❌ Échec'} test config 14: {lazy_values} : ('0.0.0.0', True)")
+
 if __name__ == "__main__":
     class_test_config.config_test_pyfasty()
\ No newline at end of file
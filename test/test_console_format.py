@@ -0,0 +1,202 @@
+"""
+Test du rendu des formats de la console PyFasty
+
+Ce module vérifie que le format compilé produit exactement la sortie de l'ancien
+analyseur (chiffres masqués : dates et codes couleur), y compris pour les jetons
+mal formés et les anciennes formes sans %, et qu'un message long n'est pas tronqué.
+Il vérifie aussi les étiquettes <%FILE>/<%FUNC> et le cache des sites d'appel,
+y compris pour deux fonctions identiques de fichiers différents.
+Les couleurs modifiées sur place dans config["colors"] doivent être prises en compte.
+Les appels passent par du code compilé sous un nom de fichier fixe, pour que les
+étiquettes ne dépendent pas de l'emplacement des tests.
+L'affichage est capturé pour ne pas polluer la sortie des tests.
+"""
+
+import contextlib
+import gc
+import io
+import os
+import re
+import shutil
+import tempfile
+import weakref
+
+import pyfasty
+
+# Appels compilés sous format_check.py
+FORMAT_SOURCE = """
+def emit(console):
+    console.info("100% <%TYPE> sûr")
+    console.fatal("é")
+    console("brut <%TYPE>")
+"""
+
+# Sites d'appel : fonction, méthode, lambda et niveau module
+CALLSITE_SOURCE = """
+def function(console):
+    console.info("function")
+
+class Service:
+    def method(self, console):
+        console.info("method")
+
+callback = lambda console: console.info("lambda")
+
+console.info("module")
+"""
+
+# (format, sortie attendue de emit())
+FORMAT_OUTPUTS = [
+    (None,
+     '\033[00;0;000m0000-00-00 00:00:00.0000 | \033[0m\033[00;0;00m[INFO] [format_check.py:emit]\033[0m\033[00;0;000m | \033[0m000% <%TYPE> sûr\n' +
+     '\033[00;0;000m0000-00-00 00:00:00.0000 | \033[0m\033[00;0;000m\033[00;0;000m[FATAL] [format_check.py:emit]\033[0m\033[00;0;000m | \033[0mé\n' +
+     'brut <%TYPE>\n'),
+    ('<%FUNC> <%FILE> <%TYPE> <%FUNC&%FILE> <%H>:<%M>:<%S> <%FILE&%FUNC> <%MESSAGE> <%MESSAGE>',
+     '[emit] [format_check.py] [INFO] [format_check.py:emit] 00:00:00 [format_check.py:emit] 000% <%TYPE> sûr 000% <%TYPE> sûr\n' +
+     '[emit] [format_check.py] [FATAL] [format_check.py:emit] 00:00:00 [format_check.py:emit] é é\n' +
+     'brut <%TYPE>\n'),
+    ('<%Y>-<%m>-<%d> <%F:1>|<%F:3>|<%F:6>|<%F:9>|<%F:12>|<%F:0>|<%F:>|<%F:x>',
+     '0000-00-00 0|000|000000|000000000|000000000|||<%F:x>\n' +
+     '0000-00-00 0|000|000000|000000000|000000000|||<%F:x>\n' +
+     'brut <%TYPE>\n'),
+    ('<!gray><!type>[<!nope>]<!reset> <!> < <% <%Z> <%TYPE <%MESSAGE>>',
+     '\033[00;0;000m\033[00;0;00m[]\033[0m  < <% <%Z> <%TYPE 000% <%TYPE> sûr>\n' +
+     '\033[00;0;000m\033[00;0;000m\033[00;0;000m[]\033[0m  < <% <%Z> <%TYPE é>\n' +
+     'brut <%TYPE>\n'),
+    ('<HH>:<MM>:<SS>.<MS> <DD>/<MO>/<YYYY> <TYPE> <FILE> <FUNC> <FILE&FUNC> <MESSAGE>',
+     '<HH>:<MM>:<SS>.<MS> <DD>/<MO>/<YYYY> <TYPE> <FILE> <FUNC> <FILE&FUNC> <MESSAGE>\n' +
+     '<HH>:<MM>:<SS>.<MS> <DD>/<MO>/<YYYY> <TYPE> <FILE> <FUNC> <FILE&FUNC> <MESSAGE>\n' +
+     'brut <%TYPE>\n'),
+]
+
+def compiled(source, filename, **namespace):
+    """Exécuter du code sous un nom de fichier donné, renvoie son espace de noms"""
+    exec(compile(source, filename, "exec"), namespace)
+    return namespace
+
+def capture(*calls):
+    """Sortie standard produite par les appels"""
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        for call in calls:
+            call()
+    return output.getvalue()
+
+class class_test_console_format:
+    def __init__():
+        pass
+
+    def console_format_test_pyfasty():
+        print(f"\n\033[96mConsole format test pyfasty: (format: lib_pyfasty : expected_real_value)\033[0m")
+
+        directory = tempfile.mkdtemp(prefix="pyfasty_format_")
+        test_number = 0
+
+        # Sortie identique à l'ancien analyseur, format par format
+        emit = compiled(FORMAT_SOURCE, "format_check.py")["emit"]
+        for format_str, expected in FORMAT_OUTPUTS:
+            test_number += 1
+            console = pyfasty.Console()
+            if format_str is not None:
+                console.config = {"format": format_str}
+            output = re.sub(r"\d", "0", capture(lambda: emit(console)))
+            print(f"  {'✅' if output == expected else '❌ Échec'} test format {test_number}: {output!r} : {expected!r}")
+
+        # Message de plus de 2048 caractères : ni tronqué ni débordant, console et fichier
+        test_number += 1
+        path = os.path.join(directory, "long.log")
+        console = pyfasty.Console()
+        console.config = {
+            "format": "<!gray><%TYPE> | <!reset><%MESSAGE> | fin",
+            "save_log": {"status": True, "filename": path, "filemode": "w"},
+        }
+        message = "".join(chr(ord("a") + i % 26) for i in range(5000)) + " é"
+        output = capture(lambda: console.warning(message))
+        console.close()
+        with open(path, encoding="utf-8") as f:
+            logged = f.read()
+        expected = "[WARNING] | " + message + " | fin\n"
+        colored = "\033[38;5;245m[WARNING] | \033[0m" + message + " | fin\n"
+        result = (len(output), output == colored, logged == expected)
+        print(f"  {'✅' if result == (len(colored), True, True) else '❌ Échec'} test format {test_number}: {result} : {(len(colored), True, True)}")
+
+        # Étiquettes depuis une fonction, une méthode, une lambda et le niveau module
+        test_number += 1
+        console = pyfasty.Console()
+        console.config = {"format": "<%FILE> <%FUNC> <%FILE&%FUNC> <%MESSAGE>"}
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            namespace = compiled(CALLSITE_SOURCE, "callsite_check.py", console=console)
+            namespace["function"](console)
+            namespace["Service"]().method(console)
+            namespace["callback"](console)
+        output = output.getvalue().splitlines()
+        expected = [
+            "[callsite_check.py]  [callsite_check.py] module",
+            "[callsite_check.py] [function] [callsite_check.py:function] function",
+            "[callsite_check.py] [method] [callsite_check.py:method] method",
+            "[callsite_check.py] [<lambda>] [callsite_check.py:<lambda>] lambda",
+        ]
+        print(f"  {'✅' if output == expected else '❌ Échec'} test format {test_number}: {output} : {expected}")
+
+        # Sans jeton de site d'appel, la pile n'est pas parcourue : le code n'entre pas dans le cache
+        def code_kept(format_str):
+            console.config = {"format": format_str}
+            function = compiled("def fresh(console):\n    console.info('x')\n", "fresh_check.py")["fresh"]
+            code = weakref.ref(function.__code__)
+            capture(lambda: function(console))
+            del function
+            gc.collect()
+            return code
+
+        test_number += 1
+        result = (code_kept("<%TYPE> <%MESSAGE>")() is None, code_kept("<%FUNC> <%MESSAGE>")() is not None)
+        print(f"  {'✅' if result == (True, True) else '❌ Échec'} test format {test_number}: {result} : {(True, True)}")
+
+        # Le cache est borné : vidé une fois plein, il relâche les code objects
+        test_number += 1
+        code = code_kept("<%FUNC> <%MESSAGE>")
+        for _ in range(4096):
+            function = compiled("def fresh(console):\n    console.info('x')\n", "fresh_check.py")["fresh"]
+            capture(lambda: function(console))
+        del function
+        gc.collect()
+        result = code() is None
+        print(f"  {'✅' if result else '❌ Échec'} test format {test_number}: {result} : True")
+
+        # Couleurs modifiées sur place dans config["colors"] : prises en compte au message suivant
+        test_number += 1
+        console = pyfasty.Console()
+        console.config = {"format": "<!type><!gray><!custom><%MESSAGE><!reset>"}
+        outputs = [capture(lambda: console.info("a"))]
+        console.config["colors"]["type"]["info"] = "<i>"
+        console.config["colors"]["gray"] = "<g>"
+        outputs.append(capture(lambda: console.info("b")))
+        console.config["colors"]["custom"] = "<c>"
+        outputs.append(capture(lambda: console.info("c"), lambda: console.error("d")))
+        del console.config["colors"]["type"]
+        outputs.append(capture(lambda: console.info("e")))
+        expected = [
+            "\033[38;5;75m\033[38;5;245ma\033[0m\n",
+            "<i><g>b\033[0m\n",
+            "<i><g><c>c\033[0m\n\033[38;5;196m<g><c>d\033[0m\n",
+            "<g><c>e\033[0m\n",
+        ]
+        print(f"  {'✅' if outputs == expected else '❌ Échec'} test format {test_number}: {outputs} : {expected}")
+
+        # Même fonction à la même ligne dans deux fichiers : code objects égaux, étiquettes distinctes
+        test_number += 1
+        console = pyfasty.Console()
+        console.config = {"format": "<%FILE&%FUNC> <%MESSAGE>"}
+        source = "def go(console):\n    console.info('x')\n"
+        alpha = compiled(source, "alpha.py")["go"]
+        beta = compiled(source, "beta.py")["go"]
+        output = capture(lambda: alpha(console), lambda: beta(console), lambda: alpha(console)).splitlines()
+        expected = ["[alpha.py:go] x", "[beta.py:go] x", "[alpha.py:go] x"]
+        result = (alpha.__code__ == beta.__code__, output)
+        print(f"  {'✅' if result == (True, expected) else '❌ Échec'} test format {test_number}: {result} : {(True, expected)}")
+
+        shutil.rmtree(directory, ignore_errors=True)
+
+if __name__ == "__main__":
+    class_test_console_format.console_format_test_pyfasty()
@@ -0,0 +1,121 @@
+"""
+Test des niveaux de la console PyFasty
+
+Ce module teste console.level (nom ou gravité numérique, erreurs), l'héritage du
+niveau global par les instances Console(), leur remise à zéro par None ou del,
+console.is_enabled() combiné à debug_view et console_view, et la validation des
+arguments des appels filtrés.
+L'affichage est capturé pour ne pas polluer la sortie des tests.
+"""
+
+import contextlib
+import io
+
+import pyfasty
+
+def shown(console, *calls):
+    """Types affichés par les appels (level, message), format <%TYPE> seul"""
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        for level, message in calls:
+            getattr(console, level)(message)
+    return output.getvalue().split()
+
+ALL_LEVELS = [("debug", "d"), ("info", "i"), ("success", "s"), ("warning", "w"), ("error", "e"), ("critical", "c"), ("fatal", "f")]
+
+class class_test_console_level:
+    def __init__():
+        pass
+
+    def console_level_test_pyfasty():
+        print(f"\n\033[96mConsole level test pyfasty: (format: lib_pyfasty : expected_real_value)\033[0m")
+
+        console = pyfasty.Console()
+        console.config = {"format": "<%TYPE>"}
+
+        # Niveau par nom et par gravité, relu sous forme de nom (ou de gravité sans nom)
+        values = []
+        for level in ("warning", 40, 35, "DEBUG"):
+            try:
+                console.level = level
+                values.append(console.level)
+            except ValueError:
+                values.append("ValueError")
+        expected = ["warning", "error", 35, "ValueError"]
+        print(f"  {'✅' if values == expected else '❌ Échec'} test level 1: {values} : {expected}")
+
+        # Gravité 35 : warning (30) filtré, error (40) et au-delà affichés
+        result = shown(console, *ALL_LEVELS)
+        expected = ["[ERROR]", "[CRITICAL]", "[FATAL]"]
+        print(f"  {'✅' if result == expected else '❌ Échec'} test level 2: {result} : {expected}")
+
+        # Valeurs invalides : ValueError pour un nom inconnu ou une gravité négative, TypeError sinon
+        errors = []
+        for level in ("loud", -1, 2.5, ["info"]):
+            try:
+                console.level = level
+                errors.append(None)
+            except (TypeError, ValueError) as error:
+                errors.append(type(error).__name__)
+        expected = ["ValueError", "ValueError", "TypeError", "TypeError"]
+        unchanged = console.level == 35
+        print(f"  {'✅' if errors == expected and unchanged else '❌ Échec'} test level 3: {errors} : {expected}")
+
+        # Une instance sans niveau propre suit le niveau de la console globale
+        try:
+            console.level = None
+            pyfasty.console.level = "error"
+            result = (console.level, shown(console, ("warning", "w"), ("error", "e")), console.is_enabled("warning"))
+        finally:
+            del pyfasty.console.level
+        expected = (None, ["[ERROR]"], False)
+        print(f"  {'✅' if result == expected else '❌ Échec'} test level 4: {result} : {expected}")
+
+        # Niveau propre prioritaire, puis retour à l'héritage par None ou del ; del sur la console globale : tous les niveaux
+        try:
+            pyfasty.console.level = "error"
+            console.level = "info"
+            own = shown(console, ("info", "i"))
+            console.level = None
+            reset_none = shown(console, ("info", "i"), ("error", "e"))
+            console.level = "debug"
+            del console.level
+            reset_del = shown(console, ("warning", "w"), ("fatal", "f"))
+        finally:
+            del pyfasty.console.level
+        result = (own, reset_none, reset_del, console.level, pyfasty.console.level)
+        expected = (["[INFO]"], ["[ERROR]"], ["[FATAL]"], None, "debug")
+        print(f"  {'✅' if result == expected else '❌ Échec'} test level 5: {result} : {expected}")
+
+        # is_enabled() : niveau, debug_view puis console_view
+        states = []
+        console.config = {"debug_view": False}
+        states.append((console.is_enabled("debug"), console.is_enabled("info"), console.is_enabled(10)))
+        console.config = {"debug_view": True}
+        states.append((console.is_enabled("debug"), console.is_enabled("info"), console.is_enabled(10)))
+        console.level = "info"
+        states.append((console.is_enabled("debug"), console.is_enabled("info"), console.is_enabled(10)))
+        console.config = {"console_view": False}
+        states.append((console.is_enabled("debug"), console.is_enabled("info"), console.is_enabled("fatal")))
+        console.config = {"console_view": True}
+        console.level = None
+        expected = [(False, True, False), (True, True, True), (False, True, False), (False, False, False)]
+        print(f"  {'✅' if states == expected else '❌ Échec'} test level 6: {states} : {expected}")
+
+        # Appels filtrés (niveau ou debug_view) : les arguments invalides lèvent toujours
+        errors = []
+        console.level = "fatal"
+        console.config = {"debug_view": False}
+        for call, arguments in ((console.info, (42,)), (console.warning, ()), (console.error, ("a", "b")), (console.info, ("a\0b",)), (console.debug, (None,))):
+            try:
+                call(*arguments)
+                errors.append(None)
+            except (TypeError, ValueError) as error:
+                errors.append(type(error).__name__)
+        console.config = {"debug_view": True}
+        console.level = None
+        expected = ["TypeError", "TypeError", "TypeError", "ValueError", "TypeError"]
+        print(f"  {'✅' if errors == expected else '❌ Échec'} test level 7: {errors} : {expected}")
+
+if __name__ == "__main__":
+    class_test_console_level.console_level_test_pyfasty()
@@ -0,0 +1,189 @@
+"""
+Test des sorties de la console PyFasty
+
+Ce module teste le fichier de log persistant (save_log) : vidage explicite,
+fermeture et réouverture, vidage par niveau et périodique, validation des options.
+L'affichage est capturé pour ne pas polluer la sortie des tests.
+
+L'écriture asynchrone (config["async"]) passe par la sortie standard du processus
+et non par sys.stdout : elle est testée dans un processus enfant dont la sortie
+est lue par un tube.
+"""
+
+import contextlib
+import io
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+import pyfasty
+
+# Enfant : N lignes en asynchrone, flush(), puis les compteurs sur stderr
+ASYNC_CHILD = """
+import json, sys
+import pyfasty
+pyfasty.console.config = {"format": "<%MESSAGE>", "async": json.loads(sys.argv[1]),
+                          "save_log": {"status": True, "filename": sys.argv[3], "filemode": "w", "flush_interval": 60}}
+for i in range(int(sys.argv[2])):
+    pyfasty.console.info(f"{i:06d} " + "x" * 200)
+pyfasty.console.flush()
+with open(sys.argv[3]) as f:
+    logged = sum(1 for _ in f)
+sys.stderr.write(json.dumps({"stats": pyfasty.console.async_stats(), "logged": logged}))
+"""
+
+# Enfant : alternance synchrone / asynchrone
+SWITCH_CHILD = """
+import pyfasty
+console = pyfasty.console
+console.config = {"format": "<%MESSAGE>"}
+for step, messages in enumerate([["s1"], ["a1", "a2"], ["s2"], ["a3"], ["s3"]]):
+    console.config = {"async": {"enabled": step % 2 == 1}}
+    for message in messages:
+        console.info(message)
+"""
+
+def run_child(code, *args, delay=0):
+    """Lancer un enfant dont la sortie standard est un tube lu lentement, sans PYTHONUNBUFFERED"""
+    env = {key: value for key, value in os.environ.items() if key != "PYTHONUNBUFFERED"}
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [os.path.dirname(os.path.dirname(pyfasty.__file__)), env.get("PYTHONPATH")]))
+    child = subprocess.Popen([sys.executable, "-c", code, *args], stdout=subprocess.PIPE, stderr=subprocess.PIPE, env=env)
+    output = b""
+    while True:
+        chunk = child.stdout.read1(4096)
+        if not chunk:
+            break
+        output += chunk
+        time.sleep(delay)
+    error = child.stderr.read()
+    child.wait()
+    return output.decode().splitlines(), error.decode()
+
+class class_test_console_sink:
+    def __init__():
+        pass
+
+    def console_sink_test_pyfasty():
+        print(f"\n\033[96mConsole sink test pyfasty: (format: lib_pyfasty : expected_real_value)\033[0m")
+
+        directory = tempfile.mkdtemp(prefix="pyfasty_sink_")
+
+        def sink_console(name, **save_log):
+            path = os.path.join(directory, name)
+            console = pyfasty.Console()
+            console.config = {
+                "format": "<%TYPE> <%MESSAGE>",
+                "save_log": {"status": True, "filename": path, "filemode": "w", "flush_interval": 60, **save_log},
+            }
+            return console, path
+
+        def read(path):
+            with open(path) as f:
+                return f.read()
+
+        def quiet(*calls):
+            with contextlib.redirect_stdout(io.StringIO()):
+                for call in calls:
+                    call()
+
+        # Tampon : rien sur disque avant flush(), tout après
+        console, path = sink_console("flush.log")
+        quiet(lambda: console.info("a"), lambda: console.info("b"))
+        before = read(path)
+        console.flush()
+        after = read(path)
+        expected = ("", "[INFO] a\n[INFO] b\n")
+        print(f"  {'✅' if (before, after) == expected else '❌ Échec'} test sink 1: {(before, after)!r} : {expected!r}")
+
+        # close() vide le tampon ; le message suivant rouvre le fichier en ajout
+        quiet(lambda: console.info("c"))
+        console.close()
+        closed = read(path)
+        quiet(lambda: console.info("d"))
+        console.close()
+        reopened = read(path)
+        expected = "[INFO] a\n[INFO] b\n[INFO] c\n"
+        print(f"  {'✅' if closed == expected and reopened == expected + '[INFO] d' + chr(10) else '❌ Échec'} test sink 2: {(closed, reopened)!r} : {(expected, expected + '[INFO] d' + chr(10))!r}")
+
+        # flush_level : un message de ce niveau vide aussi les lignes précédentes
+        console, path = sink_console("level.log", flush_level="warning")
+        quiet(lambda: console.info("a"))
+        buffered = read(path)
+        quiet(lambda: console.warning("b"))
+        flushed = read(path)
+        console.close()
+        expected = ("", "[INFO] a\n[WARNING] b\n")
+        print(f"  {'✅' if (buffered, flushed) == expected else '❌ Échec'} test sink 3: {(buffered, flushed)!r} : {expected!r}")
+
+        # flush_interval : vidage périodique, sans attendre de message suivant
+        console, path = sink_console("interval.log", flush_interval=0.05)
+        quiet(lambda: console.info("a"))
+        buffered = read(path)
+        time.sleep(0.3)
+        flushed = read(path)
+        console.close()
+        expected = ("", "[INFO] a\n")
+        print(f"  {'✅' if (buffered, flushed) == expected else '❌ Échec'} test sink 4: {(buffered, flushed)!r} : {expected!r}")
+
+        # buffer_size=0 : chaque ligne est sur disque immédiatement
+        console, path = sink_console("unbuffered.log", buffer_size=0)
+        quiet(lambda: console.info("a"))
+        unbuffered = read(path)
+        console.close()
+        expected = "[INFO] a\n"
+        print(f"  {'✅' if unbuffered == expected else '❌ Échec'} test sink 5: {unbuffered!r} : {expected!r}")
+
+        # Options invalides refusées, configuration inchangée
+        errors = []
+        for options in ({"buffer_size": -1}, {"buffer_size": "64k"}, {"flush_level": "loud"}, {"flush_interval": -1}):
+            try:
+                console.config = {"save_log": {"status": True, **options}}
+                errors.append(None)
+            except (TypeError, ValueError) as error:
+                errors.append(type(error).__name__)
+        expected_errors = ["ValueError", "TypeError", "ValueError", "ValueError"]
+        unchanged = console.config["save_log"]["buffer_size"] == 0
+        print(f"  {'✅' if errors == expected_errors and unchanged else '❌ Échec'} test sink 6: {errors} : {expected_errors}")
+
+        # overflow="drop" : anneau plein face à un lecteur lent, les lignes en trop sont comptées
+        lines = 2000
+        path = os.path.join(directory, "drop.log")
+        output, error = run_child(ASYNC_CHILD, json.dumps({"enabled": True, "queue_size": 16, "overflow": "drop"}), str(lines), path, delay=0.002)
+        report = json.loads(error)
+        stats = report["stats"]
+        result = (stats["dropped"] > 0, stats["queued"] + stats["dropped"], len(output), report["logged"], stats["blocked"])
+        expected = (True, lines, stats["queued"], stats["queued"], 0)
+        print(f"  {'✅' if result == expected else '❌ Échec'} test sink 7: {result} : {expected}")
+
+        # overflow="block" : aucune ligne perdue, les attentes sont comptées, ordre conservé
+        path = os.path.join(directory, "block.log")
+        output, error = run_child(ASYNC_CHILD, json.dumps({"enabled": True, "queue_size": 16, "overflow": "block"}), str(lines), path, delay=0.002)
+        report = json.loads(error)
+        stats = report["stats"]
+        ordered = [int(line.split()[0]) for line in output] == list(range(lines))
+        result = (stats["blocked"] > 0, stats["dropped"], ordered, report["logged"])
+        expected = (True, 0, True, lines)
+        print(f"  {'✅' if result == expected else '❌ Échec'} test sink 8: {result} : {expected}")
+
+        # flush() vide l'anneau : plus rien en attente, tout est écrit sur la console et dans le fichier
+        path = os.path.join(directory, "flush_async.log")
+        output, error = run_child(ASYNC_CHILD, json.dumps({"enabled": True}), str(lines), path)
+        report = json.loads(error)
+        stats = report["stats"]
+        result = (stats["pending"], stats["written"], report["logged"], len(output))
+        expected = (0, lines, lines, lines)
+        print(f"  {'✅' if result == expected else '❌ Échec'} test sink 9: {result} : {expected}")
+
+        # Retour en synchrone (et inversement) : l'ordre des messages est conservé
+        output, error = run_child(SWITCH_CHILD)
+        expected = ["s1", "a1", "a2", "s2", "a3", "s3"]
+        print(f"  {'✅' if output == expected and not error else '❌ Échec'} test sink 10: {output} : {expected}")
+
+        shutil.rmtree(directory, ignore_errors=True)
+
+if __name__ == "__main__":
+    class_test_console_sink.console_sink_test_pyfasty()
@@ -0,0 +1,397 @@
+"""
+Test du moteur d'événements PyFasty
+
+Ce module teste le fonctionnement interne du moteur : suivi des dépendances,
+réévaluation ciblée des conditions et inspection des handlers.
+"""
+
+import asyncio
+import gc
+import threading
+import time
+import weakref
+
+import pyfasty
+
+class class_test_event_engine:
+    def __init__():
+        pass
+
+    def event_engine_test_pyfasty():
+        print(f"\n\033[96mEvent engine test pyfasty: (format: lib_pyfasty : expected_real_value)\033[0m")
+
+        pyfasty.event_clear_handlers()
+        evaluations = {"a": 0, "b": 0}
+        fired = []
+
+        def condition_a():
+            evaluations["a"] += 1
+            return pyfasty.registry.engine_dep.a == 3
+
+        def condition_b():
+            evaluations["b"] += 1
+            return pyfasty.registry.engine_dep_b.c == 5
+
+        @pyfasty.event(condition_a)
+        def engine_on_a():
+            fired.append("a")
+
+        @pyfasty.event(condition_b)
+        def engine_on_b():
+            fired.append("b")
+
+        # Première écriture : les deux handlers sont évalués et leurs lectures enregistrées
+        pyfasty.registry.engine_dep.a = 1
+        dependencies = pyfasty.event_dependencies()
+        print(f"  {'✅' if 'registry.engine_dep.a' in dependencies[engine_on_a] else '❌ Échec'} test engine 1: {dependencies[engine_on_a]} : registry.engine_dep.a")
+        print(f"  {'✅' if 'registry.engine_dep_b.c' in dependencies[engine_on_b] else '❌ Échec'} test engine 2: {dependencies[engine_on_b]} : registry.engine_dep_b.c")
+
+        # Écritures sur engine_dep.a : seule la condition a est réévaluée
+        before_b = evaluations["b"]
+        for i in range(10):
+            pyfasty.registry.engine_dep.a = 2
+        print(f"  {'✅' if evaluations['b'] == before_b else '❌ Échec'} test engine 3: {evaluations['b'] - before_b} : 0")
+
+        # Écriture sans rapport : aucune condition réévaluée
+        before = dict(evaluations)
+        pyfasty.registry.engine_unrelated += 1
+        print(f"  {'✅' if evaluations == before else '❌ Échec'} test engine 4: {evaluations} : {before}")
+
+        # Le déclenchement False→True fonctionne toujours
+        pyfasty.registry.engine_dep.a = 3
+        pyfasty.registry.engine_dep_b.c = 5
+        print(f"  {'✅' if fired == ['a', 'b'] else '❌ Échec'} test engine 5: {fired} : ['a', 'b']")
+
+        # Analyse à l'enregistrement : condition constante fausse jamais évaluée ni déclenchée
+        @pyfasty.event(lambda: 1 == 2)
+        def engine_impossible():
+            fired.append("impossible")
+
+        # Condition simple : déclenchement unique sur changement False→True
+        @pyfasty.event(lambda: pyfasty.registry.engine_simple)
+        def engine_simple():
+            fired.append("simple")
+
+        pyfasty.event_evaluate_all()
+        pyfasty.registry.engine_simple = 1
+        pyfasty.registry.engine_simple = 2
+        print(f"  {'✅' if fired == ['a', 'b', 'simple'] else '❌ Échec'} test engine 6: {fired} : ['a', 'b', 'simple']")
+
+        # Retrait d'un handler
+        removed = pyfasty.event_remove(engine_simple)
+        pyfasty.registry.engine_simple = 0
+        pyfasty.registry.engine_simple = 1
+        print(f"  {'✅' if removed and fired.count('simple') == 1 else '❌ Échec'} test engine 7: {fired.count('simple')} : 1")
+        print(f"  {'✅' if pyfasty.event_remove(engine_simple) == False else '❌ Échec'} test engine 8: {pyfasty.event_remove(engine_simple)} : False")
+
+        # Plus de 256 handlers : l'état de chacun reste suivi
+        pyfasty.event_clear_handlers()
+        many_fired = []
+        for i in range(300):
+            pyfasty.event(lambda i=i: pyfasty.registry.engine_many == i)(lambda i=i: many_fired.append(i))
+        pyfasty.registry.engine_many = 299
+        pyfasty.registry.engine_many = 299
+        print(f"  {'✅' if many_fired == [299] else '❌ Échec'} test engine 9: {many_fired} : [299]")
+
+        pyfasty.event_clear_handlers()
+        print(f"  {'✅' if pyfasty.event_dependencies() == {} else '❌ Échec'} test engine 10: {pyfasty.event_dependencies()} : {{}}")
+
+        # Écritures regroupées : une seule évaluation à la sortie du batch
+        batch_fired = []
+        batch_evaluations = []
+
+        def batch_condition():
+            batch_evaluations.append(1)
+            return pyfasty.registry.engine_batch.total > 5
+
+        pyfasty.event(batch_condition)(lambda: batch_fired.append(1))
+        pyfasty.registry.engine_batch.total = 0
+        batch_evaluations.clear()
+        with pyfasty.registry.batch():
+            for i in range(10):
+                pyfasty.registry.engine_batch.total = i
+            pyfasty.registry.engine_unrelated_batch = 1
+        print(f"  {'✅' if len(batch_evaluations) == 1 and batch_fired == [1] else '❌ Échec'} test engine 11: {len(batch_evaluations)}, {batch_fired} : 1, [1]")
+
+        pyfasty.registry.update_many({"engine_batch.total": 0, "engine_batch.label": "x"})
+        pyfasty.registry.update_many({"engine_batch.total": 7})
+        print(f"  {'✅' if batch_fired == [1, 1] and pyfasty.registry.engine_batch.label == 'x' else '❌ Échec'} test engine 12: {batch_fired} : [1, 1]")
+
+        pyfasty.event_clear_handlers()
+
+        # Mode async : le callback s'exécute dans le thread de dispatch
+        main_thread = threading.get_ident()
+        async_threads = []
+        pyfasty.event(lambda: pyfasty.registry.engine_async.a > 0, mode="async")(lambda: async_threads.append(threading.get_ident()))
+        pyfasty.registry.engine_async.a = 1
+        pyfasty.event_flush()
+        print(f"  {'✅' if len(async_threads) == 1 and async_threads[0] != main_thread else '❌ Échec'} test engine 13: {len(async_threads)} : 1")
+
+        # File bornée : un callback bloqué, puis 5 déclenchements
+        for number, overflow, max_pending, expected in ((14, "coalesce", 8, 2), (15, "drop", 2, 3)):
+            started = threading.Event()
+            release = threading.Event()
+            runs = []
+
+            def blocking_callback():
+                runs.append(1)
+                started.set()
+                release.wait(5)
+
+            key = f"engine_{overflow}"
+            pyfasty.event(lambda key=key: getattr(pyfasty.registry, key).v > 0, mode="async",
+                          overflow=overflow, max_pending=max_pending)(blocking_callback)
+            setattr(pyfasty.registry, key, 0)
+            getattr(pyfasty.registry, key).v = 1
+            started.wait(5)
+            for i in range(5):
+                getattr(pyfasty.registry, key).v = 0
+                getattr(pyfasty.registry, key).v = 1
+            release.set()
+            pyfasty.event_flush()
+            print(f"  {'✅' if len(runs) == expected else '❌ Échec'} test engine {number}: {len(runs)} : {expected}")
+
+        # Mode asyncio : le callback est planifié dans la boucle
+        async def asyncio_dispatch():
+            scheduled = []
+            pyfasty.event(lambda: pyfasty.registry.engine_asyncio.a > 0, mode="asyncio")(lambda: scheduled.append(1))
+            pyfasty.registry.engine_asyncio.a = 1
+            before = len(scheduled)
+            await asyncio.sleep(0)
+            return before, len(scheduled)
+
+        asyncio_result = asyncio.run(asyncio_dispatch())
+        print(f"  {'✅' if asyncio_result == (0, 1) else '❌ Échec'} test engine 16: {asyncio_result} : (0, 1)")
+
+        pyfasty.event_clear_handlers()
+
+        # Limitation de fréquence : 50 bascules rapides d'une condition
+        for number, options, expected in ((17, {"throttle_ms": 10000}, 1),
+                                          (18, {"max_rate": 5}, 5),
+                                          (19, {"debounce_ms": 10000}, 1)):
+            key = f"engine_rate_{number}"
+            limited = []
+
+            def limited_callback():
+                limited.append(1)
+
+            pyfasty.event(lambda key=key: getattr(pyfasty.registry, key).v > 0, **options)(limited_callback)
+            setattr(pyfasty.registry, key, 0)
+            for i in range(50):
+                getattr(pyfasty.registry, key).v = 1
+                getattr(pyfasty.registry, key).v = 0
+            stats = pyfasty.event_handler_stats()[limited_callback]
+            print(f"  {'✅' if len(limited) == expected and stats['suppressed'] == 50 - expected else '❌ Échec'} test engine {number}: {len(limited)}, {stats['suppressed']} : {expected}, {50 - expected}")
+
+        # Debounce : un nouveau déclenchement passe après le délai de silence
+        debounced = []
+        pyfasty.event(lambda: pyfasty.registry.engine_debounce.v > 0, debounce_ms=20)(lambda: debounced.append(1))
+        pyfasty.registry.engine_debounce = 0
+        pyfasty.registry.engine_debounce.v = 1
+        pyfasty.registry.engine_debounce.v = 0
+        time.sleep(0.05)
+        pyfasty.registry.engine_debounce.v = 1
+        print(f"  {'✅' if debounced == [1, 1] else '❌ Échec'} test engine 20: {debounced} : [1, 1]")
+
+        pyfasty.event_clear_handlers()
+
+        # Conditions compilées : même comportement que l'interpréteur
+        compiled_fired = []
+        interpreted_fired = []
+
+        def compiled_callback():
+            compiled_fired.append(1)
+
+        def chain_callback():
+            compiled_fired.append(2)
+
+        def call_callback():
+            interpreted_fired.append(1)
+
+        pyfasty.event(lambda: pyfasty.registry.engine_compiled.v > 5, compile=True)(compiled_callback)
+        pyfasty.event(lambda: pyfasty.registry.engine_compiled.v > 5 and pyfasty.registry.engine_compiled.w == 1,
+                      compile=True)(chain_callback)
+        pyfasty.event(lambda: str(pyfasty.registry.engine_compiled.v) == "7", compile=True)(call_callback)
+        pyfasty.registry.engine_compiled = 0
+        pyfasty.registry.engine_compiled.w = 1
+        pyfasty.registry.engine_compiled.v = 3
+        pyfasty.registry.engine_compiled.v = 7
+        stats = pyfasty.event_handler_stats()
+        compiled_flags = (stats[compiled_callback]["compiled"], stats[chain_callback]["compiled"], stats[call_callback]["compiled"])
+        print(f"  {'✅' if compiled_flags == (True, True, False) else '❌ Échec'} test engine 21: {compiled_flags} : (True, True, False)")
+        print(f"  {'✅' if compiled_fired == [1, 2] and interpreted_fired == [1] else '❌ Échec'} test engine 22: {compiled_fired}, {interpreted_fired} : [1, 2], [1]")
+
+        # Les dépendances restent suivies pour les conditions compilées
+        dependencies = pyfasty.event_dependencies()
+        print(f"  {'✅' if 'registry.engine_compiled.w' in dependencies[chain_callback] else '❌ Échec'} test engine 23: {dependencies[chain_callback]} : registry.engine_compiled.w")
+
+        pyfasty.event_clear_handlers()
+
+        # Instrumentation : rien n'est mesuré tant qu'elle est désactivée
+        def measured_callback():
+            pass
+
+        def failing_callback():
+            raise ValueError("engine stats")
+
+        pyfasty.event(lambda: pyfasty.registry.engine_stats.v > 5)(measured_callback)
+        pyfasty.event(lambda: pyfasty.registry.engine_stats.v > 5)(failing_callback)
+        pyfasty.registry.engine_stats = 0
+        pyfasty.registry.engine_stats.v = 1
+        evaluations = pyfasty.event_stats()["handlers"][measured_callback]["evaluations"]
+        print(f"  {'✅' if evaluations == 0 else '❌ Échec'} test engine 24: {evaluations} : 0")
+
+        pyfasty.event_stats_reset()
+        pyfasty.event_stats_enable()
+        for i in range(10):
+            pyfasty.registry.engine_stats.v = i
+        pyfasty.event_stats_disable()
+        stats = pyfasty.event_stats()
+        measured = stats["handlers"][measured_callback]
+        summary = (measured["evaluations"], measured["fires"], measured["condition_ns"]["count"], measured["callback_ns"]["count"])
+        print(f"  {'✅' if summary == (10, 1, 10, 1) else '❌ Échec'} test engine 25: {summary} : (10, 1, 10, 1)")
+
+        registry_totals = stats["modules"]["registry"]
+        totals = (registry_totals["evaluations"], registry_totals["fires"], stats["handlers"][failing_callback]["errors"])
+        print(f"  {'✅' if totals == (20, 2, 1) else '❌ Échec'} test engine 26: {totals} : (20, 2, 1)")
+
+        pyfasty.event_stats_reset()
+        pyfasty.event_clear_handlers()
+
+        # Politique d'erreur : collecte bornée et désactivation après 3 échecs consécutifs
+        failing_runs = []
+
+        def failing_again():
+            failing_runs.append(1)
+            raise RuntimeError("engine errors")
+
+        def broken_condition_callback():
+            pass
+
+        pyfasty.event_error_policy("collect", max_failures=3, capacity=4)
+        pyfasty.event(lambda: pyfasty.registry.engine_errors.v > 0)(failing_again)
+        pyfasty.event(lambda: pyfasty.registry.engine_errors.v.missing() > 0)(broken_condition_callback)
+        pyfasty.registry.engine_errors = 0
+        for i in range(5):
+            pyfasty.registry.engine_errors.v = 1
+            pyfasty.registry.engine_errors.v = 0
+        stats = pyfasty.event_handler_stats()
+        active = (stats[failing_again]["active"], stats[broken_condition_callback]["active"])
+        print(f"  {'✅' if len(failing_runs) == 3 and active == (False, False) else '❌ Échec'} test engine 27: {len(failing_runs)}, {active} : 3, (False, False)")
+
+        errors = pyfasty.event_errors(clear=True)
+        last = (errors[-1]["phase"], errors[-1]["failures"], errors[-1]["disabled"], type(errors[-1]["error"]).__name__)
+        print(f"  {'✅' if len(errors) == 4 and last == ('callback', 3, True, 'RuntimeError') else '❌ Échec'} test engine 28: {len(errors)}, {last} : 4, ('callback', 3, True, 'RuntimeError')")
+        print(f"  {'✅' if pyfasty.event_errors() == [] else '❌ Échec'} test engine 29: {pyfasty.event_errors()} : []")
+
+        pyfasty.event_error_policy("ignore")
+        pyfasty.event_clear_handlers()
+
+        # Modes de déclenchement : fronts et niveau sur la même séquence d'écritures
+        triggered = {"rising": [], "falling": [], "change": [], "level": []}
+        for trigger in triggered:
+            pyfasty.event(lambda: pyfasty.registry.engine_trigger.v > 0, trigger=trigger)(
+                lambda trigger=trigger: triggered[trigger].append(1))
+        pyfasty.registry.engine_trigger = 0
+        for value in (0, 1, 2, 0, 0, 3):
+            pyfasty.registry.engine_trigger.v = value
+        counts = {trigger: len(calls) for trigger, calls in triggered.items()}
+        expected_counts = {"rising": 2, "falling": 1, "change": 3, "level": 3}
+        print(f"  {'✅' if counts == expected_counts else '❌ Échec'} test engine 30: {counts} : {expected_counts}")
+
+        # Réarmement : la condition restée vraie redéclenche après rearm_after ms
+        rearmed = []
+        pyfasty.event(lambda: pyfasty.registry.engine_rearm.v > 0, rearm_after=30)(lambda: rearmed.append(1))
+        pyfasty.registry.engine_rearm = 0
+        pyfasty.registry.engine_rearm.v = 1
+        pyfasty.registry.engine_rearm.v = 2
+        time.sleep(0.05)
+        pyfasty.registry.engine_rearm.v = 3
+        pyfasty.registry.engine_rearm.v = 4
+        print(f"  {'✅' if rearmed == [1, 1] else '❌ Échec'} test engine 31: {rearmed} : [1, 1]")
+
+        # Module direct avec un mode explicite : front montant au lieu de chaque écriture
+        direct = []
+        pyfasty.event(lambda: pyfasty.registry, trigger="rising")(lambda: direct.append(1))
+        pyfasty.registry.engine_direct = 1
+        pyfasty.registry.engine_direct = 2
+        print(f"  {'✅' if direct == [1] else '❌ Échec'} test engine 32: {direct} : [1]")
+
+        pyfasty.event_clear_handlers()
+
+        # get_path() et get() : chaque segment lu reste une dépendance de la condition
+        path_fired = []
+        pyfasty.event(lambda: pyfasty.registry.get_path("engine_path.b") > 5)(lambda: path_fired.append("get_path"))
+        pyfasty.event(lambda: pyfasty.registry.engine_path.get("c", 0) > 5)(lambda: path_fired.append("get"))
+        pyfasty.registry.engine_path = 0
+        for value in (1, 7, 2, 9):
+            pyfasty.registry.engine_path.b = value
+            pyfasty.registry.engine_path.c = value
+        expected_path = ["get_path", "get", "get_path", "get"]
+        print(f"  {'✅' if path_fired == expected_path else '❌ Échec'} test engine 33: {path_fired} : {expected_path}")
+
+        pyfasty.event_clear_handlers()
+
+        # Autre thread pendant une évaluation : ses lectures ne sont pas attribuées à la condition,
+        # son écriture est mise en file puis évaluée au lieu d'être perdue
+        handshake = {"armed": False}
+        reader_go = threading.Event()
+        reader_done = threading.Event()
+        thread_fired = []
+
+        def thread_condition():
+            if handshake["armed"]:
+                handshake["armed"] = False
+                reader_go.set()
+                reader_done.wait(5)
+            return pyfasty.registry.engine_thread.v > 0
+
+        def thread_callback():
+            thread_fired.append("thread")
+
+        def other_thread():
+            reader_go.wait(5)
+            pyfasty.registry.engine_thread_other.x
+            pyfasty.registry.engine_thread_w.v = 1
+            reader_done.set()
+
+        pyfasty.event(thread_condition)(thread_callback)
+        pyfasty.event(lambda: pyfasty.registry.engine_thread_w.v > 0)(lambda: thread_fired.append("other"))
+        pyfasty.registry.engine_thread = 0
+        pyfasty.registry.engine_thread_w = 0
+        pyfasty.registry.engine_thread.v = 0
+        pyfasty.registry.engine_thread_w.v = 0
+        handshake["armed"] = True
+        worker = threading.Thread(target=other_thread)
+        worker.start()
+        pyfasty.registry.engine_thread.v = 1
+        worker.join(5)
+        thread_reads = sorted(pyfasty.event_dependencies()[thread_callback])
+        expected_reads = ['registry.engine_thread', 'registry.engine_thread.v']
+        print(f"  {'✅' if thread_reads == expected_reads else '❌ Échec'} test engine 34: {thread_reads} : {expected_reads}")
+        print(f"  {'✅' if thread_fired == ['thread', 'other'] else '❌ Échec'} test engine 35: {thread_fired} : ['thread', 'other']")
+
+        pyfasty.event_clear_handlers()
+
+        # Cycle handler -> boucle -> handler : collecté une fois le handler retiré
+        class engine_gc_loop:
+            def __init__(self):
+                self.scheduled = []
+
+            def call_soon_threadsafe(self, handler):
+                self.scheduled.append(handler)
+
+        gc_loop = engine_gc_loop()
+        gc_loop_ref = weakref.ref(gc_loop)
+        gc_callback = lambda: None
+        pyfasty.event(lambda: pyfasty.registry.engine_gc.v > 0, mode="asyncio", loop=gc_loop)(gc_callback)
+        pyfasty.registry.engine_gc = 0
+        pyfasty.registry.engine_gc.v = 1
+        scheduled = len(gc_loop.scheduled)
+        pyfasty.event_remove(gc_callback)
+        del gc_loop
+        gc.collect()
+        print(f"  {'✅' if scheduled == 1 and gc_loop_ref() is None else '❌ Échec'} test engine 36: {scheduled}, {gc_loop_ref()} : 1, None")
+
+if __name__ == "__main__":
+    class_test_event_engine.event_engine_test_pyfasty()
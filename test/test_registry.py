@@ -5,6 +5,21 @@ import pyfasty
 import time
 import json
 
+def shared_registry_worker(name, count):
+    shared = pyfasty.SharedRegistry(name)
+    for _ in range(count):
+        shared.add("stats.hits")
+
+def shared_registry_stale_writer(name):
+    pyfasty.SharedRegistry(name).recovered = True
+
+def shared_registry_reader(name, count, stop, misses):
+    shared = pyfasty.SharedRegistry(name)
+    missed = 0
+    while not stop.is_set():
+        missed += sum(shared.get(f"keep{i}") != i for i in range(count))
+    misses.value = missed
+
 class class_test_registry:
     def __init__():
         pass
@@ -214,6 +229,218 @@ class class_test_registry:
         
         print(f"  {'✅' if pyfasty.registry.test_array.test_2 == test_array_test_2 else '❌ Échec'} test registry 51: {pyfasty.registry.test_array.test_2} : {test_array_test_2}")
 
+        # Chemins compilés : résolution mise en cache, invalidée par les changements de structure
+        requests = pyfasty.registry.compile_path("test_path.stats.requests")
+        print(f"  {'✅' if requests.get(0) == 0 else '❌ Échec'} test registry 52: {requests.get(0)} : 0")
+
+        requests.incr()
+        requests.incr(4)
+        print(f"  {'✅' if str(pyfasty.registry.test_path.stats.requests) == '5' else '❌ Échec'} test registry 53: {pyfasty.registry.test_path.stats.requests} : 5")
+
+        pyfasty.registry.test_path.stats.requests += 2
+        print(f"  {'✅' if requests.get() == 7 else '❌ Échec'} test registry 54: {requests.get()} : 7")
+
+        requests.set(40)
+        print(f"  {'✅' if str(pyfasty.registry.test_path.stats.requests) == '40' else '❌ Échec'} test registry 55: {pyfasty.registry.test_path.stats.requests} : 40")
+
+        pyfasty.registry.test_path["stats"] = {"requests": 1}
+        print(f"  {'✅' if requests.get() == 1 else '❌ Échec'} test registry 56: {requests.get()} : 1")
+
+        # Compteurs atomiques : simples ou répartis en bandes par thread
+        hits = pyfasty.registry.counter("test_counter.hits")
+        hits.add()
+        hits.add(9)
+        print(f"  {'✅' if str(pyfasty.registry.test_counter.hits) == '10' else '❌ Échec'} test registry 57: {pyfasty.registry.test_counter.hits} : 10")
+        print(f"  {'✅' if pyfasty.registry.counter('test_counter.hits') is hits else '❌ Échec'} test registry 58: {pyfasty.registry.counter('test_counter.hits') is hits} : True")
+
+        import threading
+        striped = pyfasty.registry.counter("test_counter.striped", stripes=8)
+        def add_many():
+            for _ in range(10000):
+                striped.add()
+        threads = [threading.Thread(target=add_many) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        print(f"  {'✅' if striped.get() == 40000 else '❌ Échec'} test registry 59: {striped.get()} : 40000")
+
+        previous = striped.reset()
+        print(f"  {'✅' if (previous, striped.get()) == (40000, 0) else '❌ Échec'} test registry 60: {(previous, striped.get())} : (40000, 0)")
+
+        # Sauvegarde binaire : dump() puis load() dans un autre nœud
+        import tempfile
+        dump_path = os.path.join(tempfile.gettempdir(), "pyfasty_test_registry.dump")
+        pyfasty.registry.test_dump.app.name = "pyfasty"
+        pyfasty.registry.test_dump.app.version = (1, 2)
+        pyfasty.registry.test_dump.app.ratio = 0.5
+        pyfasty.registry.test_dump.app.tags = ["a", "b"]
+        pyfasty.registry.test_dump.dump(dump_path)
+        pyfasty.registry.test_load.load(dump_path)
+        os.remove(dump_path)
+        loaded = pyfasty.registry.test_load.app
+        restored = (str(loaded.name) == "pyfasty", loaded.version == (1, 2), loaded.ratio == 0.5, loaded.tags == ["a", "b"])
+        print(f"  {'✅' if all(restored) else '❌ Échec'} test registry 61: {restored} : (True, True, True, True)")
+
+        with open(dump_path, "wb") as f:
+            f.write(b"PYFS\x01R\xff")
+        try:
+            pyfasty.registry.test_load.load(dump_path)
+            corrupted = "aucune erreur"
+        except ValueError:
+            corrupted = "ValueError"
+        os.remove(dump_path)
+        print(f"  {'✅' if corrupted == 'ValueError' and str(pyfasty.registry.test_load.app.name) == 'pyfasty' else '❌ Échec'} test registry 62: {corrupted} : ValueError")
+
+        # Registry partagé entre processus (mémoire partagée)
+        import multiprocessing
+        pyfasty.SharedRegistry("pyfasty_test", 1 << 16).unlink()
+        shared = pyfasty.SharedRegistry("pyfasty_test", 1 << 16)
+        shared.flags.beta = True
+        shared.app.name = "pyfasty"
+        other = pyfasty.SharedRegistry("pyfasty_test")
+        seen = (other.flags.beta, str(other.app.name), other.keys())
+        print(f"  {'✅' if seen == (True, 'pyfasty', ['app.name', 'flags.beta']) else '❌ Échec'} test registry 63: {seen} : (True, 'pyfasty', ['app.name', 'flags.beta'])")
+
+        workers = [multiprocessing.Process(target=shared_registry_worker, args=("pyfasty_test", 1000)) for _ in range(4)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        print(f"  {'✅' if shared.stats.hits == 4000 else '❌ Échec'} test registry 64: {shared.stats.hits} : 4000")
+
+        try:
+            shared.app.tags = ["a", "b"]
+            rejected = "aucune erreur"
+        except TypeError:
+            rejected = "TypeError"
+        shared.unlink()
+        print(f"  {'✅' if rejected == 'TypeError' else '❌ Échec'} test registry 65: {rejected} : TypeError")
+
+        # Instantané : vue figée, les écritures suivantes ne la modifient pas
+        pyfasty.registry.test_snapshot.app.name = "v1"
+        pyfasty.registry.test_snapshot.app.port = 80
+        snapshot = pyfasty.registry.test_snapshot.snapshot()
+        pyfasty.registry.test_snapshot.app.name = "v2"
+        pyfasty.registry.test_snapshot.app.port += 1
+        pyfasty.registry.test_snapshot.app.debug = True
+        frozen = snapshot.to_dict()
+        print(f"  {'✅' if frozen == {'app': {'name': 'v1', 'port': 80}} and str(pyfasty.registry.test_snapshot.app.name) == 'v2' else '❌ Échec'} test registry 66: {frozen} : {{'app': {{'name': 'v1', 'port': 80}}}}")
+
+        try:
+            snapshot.app.name = "v3"
+            read_only = "aucune erreur"
+        except TypeError:
+            read_only = "TypeError"
+        print(f"  {'✅' if read_only == 'TypeError' and snapshot.app.name == 'v1' else '❌ Échec'} test registry 67: {read_only} : TypeError")
+
+        evicted = []
+        cache = pyfasty.registry.configure("test_cache", max_entries=3, on_evict=lambda key, value: evicted.append((key, value)))
+        for i in range(4):
+            pyfasty.registry.test_cache[f"k{i}"] = i
+        pyfasty.registry.test_cache["k1"]
+        pyfasty.registry.test_cache["k4"] = 4
+        stats = cache.stats()
+        print(f"  {'✅' if evicted == [('k0', 0), ('k2', 2)] and (stats['entries'], stats['hits'], stats['evictions']) == (3, 1, 2) else '❌ Échec'} test registry 68: {evicted} : [('k0', 0), ('k2', 2)]")
+
+        cache = pyfasty.registry.configure("test_cache_ttl", ttl=0.05)
+        pyfasty.registry.test_cache_ttl["token"] = "abc"
+        time.sleep(0.1)
+        try:
+            expired = pyfasty.registry.test_cache_ttl["token"]
+        except KeyError:
+            expired = "KeyError"
+        stats = cache.stats()
+        print(f"  {'✅' if expired == 'KeyError' and (stats['entries'], stats['misses'], stats['expirations']) == (0, 1, 1) else '❌ Échec'} test registry 69: {expired} : KeyError")
+
+        for i, country in enumerate(["FR", "DE", "FR", "IT"]):
+            user = getattr(pyfasty.registry.test_index_users, f"u{i}")
+            user.profile.country = country
+            user.age = 20 + 10 * i
+        pyfasty.registry.test_index_users.create_index("profile.country")
+        pyfasty.registry.test_index_users.create_index("age", kind="sorted")
+        pyfasty.registry.test_index_users.u1.profile.country = "FR"
+        del pyfasty.registry.test_index_users["u0"]
+        french = sorted(pyfasty.registry.test_index_users.where(country="FR"))
+        print(f"  {'✅' if french == ['u1', 'u2'] else '❌ Échec'} test registry 70: {french} : ['u1', 'u2']")
+
+        adults = sorted(pyfasty.registry.test_index_users.where(age__ge=30, profile__country="FR"))
+        print(f"  {'✅' if adults == ['u1', 'u2'] and pyfasty.registry.test_index_users.where(age__gt=35) == ['u2', 'u3'] else '❌ Échec'} test registry 71: {adults} : ['u1', 'u2']")
+
+        shared = {"host": "db", "port": 5432}
+        pyfasty.registry.test_bulk.update_from({"primary": shared, "replica": shared, "hits": 3})
+        pyfasty.registry.test_bulk.hits += 1
+        exported = pyfasty.registry.test_bulk.to_dict()
+        print(f"  {'✅' if exported == {'primary': shared, 'replica': shared, 'hits': 4} and exported['primary'] is exported['replica'] else '❌ Échec'} test registry 72: {exported} : {{'primary': {shared}, 'replica': {shared}, 'hits': 4}}")
+
+        pyfasty.registry.test_bulk.update_from({"primary": {"port": 6543}})
+        merged = pyfasty.registry.test_bulk.primary.to_dict()
+        pyfasty.registry.test_bulk.update_from({"replica": {"port": 6543}}, deep=False)
+        replaced = pyfasty.registry.test_bulk.replica.to_dict()
+        print(f"  {'✅' if merged == {'host': 'db', 'port': 6543} and replaced == {'port': 6543} else '❌ Échec'} test registry 73: {merged}, {replaced} : {{'host': 'db', 'port': 6543}}, {{'port': 6543}}")
+
+        # Compteur entier : dépassement de 64 bits signalé, valeur conservée
+        big = pyfasty.registry.counter("test_counter.big", 2**62)
+        try:
+            big.add(2**62)
+            overflow = "no error"
+        except OverflowError:
+            overflow = "OverflowError"
+        print(f"  {'✅' if (overflow, big.get()) == ('OverflowError', 2**62) else '❌ Échec'} test registry 74: {(overflow, big.get())} : ('OverflowError', {2**62})")
+
+        # Verrou d'un écrivain mort dont le pid a été repris par un processus vivant
+        if os.path.isdir("/dev/shm"):
+            import mmap
+            import multiprocessing
+            pyfasty.SharedRegistry("pyfasty_test_stale", 1 << 16).unlink()
+            stale = pyfasty.SharedRegistry("pyfasty_test_stale", 1 << 16)
+            with open("/dev/shm/pyfasty.pyfasty_test_stale", "r+b") as segment_file:
+                segment = mmap.mmap(segment_file.fileno(), 0)
+                segment[64:72] = ((0xFFFFFFFF << 32) | os.getpid()).to_bytes(8, "little")
+                segment.close()
+            writer = multiprocessing.Process(target=shared_registry_stale_writer, args=("pyfasty_test_stale",))
+            writer.start()
+            writer.join(10)
+            if writer.is_alive():
+                writer.terminate()
+                writer.join()
+            recovered = stale.get("recovered")
+            stale.unlink()
+            print(f"  {'✅' if recovered is True else '❌ Échec'} test registry 75: {recovered} : True")
+
+        # Clés distinctes créées puis supprimées : les emplacements supprimés sont réutilisés
+        pyfasty.SharedRegistry("pyfasty_test_churn", 1 << 16).unlink()
+        churn = pyfasty.SharedRegistry("pyfasty_test_churn", 1 << 16)
+        try:
+            for i in range(5000):
+                churn.set(f"sess{i}", i)
+                churn.delete(f"sess{i}")
+            churned = churn.keys()
+        except MemoryError as error:
+            churned = f"MemoryError: {error}"
+        print(f"  {'✅' if churned == [] else '❌ Échec'} test registry 76: {churned} : []")
+
+        # Avec des feuilles permanentes, compactage sans perte, y compris pour un lecteur concurrent
+        for i in range(150):
+            churn.set(f"keep{i}", i)
+        stop = multiprocessing.Event()
+        misses = multiprocessing.Value("i", -1)
+        reader = multiprocessing.Process(target=shared_registry_reader, args=("pyfasty_test_churn", 150, stop, misses))
+        reader.start()
+        try:
+            for i in range(20000):
+                churn.set(f"sess{i}", i)
+                if i >= 30:
+                    churn.delete(f"sess{i - 30}")
+            window = len(churn.keys())
+        except MemoryError as error:
+            window = f"MemoryError: {error}"
+        stop.set()
+        reader.join()
+        kept = all(churn.get(f"keep{i}") == i for i in range(150))
+        churn.unlink()
+        print(f"  {'✅' if (window, kept, misses.value) == (180, True, 0) else '❌ Échec'} test registry 77: {(window, kept, misses.value)} : (180, True, 0)")
+
         class_test_registry.registry_benchmark_pyfasty()
 
     def registry_benchmark_pyfasty():